@@ -44,9 +44,18 @@ sys.path.insert(0, "/opt/airflow/services")
 # Import after path modification
 from campaign_management import CampaignService
 from enricher import ChatGPTEnricher, JobEnricher
-from extractor import CompanyExtractor, GlassdoorClient, JobExtractor, JSearchClient
+from extractor import (
+    CompanyExtractor,
+    GlassdoorClient,
+    JobExtractor,
+    JSearchClient,
+    ResponseCache,
+)
+from extractor.company_name_index import DEFAULT_SCORE_CUTOFF
+from extractor.response_cache import CACHE_FILE_NAME, DEFAULT_CACHE_TTL_SECONDS
+from jobs import JobStatusService
 from notifier import EmailNotifier, NotificationCoordinator
-from ranker import JobRanker
+from ranker import JobRanker, SQLJobRanker
 from shared import MetricsRecorder, PostgreSQLDatabase
 
 # Writable paths for dbt target and logs (project dir is mounted read-only for airflow user)
@@ -97,6 +106,97 @@ def get_metrics_recorder() -> MetricsRecorder:
     return MetricsRecorder(database=database)
 
 
+def refresh_user_applied_companies() -> None:
+    """
+    Refresh the per-user "applied to this company" sets after a dbt run.
+
+    fact_jobs company keys can change when dbt rebuilds it; the sets are only a
+    display hint for job lists, so a failed refresh is logged and not raised.
+    """
+    try:
+        database = PostgreSQLDatabase(connection_string=build_db_connection_string())
+        JobStatusService(database=database).refresh_applied_companies()
+    except Exception as e:
+        logger.warning(f"Failed to refresh user applied companies: {e}", exc_info=True)
+
+
+def refresh_dashboard_stats(campaign_id: int | None) -> None:
+    """
+    Refresh precomputed dashboard stats after a pipeline step.
+
+    Refreshes the owner of campaign_id, or every user when the DAG run covers all
+    campaigns. The stats are a display summary, so a failed refresh is logged and
+    not raised.
+
+    Args:
+        campaign_id: Campaign the DAG run was triggered for, if any
+    """
+    try:
+        campaign_service = get_campaign_service()
+        if campaign_id:
+            campaign_service.refresh_dashboard_stats_for_campaign(campaign_id)
+        else:
+            campaign_service.refresh_dashboard_stats()
+    except Exception as e:
+        logger.warning(f"Failed to refresh dashboard stats: {e}", exc_info=True)
+
+
+def get_response_cache() -> ResponseCache | None:
+    """
+    Get the API response cache configured by API_CACHE_DIR.
+
+    Retries and same-day re-triggers of a DAG repeat identical API requests; the
+    cache answers them without spending API quota.
+
+    Returns:
+        ResponseCache stored in API_CACHE_DIR, or None if caching is not configured
+    """
+    cache_dir = os.getenv("API_CACHE_DIR")
+    if not cache_dir:
+        return None
+    ttl_env = os.getenv("API_CACHE_TTL_SECONDS")
+    Path(cache_dir).mkdir(parents=True, exist_ok=True)
+    return ResponseCache(
+        path=str(Path(cache_dir) / CACHE_FILE_NAME),
+        default_ttl=float(ttl_env) if ttl_env else DEFAULT_CACHE_TTL_SECONDS,
+    )
+
+
+def get_job_ranker(database: PostgreSQLDatabase) -> JobRanker:
+    """
+    Get JobRanker instance configured from environment variables.
+
+    Reads RANKER_BACKEND (optional, "python" or "sql") to select the ranking backend,
+    RANKER_STREAM_CHUNK_SIZE (optional) to enable streaming mode for the Python backend,
+    and RANKER_TOP_K (optional) as the default top-K limit for campaigns without
+    ranking_top_k.
+
+    Args:
+        database: Database connection
+
+    Returns:
+        JobRanker instance
+    """
+    top_k_env = os.getenv("RANKER_TOP_K")
+    top_k = int(top_k_env) if top_k_env else None
+    if top_k:
+        logger.info(f"Ranker top-K mode enabled by default (K: {top_k})")
+
+    backend = os.getenv("RANKER_BACKEND", "python").lower()
+    if backend == "sql":
+        logger.info("Using SQL ranking backend")
+        return SQLJobRanker(database=database, top_k=top_k)
+    if backend != "python":
+        raise ValueError(f"Invalid RANKER_BACKEND: {backend} (expected 'python' or 'sql')")
+
+    stream_chunk_size_env = os.getenv("RANKER_STREAM_CHUNK_SIZE")
+    stream_chunk_size = int(stream_chunk_size_env) if stream_chunk_size_env else None
+    if stream_chunk_size:
+        logger.info(f"Ranker streaming mode enabled (chunk size: {stream_chunk_size})")
+
+    return JobRanker(database=database, stream_chunk_size=stream_chunk_size, top_k=top_k)
+
+
 def get_campaign_id_from_context(context: dict[str, Any]) -> int | None:
     """
     Extract campaign_id from DAG run configuration.
@@ -163,15 +263,42 @@ def extract_job_postings_task(**context) -> dict[str, Any]:
             f"Extracting {num_pages} page(s) per campaign (approximately {num_pages * 10} jobs)"
         )
 
+        # Concurrency and provider rate (optional; defaults: 1 worker, 1 request/second).
+        # All workers share one rate limiter per API host.
+        max_workers_env = os.getenv("JSEARCH_MAX_WORKERS")
+        max_workers = int(max_workers_env) if max_workers_env else 1
+        requests_per_second_env = os.getenv("JSEARCH_REQUESTS_PER_SECOND")
+        rate_limit_delay = 1.0 / float(requests_per_second_env) if requests_per_second_env else 1.0
+        # Page streaming (optional): fetch pages concurrently, write each as it arrives
+        # and stop once a page holds only existing jobs
+        page_workers_env = os.getenv("JSEARCH_PAGE_WORKERS")
+        page_workers = int(page_workers_env) if page_workers_env else None
+        # Incremental extraction (default on): search only the window since each
+        # campaign's high-water mark. Set JSEARCH_INCREMENTAL=false to always use date_window.
+        incremental = os.getenv("JSEARCH_INCREMENTAL", "true").lower() != "false"
+        # Raw storage mode (default "full"); "slim" drops fields staging doesn't read and
+        # stores each distinct job description once
+        raw_storage = os.getenv("JSEARCH_RAW_STORAGE", "full").lower()
+
         # Build dependencies
         database = PostgreSQLDatabase(connection_string=db_conn_str)
-        jsearch_client = JSearchClient(api_key=jsearch_api_key)
+        response_cache = get_response_cache()
+        jsearch_client = JSearchClient(
+            api_key=jsearch_api_key,
+            rate_limit_delay=rate_limit_delay,
+            base_url=os.getenv("JSEARCH_BASE_URL") or None,
+            response_cache=response_cache,
+        )
 
         # Initialize extractor
         extractor = JobExtractor(
             database=database,
             jsearch_client=jsearch_client,
             num_pages=num_pages,
+            max_workers=max_workers,
+            page_workers=page_workers,
+            incremental=incremental,
+            raw_storage=raw_storage,
         )
 
         # Check if campaign_id is specified in DAG run configuration
@@ -232,15 +359,26 @@ def extract_job_postings_task(**context) -> dict[str, Any]:
         # If processing a single campaign, record with campaign_id; otherwise record without it
         # (for multi-campaign runs, we can't assign a single campaign_id)
         campaign_id_for_metrics = campaign_id_from_conf if campaign_id_from_conf else None
+        # Searches shared by several campaigns are only requested once (query coalescing)
+        api_requests_made = extractor.last_run_stats.get("api_requests_made", len(results))
+        api_requests_saved = extractor.last_run_stats.get("api_requests_saved", 0)
+        # Page requests answered by the response cache (e.g. on a retry) cost no API calls
+        cache_stats = response_cache.stats() if response_cache else {}
         metrics_recorder.record_task_metrics(
             dag_run_id=dag_run_id,
             task_name="extract_job_postings",
             task_status="success",
             campaign_id=campaign_id_for_metrics,
             rows_processed_raw=total_jobs,
-            api_calls_made=total_jobs,  # Approximate - one API call per job
+            api_calls_made=api_requests_made,
             processing_duration_seconds=duration,
-            metadata={"results_by_campaign": results},
+            metadata={
+                "results_by_campaign": results,
+                "api_requests_saved": api_requests_saved,
+                "api_pages_saved": api_requests_saved * num_pages,
+                "api_cache_hits": cache_stats.get("hits", 0),
+                "api_cache_misses": cache_stats.get("misses", 0),
+            },
         )
 
         # Return results for Airflow XCom (optional)
@@ -314,7 +452,7 @@ def rank_jobs_task(**context) -> dict[str, Any]:
         database = PostgreSQLDatabase(connection_string=db_conn_str)
 
         # Initialize ranker with injected dependencies
-        ranker = JobRanker(database=database)
+        ranker = get_job_ranker(database)
 
         # Extract campaign_id from DAG run config if available
         campaign_id_from_conf = get_campaign_id_from_context(context)
@@ -348,6 +486,7 @@ def rank_jobs_task(**context) -> dict[str, Any]:
         total_ranked = sum(results.values())
         logger.info(f"Job ranking complete. Total jobs ranked: {total_ranked}")
         logger.info(f"Results per campaign: {results}")
+        refresh_dashboard_stats(campaign_id_from_conf)
 
         # Log summary of scoring factors used
         logger.info(
@@ -488,6 +627,7 @@ def send_notifications_task(**context) -> dict[str, Any]:
 
         # Record metrics
         campaign_id_from_conf = get_campaign_id_from_context(context)
+        refresh_dashboard_stats(campaign_id_from_conf)
         duration = time.time() - start_time
         task_status = (
             "success" if error_count == 0 else "success"
@@ -562,23 +702,55 @@ def extract_companies_task(**context) -> dict[str, Any]:
         if not glassdoor_api_key:
             raise ValueError("GLASSDOOR_API_KEY environment variable is required")
 
+        # Leased enrichment (optional): workers lease batches from the enrichment queue
+        # with SKIP LOCKED and write results in bulk (defaults: off, 1 worker)
+        lease_batch_size_env = os.getenv("GLASSDOOR_LEASE_BATCH_SIZE")
+        lease_batch_size = int(lease_batch_size_env) if lease_batch_size_env else None
+        max_workers_env = os.getenv("GLASSDOOR_MAX_WORKERS")
+        max_workers = int(max_workers_env) if max_workers_env else 1
+        # Incremental backlog scan (leased mode only): only read postings loaded since
+        # the last enqueue
+        incremental_scan = (
+            lease_batch_size is not None
+            and os.getenv("GLASSDOOR_INCREMENTAL_SCAN", "false").lower() == "true"
+        )
+        # Local name resolution against enriched companies ("off" disables it)
+        name_match_cutoff_env = os.getenv("GLASSDOOR_NAME_MATCH_CUTOFF")
+        if name_match_cutoff_env and name_match_cutoff_env.lower() == "off":
+            name_match_cutoff = None
+        elif name_match_cutoff_env:
+            name_match_cutoff = float(name_match_cutoff_env)
+        else:
+            name_match_cutoff = DEFAULT_SCORE_CUTOFF
+
         # Initialize dependencies and extractor
         database = PostgreSQLDatabase(connection_string=db_conn_str)
-        glassdoor_client = GlassdoorClient(api_key=glassdoor_api_key)
-        extractor = CompanyExtractor(database=database, glassdoor_client=glassdoor_client)
+        response_cache = get_response_cache()
+        glassdoor_client = GlassdoorClient(api_key=glassdoor_api_key, response_cache=response_cache)
+        extractor = CompanyExtractor(
+            database=database,
+            glassdoor_client=glassdoor_client,
+            lease_batch_size=lease_batch_size,
+            max_workers=max_workers,
+            name_match_cutoff=name_match_cutoff,
+            incremental_scan=incremental_scan,
+        )
 
         # Extract companies (no limit - process all that need enrichment)
         results = extractor.extract_all_companies()
 
         # Count results by status
         success_count = sum(1 for v in results.values() if v == "success")
+        resolved_count = sum(1 for v in results.values() if v == "resolved")
         not_found_count = sum(1 for v in results.values() if v == "not_found")
         error_count = sum(1 for v in results.values() if v == "error")
         total_processed = len(results)
+        cache_hits = response_cache.stats()["hits"] if response_cache else 0
 
         logger.info(
             f"Company extraction complete. "
-            f"Success: {success_count}, Not Found: {not_found_count}, Errors: {error_count}"
+            f"Success: {success_count}, Resolved locally: {resolved_count}, "
+            f"Not Found: {not_found_count}, Errors: {error_count}"
         )
 
         # Record metrics
@@ -590,14 +762,17 @@ def extract_companies_task(**context) -> dict[str, Any]:
             task_status="success",
             campaign_id=campaign_id_from_conf,  # Record campaign_id if DAG was triggered for specific campaign
             rows_processed_staging=total_processed,
-            api_calls_made=total_processed,  # Approximate - one API call per company
+            # Approximate - one API call per company not resolved locally or from cache
+            api_calls_made=total_processed - resolved_count - cache_hits,
             api_errors=error_count,
             processing_duration_seconds=duration,
             metadata={
                 "success_count": success_count,
+                "resolved_count": resolved_count,
                 "not_found_count": not_found_count,
                 "error_count": error_count,
                 "total_processed": total_processed,
+                "api_cache_hits": cache_hits,
             },
         )
 
@@ -605,6 +780,7 @@ def extract_companies_task(**context) -> dict[str, Any]:
         return {
             "status": "success",
             "success_count": success_count,
+            "resolved_count": resolved_count,
             "not_found_count": not_found_count,
             "error_count": error_count,
             "total_processed": total_processed,
@@ -1187,6 +1363,7 @@ def dbt_modelling_task(**context) -> dict[str, Any]:
             )
 
         logger.info(f"dbt run output: {output}")
+        refresh_user_applied_companies()
 
         # Record metrics (campaign_id_from_conf already extracted above)
         duration = time.time() - start_time
@@ -1485,6 +1662,7 @@ def dbt_modelling_chatgpt_task(**context) -> dict[str, Any]:
         # Parse output
         output = result.stdout
         logger.info(f"dbt run output: {output}")
+        refresh_user_applied_companies()
 
         # Record metrics
         duration = time.time() - start_time
@@ -1565,7 +1743,7 @@ def rank_jobs_chatgpt_task(**context) -> dict[str, Any]:
         database = PostgreSQLDatabase(connection_string=db_conn_str)
 
         # Initialize ranker with injected dependencies
-        ranker = JobRanker(database=database)
+        ranker = get_job_ranker(database)
 
         # Extract campaign_id from DAG run config if available
         campaign_id_from_conf = get_campaign_id_from_context(context)
@@ -1599,6 +1777,7 @@ def rank_jobs_chatgpt_task(**context) -> dict[str, Any]:
         total_ranked = sum(results.values())
         logger.info(f"Job ranking complete (with ChatGPT data). Total jobs ranked: {total_ranked}")
         logger.info(f"Results per campaign: {results}")
+        refresh_dashboard_stats(campaign_id_from_conf)
 
         # Record metrics
         duration = time.time() - start_time
@@ -10,10 +10,12 @@ from blueprints.documents import documents_bp
 from blueprints.jobs import jobs_bp
 from blueprints.staging import staging_bp
 from blueprints.system import system_bp
+from blueprints.tasks import tasks_bp
 from config import Config
 from flask import Flask, jsonify
 from flask_cors import CORS
 from flask_jwt_extended import JWTManager
+from utils.json_provider import OrjsonProvider
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -24,6 +26,7 @@ def create_app():
     """Application factory function."""
     app = Flask(__name__)
     app.config.from_object(Config)
+    app.json = OrjsonProvider(app)
 
     # Initialize JWT
     jwt = JWTManager(app)
@@ -46,7 +49,7 @@ def create_app():
         app,
         origins=Config.CORS_ORIGINS,
         supports_credentials=True,
-        allow_headers=["Content-Type", "Authorization"],
+        allow_headers=["Content-Type", "Authorization", "Prefer"],
     )
 
     # Register Blueprints
@@ -58,6 +61,7 @@ def create_app():
     app.register_blueprint(documents_bp)
     app.register_blueprint(staging_bp)
     app.register_blueprint(system_bp)
+    app.register_blueprint(tasks_bp)
 
     # Close connection pools on process exit for graceful cleanup
     from services.shared import close_all_pools
@@ -31,7 +31,9 @@ def api_register():
             return jsonify({"error": "Registration failed"}), 400
 
         # Create access token for immediate login
-        access_token = create_access_token(identity=str(user_id))
+        access_token = create_access_token(
+            identity=str(user_id), additional_claims={"role": "user"}
+        )
         return (
             jsonify(
                 {
@@ -71,8 +73,10 @@ def api_login():
             return jsonify({"error": "Invalid username or password"}), 401
 
         # Create access token
-        access_token = create_access_token(identity=str(user["user_id"]))
         role = user.get("role") or "user"
+        access_token = create_access_token(
+            identity=str(user["user_id"]), additional_claims={"role": role}
+        )
         return (
             jsonify(
                 {
@@ -1,106 +1,203 @@
+import json
 import logging
+import queue
 import re
+import time
 
 from config import Config
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, jsonify, request, stream_with_context
 from flask_jwt_extended import get_jwt_identity, jwt_required
+from shared import RESYNC
+from utils.background_tasks import prefers_async, submit_task
 from utils.errors import _sanitize_error_message
+from utils.http_cache import make_etag, not_modified_response, with_validators
+from utils.identity import is_current_user_admin
 from utils.services import (
     get_airflow_client,
+    get_campaign_progress_listener,
     get_campaign_service,
     get_job_service,
-    get_user_service,
 )
 from utils.validators import _join_json_array_values, _safe_strip
 
 logger = logging.getLogger(__name__)
 campaigns_bp = Blueprint("campaigns", __name__, url_prefix="/api/campaigns")
 
+# Campaign event streams: keepalive comment interval, maximum stream lifetime
+# (clients reconnect) and the reconnect delay suggested to clients
+CAMPAIGN_EVENTS_KEEPALIVE_SECONDS = 15
+CAMPAIGN_EVENTS_MAX_SECONDS = 30 * 60
+CAMPAIGN_EVENTS_RETRY_MS = 3000
+
+
+def _parse_dag_run_id(dag_run_id_raw: str | None) -> str | None:
+    """Restore the "+HH:MM" offset of a dag_run_id whose "+" was decoded as a space."""
+    if not dag_run_id_raw:
+        return None
+    if " 00:00" in dag_run_id_raw or " 01:00" in dag_run_id_raw or " 02:00" in dag_run_id_raw:
+        return re.sub(r"(\d{2}:\d{2}:\d{2}\.\d+)\s+(\d{2}:\d{2})", r"\1+\2", dag_run_id_raw)
+    return dag_run_id_raw
+
+
+def _campaign_status_payload(service, campaign_id: int, dag_run_id: str | None) -> dict:
+    """Build the campaign status response from etl_run_metrics."""
+    status_data = service.get_campaign_status_from_metrics(
+        campaign_id=campaign_id, dag_run_id=dag_run_id
+    )
+
+    if status_data is None:
+        return {
+            "status": "pending",
+            "message": "No DAG runs yet",
+            "completed_tasks": [],
+            "failed_tasks": [],
+            "is_complete": False,
+            "jobs_available": False,
+            "dag_run_id": dag_run_id,
+        }
+
+    status = status_data["status"]
+    if status == "success":
+        message = "All tasks completed successfully"
+    elif status == "error":
+        failed_tasks = status_data.get("failed_tasks", [])
+        if failed_tasks:
+            message = f"Failed tasks: {', '.join(failed_tasks)}"
+        else:
+            message = "Pipeline error occurred"
+    elif status == "running":
+        completed = status_data.get("completed_tasks", [])
+        if completed:
+            message = f"In progress: {len(completed)} of 4 tasks completed"
+        else:
+            message = "Pipeline starting"
+    else:
+        message = "No tasks have run yet"
+
+    return {
+        "status": status,
+        "message": message,
+        "completed_tasks": status_data.get("completed_tasks", []),
+        "failed_tasks": status_data.get("failed_tasks", []),
+        "is_complete": status_data.get("is_complete", False),
+        "jobs_available": status_data.get("jobs_available", False),
+        "dag_run_id": status_data.get("dag_run_id") or dag_run_id,
+    }
+
+
+def _check_campaign_access(service, campaign_id: int):
+    """Return an error (response, status code) if the caller may not view the campaign."""
+    campaign = service.get_campaign_by_id(campaign_id)
+    if not campaign:
+        return jsonify({"error": f"Campaign {campaign_id} not found"}), 404
+    if campaign.get("user_id") != int(get_jwt_identity()) and not is_current_user_admin():
+        return jsonify({"error": "You do not have permission to view this campaign."}), 403
+    return None
+
 
 @campaigns_bp.route("/<int:campaign_id>/status", methods=["GET"])
 @jwt_required()
 def api_get_campaign_status(campaign_id: int):
-    """Get campaign status derived from etl_run_metrics (API)."""
-    try:
-        user_id = get_jwt_identity()
-        user_service = get_user_service()
-        user_data = user_service.get_user_by_id(int(user_id))
-        is_admin = user_data.get("role") == "admin" if user_data else False
+    """Get campaign status derived from etl_run_metrics (API).
 
+    Supports conditional GET: the ETag changes only when metrics are recorded
+    for the campaign, so unchanged polls get 304 Not Modified.
+    """
+    try:
         service = get_campaign_service()
-        campaign = service.get_campaign_by_id(campaign_id)
-        if not campaign:
-            return jsonify({"error": f"Campaign {campaign_id} not found"}), 404
-
-        if not is_admin and campaign.get("user_id") != int(user_id):
-            return jsonify({"error": "You do not have permission to view this campaign."}), 403
+        error = _check_campaign_access(service, campaign_id)
+        if error is not None:
+            return error
 
         # Get optional dag_run_id from query parameters
-        dag_run_id_raw = request.args.get("dag_run_id", None)
-        if dag_run_id_raw:
-            if (
-                " 00:00" in dag_run_id_raw
-                or " 01:00" in dag_run_id_raw
-                or " 02:00" in dag_run_id_raw
-            ):
-                dag_run_id = re.sub(
-                    r"(\d{2}:\d{2}:\d{2}\.\d+)\s+(\d{2}:\d{2})", r"\1+\2", dag_run_id_raw
-                )
-            else:
-                dag_run_id = dag_run_id_raw
-        else:
-            dag_run_id = None
+        dag_run_id = _parse_dag_run_id(request.args.get("dag_run_id", None))
 
-        status_data = service.get_campaign_status_from_metrics(
+        metrics_count, last_run_at = service.get_campaign_status_version(
             campaign_id=campaign_id, dag_run_id=dag_run_id
         )
+        etag = make_etag("campaign-status", campaign_id, dag_run_id, metrics_count, last_run_at)
+        not_modified = not_modified_response(etag, last_run_at)
+        if not_modified is not None:
+            return not_modified
 
-        if status_data is None:
-            return jsonify(
-                {
-                    "status": "pending",
-                    "message": "No DAG runs yet",
-                    "completed_tasks": [],
-                    "failed_tasks": [],
-                    "is_complete": False,
-                    "jobs_available": False,
-                    "dag_run_id": dag_run_id,
-                }
-            )
+        payload = _campaign_status_payload(service, campaign_id, dag_run_id)
+        return with_validators(jsonify(payload), etag, last_run_at)
+    except Exception as e:
+        logger.error(f"Error getting campaign status: {e}", exc_info=True)
+        return jsonify({"error": _sanitize_error_message(e)}), 500
 
-        status = status_data["status"]
-        if status == "success":
-            message = "All tasks completed successfully"
-        elif status == "error":
-            failed_tasks = status_data.get("failed_tasks", [])
-            if failed_tasks:
-                message = f"Failed tasks: {', '.join(failed_tasks)}"
-            else:
-                message = "Pipeline error occurred"
-        elif status == "running":
-            completed = status_data.get("completed_tasks", [])
-            if completed:
-                message = f"In progress: {len(completed)} of 4 tasks completed"
-            else:
-                message = "Pipeline starting"
-        else:
-            message = "No tasks have run yet"
 
-        return jsonify(
-            {
-                "status": status,
-                "message": message,
-                "completed_tasks": status_data.get("completed_tasks", []),
-                "failed_tasks": status_data.get("failed_tasks", []),
-                "is_complete": status_data.get("is_complete", False),
-                "jobs_available": status_data.get("jobs_available", False),
-                "dag_run_id": status_data.get("dag_run_id") or dag_run_id,
-            }
-        )
+def _sse_event(event: str, data: dict) -> str:
+    """Format a server-sent event."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+@campaigns_bp.route("/<int:campaign_id>/events", methods=["GET"])
+@jwt_required()
+def api_campaign_events(campaign_id: int):
+    """Stream campaign progress as server-sent events (API).
+
+    Replaces polling of the status endpoint while a DAG runs. Events:
+
+    - status: the same payload as GET /status, sent on connect, after every task
+      transition and whenever notifications may have been missed
+    - task: a task transition as recorded in etl_run_metrics (task_name,
+      task_status, dag_run_id, run_timestamp)
+
+    Transitions arrive through Postgres LISTEN/NOTIFY, within a second of the
+    task's metrics being recorded. Comment lines keep the connection alive and
+    the stream ends after CAMPAIGN_EVENTS_MAX_SECONDS, after which clients
+    reconnect. Authenticate with the Authorization header (EventSource cannot
+    send one; use fetch() and read the body stream).
+
+    Query params: dag_run_id (optional) restricts transitions and status to one run.
+    """
+    try:
+        service = get_campaign_service()
+        error = _check_campaign_access(service, campaign_id)
+        if error is not None:
+            return error
+        dag_run_id = _parse_dag_run_id(request.args.get("dag_run_id", None))
+        listener = get_campaign_progress_listener()
     except Exception as e:
-        logger.error(f"Error getting campaign status: {e}", exc_info=True)
+        logger.error(f"Error opening campaign event stream: {e}", exc_info=True)
         return jsonify({"error": _sanitize_error_message(e)}), 500
 
+    subscription = listener.subscribe()
+
+    def stream():
+        try:
+            # Subscribed before the first status read, so no transition falls in between
+            yield f"retry: {CAMPAIGN_EVENTS_RETRY_MS}\n\n"
+            yield _sse_event("status", _campaign_status_payload(service, campaign_id, dag_run_id))
+            deadline = time.monotonic() + CAMPAIGN_EVENTS_MAX_SECONDS
+            while (remaining := deadline - time.monotonic()) > 0:
+                try:
+                    payload = subscription.get(
+                        timeout=min(CAMPAIGN_EVENTS_KEEPALIVE_SECONDS, remaining)
+                    )
+                except queue.Empty:
+                    yield ": keepalive\n\n"
+                    continue
+                if payload is not RESYNC:
+                    task = json.loads(payload)
+                    if task.get("campaign_id") != campaign_id:
+                        continue
+                    if dag_run_id and task.get("dag_run_id") != dag_run_id:
+                        continue
+                    yield _sse_event("task", task)
+                yield _sse_event(
+                    "status", _campaign_status_payload(service, campaign_id, dag_run_id)
+                )
+        finally:
+            listener.unsubscribe(subscription)
+
+    response = Response(stream_with_context(stream()), mimetype="text/event-stream")
+    response.headers["Cache-Control"] = "no-cache"
+    # Stop reverse proxies (nginx) from buffering the stream
+    response.headers["X-Accel-Buffering"] = "no"
+    return response
+
 
 @campaigns_bp.route("", methods=["GET"])
 @jwt_required()
@@ -111,9 +208,7 @@ def api_list_campaigns():
         if user_id_str is None:
             return jsonify({"error": "Invalid user identity in token"}), 401
         user_id = int(user_id_str)
-        user_service = get_user_service()
-        user_data = user_service.get_user_by_id(user_id)
-        is_admin = user_data.get("role") == "admin" if user_data else False
+        is_admin = is_current_user_admin()
 
         service = get_campaign_service()
         job_service = get_job_service()
@@ -153,9 +248,7 @@ def api_get_campaign(campaign_id: int):
         if user_id_str is None:
             return jsonify({"error": "Invalid user identity in token"}), 401
         user_id = int(user_id_str)
-        user_service = get_user_service()
-        user_data = user_service.get_user_by_id(user_id)
-        is_admin = user_data.get("role") == "admin" if user_data else False
+        is_admin = is_current_user_admin()
 
         service = get_campaign_service()
         campaign = service.get_campaign_by_id(campaign_id)
@@ -279,9 +372,7 @@ def api_update_campaign(campaign_id: int):
         if user_id_str is None:
             return jsonify({"error": "Invalid user identity in token"}), 401
         user_id = int(user_id_str)
-        user_service = get_user_service()
-        user_data = user_service.get_user_by_id(user_id)
-        is_admin = user_data.get("role") == "admin" if user_data else False
+        is_admin = is_current_user_admin()
 
         service = get_campaign_service()
         campaign = service.get_campaign_by_id(campaign_id)
@@ -381,9 +472,7 @@ def api_toggle_active(campaign_id: int):
     """Toggle is_active status of a campaign via API."""
     try:
         user_id = get_jwt_identity()
-        user_service = get_user_service()
-        user_data = user_service.get_user_by_id(int(user_id))
-        is_admin = user_data.get("role") == "admin" if user_data else False
+        is_admin = is_current_user_admin()
 
         service = get_campaign_service()
         campaign = service.get_campaign_by_id(campaign_id)
@@ -418,9 +507,7 @@ def api_delete_campaign(campaign_id: int):
         if user_id_str is None:
             return jsonify({"error": "Invalid user identity in token"}), 401
         user_id = int(user_id_str)
-        user_service = get_user_service()
-        user_data = user_service.get_user_by_id(user_id)
-        is_admin = user_data.get("role") == "admin" if user_data else False
+        is_admin = is_current_user_admin()
 
         service = get_campaign_service()
         campaign = service.get_campaign_by_id(campaign_id)
@@ -442,15 +529,40 @@ def api_delete_campaign(campaign_id: int):
         return jsonify({"error": _sanitize_error_message(e)}), 500
 
 
+def _trigger_campaign_dag(airflow_client, campaign_id: int, force: bool) -> tuple[dict, int]:
+    """Call Airflow to start the campaign's DAG run (runs inline or as a background task).
+
+    Returns:
+        Response body and HTTP status code
+    """
+    try:
+        dag_run = airflow_client.trigger_dag(
+            dag_id=Config.DEFAULT_DAG_ID, conf={"campaign_id": campaign_id}
+        )
+        dag_run_id = dag_run.get("dag_run_id") if dag_run else None
+
+        return {
+            "success": True,
+            "message": "DAG triggered successfully" + (" (forced)" if force else ""),
+            "dag_run_id": dag_run_id,
+            "forced": force,
+        }, 200
+    except Exception as e:
+        logger.error(f"Error triggering DAG for campaign {campaign_id}: {e}", exc_info=True)
+        return {"success": False, "error": _sanitize_error_message(e)}, 500
+
+
 @campaigns_bp.route("/<int:campaign_id>/trigger-dag", methods=["POST"])
 @jwt_required()
 def trigger_campaign_dag(campaign_id: int):
-    """Trigger DAG run for a specific campaign."""
+    """Trigger DAG run for a specific campaign.
+
+    With ``Prefer: respond-async`` the Airflow call runs as a background task:
+    the response is 202 with a status_url to poll (see blueprints/tasks.py).
+    """
     try:
         user_id = get_jwt_identity()
-        user_service = get_user_service()
-        user_data = user_service.get_user_by_id(int(user_id))
-        is_admin = user_data.get("role") == "admin" if user_data else False
+        is_admin = is_current_user_admin()
 
         force = False
         if request.is_json and hasattr(request, "json") and request.json:
@@ -490,19 +602,14 @@ def trigger_campaign_dag(campaign_id: int):
         if not airflow_client:
             return jsonify({"success": False, "error": "Airflow API is not configured."}), 503
 
-        dag_run = airflow_client.trigger_dag(
-            dag_id=Config.DEFAULT_DAG_ID, conf={"campaign_id": campaign_id}
-        )
-        dag_run_id = dag_run.get("dag_run_id") if dag_run else None
-
-        return jsonify(
-            {
-                "success": True,
-                "message": "DAG triggered successfully" + (" (forced)" if force else ""),
-                "dag_run_id": dag_run_id,
-                "forced": force,
-            }
-        ), 200
+        if prefers_async():
+            return submit_task(
+                "campaign_dag",
+                int(user_id),
+                lambda: _trigger_campaign_dag(airflow_client, campaign_id, force),
+            )
+        body, status = _trigger_campaign_dag(airflow_client, campaign_id, force)
+        return jsonify(body), status
     except Exception as e:
         logger.error(f"Error triggering DAG for campaign {campaign_id}: {e}", exc_info=True)
         return jsonify({"success": False, "error": _sanitize_error_message(e)}), 500
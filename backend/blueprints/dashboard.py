@@ -1,10 +1,13 @@
 import logging
+from datetime import date
 
 from config import get_airflow_ui_url
 from flask import Blueprint, jsonify
-from flask_jwt_extended import get_jwt_identity, jwt_required
+from flask_jwt_extended import jwt_required
 from utils.errors import _sanitize_error_message
-from utils.services import get_campaign_service, get_job_service, get_user_service
+from utils.http_cache import make_etag, not_modified_response, with_validators
+from utils.identity import get_current_user_id, is_current_user_admin
+from utils.services import get_campaign_service, get_job_service
 
 logger = logging.getLogger(__name__)
 dashboard_bp = Blueprint("dashboard", __name__, url_prefix="/api/dashboard")
@@ -13,19 +16,26 @@ dashboard_bp = Blueprint("dashboard", __name__, url_prefix="/api/dashboard")
 @dashboard_bp.route("", methods=["GET"])
 @jwt_required()
 def api_dashboard():
-    """Get dashboard statistics."""
+    """Get dashboard statistics.
+
+    Supports conditional GET: the ETag is derived from the data version of the
+    user (all users for admins) and the current date (the activity window), so
+    unchanged polls get 304 Not Modified.
+    """
     try:
-        user_id = get_jwt_identity()
+        user_id = get_current_user_id()
         campaign_service = get_campaign_service()
         job_service = get_job_service()
-        user_service = get_user_service()
-
-        # Get user info to check if admin
-        user = user_service.get_user_by_id(user_id)
-        is_admin = user.get("is_admin", False) if user else False
 
         # If admin, show all data, otherwise only user's data
-        target_user_id = None if is_admin else user_id
+        target_user_id = None if is_current_user_admin() else user_id
+
+        version, users, last_modified = campaign_service.get_data_version(target_user_id)
+        airflow_ui_url = get_airflow_ui_url()
+        etag = make_etag("dashboard", target_user_id, version, users, date.today(), airflow_ui_url)
+        not_modified = not_modified_response(etag, last_modified)
+        if not_modified is not None:
+            return not_modified
 
         stats_raw = campaign_service.get_dashboard_stats(user_id=target_user_id)
         recent_jobs = job_service.get_recent_jobs(user_id=target_user_id, limit=5)
@@ -38,10 +48,10 @@ def api_dashboard():
             "success_rate": stats_raw.get("success_rate", 0),
             "recent_jobs": recent_jobs,
             "activity_data": stats_raw.get("activity_data", []),
-            "airflow_ui_url": get_airflow_ui_url(),
+            "airflow_ui_url": airflow_ui_url,
         }
 
-        return jsonify(formatted_stats), 200
+        return with_validators(jsonify(formatted_stats), etag, last_modified), 200
 
     except Exception as e:
         logger.error(f"Dashboard error: {str(e)}")
@@ -4,8 +4,12 @@ from datetime import UTC, datetime
 from documents import CoverLetterGenerationError
 from flask import Blueprint, Response, jsonify, request
 from flask_jwt_extended import get_jwt_identity, jwt_required
+from jobs import encode_jobs_cursor
+from utils.background_tasks import prefers_async, submit_task
 from utils.decorators import rate_limit
 from utils.errors import _sanitize_error_message
+from utils.http_cache import make_etag, not_modified_response, with_validators
+from utils.identity import is_current_user_admin
 from utils.services import (
     get_campaign_service,
     get_cover_letter_generator,
@@ -20,43 +24,85 @@ from utils.services import (
 logger = logging.getLogger(__name__)
 jobs_bp = Blueprint("jobs", __name__, url_prefix="/api/jobs")
 
+# Largest page the jobs list returns when paginated (?limit=)
+MAX_JOBS_PAGE_SIZE = 500
+
 
 @jobs_bp.route("", methods=["GET"])
 @jwt_required()
 def api_list_jobs():
-    """Jobs list API endpoint returning JSON list."""
+    """Jobs list API endpoint returning JSON list.
+
+    Query params: campaign_id (optional), limit (optional page size, up to
+    MAX_JOBS_PAGE_SIZE) and cursor (next_cursor of the previous page). Without
+    limit all jobs are returned. next_cursor is null on the last page.
+    shape=columns returns the jobs as {"columns": [...], "rows": [[...]]}
+    instead of a list of objects, which is smaller and faster for large lists.
+
+    Supports conditional GET: the ETag is derived from the data versions of the
+    caller (statuses, notes) and of the campaign owner (rankings), so unchanged
+    polls get 304 Not Modified without running the jobs query.
+    """
     try:
         user_id_str = get_jwt_identity()
         if user_id_str is None:
             return jsonify({"error": "Invalid user identity in token"}), 401
         user_id = int(user_id_str)
-        user_service = get_job_service()  # Wait, get_user_service was used in app.py
-        # I'll use the correct service
-        from utils.services import get_user_service
-
-        user_service = get_user_service()
-        user_data = user_service.get_user_by_id(user_id)
-        is_admin = user_data.get("role") == "admin" if user_data else False
-
         campaign_id = request.args.get("campaign_id", type=int)
+        limit = request.args.get("limit", type=int)
+        cursor = request.args.get("cursor") or None
+        shape = request.args.get("shape", "objects")
+        if limit is not None and not 1 <= limit <= MAX_JOBS_PAGE_SIZE:
+            return jsonify({"error": f"limit must be between 1 and {MAX_JOBS_PAGE_SIZE}"}), 400
+        if shape not in ("objects", "columns"):
+            return jsonify({"error": "shape must be 'objects' or 'columns'"}), 400
+        # Fetch one extra job to know whether another page follows
+        fetch_limit = limit + 1 if limit else None
         job_service = get_job_service()
+        campaign_service = get_campaign_service()
+        data_versions = [campaign_service.get_data_version(user_id)]
 
         if campaign_id:
-            campaign_service = get_campaign_service()
             campaign = campaign_service.get_campaign_by_id(campaign_id)
             if not campaign:
                 return jsonify({"error": f"Campaign {campaign_id} not found"}), 404
 
-            if not is_admin and campaign.get("user_id") != user_id:
+            if campaign.get("user_id") != user_id and not is_current_user_admin():
                 return jsonify(
                     {"error": "You do not have permission to view jobs for this campaign"}
                 ), 403
+            if campaign.get("user_id") != user_id:
+                data_versions.append(campaign_service.get_data_version(campaign.get("user_id")))
+
+        etag = make_etag("jobs", user_id, campaign_id, limit, cursor, shape, data_versions)
+        last_modified = max((v[2] for v in data_versions if v[2]), default=None)
+        not_modified = not_modified_response(etag, last_modified)
+        if not_modified is not None:
+            return not_modified
 
-            jobs = job_service.get_jobs_for_campaign(campaign_id=campaign_id, user_id=user_id)
+        if campaign_id:
+            jobs = job_service.get_jobs_for_campaign(
+                campaign_id=campaign_id,
+                user_id=user_id,
+                limit=fetch_limit,
+                cursor=cursor,
+                as_rows=True,
+            )
         else:
-            jobs = job_service.get_jobs_for_user(user_id=user_id)
+            jobs = job_service.get_jobs_for_user(
+                user_id=user_id, limit=fetch_limit, cursor=cursor, as_rows=True
+            )
 
-        return jsonify({"jobs": jobs or []}), 200
+        # Rows are serialized straight from the query's tuples
+        next_cursor = None
+        if limit and len(jobs) > limit:
+            jobs = jobs[:limit]
+            next_cursor = encode_jobs_cursor(jobs[-1])
+        payload = jobs.as_table() if shape == "columns" else jobs
+        response = jsonify({"jobs": payload, "next_cursor": next_cursor})
+        return with_validators(response, etag, last_modified), 200
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
         logger.error(f"Error fetching jobs: {e}", exc_info=True)
         return jsonify({"error": _sanitize_error_message(e)}), 500
@@ -348,11 +394,57 @@ def api_create_job_cover_letter(job_id: str):
         return jsonify({"error": _sanitize_error_message(e)}), 500
 
 
+def _generate_cover_letter(
+    job_id: str, user_id: str, resume_id: int, user_comments: str | None
+) -> tuple[dict, int]:
+    """Generate a cover letter and link it to the job (runs inline or as a background task).
+
+    Returns:
+        Response body and HTTP status code
+    """
+    try:
+        generator = get_cover_letter_generator()
+        cover_letter = generator.generate_cover_letter(
+            resume_id=resume_id,
+            jsearch_job_id=job_id,
+            user_id=user_id,
+            user_comments=user_comments,
+        )
+
+        document_service = get_document_service()
+        document_service.link_documents_to_job(
+            jsearch_job_id=job_id,
+            user_id=user_id,
+            cover_letter_id=cover_letter["cover_letter_id"],
+        )
+
+        return {
+            "cover_letter_text": cover_letter["cover_letter_text"],
+            "cover_letter_id": cover_letter["cover_letter_id"],
+            "cover_letter_name": cover_letter["cover_letter_name"],
+        }, 200
+
+    except CoverLetterGenerationError as e:
+        logger.error(f"Cover letter generation failed: {e}", exc_info=True)
+        return {
+            "error": "Failed to generate cover letter. Please check your resume and try again."
+        }, 500
+    except ValueError as e:
+        return {"error": str(e)}, 400
+    except Exception as e:
+        logger.error(f"Unexpected error generating cover letter: {e}", exc_info=True)
+        return {"error": _sanitize_error_message(e)}, 500
+
+
 @jobs_bp.route("/<job_id>/cover-letter/generate", methods=["POST"])
 @jwt_required()
 @rate_limit(max_calls=5, window_seconds=60)
 def generate_cover_letter(job_id: str):
-    """Generate a cover letter using AI."""
+    """Generate a cover letter using AI.
+
+    With ``Prefer: respond-async`` the generation runs as a background task:
+    the response is 202 with a status_url to poll (see blueprints/tasks.py).
+    """
     try:
         if not request.is_json:
             return jsonify({"error": "Request must be JSON"}), 400
@@ -369,37 +461,15 @@ def generate_cover_letter(job_id: str):
         except (ValueError, TypeError):
             return jsonify({"error": "resume_id must be an integer"}), 400
 
-        generator = get_cover_letter_generator()
         user_id = get_jwt_identity()
-        cover_letter = generator.generate_cover_letter(
-            resume_id=resume_id,
-            jsearch_job_id=job_id,
-            user_id=user_id,
-            user_comments=user_comments,
-        )
-
-        document_service = get_document_service()
-        document_service.link_documents_to_job(
-            jsearch_job_id=job_id,
-            user_id=user_id,
-            cover_letter_id=cover_letter["cover_letter_id"],
-        )
-
-        return jsonify(
-            {
-                "cover_letter_text": cover_letter["cover_letter_text"],
-                "cover_letter_id": cover_letter["cover_letter_id"],
-                "cover_letter_name": cover_letter["cover_letter_name"],
-            }
-        )
-
-    except CoverLetterGenerationError as e:
-        logger.error(f"Cover letter generation failed: {e}", exc_info=True)
-        return jsonify(
-            {"error": "Failed to generate cover letter. Please check your resume and try again."}
-        ), 500
-    except ValueError as e:
-        return jsonify({"error": str(e)}), 400
+        if prefers_async():
+            return submit_task(
+                "cover_letter",
+                int(user_id),
+                lambda: _generate_cover_letter(job_id, user_id, resume_id, user_comments),
+            )
+        body, status = _generate_cover_letter(job_id, user_id, resume_id, user_comments)
+        return jsonify(body), status
     except Exception as e:
         logger.error(f"Unexpected error generating cover letter: {e}", exc_info=True)
         return jsonify({"error": _sanitize_error_message(e)}), 500
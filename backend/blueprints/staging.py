@@ -5,8 +5,9 @@ from datetime import datetime
 from typing import Any
 
 from flask import Blueprint, jsonify, request
-from flask_jwt_extended import get_jwt_identity, jwt_required
-from utils.services import get_staging_service, get_user_service
+from flask_jwt_extended import jwt_required
+from utils.identity import is_current_user_admin
+from utils.services import get_staging_service
 
 logger = logging.getLogger(__name__)
 staging_bp = Blueprint("staging", __name__, url_prefix="/api/staging")
@@ -14,10 +15,7 @@ staging_bp = Blueprint("staging", __name__, url_prefix="/api/staging")
 
 def _require_admin():
     """Ensure current user is admin. Returns (None, None) if ok, else (response, status_code)."""
-    user_id = get_jwt_identity()
-    user_service = get_user_service()
-    user_data = user_service.get_user_by_id(int(user_id))
-    if not user_data or user_data.get("role") != "admin":
+    if not is_current_user_admin():
         return jsonify({"error": "Admin access required"}), 403
     return None, None
 
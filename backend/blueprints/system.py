@@ -3,7 +3,9 @@ import os
 
 from config import Config
 from flask import Blueprint, jsonify
-from shared import PostgreSQLDatabase
+from flask_jwt_extended import jwt_required
+from shared import PostgreSQLDatabase, get_pool_stats
+from utils.identity import is_current_user_admin
 from utils.services import build_db_connection_string, get_airflow_client
 
 logger = logging.getLogger(__name__)
@@ -59,6 +61,15 @@ def api_health():
     return jsonify(response)
 
 
+@system_bp.route("/system/db-pool")
+@jwt_required()
+def api_db_pool_stats():
+    """Connection pool metrics for this process (admin only)."""
+    if not is_current_user_admin():
+        return jsonify({"error": "Admin access required"}), 403
+    return jsonify({"pools": get_pool_stats()}), 200
+
+
 @system_bp.route("/api/trigger-all-dags", methods=["POST"])
 def trigger_all_dags():
     """Trigger DAG run for all active campaigns."""
@@ -0,0 +1,28 @@
+import logging
+
+from flask import Blueprint, jsonify
+from flask_jwt_extended import jwt_required
+from utils.background_tasks import TASK_POLL_SECONDS, get_task_runner
+from utils.identity import get_current_user_id
+
+logger = logging.getLogger(__name__)
+tasks_bp = Blueprint("tasks", __name__, url_prefix="/api/tasks")
+
+
+@tasks_bp.route("/<task_id>", methods=["GET"])
+@jwt_required()
+def api_get_task(task_id: str):
+    """Status of a background task submitted with ``Prefer: respond-async``.
+
+    While the task is queued or running, status is "queued"/"running" and a
+    Retry-After header suggests when to poll again. Once finished, status is
+    "succeeded" or "failed", and result/status_code hold the body and HTTP
+    status the endpoint would have returned synchronously.
+    """
+    task = get_task_runner().get(task_id, get_current_user_id())
+    if task is None:
+        return jsonify({"error": "Task not found"}), 404
+    response = jsonify(task.to_dict())
+    if task.finished_at is None:
+        response.headers["Retry-After"] = str(TASK_POLL_SECONDS)
+    return response, 200
@@ -37,6 +37,10 @@ class Config:
         else ["http://localhost:5173", "http://localhost:3000"]
     )
 
+    # Background tasks for slow external calls (see utils/background_tasks.py)
+    BACKGROUND_TASK_WORKERS = int(os.getenv("BACKGROUND_TASK_WORKERS", "4"))
+    BACKGROUND_TASK_MAX_PENDING = int(os.getenv("BACKGROUND_TASK_MAX_PENDING", "32"))
+
     # Constants
     DEFAULT_DAG_ID = "jobs_etl_daily"
 
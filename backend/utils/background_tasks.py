@@ -0,0 +1,203 @@
+"""Background execution for slow API calls (OpenAI generation, Airflow triggers).
+
+Endpoints that wait on an external service can run that call on a bounded
+thread pool instead of holding a request worker for its whole duration. A
+client opts in per request with the RFC 7240 header ``Prefer: respond-async``;
+the endpoint validates the request, submits the slow part and answers
+202 Accepted with the task's status URL, which the client polls via
+GET /api/tasks/<task_id> until the task has finished:
+
+    if prefers_async():
+        return submit_task("cover_letter", user_id, work)
+    body, status = work()
+    return jsonify(body), status
+
+Task functions return the (body, status code) pair the synchronous endpoint
+would have answered with, so both modes share one implementation and clients
+see the same payloads. At most Config.BACKGROUND_TASK_WORKERS tasks run at
+once, and submissions beyond Config.BACKGROUND_TASK_MAX_PENDING queued or
+running tasks are refused with 503.
+
+Tasks live in this process's memory (the backend runs a single process), are
+visible only to the user who submitted them, and are forgotten
+TASK_RESULT_TTL_SECONDS after they finish.
+"""
+
+import logging
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from config import Config
+from flask import Response, jsonify, request, url_for
+
+from .errors import _sanitize_error_message
+
+logger = logging.getLogger(__name__)
+
+# Seconds a finished task's result stays available to the status endpoint
+TASK_RESULT_TTL_SECONDS = 900
+
+# Poll interval suggested to clients (Retry-After on 202 and running tasks)
+TASK_POLL_SECONDS = 2
+
+TaskResult = tuple[dict[str, Any], int]
+
+
+class TaskQueueFullError(Exception):
+    """Raised when too many background tasks are already queued or running."""
+
+
+@dataclass
+class BackgroundTask:
+    """State of one submitted task."""
+
+    task_id: str
+    kind: str
+    user_id: int
+    status: str = "queued"  # queued, running, succeeded, failed
+    status_code: int | None = None
+    result: dict[str, Any] | None = None
+    created_at: float = field(default_factory=time.time)
+    finished_at: float | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Status payload returned by the task status endpoint."""
+        return {
+            "task_id": self.task_id,
+            "kind": self.kind,
+            "status": self.status,
+            "status_code": self.status_code,
+            "result": self.result,
+        }
+
+
+class BackgroundTaskRunner:
+    """Bounded thread pool plus a registry of submitted tasks."""
+
+    def __init__(self, max_workers: int, max_pending: int):
+        """
+        Initialize the runner.
+
+        Args:
+            max_workers: Tasks executed concurrently
+            max_pending: Queued plus running tasks accepted before refusing more
+        """
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="background-task"
+        )
+        self._max_pending = max_pending
+        self._tasks: dict[str, BackgroundTask] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, kind: str, user_id: int, func: Callable[[], TaskResult]) -> BackgroundTask:
+        """
+        Queue a task.
+
+        Args:
+            kind: Short task type shown to clients (e.g. "cover_letter")
+            user_id: Submitting user (only they can read the task)
+            func: Work returning (response body, HTTP status code)
+
+        Returns:
+            The queued task
+
+        Raises:
+            TaskQueueFullError: If max_pending tasks are already queued or running
+        """
+        with self._lock:
+            self._prune()
+            pending = sum(1 for t in self._tasks.values() if t.finished_at is None)
+            if pending >= self._max_pending:
+                raise TaskQueueFullError(f"{pending} background tasks already pending")
+            task = BackgroundTask(task_id=uuid.uuid4().hex, kind=kind, user_id=user_id)
+            self._tasks[task.task_id] = task
+        self._executor.submit(self._run, task, func)
+        return task
+
+    def get(self, task_id: str, user_id: int) -> BackgroundTask | None:
+        """Get a task by ID if it belongs to the user."""
+        with self._lock:
+            task = self._tasks.get(task_id)
+        if task is None or task.user_id != user_id:
+            return None
+        return task
+
+    def _run(self, task: BackgroundTask, func: Callable[[], TaskResult]) -> None:
+        task.status = "running"
+        try:
+            result, status_code = func()
+        except Exception as e:
+            logger.error(f"Background task {task.kind} {task.task_id} failed: {e}", exc_info=True)
+            result, status_code = {"error": _sanitize_error_message(e)}, 500
+        task.result = result
+        task.status_code = status_code
+        task.finished_at = time.time()
+        task.status = "succeeded" if status_code < 400 else "failed"
+
+    def _prune(self) -> None:
+        """Drop finished tasks older than the TTL (caller holds the lock)."""
+        cutoff = time.time() - TASK_RESULT_TTL_SECONDS
+        expired = [
+            task_id
+            for task_id, task in self._tasks.items()
+            if task.finished_at is not None and task.finished_at < cutoff
+        ]
+        for task_id in expired:
+            del self._tasks[task_id]
+
+
+_runner: BackgroundTaskRunner | None = None
+_runner_lock = threading.Lock()
+
+
+def get_task_runner() -> BackgroundTaskRunner:
+    """Get the process-wide task runner, creating it on first use."""
+    global _runner
+    if _runner is None:
+        with _runner_lock:
+            if _runner is None:
+                _runner = BackgroundTaskRunner(
+                    max_workers=Config.BACKGROUND_TASK_WORKERS,
+                    max_pending=Config.BACKGROUND_TASK_MAX_PENDING,
+                )
+    return _runner
+
+
+def prefers_async() -> bool:
+    """Check whether the client sent ``Prefer: respond-async``."""
+    prefer = request.headers.get("Prefer", "")
+    return any(
+        token.split("=")[0].strip().lower() == "respond-async" for token in prefer.split(",")
+    )
+
+
+def submit_task(kind: str, user_id: int, func: Callable[[], TaskResult]) -> tuple[Response, int]:
+    """
+    Run func in the background and answer 202 Accepted (or 503 if the queue is full).
+
+    Args:
+        kind: Short task type shown to clients
+        user_id: Submitting user
+        func: Work returning (response body, HTTP status code)
+
+    Returns:
+        Flask response tuple for the endpoint to return
+    """
+    try:
+        task = get_task_runner().submit(kind, user_id, func)
+    except TaskQueueFullError as e:
+        logger.warning(f"Refusing background task {kind} for user {user_id}: {e}")
+        response = jsonify({"error": "Server is busy. Please try again shortly."})
+        response.headers["Retry-After"] = str(TASK_POLL_SECONDS * 5)
+        return response, 503
+    status_url = url_for("tasks.api_get_task", task_id=task.task_id)
+    response = jsonify({**task.to_dict(), "status_url": status_url})
+    response.headers["Location"] = status_url
+    response.headers["Retry-After"] = str(TASK_POLL_SECONDS)
+    response.headers["Preference-Applied"] = "respond-async"
+    return response, 202
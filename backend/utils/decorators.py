@@ -5,7 +5,7 @@ from functools import wraps
 from flask import jsonify
 from flask_jwt_extended import get_jwt_identity, jwt_required
 
-from .services import get_user_service
+from .identity import is_current_user_admin
 
 logger = logging.getLogger(__name__)
 
@@ -74,11 +74,7 @@ def admin_required(f):
     @wraps(f)
     @jwt_required()
     def decorated_function(*args, **kwargs):
-        user_id = get_jwt_identity()
-        user_service = get_user_service()
-        user = user_service.get_user_by_id(user_id)
-
-        if not user or not user.get("is_admin"):
+        if not is_current_user_admin():
             return jsonify({"error": "Admin access required"}), 403
         return f(*args, **kwargs)
 
@@ -0,0 +1,85 @@
+"""Conditional GET support (ETag / Last-Modified) for polled API endpoints.
+
+Handlers compute cheap validators (change counters, latest timestamps) before
+building their payload and return early with 304 Not Modified when the client's
+If-None-Match / If-Modified-Since still match:
+
+    etag = make_etag("dashboard", user_id, version)
+    not_modified = not_modified_response(etag, last_modified)
+    if not_modified is not None:
+        return not_modified
+    ...
+    return with_validators(jsonify(payload), etag, last_modified), 200
+
+Responses are marked private and must be revalidated on every use, so browsers
+keep a copy and send the validators back on their next poll.
+"""
+
+import hashlib
+from datetime import UTC, datetime
+from typing import Any
+
+from flask import Response, request
+from werkzeug.http import is_resource_modified
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Build an ETag value from the parts that identify a representation.
+
+    Args:
+        *parts: Endpoint name, caller, query arguments and data validators
+
+    Returns:
+        Opaque hex digest (quoting and the weak prefix are added by the response)
+    """
+    return hashlib.sha1(repr(parts).encode(), usedforsecurity=False).hexdigest()
+
+
+def _as_utc(last_modified: datetime | None) -> datetime | None:
+    """Interpret naive database timestamps as UTC (Last-Modified has second precision)."""
+    if last_modified is None or last_modified.tzinfo is not None:
+        return last_modified
+    return last_modified.replace(tzinfo=UTC)
+
+
+def with_validators(
+    response: Response, etag: str, last_modified: datetime | None = None
+) -> Response:
+    """
+    Add ETag, Last-Modified and revalidation headers to a response.
+
+    Args:
+        response: Response to decorate
+        etag: Value from make_etag()
+        last_modified: Time of the last change to the underlying data
+
+    Returns:
+        The same response
+    """
+    response.set_etag(etag, weak=True)
+    if last_modified is not None:
+        response.last_modified = _as_utc(last_modified)
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    response.vary.add("Authorization")
+    return response
+
+
+def not_modified_response(etag: str, last_modified: datetime | None = None) -> Response | None:
+    """
+    Answer a conditional GET whose validators still match.
+
+    If-None-Match takes precedence over If-Modified-Since, so clients that send
+    the ETag never miss a change made within the same second.
+
+    Args:
+        etag: Value from make_etag()
+        last_modified: Time of the last change to the underlying data
+
+    Returns:
+        A 304 response carrying the validators, or None if the client's copy is stale
+    """
+    if is_resource_modified(request.environ, etag=etag, last_modified=_as_utc(last_modified)):
+        return None
+    return with_validators(Response(status=304), etag, last_modified)
@@ -0,0 +1,61 @@
+"""Current-user helpers for JWT-protected routes.
+
+The user record is looked up at most once per request and cached on flask.g,
+so handlers and helpers that need the caller's role don't each query the users
+table. Access tokens carry the user's role as a "role" claim (set at login):
+a non-admin claim answers the admin check without a database read, while an
+admin claim is always confirmed against the users table so a demoted admin
+loses access immediately instead of when the token expires.
+"""
+
+from typing import Any
+
+from flask import g
+from flask_jwt_extended import get_jwt, get_jwt_identity
+
+from .services import get_user_service
+
+# Sentinel so a missing user (None) is cached too
+_NOT_LOADED = object()
+
+
+def get_current_user_id() -> int:
+    """
+    Get the authenticated user's ID from the JWT identity.
+
+    Returns:
+        User ID
+    """
+    return int(get_jwt_identity())
+
+
+def get_current_user() -> dict[str, Any] | None:
+    """
+    Get the authenticated user's record, loading it once per request.
+
+    Returns:
+        User dictionary, or None if the user no longer exists
+    """
+    user = g.get("current_user", _NOT_LOADED)
+    if user is _NOT_LOADED:
+        user = get_user_service().get_user_by_id(get_current_user_id())
+        g.current_user = user
+    return user
+
+
+def is_current_user_admin() -> bool:
+    """
+    Check whether the authenticated user is an admin.
+
+    Tokens whose role claim is not "admin" are rejected without a database
+    read. Admin claims (and tokens issued before the claim existed) are
+    verified against the user's current role.
+
+    Returns:
+        True if the user exists and has the admin role
+    """
+    role = get_jwt().get("role")
+    if role is not None and role != "admin":
+        return False
+    user = get_current_user()
+    return bool(user) and user.get("role") == "admin"
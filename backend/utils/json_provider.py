@@ -0,0 +1,79 @@
+"""Flask JSON provider backed by orjson.
+
+Large list responses (jobs, rankings) are dominated by JSON encoding with the
+standard library. When orjson is installed, responses are encoded with it,
+with datetimes written natively as ISO 8601 (naive database timestamps as
+UTC) and Decimals as numbers. RowSet results from the service layer are
+written as lists of objects without the handler converting them first.
+
+Without orjson the provider falls back to Flask's stdlib encoder, applying
+the same Decimal and RowSet handling so the response shape doesn't change.
+Request parsing (loads) is unchanged.
+"""
+
+from decimal import Decimal
+from typing import Any
+
+from flask.json.provider import DefaultJSONProvider
+from shared import RowSet
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+_ORJSON_OPTIONS = 0 if orjson is None else orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+
+def _default(o: Any) -> Any:
+    """Serialize types neither encoder handles natively."""
+    if isinstance(o, Decimal):
+        return float(o)
+    if isinstance(o, RowSet):
+        return o.to_dicts()
+    return DefaultJSONProvider.default(o)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that encodes responses with orjson when it is available."""
+
+    default = staticmethod(_default)  # type: ignore[assignment]
+    # Key order carries no meaning for API clients, and sorting costs time
+    sort_keys = False
+
+    def _orjson_options(self, indent: bool) -> int:
+        options = _ORJSON_OPTIONS
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        if indent:
+            options |= orjson.OPT_INDENT_2
+        return options
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """
+        Serialize data as a JSON string.
+
+        Calls with stdlib-only arguments (e.g. cls, ensure_ascii) use the
+        standard library encoder.
+
+        Args:
+            obj: Data to serialize
+            **kwargs: Passed to json.dumps on the fallback path
+
+        Returns:
+            JSON text
+        """
+        if orjson is None or set(kwargs) - {"indent", "separators"}:
+            return super().dumps(obj, **kwargs)
+        options = self._orjson_options(bool(kwargs.get("indent")))
+        return orjson.dumps(obj, default=self.default, option=options).decode()
+
+    def response(self, *args: Any, **kwargs: Any) -> Any:
+        """Serialize arguments as a JSON response (see DefaultJSONProvider.response)."""
+        if orjson is None:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        options = self._orjson_options(indent) | orjson.OPT_APPEND_NEWLINE
+        body = orjson.dumps(obj, default=self.default, option=options)
+        return self._app.response_class(body, mimetype=self.mimetype)
@@ -1,6 +1,18 @@
+"""Service factories for the backend.
+
+Services and their database wrapper are application-scoped: each factory builds
+its object once per connection string (and configuration) and returns the same
+instance afterwards. The services hold no per-request state, and
+PostgreSQLDatabase borrows a pooled connection per get_cursor() call, so the
+instances are shared safely across request threads.
+"""
+
 import os
 import sys
+import threading
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any, TypeVar
 
 # Add services to path
 if Path("/app").exists():
@@ -20,9 +32,15 @@ from documents import (
     ResumeService,
 )
 from jobs import JobNoteService, JobService, JobStatusService
-from shared import PostgreSQLDatabase
+from shared import CAMPAIGN_PROGRESS_CHANNEL, NotificationListener, PostgreSQLDatabase
 from staging_management import StagingManagementService
 
+T = TypeVar("T")
+
+# Application-scoped instances: (factory name, configuration...) -> instance
+_instances: dict[tuple, Any] = {}
+_instances_lock = threading.Lock()
+
 
 def build_db_connection_string() -> str:
     """
@@ -52,16 +70,71 @@ def build_db_connection_string() -> str:
     return conn_str
 
 
+def _app_scoped(key: tuple, factory: Callable[[], T]) -> T:
+    """Return the instance cached under key, building it with factory on first use."""
+    instance = _instances.get(key)
+    if instance is None:
+        with _instances_lock:
+            instance = _instances.get(key)
+            if instance is None:
+                instance = factory()
+                _instances[key] = instance
+    return instance
+
+
+def reset_services() -> None:
+    """Drop all cached service instances (e.g. after changing configuration in tests)."""
+    with _instances_lock:
+        _instances.clear()
+
+
+def get_database() -> PostgreSQLDatabase:
+    """
+    Get the PostgreSQLDatabase for the configured connection string.
+
+    Returns:
+        Application-scoped PostgreSQLDatabase instance
+    """
+    db_conn_str = build_db_connection_string()
+    return _app_scoped(
+        ("database", db_conn_str), lambda: PostgreSQLDatabase(connection_string=db_conn_str)
+    )
+
+
+def get_campaign_progress_listener() -> NotificationListener:
+    """
+    Get the listener for campaign progress notifications (see MetricsRecorder).
+
+    Returns:
+        Application-scoped NotificationListener; it holds one dedicated database
+        connection once the first client subscribes
+    """
+    db_conn_str = build_db_connection_string()
+    return _app_scoped(
+        ("campaign_progress_listener", db_conn_str),
+        lambda: NotificationListener(db_conn_str, CAMPAIGN_PROGRESS_CHANNEL),
+    )
+
+
+def _upload_settings() -> tuple[str, int, tuple[str, ...]]:
+    """Upload directory, maximum file size and allowed extensions from the environment."""
+    upload_base_dir = os.getenv("UPLOAD_BASE_DIR", "uploads")
+    max_file_size = int(os.getenv("UPLOAD_MAX_SIZE", "5242880"))
+    allowed_extensions = tuple(os.getenv("UPLOAD_ALLOWED_EXTENSIONS", "pdf,docx").split(","))
+    return upload_base_dir, max_file_size, allowed_extensions
+
+
 def get_user_service() -> UserService:
     """
     Get UserService instance with database connection.
 
     Returns:
-        UserService instance
+        Application-scoped UserService instance
     """
-    db_conn_str = build_db_connection_string()
-    database = PostgreSQLDatabase(connection_string=db_conn_str)
-    return UserService(database=database)
+    database = get_database()
+    return _app_scoped(
+        ("user_service", database.connection_string), lambda: UserService(database=database)
+    )
 
 
 def get_auth_service() -> AuthService:
@@ -69,10 +142,13 @@ def get_auth_service() -> AuthService:
     Get AuthService instance with database connection.
 
     Returns:
-        AuthService instance
+        Application-scoped AuthService instance
     """
     user_service = get_user_service()
-    return AuthService(user_service=user_service)
+    return _app_scoped(
+        ("auth_service", user_service.db.connection_string),
+        lambda: AuthService(user_service=user_service),
+    )
 
 
 def get_job_service() -> JobService:
@@ -80,11 +156,12 @@ def get_job_service() -> JobService:
     Get JobService instance with database connection.
 
     Returns:
-        JobService instance
+        Application-scoped JobService instance
     """
-    db_conn_str = build_db_connection_string()
-    database = PostgreSQLDatabase(connection_string=db_conn_str)
-    return JobService(database=database)
+    database = get_database()
+    return _app_scoped(
+        ("job_service", database.connection_string), lambda: JobService(database=database)
+    )
 
 
 def get_job_note_service() -> JobNoteService:
@@ -92,11 +169,12 @@ def get_job_note_service() -> JobNoteService:
     Get JobNoteService instance with database connection.
 
     Returns:
-        JobNoteService instance
+        Application-scoped JobNoteService instance
     """
-    db_conn_str = build_db_connection_string()
-    database = PostgreSQLDatabase(connection_string=db_conn_str)
-    return JobNoteService(database=database)
+    database = get_database()
+    return _app_scoped(
+        ("job_note_service", database.connection_string), lambda: JobNoteService(database=database)
+    )
 
 
 def get_job_status_service() -> JobStatusService:
@@ -104,11 +182,13 @@ def get_job_status_service() -> JobStatusService:
     Get JobStatusService instance with database connection.
 
     Returns:
-        JobStatusService instance
+        Application-scoped JobStatusService instance
     """
-    db_conn_str = build_db_connection_string()
-    database = PostgreSQLDatabase(connection_string=db_conn_str)
-    return JobStatusService(database=database)
+    database = get_database()
+    return _app_scoped(
+        ("job_status_service", database.connection_string),
+        lambda: JobStatusService(database=database),
+    )
 
 
 def get_resume_service() -> ResumeService:
@@ -116,19 +196,19 @@ def get_resume_service() -> ResumeService:
     Get ResumeService instance with database connection and storage.
 
     Returns:
-        ResumeService instance
+        Application-scoped ResumeService instance
     """
-    db_conn_str = build_db_connection_string()
-    database = PostgreSQLDatabase(connection_string=db_conn_str)
-    upload_base_dir = os.getenv("UPLOAD_BASE_DIR", "uploads")
-    max_file_size = int(os.getenv("UPLOAD_MAX_SIZE", "5242880"))
-    allowed_extensions = os.getenv("UPLOAD_ALLOWED_EXTENSIONS", "pdf,docx").split(",")
-    storage_service = LocalStorageService(base_dir=upload_base_dir)
-    return ResumeService(
-        database=database,
-        storage_service=storage_service,
-        max_file_size=max_file_size,
-        allowed_extensions=allowed_extensions,
+    database = get_database()
+    settings = _upload_settings()
+    upload_base_dir, max_file_size, allowed_extensions = settings
+    return _app_scoped(
+        ("resume_service", database.connection_string, settings),
+        lambda: ResumeService(
+            database=database,
+            storage_service=LocalStorageService(base_dir=upload_base_dir),
+            max_file_size=max_file_size,
+            allowed_extensions=list(allowed_extensions),
+        ),
     )
 
 
@@ -137,19 +217,19 @@ def get_cover_letter_service() -> CoverLetterService:
     Get CoverLetterService instance with database connection and storage.
 
     Returns:
-        CoverLetterService instance
+        Application-scoped CoverLetterService instance
     """
-    db_conn_str = build_db_connection_string()
-    database = PostgreSQLDatabase(connection_string=db_conn_str)
-    upload_base_dir = os.getenv("UPLOAD_BASE_DIR", "uploads")
-    max_file_size = int(os.getenv("UPLOAD_MAX_SIZE", "5242880"))
-    allowed_extensions = os.getenv("UPLOAD_ALLOWED_EXTENSIONS", "pdf,docx").split(",")
-    storage_service = LocalStorageService(base_dir=upload_base_dir)
-    return CoverLetterService(
-        database=database,
-        storage_service=storage_service,
-        max_file_size=max_file_size,
-        allowed_extensions=allowed_extensions,
+    database = get_database()
+    settings = _upload_settings()
+    upload_base_dir, max_file_size, allowed_extensions = settings
+    return _app_scoped(
+        ("cover_letter_service", database.connection_string, settings),
+        lambda: CoverLetterService(
+            database=database,
+            storage_service=LocalStorageService(base_dir=upload_base_dir),
+            max_file_size=max_file_size,
+            allowed_extensions=list(allowed_extensions),
+        ),
     )
 
 
@@ -158,11 +238,12 @@ def get_document_service() -> DocumentService:
     Get DocumentService instance with database connection.
 
     Returns:
-        DocumentService instance
+        Application-scoped DocumentService instance
     """
-    db_conn_str = build_db_connection_string()
-    database = PostgreSQLDatabase(connection_string=db_conn_str)
-    return DocumentService(database=database)
+    database = get_database()
+    return _app_scoped(
+        ("document_service", database.connection_string), lambda: DocumentService(database=database)
+    )
 
 
 def get_cover_letter_generator() -> CoverLetterGenerator:
@@ -170,21 +251,19 @@ def get_cover_letter_generator() -> CoverLetterGenerator:
     Get CoverLetterGenerator instance with all required services.
 
     Returns:
-        CoverLetterGenerator instance
+        Application-scoped CoverLetterGenerator instance
     """
-    db_conn_str = build_db_connection_string()
-    database = PostgreSQLDatabase(connection_string=db_conn_str)
-    upload_base_dir = os.getenv("UPLOAD_BASE_DIR", "uploads")
-    storage_service = LocalStorageService(base_dir=upload_base_dir)
-    cover_letter_service = get_cover_letter_service()
-    resume_service = get_resume_service()
-    job_service = get_job_service()
-    return CoverLetterGenerator(
-        database=database,
-        cover_letter_service=cover_letter_service,
-        resume_service=resume_service,
-        job_service=job_service,
-        storage_service=storage_service,
+    database = get_database()
+    settings = _upload_settings()
+    return _app_scoped(
+        ("cover_letter_generator", database.connection_string, settings),
+        lambda: CoverLetterGenerator(
+            database=database,
+            cover_letter_service=get_cover_letter_service(),
+            resume_service=get_resume_service(),
+            job_service=get_job_service(),
+            storage_service=LocalStorageService(base_dir=settings[0]),
+        ),
     )
 
 
@@ -193,7 +272,7 @@ def get_airflow_client() -> AirflowClient | None:
     Get AirflowClient instance if configured.
 
     Returns:
-        AirflowClient instance or None if not configured
+        Application-scoped AirflowClient instance or None if not configured
     """
     api_url = os.getenv("AIRFLOW_API_URL")
     username = os.getenv("AIRFLOW_API_USERNAME")
@@ -202,7 +281,10 @@ def get_airflow_client() -> AirflowClient | None:
     if not api_url or not username or not password:
         return None
 
-    return AirflowClient(api_url=api_url, username=username, password=password)
+    return _app_scoped(
+        ("airflow_client", api_url, username, password),
+        lambda: AirflowClient(api_url=api_url, username=username, password=password),
+    )
 
 
 def get_campaign_service() -> CampaignService:
@@ -210,11 +292,12 @@ def get_campaign_service() -> CampaignService:
     Get CampaignService instance with database connection.
 
     Returns:
-        CampaignService instance
+        Application-scoped CampaignService instance
     """
-    db_conn_str = build_db_connection_string()
-    database = PostgreSQLDatabase(connection_string=db_conn_str)
-    return CampaignService(database=database)
+    database = get_database()
+    return _app_scoped(
+        ("campaign_service", database.connection_string), lambda: CampaignService(database=database)
+    )
 
 
 def get_staging_service() -> StagingManagementService:
@@ -222,8 +305,10 @@ def get_staging_service() -> StagingManagementService:
     Get StagingManagementService instance with database connection.
 
     Returns:
-        StagingManagementService instance
+        Application-scoped StagingManagementService instance
     """
-    db_conn_str = build_db_connection_string()
-    database = PostgreSQLDatabase(connection_string=db_conn_str)
-    return StagingManagementService(database=database)
+    database = get_database()
+    return _app_scoped(
+        ("staging_service", database.connection_string),
+        lambda: StagingManagementService(database=database),
+    )
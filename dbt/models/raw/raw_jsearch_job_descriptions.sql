@@ -0,0 +1,13 @@
+{{ config(
+    materialized='ephemeral',
+    schema='raw'
+) }}
+
+-- Raw layer table for deduplicated JSearch job descriptions
+-- Populated by the Source Extractor service in slim raw storage mode
+-- (JSEARCH_RAW_STORAGE=slim), keyed by the SHA-256 of the description text
+-- 
+-- IMPORTANT: Table structure is created by docker/init/02_create_tables.sql
+-- This model exists for dbt lineage only (ephemeral = no database object created)
+
+select * from raw.jsearch_job_descriptions
@@ -2,6 +2,7 @@
     materialized='incremental',
     unique_key=['jsearch_job_id', 'campaign_id'],
     on_schema_change='append_new_columns',
+    indexes=[{'columns': ['dwh_load_timestamp']}],
     pre_hook="{% if is_incremental() %}ALTER TABLE {{ this }} ADD COLUMN IF NOT EXISTS extracted_skills jsonb, ADD COLUMN IF NOT EXISTS seniority_level varchar, ADD COLUMN IF NOT EXISTS remote_work_type varchar, ADD COLUMN IF NOT EXISTS job_salary_currency varchar, ADD COLUMN IF NOT EXISTS job_summary text, ADD COLUMN IF NOT EXISTS chatgpt_extracted_skills jsonb, ADD COLUMN IF NOT EXISTS chatgpt_extracted_location varchar, ADD COLUMN IF NOT EXISTS chatgpt_enriched_at timestamp, ADD COLUMN IF NOT EXISTS enrichment_status jsonb;{% endif %}"
 ) }}
 
@@ -11,20 +12,24 @@
 
 with raw_data as (
     select
-        jsearch_job_postings_key,
-        raw_payload,
-        dwh_load_date,
-        dwh_load_timestamp,
-        dwh_source_system,
-        campaign_id
-    from {{ ref('raw_jsearch_job_postings') }}
-    where raw_payload is not null
+        r.jsearch_job_postings_key,
+        r.raw_payload,
+        -- Slim raw storage keeps job_description out of raw_payload, stored once per text
+        d.job_description as stored_job_description,
+        r.dwh_load_date,
+        r.dwh_load_timestamp,
+        r.dwh_source_system,
+        r.campaign_id
+    from {{ ref('raw_jsearch_job_postings') }} r
+    left join {{ ref('raw_jsearch_job_descriptions') }} d
+        on d.description_hash = r.job_description_hash
+    where r.raw_payload is not null
         -- Filter by campaign_id if provided via dbt variable
         -- Uses -1 as sentinel value (invalid campaign_id) to detect if variable was provided
         -- When campaign_id is not provided, var('campaign_id', -1) returns -1, so condition is false
         -- When campaign_id is provided, condition is true and filters to that campaign
         {% if var('campaign_id', -1) != -1 %}
-        and campaign_id = {{ var('campaign_id') }}
+        and r.campaign_id = {{ var('campaign_id') }}
         {% endif %}
 ),
 
@@ -38,7 +43,7 @@ extracted as (
         
         -- Basic job information
         raw_payload->>'job_title' as job_title,
-        raw_payload->>'job_description' as job_description,
+        coalesce(raw_payload->>'job_description', stored_job_description) as job_description,
         raw_payload->>'employer_name' as employer_name,
         raw_payload->>'employer_logo' as employer_logo,
         raw_payload->>'employer_website' as employer_website,
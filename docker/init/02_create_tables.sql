@@ -17,11 +17,19 @@ CREATE TABLE IF NOT EXISTS raw.jsearch_job_postings (
     dwh_load_date date,
     dwh_load_timestamp timestamp,
     dwh_source_system varchar,
-    campaign_id integer
+    campaign_id integer,
+    job_description_hash varchar(64)
 );
 
 COMMENT ON TABLE raw.jsearch_job_postings IS 'Raw layer table for JSearch job postings. Stores raw JSON payloads from JSearch API with minimal transformation. Populated by Source Extractor service. Each row is associated with a campaign_id.';
 
+-- Deduplicated job descriptions for slim raw storage (see 27_add_jsearch_job_description_store.sql)
+CREATE TABLE IF NOT EXISTS raw.jsearch_job_descriptions (
+    description_hash varchar(64) PRIMARY KEY,
+    job_description text NOT NULL,
+    dwh_load_timestamp timestamp
+);
+
 -- Raw company data from Glassdoor API
 CREATE TABLE IF NOT EXISTS raw.glassdoor_companies (
     glassdoor_companies_key bigint,
@@ -47,7 +55,8 @@ CREATE TABLE IF NOT EXISTS staging.company_enrichment_queue (
     last_attempt_at timestamp,
     completed_at timestamp,
     error_message text,
-    attempt_count integer
+    attempt_count integer,
+    leased_until timestamp  -- end of a worker's lease on a pending company (leased enrichment)
 );
 
 COMMENT ON TABLE staging.company_enrichment_queue IS 'Tracks which companies need Glassdoor enrichment. Populated and updated by Company Extraction service as enrichment progresses.';
@@ -93,6 +102,10 @@ CREATE TABLE IF NOT EXISTS marts.job_campaigns (
     -- Ranking weights (JSONB, percentages should sum to 100%)
     -- Format: {"location_match": 15.0, "salary_match": 15.0, ...}
     ranking_weights jsonb,
+    -- Optional top-K ranking mode: keep only the best K jobs in dim_ranking (NULL = all)
+    ranking_top_k integer CHECK (ranking_top_k IS NULL OR ranking_top_k > 0),
+    -- Newest job posting time (UTC) extracted for the campaign; drives incremental extraction
+    extraction_high_water_mark timestamp,
     created_at timestamp,
     updated_at timestamp,
     total_run_count integer,
@@ -111,6 +124,16 @@ CREATE TABLE IF NOT EXISTS marts.dim_ranking (
     campaign_id integer,
     rank_score numeric,
     rank_explain jsonb,
+    -- Typed ranking factor breakdown (weighted points, mirrors rank_explain)
+    location_match_points numeric,
+    salary_match_points numeric,
+    company_size_match_points numeric,
+    skills_match_points numeric,
+    keyword_match_points numeric,
+    employment_type_match_points numeric,
+    seniority_match_points numeric,
+    remote_type_match_points numeric,
+    recency_points numeric,
     ranked_at timestamp,
     ranked_date date,
     dwh_load_timestamp timestamp,
@@ -183,6 +206,15 @@ CREATE INDEX IF NOT EXISTS idx_company_enrichment_queue_status
 CREATE INDEX IF NOT EXISTS idx_company_enrichment_queue_lookup 
     ON staging.company_enrichment_queue(company_lookup_key);
 
+-- Index for jobs list keyset pagination (see 28_add_dim_ranking_keyset_index.sql)
+CREATE INDEX IF NOT EXISTS idx_dim_ranking_campaign_keyset
+    ON marts.dim_ranking (
+        campaign_id,
+        (COALESCE(rank_score, '-Infinity'::numeric)),
+        (COALESCE(ranked_at, '-infinity'::timestamp)),
+        jsearch_job_id
+    );
+
 -- Indexes for users
 CREATE INDEX IF NOT EXISTS idx_users_username 
     ON marts.users(username);
@@ -0,0 +1,44 @@
+-- ============================================================
+-- Add Typed Ranking Factor Columns to marts.dim_ranking
+-- Migration script: 22_add_dim_ranking_factor_columns.sql
+-- Stores the per-factor ranking breakdown as numeric columns so it can be
+-- bulk loaded with COPY and queried directly for analytics.
+-- rank_explain JSONB is still populated (built server-side by the ranker upsert).
+-- This script is idempotent and safe to run multiple times
+-- ============================================================
+
+ALTER TABLE marts.dim_ranking
+    ADD COLUMN IF NOT EXISTS location_match_points numeric,
+    ADD COLUMN IF NOT EXISTS salary_match_points numeric,
+    ADD COLUMN IF NOT EXISTS company_size_match_points numeric,
+    ADD COLUMN IF NOT EXISTS skills_match_points numeric,
+    ADD COLUMN IF NOT EXISTS keyword_match_points numeric,
+    ADD COLUMN IF NOT EXISTS employment_type_match_points numeric,
+    ADD COLUMN IF NOT EXISTS seniority_match_points numeric,
+    ADD COLUMN IF NOT EXISTS remote_type_match_points numeric,
+    ADD COLUMN IF NOT EXISTS recency_points numeric;
+
+-- Backfill typed columns from existing rank_explain JSON
+UPDATE marts.dim_ranking
+SET
+    location_match_points = (rank_explain->>'location_match')::numeric,
+    salary_match_points = (rank_explain->>'salary_match')::numeric,
+    company_size_match_points = (rank_explain->>'company_size_match')::numeric,
+    skills_match_points = (rank_explain->>'skills_match')::numeric,
+    keyword_match_points = (rank_explain->>'keyword_match')::numeric,
+    employment_type_match_points = (rank_explain->>'employment_type_match')::numeric,
+    seniority_match_points = (rank_explain->>'seniority_match')::numeric,
+    remote_type_match_points = (rank_explain->>'remote_type_match')::numeric,
+    recency_points = (rank_explain->>'recency')::numeric
+WHERE rank_explain IS NOT NULL
+  AND location_match_points IS NULL;
+
+COMMENT ON COLUMN marts.dim_ranking.location_match_points IS 'Weighted points for location match (same value as rank_explain.location_match)';
+COMMENT ON COLUMN marts.dim_ranking.salary_match_points IS 'Weighted points for salary match';
+COMMENT ON COLUMN marts.dim_ranking.company_size_match_points IS 'Weighted points for company size match';
+COMMENT ON COLUMN marts.dim_ranking.skills_match_points IS 'Weighted points for skills match';
+COMMENT ON COLUMN marts.dim_ranking.keyword_match_points IS 'Weighted points for position title keyword match';
+COMMENT ON COLUMN marts.dim_ranking.employment_type_match_points IS 'Weighted points for employment type match';
+COMMENT ON COLUMN marts.dim_ranking.seniority_match_points IS 'Weighted points for seniority match';
+COMMENT ON COLUMN marts.dim_ranking.remote_type_match_points IS 'Weighted points for remote type match';
+COMMENT ON COLUMN marts.dim_ranking.recency_points IS 'Weighted points for posting recency';
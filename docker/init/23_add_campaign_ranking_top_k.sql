@@ -0,0 +1,26 @@
+-- ============================================================
+-- Add Top-K Ranking Setting to marts.job_campaigns
+-- Migration script: 23_add_campaign_ranking_top_k.sql
+-- When ranking_top_k is set, the ranker only persists the best K jobs for the
+-- campaign in marts.dim_ranking (plus jobs the user has a status for) and
+-- prunes the rest. NULL keeps every ranked job (default behavior).
+-- This script is idempotent and safe to run multiple times
+-- ============================================================
+
+ALTER TABLE marts.job_campaigns
+    ADD COLUMN IF NOT EXISTS ranking_top_k integer;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_constraint
+        WHERE conname = 'chk_job_campaigns_ranking_top_k'
+        AND conrelid = 'marts.job_campaigns'::regclass
+    ) THEN
+        ALTER TABLE marts.job_campaigns
+        ADD CONSTRAINT chk_job_campaigns_ranking_top_k CHECK (ranking_top_k IS NULL OR ranking_top_k > 0);
+    END IF;
+END $$;
+
+COMMENT ON COLUMN marts.job_campaigns.ranking_top_k IS 'Optional top-K ranking mode: only the best K jobs (plus jobs with a user_job_status) are kept in dim_ranking. NULL keeps all ranked jobs.';
+
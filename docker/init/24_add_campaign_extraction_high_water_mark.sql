@@ -0,0 +1,14 @@
+-- ============================================================
+-- Add Extraction High-Water Mark to marts.job_campaigns
+-- Migration script: 24_add_campaign_extraction_high_water_mark.sql
+-- Stores the newest job posting time (UTC) extracted for each campaign so the
+-- extractor can request the narrowest JSearch date window that covers the gap
+-- since the last run instead of the campaign's full date_window.
+-- NULL (new or edited campaign) means the full window is searched.
+-- This script is idempotent and safe to run multiple times
+-- ============================================================
+
+ALTER TABLE marts.job_campaigns
+    ADD COLUMN IF NOT EXISTS extraction_high_water_mark timestamp;
+
+COMMENT ON COLUMN marts.job_campaigns.extraction_high_water_mark IS 'Newest job_posted_at (UTC) extracted for the campaign; drives incremental extraction. Reset to NULL when the campaign is edited.';
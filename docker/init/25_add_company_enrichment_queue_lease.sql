@@ -0,0 +1,19 @@
+-- ============================================================
+-- Add Lease Column to staging.company_enrichment_queue
+-- Migration script: 25_add_company_enrichment_queue_lease.sql
+-- Leased (concurrent) company enrichment reserves batches of pending companies
+-- with SELECT ... FOR UPDATE SKIP LOCKED and records the reservation in
+-- leased_until, so several workers can drain the queue at once and companies
+-- leased by a crashed worker become available again once the lease expires.
+-- This script is idempotent and safe to run multiple times
+-- ============================================================
+
+ALTER TABLE staging.company_enrichment_queue
+    ADD COLUMN IF NOT EXISTS leased_until timestamp;
+
+COMMENT ON COLUMN staging.company_enrichment_queue.leased_until IS 'End of the current worker lease for a pending company (NULL when not leased). Expired leases can be re-leased.';
+
+-- Index for leasing pending companies in key order
+CREATE INDEX IF NOT EXISTS idx_company_enrichment_queue_pending_key
+    ON staging.company_enrichment_queue(company_lookup_key)
+    WHERE enrichment_status = 'pending';
@@ -0,0 +1,17 @@
+-- ============================================================
+-- Add Load Timestamp Index to staging.jsearch_job_postings
+-- Migration script: 26_add_staging_job_postings_load_timestamp_index.sql
+-- Incremental company-enrichment scans (GET_NEW_COMPANIES_TO_ENRICH_SINCE) only
+-- read postings loaded since the last enqueue. staging.jsearch_job_postings is
+-- built by dbt (which also declares this index for fresh builds), so the index
+-- is only created here when the table already exists.
+-- This script is idempotent and safe to run multiple times
+-- ============================================================
+
+DO $$
+BEGIN
+    IF to_regclass('staging.jsearch_job_postings') IS NOT NULL THEN
+        CREATE INDEX IF NOT EXISTS idx_stg_jsearch_job_postings_load_timestamp
+            ON staging.jsearch_job_postings(dwh_load_timestamp);
+    END IF;
+END $$;
@@ -0,0 +1,34 @@
+-- ============================================================
+-- Add Slim Raw Storage for JSearch Job Postings
+-- Migration script: 27_add_jsearch_job_description_store.sql
+-- With JSEARCH_RAW_STORAGE=slim the extractor stores only the fields the
+-- staging model reads in raw_payload and moves job_description (the bulk of
+-- each payload) to raw.jsearch_job_descriptions, stored once per distinct text
+-- and referenced by its SHA-256 hash. Large values in both tables use lz4 TOAST
+-- compression where the server supports it (faster than the pglz default and
+-- usually at least as compact for JSON and text).
+-- This script is idempotent and safe to run multiple times
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS raw.jsearch_job_descriptions (
+    description_hash varchar(64) PRIMARY KEY,
+    job_description text NOT NULL,
+    dwh_load_timestamp timestamp
+);
+
+COMMENT ON TABLE raw.jsearch_job_descriptions IS 'Deduplicated JSearch job descriptions for slim raw storage. Keyed by the SHA-256 hex digest of the description text.';
+
+ALTER TABLE raw.jsearch_job_postings
+    ADD COLUMN IF NOT EXISTS job_description_hash varchar(64);
+
+COMMENT ON COLUMN raw.jsearch_job_postings.job_description_hash IS 'SHA-256 of the job description stored in raw.jsearch_job_descriptions (slim raw storage). NULL when raw_payload holds the full job object.';
+
+-- lz4 applies to newly written values; existing rows keep their compression
+DO $$
+BEGIN
+    ALTER TABLE raw.jsearch_job_postings ALTER COLUMN raw_payload SET COMPRESSION lz4;
+    ALTER TABLE raw.jsearch_job_descriptions ALTER COLUMN job_description SET COMPRESSION lz4;
+EXCEPTION
+    WHEN feature_not_supported THEN
+        RAISE NOTICE 'lz4 compression is not available, keeping the default TOAST compression';
+END $$;
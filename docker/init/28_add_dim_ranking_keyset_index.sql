@@ -0,0 +1,18 @@
+-- ============================================================
+-- Add Keyset Pagination Index to marts.dim_ranking
+-- Migration script: 28_add_dim_ranking_keyset_index.sql
+-- The jobs list API pages through a campaign's ranked jobs ordered by
+-- (rank_score, ranked_at, jsearch_job_id) descending, with NULL scores and
+-- timestamps sorted last via COALESCE to -Infinity. This index matches that
+-- order (read backwards), so each page is an index range scan starting at the
+-- cursor instead of a sort of every ranked job in the campaign.
+-- This script is idempotent and safe to run multiple times
+-- ============================================================
+
+CREATE INDEX IF NOT EXISTS idx_dim_ranking_campaign_keyset
+    ON marts.dim_ranking (
+        campaign_id,
+        (COALESCE(rank_score, '-Infinity'::numeric)),
+        (COALESCE(ranked_at, '-infinity'::timestamp)),
+        jsearch_job_id
+    );
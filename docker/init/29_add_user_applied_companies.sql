@@ -0,0 +1,46 @@
+-- ============================================================
+-- Add User Applied Companies Table
+-- Migration script: 29_add_user_applied_companies.sql
+-- The jobs list flags jobs at companies the user already acted on (any job
+-- at the company with a status other than 'waiting'). Computing that per
+-- listed job meant a correlated fact_jobs/user_job_status join on every row.
+-- This table keeps the set precomputed per user, so the flag is a primary
+-- key probe. It is refreshed for a user when they change a job status and for
+-- all users after each dbt run (fact_jobs company keys can change).
+-- This script is idempotent and safe to run multiple times
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS marts.user_applied_companies (
+    user_id integer NOT NULL,
+    company_key varchar NOT NULL,
+    created_at timestamp DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT user_applied_companies_pkey PRIMARY KEY (user_id, company_key),
+    CONSTRAINT fk_user_applied_companies_user FOREIGN KEY (user_id) REFERENCES marts.users(user_id) ON DELETE CASCADE
+);
+
+COMMENT ON TABLE marts.user_applied_companies IS 'Companies each user has acted on (a job at the company has a status other than waiting). Derived from user_job_status and fact_jobs; used for the "applied to this company" flag in job lists.';
+
+-- Backfill from existing statuses
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM information_schema.tables WHERE table_schema = 'marts' AND table_name = 'fact_jobs') THEN
+        INSERT INTO marts.user_applied_companies (user_id, company_key)
+        SELECT DISTINCT ujs.user_id, fj.company_key
+        FROM marts.user_job_status ujs
+        INNER JOIN marts.fact_jobs fj
+            ON ujs.jsearch_job_id = fj.jsearch_job_id
+        WHERE ujs.status != 'waiting'
+            AND fj.company_key IS NOT NULL
+        ON CONFLICT (user_id, company_key) DO NOTHING;
+    END IF;
+END $$;
+
+-- Grant permissions to application user (if exists)
+DO $$
+BEGIN
+    IF EXISTS (SELECT FROM pg_user WHERE usename = 'app_user') THEN
+        EXECUTE 'GRANT ALL PRIVILEGES ON TABLE marts.user_applied_companies TO app_user';
+    END IF;
+END $$;
+
+GRANT ALL PRIVILEGES ON TABLE marts.user_applied_companies TO postgres;
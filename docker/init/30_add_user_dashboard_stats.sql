@@ -0,0 +1,38 @@
+-- ============================================================
+-- Add User Dashboard Stats Table
+-- Migration script: 30_add_user_dashboard_stats.sql
+-- The dashboard used to run five aggregate queries per request (campaign
+-- counts, ranked jobs, status counts and 7 days of activity). This table
+-- keeps those numbers per user so the dashboard is a primary key read.
+-- Rows are refreshed by the DAG's rank and notification tasks, by campaign
+-- changes and by job status changes. Users without a row get one computed on
+-- their first dashboard visit.
+-- Daily activity is stored as {"YYYY-MM-DD": count} for the last 7 days.
+-- This script is idempotent and safe to run multiple times
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS marts.user_dashboard_stats (
+    user_id integer NOT NULL,
+    total_campaigns integer NOT NULL DEFAULT 0,
+    active_campaigns integer NOT NULL DEFAULT 0,
+    jobs_processed integer NOT NULL DEFAULT 0,
+    tracked_jobs integer NOT NULL DEFAULT 0,
+    acted_jobs integer NOT NULL DEFAULT 0,
+    found_by_day jsonb NOT NULL DEFAULT '{}'::jsonb,
+    applied_by_day jsonb NOT NULL DEFAULT '{}'::jsonb,
+    updated_at timestamp DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT user_dashboard_stats_pkey PRIMARY KEY (user_id),
+    CONSTRAINT fk_user_dashboard_stats_user FOREIGN KEY (user_id) REFERENCES marts.users(user_id) ON DELETE CASCADE
+);
+
+COMMENT ON TABLE marts.user_dashboard_stats IS 'Per-user dashboard summary: campaign counts, ranked jobs, job status counts (tracked = any status, acted = not waiting) and daily jobs found / applied over the last 7 days.';
+
+-- Grant permissions to application user (if exists)
+DO $$
+BEGIN
+    IF EXISTS (SELECT FROM pg_user WHERE usename = 'app_user') THEN
+        EXECUTE 'GRANT ALL PRIVILEGES ON TABLE marts.user_dashboard_stats TO app_user';
+    END IF;
+END $$;
+
+GRANT ALL PRIVILEGES ON TABLE marts.user_dashboard_stats TO postgres;
@@ -0,0 +1,16 @@
+-- ============================================================
+-- Add User Data Version Counter
+-- Migration script: 31_add_user_data_version.sql
+-- The frontend polls the dashboard and jobs list. data_version is a per-user
+-- change counter that the API turns into an ETag, so an unchanged poll is
+-- answered with 304 Not Modified after a primary key read instead of the full
+-- jobs join. It is incremented whenever the user's dashboard stats are
+-- refreshed (campaign changes, DAG rank runs, job status changes), when the
+-- user's notes change, and for all users after dbt rebuilds company data.
+-- This script is idempotent and safe to run multiple times
+-- ============================================================
+
+ALTER TABLE marts.user_dashboard_stats
+    ADD COLUMN IF NOT EXISTS data_version bigint NOT NULL DEFAULT 0;
+
+COMMENT ON COLUMN marts.user_dashboard_stats.data_version IS 'Incremented on every change to the user''s campaigns, rankings, job statuses or notes; used as an HTTP cache validator.';
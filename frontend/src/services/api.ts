@@ -4,6 +4,18 @@ import type { AuthResponse, LoginRequest, RegisterRequest } from '../types';
 // In development, use localhost:5000. In production/staging, use relative URL (nginx proxies to backend)
 const API_BASE_URL = import.meta.env.VITE_API_URL || (import.meta.env.DEV ? 'http://localhost:5000' : '');
 
+/** Poll interval and overall wait for background tasks (slow calls sent with `Prefer: respond-async`). */
+const TASK_POLL_INTERVAL_MS = 1500;
+const TASK_TIMEOUT_MS = 10 * 60 * 1000;
+
+interface BackgroundTaskStatus<T> {
+  task_id: string;
+  status: 'queued' | 'running' | 'succeeded' | 'failed';
+  status_code: number | null;
+  result: (T & { error?: string }) | null;
+  status_url?: string;
+}
+
 /** In-memory token so the first request after login has the token before localStorage is committed (e.g. on some mobile browsers). */
 let memoryToken: string | null = null;
 
@@ -120,8 +132,17 @@ class ApiClient {
     await this.client.delete(`/api/campaigns/${id}`);
   }
 
-  async getJobs(campaignId?: number): Promise<{ jobs: unknown[] }> {
-    const params = campaignId ? { campaign_id: campaignId } : {};
+  async getJobs(
+    campaignId?: number,
+    page?: { limit: number; cursor?: string | null }
+  ): Promise<{ jobs: unknown[]; next_cursor?: string | null }> {
+    const params: Record<string, string | number> = campaignId ? { campaign_id: campaignId } : {};
+    if (page) {
+      params.limit = page.limit;
+      if (page.cursor) {
+        params.cursor = page.cursor;
+      }
+    }
     const response = await this.client.get('/api/jobs', { params });
     return response.data;
   }
@@ -135,12 +156,39 @@ class ApiClient {
     await this.client.post(`/api/jobs/${jobId}/status`, { status });
   }
 
+  /**
+   * POST a slow request as a background task and wait for its result, so the
+   * server doesn't hold a request worker while it calls an external service.
+   * Resolves with the same payload the synchronous endpoint returns; a failed
+   * task rejects with its error message.
+   */
+  private async postAndAwaitTask<T>(url: string, data: unknown): Promise<T> {
+    const response = await this.client.post<BackgroundTaskStatus<T> | T>(url, data, {
+      headers: { Prefer: 'respond-async' },
+    });
+    if (response.status !== 202) {
+      return response.data as T;
+    }
+    const statusUrl = (response.data as BackgroundTaskStatus<T>).status_url as string;
+    const deadline = Date.now() + TASK_TIMEOUT_MS;
+    while (Date.now() < deadline) {
+      await new Promise((resolve) => setTimeout(resolve, TASK_POLL_INTERVAL_MS));
+      const { data: task } = await this.client.get<BackgroundTaskStatus<T>>(statusUrl);
+      if (task.status === 'succeeded') {
+        return task.result as T;
+      }
+      if (task.status === 'failed') {
+        throw new Error(task.result?.error || 'Request failed');
+      }
+    }
+    throw new Error('Timed out waiting for the server to finish the request');
+  }
+
   async triggerCampaignDag(
     campaignId: number,
     force = false
   ): Promise<{ success?: boolean; message?: string; error?: string; dag_run_id?: string | null; forced?: boolean }> {
-    const response = await this.client.post(`/api/campaigns/${campaignId}/trigger-dag`, { force });
-    return response.data;
+    return this.postAndAwaitTask(`/api/campaigns/${campaignId}/trigger-dag`, { force });
   }
 
   async getCampaignStatus(
@@ -223,8 +271,7 @@ class ApiClient {
     resume_id: number;
     user_comments?: string;
   }): Promise<{ cover_letter_id: number; cover_letter_text: string; cover_letter_name: string }> {
-    const response = await this.client.post(`/api/jobs/${jobId}/cover-letter/generate`, data);
-    return response.data;
+    return this.postAndAwaitTask(`/api/jobs/${jobId}/cover-letter/generate`, data);
   }
 
   async getCoverLetterGenerationHistory(jobId: string): Promise<{ history: unknown[] }> {
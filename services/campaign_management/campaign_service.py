@@ -7,23 +7,32 @@ from __future__ import annotations
 
 import json
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any
 
 from shared.database import Database
 
 from .queries import (
+    CAMPAIGN_METRICS_VERSION_DAG_RUN_FILTER,
     DELETE_CAMPAIGN,
     GET_ALL_CAMPAIGNS,
     GET_ALL_CAMPAIGNS_BY_USER,
+    GET_ALL_DASHBOARD_STATS,
+    GET_ALL_DATA_VERSION,
     GET_CAMPAIGN_ACTIVE_STATUS,
     GET_CAMPAIGN_BY_ID,
+    GET_CAMPAIGN_METRICS_VERSION,
     GET_CAMPAIGN_NAME,
+    GET_CAMPAIGN_OWNER,
     GET_CAMPAIGN_STATISTICS,
     GET_JOB_COUNTS_OVER_TIME,
     GET_NEXT_CAMPAIGN_ID,
     GET_RUN_HISTORY,
+    GET_USER_DASHBOARD_STATS,
+    GET_USER_DATA_VERSION,
+    GET_USERS_WITHOUT_DASHBOARD_STATS,
     INSERT_CAMPAIGN,
+    REFRESH_USER_DASHBOARD_STATS,
     TOGGLE_CAMPAIGN_ACTIVE,
     UPDATE_CAMPAIGN,
     UPDATE_CAMPAIGN_TRACKING_FIELDS,
@@ -38,6 +47,9 @@ WEIGHT_SUM_TOLERANCE = 0.1
 MIN_WEIGHT = 0.0
 MAX_WEIGHT = 100.0
 
+# Days of activity shown on the dashboard (the window REFRESH_USER_DASHBOARD_STATS stores)
+DASHBOARD_ACTIVITY_DAYS = 7
+
 
 class CampaignService:
     """Service for managing job search campaigns."""
@@ -241,6 +253,7 @@ class CampaignService:
             result = cur.fetchone()
             if result and result[0]:
                 campaign_id = result[0]
+            self._refresh_dashboard_stats(cur, [user_id])
 
         logger.info(f"Created campaign {campaign_id}: {campaign_name}")
         return campaign_id
@@ -298,7 +311,8 @@ class CampaignService:
             raise ValueError("Country is required")
 
         # Check if campaign exists
-        if not self.get_campaign_by_id(campaign_id):
+        campaign = self.get_campaign_by_id(campaign_id)
+        if not campaign:
             raise ValueError(f"Campaign {campaign_id} not found")
 
         # Validate ranking weights if provided
@@ -339,126 +353,153 @@ class CampaignService:
                     campaign_id,
                 ),
             )
+            self._refresh_dashboard_stats(cur, [campaign["user_id"]])
 
         logger.info(f"Updated campaign {campaign_id}: {campaign_name}")
 
     def get_dashboard_stats(self, user_id: int | None = None) -> dict[str, Any]:
         """Get overall dashboard statistics.
 
+        Reads the precomputed marts.user_dashboard_stats row (computing it first if
+        the user has none yet).
+
         Args:
-            user_id: If provided, only returns stats for this user. If None, returns all stats.
+            user_id: If provided, only returns stats for this user. If None, returns all stats
+                (summed over every user's row).
 
         Returns:
             Dictionary with dashboard statistics
         """
-        with self.db.get_cursor() as cur:
-            # Base query for counts
-            if user_id is not None:
-                cur.execute(
-                    "SELECT COUNT(*), SUM(CASE WHEN is_active THEN 1 ELSE 0 END) FROM marts.job_campaigns WHERE user_id = %s",
-                    (user_id,),
-                )
-            else:
-                cur.execute(
-                    "SELECT COUNT(*), SUM(CASE WHEN is_active THEN 1 ELSE 0 END) FROM marts.job_campaigns"
-                )
+        if user_id is not None:
+            with self.db.get_cursor(read_only=True) as cur:
+                cur.execute(GET_USER_DASHBOARD_STATS, (user_id,))
+                row = cur.fetchone()
+            if row is None:
+                self.refresh_dashboard_stats([user_id])
+                with self.db.get_cursor(read_only=True) as cur:
+                    cur.execute(GET_USER_DASHBOARD_STATS, (user_id,))
+                    row = cur.fetchone()
+            rows = [row] if row else []
+        else:
+            with self.db.get_cursor(read_only=True) as cur:
+                cur.execute(GET_USERS_WITHOUT_DASHBOARD_STATS)
+                missing = [r[0] for r in cur.fetchall()]
+            if missing:
+                self.refresh_dashboard_stats(missing)
+            with self.db.get_cursor(read_only=True) as cur:
+                cur.execute(GET_ALL_DASHBOARD_STATS)
+                rows = cur.fetchall()
 
-            total_campaigns, active_campaigns = cur.fetchone()
+        return self._summarize_dashboard_stats(rows)
 
-            # Jobs processed count (total ranked jobs)
-            if user_id is not None:
-                cur.execute(
-                    "SELECT COUNT(*) FROM marts.dim_ranking dr JOIN marts.job_campaigns jc ON dr.campaign_id = jc.campaign_id WHERE jc.user_id = %s",
-                    (user_id,),
-                )
-            else:
-                cur.execute("SELECT COUNT(*) FROM marts.dim_ranking")
-            jobs_processed = cur.fetchone()[0]
+    @staticmethod
+    def _summarize_dashboard_stats(rows: list[tuple]) -> dict[str, Any]:
+        """Add up user_dashboard_stats rows into the dashboard response.
 
-            # Success rate (applied / total)
-            if user_id is not None:
-                cur.execute(
-                    "SELECT COUNT(*), SUM(CASE WHEN status != 'waiting' THEN 1 ELSE 0 END) FROM marts.user_job_status WHERE user_id = %s",
-                    (user_id,),
-                )
-            else:
-                cur.execute(
-                    "SELECT COUNT(*), SUM(CASE WHEN status != 'waiting' THEN 1 ELSE 0 END) FROM marts.user_job_status"
-                )
-            total_jobs, applied_jobs = cur.fetchone()
-            success_rate = (
-                round((applied_jobs / total_jobs * 100), 1) if total_jobs and total_jobs > 0 else 0
+        Args:
+            rows: Rows of DASHBOARD_STATS_COLUMNS
+
+        Returns:
+            Dictionary with campaign counts, jobs processed, success rate (percent of
+            tracked jobs acted on) and daily found/applied counts for the activity window
+        """
+        totals = [0, 0, 0, 0, 0]
+        found: dict[str, int] = {}
+        applied: dict[str, int] = {}
+        today = datetime.now().date()
+        for row in rows:
+            for i in range(5):
+                totals[i] += row[i] or 0
+            for day, count in (row[5] or {}).items():
+                found[day] = found.get(day, 0) + int(count)
+            for day, count in (row[6] or {}).items():
+                applied[day] = applied.get(day, 0) + int(count)
+            today = row[7]
+        total_campaigns, active_campaigns, jobs_processed, tracked_jobs, acted_jobs = totals
+
+        success_rate = round((acted_jobs / tracked_jobs * 100), 1) if tracked_jobs > 0 else 0
+
+        activity_data = []
+        for offset in range(DASHBOARD_ACTIVITY_DAYS - 1, -1, -1):
+            day = (today - timedelta(days=offset)).isoformat()
+            activity_data.append(
+                {"date": day, "found": found.get(day, 0), "applied": applied.get(day, 0)}
             )
 
-            # Activity data (last 7 days)
-            activity_data = []
-            if user_id is not None:
-                cur.execute(
-                    """
-                    SELECT
-                        d.date,
-                        COALESCE(f.found, 0) as found,
-                        COALESCE(a.applied, 0) as applied
-                    FROM (
-                        SELECT CURRENT_DATE - i as date
-                        FROM generate_series(0, 6) i
-                    ) d
-                    LEFT JOIN (
-                        SELECT DATE(run_timestamp) as date, SUM(rows_processed_raw) as found
-                        FROM marts.etl_run_metrics erm
-                        JOIN marts.job_campaigns jc ON erm.campaign_id = jc.campaign_id
-                        WHERE jc.user_id = %s AND erm.task_name = 'extract_job_postings'
-                        GROUP BY 1
-                    ) f ON d.date = f.date
-                    LEFT JOIN (
-                        SELECT DATE(created_at) as date, COUNT(*) as applied
-                        FROM marts.user_job_status
-                        WHERE user_id = %s AND status != 'waiting'
-                        GROUP BY 1
-                    ) a ON d.date = a.date
-                    ORDER BY d.date ASC
-                    """,
-                    (user_id, user_id),
-                )
-            else:
-                cur.execute(
-                    """
-                    SELECT
-                        d.date,
-                        COALESCE(f.found, 0) as found,
-                        COALESCE(a.applied, 0) as applied
-                    FROM (
-                        SELECT CURRENT_DATE - i as date
-                        FROM generate_series(0, 6) i
-                    ) d
-                    LEFT JOIN (
-                        SELECT DATE(run_timestamp) as date, SUM(rows_processed_raw) as found
-                        FROM marts.etl_run_metrics erm
-                        WHERE erm.task_name = 'extract_job_postings'
-                        GROUP BY 1
-                    ) f ON d.date = f.date
-                    LEFT JOIN (
-                        SELECT DATE(created_at) as date, COUNT(*) as applied
-                        FROM marts.user_job_status
-                        WHERE status != 'waiting'
-                        GROUP BY 1
-                    ) a ON d.date = a.date
-                    ORDER BY d.date ASC
-                    """
-                )
+        return {
+            "total_campaigns": total_campaigns,
+            "active_campaigns": active_campaigns,
+            "jobs_processed": jobs_processed,
+            "success_rate": success_rate,
+            "activity_data": activity_data,
+        }
 
-            rows = cur.fetchall()
-            activity_data = [
-                {"date": r[0].isoformat(), "found": int(r[1]), "applied": int(r[2])} for r in rows
-            ]
+    def get_data_version(self, user_id: int | None = None) -> tuple[int, int, datetime | None]:
+        """Get the change counter of a user's data, for use as an HTTP cache validator.
 
-            return {
-                "total_campaigns": total_campaigns or 0,
-                "active_campaigns": active_campaigns or 0,
-                "jobs_processed": jobs_processed or 0,
-                "success_rate": success_rate,
-                "activity_data": activity_data,
-            }
+        The counter (marts.user_dashboard_stats.data_version) goes up whenever the
+        user's campaigns, rankings, job statuses or notes change. A user without a
+        stats row gets one computed first.
+
+        Args:
+            user_id: User to check. If None, covers all users (admin views).
+
+        Returns:
+            Tuple of (data version, number of users covered, time of the last change)
+        """
+        if user_id is None:
+            with self.db.get_cursor(read_only=True) as cur:
+                cur.execute(GET_ALL_DATA_VERSION)
+                return cur.fetchone()
+
+        with self.db.get_cursor(read_only=True) as cur:
+            cur.execute(GET_USER_DATA_VERSION, (user_id,))
+            row = cur.fetchone()
+        if row is None:
+            self.refresh_dashboard_stats([user_id])
+            with self.db.get_cursor(read_only=True) as cur:
+                cur.execute(GET_USER_DATA_VERSION, (user_id,))
+                row = cur.fetchone()
+        return row if row else (0, 0, None)
+
+    def refresh_dashboard_stats(self, user_ids: list[int] | None = None) -> int:
+        """Recompute marts.user_dashboard_stats rows.
+
+        Args:
+            user_ids: Users to refresh (None refreshes every user)
+
+        Returns:
+            Number of rows written
+        """
+        with self.db.get_cursor() as cur:
+            refreshed = self._refresh_dashboard_stats(cur, user_ids)
+        logger.debug(f"Refreshed dashboard stats for {refreshed} user(s)")
+        return refreshed
+
+    def refresh_dashboard_stats_for_campaign(self, campaign_id: int) -> int:
+        """Recompute the dashboard stats of a campaign's owner.
+
+        Args:
+            campaign_id: Campaign whose owner to refresh
+
+        Returns:
+            Number of rows written (0 if the campaign doesn't exist)
+        """
+        with self.db.get_cursor() as cur:
+            return self._refresh_dashboard_stats_for_campaign(cur, campaign_id)
+
+    def _refresh_dashboard_stats(self, cur, user_ids: list[int] | None) -> int:
+        """Recompute dashboard stats on an open cursor (in the caller's transaction)."""
+        cur.execute(REFRESH_USER_DASHBOARD_STATS, (user_ids, user_ids))
+        return cur.rowcount
+
+    def _refresh_dashboard_stats_for_campaign(self, cur, campaign_id: int) -> int:
+        """Recompute the dashboard stats of a campaign's owner on an open cursor."""
+        cur.execute(GET_CAMPAIGN_OWNER, (campaign_id,))
+        owner = cur.fetchone()
+        if not owner or owner[0] is None:
+            return 0
+        return self._refresh_dashboard_stats(cur, [owner[0]])
 
     def _validate_ranking_weights(self, ranking_weights: dict[str, float]) -> None:
         """Validate ranking weights dictionary.
@@ -534,6 +575,7 @@ class CampaignService:
 
             # Update status
             cur.execute(TOGGLE_CAMPAIGN_ACTIVE, (new_status, datetime.now(), campaign_id))
+            self._refresh_dashboard_stats_for_campaign(cur, campaign_id)
 
         logger.info(f"Toggled campaign {campaign_id} active status to {new_status}")
         return new_status
@@ -569,6 +611,8 @@ class CampaignService:
                 raise ValueError(f"Campaign {campaign_id} not found")
 
             campaign_name = result[0]
+            cur.execute(GET_CAMPAIGN_OWNER, (campaign_id,))
+            owner = cur.fetchone()
 
             # Manual cleanup for tables without FK constraints or CASCADE DELETE
             # This ensures data is removed even if FK constraints aren't set up yet
@@ -645,6 +689,8 @@ class CampaignService:
             # - marts.dim_ranking (if FK constraint exists)
             # - marts.etl_run_metrics (if FK constraint exists)
             cur.execute(DELETE_CAMPAIGN, (campaign_id,))
+            if owner and owner[0] is not None:
+                self._refresh_dashboard_stats(cur, [owner[0]])
 
             logger.info(
                 f"Deleted campaign {campaign_id}: {campaign_name}. "
@@ -788,6 +834,30 @@ class CampaignService:
 
             return counts
 
+    def get_campaign_status_version(
+        self, campaign_id: int, dag_run_id: str | None = None
+    ) -> tuple[int, datetime | None]:
+        """Get HTTP cache validators for a campaign's status.
+
+        The status is derived from marts.etl_run_metrics, whose rows are only ever
+        inserted, so the row count and latest run timestamp change whenever it can.
+
+        Args:
+            campaign_id: Campaign ID
+            dag_run_id: Optional DAG run ID to restrict to
+
+        Returns:
+            Tuple of (number of metrics rows, latest run timestamp or None)
+        """
+        query = GET_CAMPAIGN_METRICS_VERSION
+        params: list[Any] = [campaign_id]
+        if dag_run_id:
+            query += CAMPAIGN_METRICS_VERSION_DAG_RUN_FILTER
+            params.append(dag_run_id)
+        with self.db.get_cursor(read_only=True) as cur:
+            cur.execute(query, params)
+            return cur.fetchone()
+
     def get_campaign_status_from_metrics(
         self, campaign_id: int, dag_run_id: str | None = None
     ) -> dict[str, Any]:
@@ -854,34 +924,15 @@ class CampaignService:
             params = (campaign_id, campaign_id) + tuple(critical_tasks)
 
         try:
-            # Query for task statuses directly
-            logger.info(
-                f"Querying status for campaign {campaign_id}, dag_run_id: {dag_run_id}, "
-                f"critical_tasks: {critical_tasks}"
-            )
-            logger.info(f"Query: {query}")
-            logger.info(f"Params: {params}")
+            # Query for task statuses directly (polled while a DAG runs, so log at debug)
             with self.db.get_cursor() as cur:
                 try:
                     cur.execute(query, params)
                     task_statuses = cur.fetchall()
-                    logger.info(
-                        f"Query executed successfully. Found {len(task_statuses)} task statuses for campaign {campaign_id}, dag_run_id: {dag_run_id}"
+                    logger.debug(
+                        f"Found {len(task_statuses)} task statuses for campaign {campaign_id}, "
+                        f"dag_run_id: {dag_run_id}: {task_statuses}"
                     )
-                    if task_statuses:
-                        logger.info(f"Task statuses: {task_statuses}")
-                    else:
-                        logger.warning(
-                            f"No task statuses found! Query returned empty for campaign {campaign_id}, "
-                            f"dag_run_id: {dag_run_id}. Query: {query}, Params: {params}"
-                        )
-                        # Try a direct query to verify data exists
-                        cur.execute(
-                            "SELECT task_name, task_status FROM marts.etl_run_metrics WHERE campaign_id = %s AND dag_run_id = %s LIMIT 5",
-                            (campaign_id, dag_run_id),
-                        )
-                        all_tasks = cur.fetchall()
-                        logger.warning(f"All tasks for this dag_run_id: {all_tasks}")
                 except Exception as query_error:
                     logger.error(
                         f"Error executing query for campaign {campaign_id}: {query_error}",
@@ -985,7 +1036,7 @@ class CampaignService:
                             result = cur2.fetchone()
                             if result:
                                 found_dag_run_id = result[0]
-                                logger.info(
+                                logger.debug(
                                     f"Retrieved dag_run_id {found_dag_run_id} for campaign {campaign_id}"
                                 )
                     except Exception as e:
@@ -65,6 +65,8 @@ GET_CAMPAIGN_BY_ID = """
         pp.company_size_preference,
         pp.employment_type_preference,
         pp.ranking_weights,
+        pp.ranking_top_k,
+        pp.extraction_high_water_mark,
         pp.total_run_count,
         pp.last_run_at,
         pp.last_run_status,
@@ -129,6 +131,8 @@ UPDATE_CAMPAIGN = """
         company_size_preference = %s,
         employment_type_preference = %s,
         ranking_weights = %s,
+        -- Search parameters may have changed: next extraction searches the full window
+        extraction_high_water_mark = NULL,
         updated_at = %s
     WHERE campaign_id = %s
 """
@@ -235,3 +239,159 @@ GET_JOB_COUNTS_OVER_TIME = """
     GROUP BY DATE(run_timestamp)
     ORDER BY run_date ASC
 """
+
+# Query to get the owner of a campaign (whose dashboard stats a campaign change affects)
+GET_CAMPAIGN_OWNER = """
+    SELECT user_id FROM marts.job_campaigns WHERE campaign_id = %s
+"""
+
+# Query to recompute marts.user_dashboard_stats rows for a set of users (NULL = all users).
+# Activity covers the dashboard's 7-day window (today and the 6 days before) as
+# {"YYYY-MM-DD": count} objects; days without activity are omitted. Each refresh
+# increments the row's data_version (the user's HTTP cache validator).
+# Params: user_ids, user_ids (int[] or NULL)
+REFRESH_USER_DASHBOARD_STATS = """
+    INSERT INTO marts.user_dashboard_stats (
+        user_id,
+        total_campaigns,
+        active_campaigns,
+        jobs_processed,
+        tracked_jobs,
+        acted_jobs,
+        found_by_day,
+        applied_by_day,
+        updated_at
+    )
+    SELECT
+        u.user_id,
+        c.total_campaigns,
+        c.active_campaigns,
+        r.jobs_processed,
+        s.tracked_jobs,
+        s.acted_jobs,
+        f.found_by_day,
+        a.applied_by_day,
+        CURRENT_TIMESTAMP
+    FROM marts.users u
+    CROSS JOIN LATERAL (
+        SELECT
+            COUNT(*) as total_campaigns,
+            COUNT(*) FILTER (WHERE jc.is_active) as active_campaigns
+        FROM marts.job_campaigns jc
+        WHERE jc.user_id = u.user_id
+    ) c
+    CROSS JOIN LATERAL (
+        SELECT COUNT(*) as jobs_processed
+        FROM marts.dim_ranking dr
+        INNER JOIN marts.job_campaigns jc
+            ON dr.campaign_id = jc.campaign_id
+        WHERE jc.user_id = u.user_id
+    ) r
+    CROSS JOIN LATERAL (
+        SELECT
+            COUNT(*) as tracked_jobs,
+            COUNT(*) FILTER (WHERE ujs.status != 'waiting') as acted_jobs
+        FROM marts.user_job_status ujs
+        WHERE ujs.user_id = u.user_id
+    ) s
+    CROSS JOIN LATERAL (
+        SELECT COALESCE(jsonb_object_agg(d.day, d.found), '{}'::jsonb) as found_by_day
+        FROM (
+            SELECT
+                DATE(erm.run_timestamp)::text as day,
+                COALESCE(SUM(erm.rows_processed_raw), 0) as found
+            FROM marts.etl_run_metrics erm
+            INNER JOIN marts.job_campaigns jc
+                ON erm.campaign_id = jc.campaign_id
+            WHERE jc.user_id = u.user_id
+                AND erm.task_name = 'extract_job_postings'
+                AND erm.run_timestamp >= CURRENT_DATE - 6
+            GROUP BY 1
+        ) d
+    ) f
+    CROSS JOIN LATERAL (
+        SELECT COALESCE(jsonb_object_agg(d.day, d.applied), '{}'::jsonb) as applied_by_day
+        FROM (
+            SELECT DATE(ujs.created_at)::text as day, COUNT(*) as applied
+            FROM marts.user_job_status ujs
+            WHERE ujs.user_id = u.user_id
+                AND ujs.status != 'waiting'
+                AND ujs.created_at >= CURRENT_DATE - 6
+            GROUP BY 1
+        ) d
+    ) a
+    WHERE %s::int[] IS NULL OR u.user_id = ANY(%s::int[])
+    ON CONFLICT (user_id)
+    DO UPDATE SET
+        total_campaigns = EXCLUDED.total_campaigns,
+        active_campaigns = EXCLUDED.active_campaigns,
+        jobs_processed = EXCLUDED.jobs_processed,
+        tracked_jobs = EXCLUDED.tracked_jobs,
+        acted_jobs = EXCLUDED.acted_jobs,
+        found_by_day = EXCLUDED.found_by_day,
+        applied_by_day = EXCLUDED.applied_by_day,
+        data_version = marts.user_dashboard_stats.data_version + 1,
+        updated_at = EXCLUDED.updated_at
+"""
+
+# Dashboard stats columns, followed by the database's current date (the activity window
+# is relative to it)
+DASHBOARD_STATS_COLUMNS = """
+        total_campaigns,
+        active_campaigns,
+        jobs_processed,
+        tracked_jobs,
+        acted_jobs,
+        found_by_day,
+        applied_by_day,
+        CURRENT_DATE as today"""
+
+# Query to get one user's dashboard stats (primary key read)
+GET_USER_DASHBOARD_STATS = f"""
+    SELECT{DASHBOARD_STATS_COLUMNS}
+    FROM marts.user_dashboard_stats
+    WHERE user_id = %s
+"""
+
+# Query to get every user's dashboard stats (admin dashboard sums them)
+GET_ALL_DASHBOARD_STATS = f"""
+    SELECT{DASHBOARD_STATS_COLUMNS}
+    FROM marts.user_dashboard_stats
+"""
+
+# Query to get a user's data version and when it last changed (HTTP cache validators)
+GET_USER_DATA_VERSION = """
+    SELECT data_version, 1, updated_at
+    FROM marts.user_dashboard_stats
+    WHERE user_id = %s
+"""
+
+# Query to get the data version across all users (admin views). The row count is
+# included so removing a user changes the result.
+GET_ALL_DATA_VERSION = """
+    SELECT COALESCE(SUM(data_version), 0), COUNT(*), MAX(updated_at)
+    FROM marts.user_dashboard_stats
+"""
+
+# Query to get the number of metrics rows and the latest run timestamp of a campaign
+# (HTTP cache validators for its status; metrics rows are only ever inserted).
+# Optional filter: CAMPAIGN_METRICS_VERSION_DAG_RUN_FILTER
+GET_CAMPAIGN_METRICS_VERSION = """
+    SELECT COUNT(*), MAX(run_timestamp)
+    FROM marts.etl_run_metrics
+    WHERE campaign_id = %s
+"""
+
+CAMPAIGN_METRICS_VERSION_DAG_RUN_FILTER = """
+        AND dag_run_id = %s"""
+
+# Query to get users that have no dashboard stats row yet
+GET_USERS_WITHOUT_DASHBOARD_STATS = """
+    SELECT u.user_id
+    FROM marts.users u
+    WHERE NOT EXISTS (
+        SELECT 1
+        FROM marts.user_dashboard_stats uds
+        WHERE uds.user_id = u.user_id
+    )
+"""
@@ -8,13 +8,18 @@ This package contains services for extracting data from external APIs:
 """
 
 from .company_extractor import CompanyExtractor
+from .company_name_index import CompanyNameIndex, normalize_company_name
 from .glassdoor_client import GlassdoorClient
 from .job_extractor import JobExtractor
 from .jsearch_client import JSearchClient
+from .response_cache import ResponseCache
 
 __all__ = [
     "JSearchClient",
     "GlassdoorClient",
     "CompanyExtractor",
+    "CompanyNameIndex",
+    "normalize_company_name",
     "JobExtractor",
+    "ResponseCache",
 ]
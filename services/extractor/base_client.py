@@ -2,7 +2,8 @@
 Base API Client
 
 Abstract base class for API clients with common functionality:
-- Rate limiting
+- Rate limiting (token bucket shared per host, see rate_limiter.py)
+- Optional disk-backed response cache (see response_cache.py)
 - Retry logic with exponential backoff
 - Error handling
 - Logging
@@ -11,7 +12,6 @@ Abstract base class for API clients with common functionality:
 from __future__ import annotations
 
 import logging
-import time
 from abc import ABC, abstractmethod
 from typing import Any
 
@@ -19,6 +19,9 @@ import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from .rate_limiter import TokenBucketRateLimiter, get_rate_limiter
+from .response_cache import ResponseCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -38,6 +41,8 @@ class BaseAPIClient(ABC):
         max_retries: int = 3,
         retry_backoff_factor: float = 2.0,
         timeout: int = 30,
+        rate_limiter: TokenBucketRateLimiter | None = None,
+        response_cache: ResponseCache | None = None,
     ):
         """
         Initialize the API client.
@@ -49,6 +54,11 @@ class BaseAPIClient(ABC):
             max_retries: Maximum number of retry attempts
             retry_backoff_factor: Multiplier for exponential backoff
             timeout: Request timeout in seconds
+            rate_limiter: Rate limiter to throttle requests with. Defaults to the
+                limiter shared by all clients of the same host, allowing one request
+                per rate_limit_delay seconds.
+            response_cache: Cache for GET responses. Cache hits skip the rate limiter
+                and the API entirely. None (default) disables caching.
         """
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
@@ -56,7 +66,10 @@ class BaseAPIClient(ABC):
         self.max_retries = max_retries
         self.retry_backoff_factor = retry_backoff_factor
         self.timeout = timeout
-        self.last_request_time = 0.0
+        if rate_limiter is None and rate_limit_delay > 0:
+            rate_limiter = get_rate_limiter(self.base_url, rate=1.0 / rate_limit_delay)
+        self.rate_limiter = rate_limiter
+        self.response_cache = response_cache
 
         # Configure session with retry strategy
         self.session = requests.Session()
@@ -71,16 +84,9 @@ class BaseAPIClient(ABC):
         self.session.mount("https://", adapter)
 
     def _enforce_rate_limit(self):
-        """Enforce rate limiting by waiting if necessary."""
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
-
-        if time_since_last_request < self.rate_limit_delay:
-            sleep_time = self.rate_limit_delay - time_since_last_request
-            logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
-            time.sleep(sleep_time)
-
-        self.last_request_time = time.time()
+        """Enforce rate limiting by waiting for a token if necessary (thread-safe)."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
 
     def _get_headers(self) -> dict[str, str]:
         """
@@ -90,6 +96,63 @@ class BaseAPIClient(ABC):
         """
         return {"x-api-key": self.api_key, "Content-Type": "application/json"}
 
+    def _get_json(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        """
+        Send a rate-limited GET request, answering it from the response cache when possible.
+
+        Fresh cache entries are returned without a request. Stale entries with an
+        ETag/Last-Modified are revalidated with a conditional request, and a 304
+        response reuses the cached body.
+
+        Args:
+            endpoint: API endpoint (relative to base_url)
+            params: Query parameters
+
+        Returns:
+            Parsed JSON response
+
+        Raises:
+            requests.RequestException: If the request fails after retries
+        """
+        url = f"{self.base_url}{endpoint}"
+        headers = self._get_headers()
+
+        cache_key = cached = None
+        if self.response_cache is not None:
+            cache_key = self.response_cache.make_key(url, params)
+            cached = self.response_cache.get(cache_key)
+            if cached is not None and cached.fresh:
+                logger.info(f"API response cache hit: {endpoint}")
+                return cached.data
+            if cached is not None:
+                headers.update(cached.conditional_headers())
+
+        self._enforce_rate_limit()
+        response = self.session.get(url, headers=headers, params=params, timeout=self.timeout)
+        self._log_request(endpoint, params, response.status_code)
+
+        if cached is not None and response.status_code == 304:
+            self.response_cache.refresh(cache_key, response.headers)
+            return cached.data
+
+        data = self._handle_response(response)
+        if (
+            cache_key is not None
+            and response.status_code == 200
+            and self._is_cacheable_response(data)
+        ):
+            self.response_cache.store(cache_key, data, response.headers)
+        return data
+
+    def _is_cacheable_response(self, data: dict[str, Any]) -> bool:
+        """
+        Whether a successful response may be cached.
+
+        Error envelopes (a "status" other than "OK") are never cached so a retry
+        asks the API again. Subclasses can override for other payload formats.
+        """
+        return data.get("status", "OK") == "OK"
+
     @abstractmethod
     def _make_request(
         self, endpoint: str, params: dict[str, Any] | None = None, method: str = "GET"
@@ -9,25 +9,41 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
-from datetime import date, datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
 from typing import Any
 
-from rapidfuzz import fuzz
+from psycopg2.extras import execute_values
+from rapidfuzz import fuzz, process
 from shared import Database
 
+from .company_name_index import DEFAULT_SCORE_CUTOFF, CompanyNameIndex, normalize_company_name
 from .glassdoor_client import GlassdoorClient
 from .queries import (
     CHECK_GLASSDOOR_TABLE_EXISTS,
+    ENQUEUE_COMPANIES_FOR_ENRICHMENT,
     GET_COMPANIES_TO_ENRICH_WITH_TABLE,
     GET_COMPANIES_TO_ENRICH_WITHOUT_TABLE,
+    GET_COMPANY_NAME_INDEX_ENTRIES,
+    GET_ENRICHMENT_QUEUE_HIGH_WATER_MARK,
+    GET_NEW_COMPANIES_TO_ENRICH_SINCE,
+    INSERT_COMPANIES_BULK,
     INSERT_COMPANY,
+    LEASE_COMPANIES_FOR_ENRICHMENT,
     MARK_COMPANY_ERROR,
     MARK_COMPANY_QUEUED,
+    MARK_COMPANY_RESOLVED,
+    UPDATE_ENRICHMENT_RESULTS_BULK,
     UPDATE_ENRICHMENT_STATUS,
 )
 
 logger = logging.getLogger(__name__)
 
+# Incremental scans re-read postings loaded this long before the last enqueue, covering
+# postings staged late (e.g. by an overlapping DAG run)
+ENRICHMENT_SCAN_MARGIN = timedelta(hours=12)
+
 
 class CompanyExtractor:
     """
@@ -35,28 +51,79 @@ class CompanyExtractor:
 
     Scans staging.jsearch_job_postings for employer names, identifies companies
     not yet enriched, and calls Glassdoor API to fetch company data.
+
+    In leased mode (lease_batch_size set), companies are enqueued in
+    staging.company_enrichment_queue and worker threads lease batches with
+    FOR UPDATE SKIP LOCKED, so several extractors (threads or Airflow workers)
+    can drain the queue at once.
+
+    Before searching Glassdoor, each company is resolved against a local index of
+    already-enriched company names (see CompanyNameIndex); name variants that
+    match an existing company are marked enriched without an API call.
     """
 
-    def __init__(self, database: Database, glassdoor_client: GlassdoorClient):
+    def __init__(
+        self,
+        database: Database,
+        glassdoor_client: GlassdoorClient,
+        lease_batch_size: int | None = None,
+        max_workers: int = 1,
+        lease_seconds: int = 600,
+        name_match_cutoff: float | None = DEFAULT_SCORE_CUTOFF,
+        incremental_scan: bool = False,
+    ):
         """
         Initialize the company extractor.
 
         Args:
             database: Database connection interface (implements Database protocol)
             glassdoor_client: Glassdoor API client instance
+            lease_batch_size: When set, enrich in leased mode, leasing this many companies
+                per batch and writing each batch's results and statuses in bulk. When
+                None (default), companies are processed one at a time.
+            max_workers: Worker threads in leased mode. API calls from all workers share
+                the client's rate limiter; keep at or below DB_POOL_MAX_CONN.
+            lease_seconds: How long a leased batch stays reserved for its worker. Must
+                cover a batch's API calls; after it expires another worker may retry.
+            name_match_cutoff: Minimum fuzzy score (0-100) for resolving a company to an
+                already-enriched one without an API call. None disables local resolution.
+            incremental_scan: In leased mode, only scan postings loaded since the last
+                company was enqueued (minus ENRICHMENT_SCAN_MARGIN) instead of all postings.
+                Requires lease_batch_size, since leased mode enqueues the whole backlog.
 
         Raises:
-            ValueError: If database or glassdoor_client is None
+            ValueError: If database or glassdoor_client is None, or an option is invalid
         """
         if not database:
             raise ValueError("Database is required")
         if not glassdoor_client:
             raise ValueError("GlassdoorClient is required")
+        if lease_batch_size is not None and (
+            not isinstance(lease_batch_size, int) or lease_batch_size <= 0
+        ):
+            raise ValueError(
+                f"lease_batch_size must be a positive integer, got: {lease_batch_size}"
+            )
+        if not isinstance(max_workers, int) or max_workers <= 0:
+            raise ValueError(f"max_workers must be a positive integer, got: {max_workers}")
+        if not isinstance(lease_seconds, int) or lease_seconds <= 0:
+            raise ValueError(f"lease_seconds must be a positive integer, got: {lease_seconds}")
+        if incremental_scan and lease_batch_size is None:
+            raise ValueError("incremental_scan requires lease_batch_size")
 
         self.db = database
         self.client = glassdoor_client
-
-    def get_companies_to_enrich(self, limit: int | None = None) -> list[str]:
+        self.lease_batch_size = lease_batch_size
+        self.max_workers = max_workers
+        self.lease_seconds = lease_seconds
+        self.name_match_cutoff = name_match_cutoff
+        self.incremental_scan = incremental_scan
+        self._name_index: CompanyNameIndex | None = None
+        self._name_index_lock = threading.Lock()
+
+    def get_companies_to_enrich(
+        self, limit: int | None = None, since: datetime | None = None
+    ) -> list[str]:
         """
         Get list of company lookup keys that need enrichment.
 
@@ -65,6 +132,8 @@ class CompanyExtractor:
 
         Args:
             limit: Maximum number of companies to return (None for all)
+            since: Only scan postings loaded at or after this time, plus companies whose
+                enrichment errored (None scans all postings)
 
         Returns:
             List of company lookup keys (normalized company names)
@@ -81,7 +150,11 @@ class CompanyExtractor:
 
             # Get unique employer names from staging that aren't already enriched
             # Check both staging.glassdoor_companies (if it exists) and company_enrichment_queue
-            if glassdoor_table_exists:
+            params: tuple = ()
+            if glassdoor_table_exists and since is not None:
+                query = GET_NEW_COMPANIES_TO_ENRICH_SINCE
+                params = (since,)
+            elif glassdoor_table_exists:
                 query = GET_COMPANIES_TO_ENRICH_WITH_TABLE
             else:
                 # If staging.glassdoor_companies doesn't exist yet (first run), only check queue
@@ -92,7 +165,9 @@ class CompanyExtractor:
 
             if limit:
                 query += " LIMIT %s"
-                cur.execute(query, (limit,))
+                params += (limit,)
+            if params:
+                cur.execute(query, params)
             else:
                 cur.execute(query)
             companies = [row[0] for row in cur.fetchall()]
@@ -110,6 +185,61 @@ class CompanyExtractor:
         with self.db.get_cursor() as cur:
             cur.execute(MARK_COMPANY_QUEUED, (company_lookup_key,))
 
+    def get_name_index(self) -> CompanyNameIndex:
+        """
+        Get the local index of enriched company names, loading it on first use.
+
+        Returns:
+            CompanyNameIndex built from staging.glassdoor_companies (empty on first run)
+        """
+        with self._name_index_lock:
+            if self._name_index is None:
+                with self.db.get_cursor() as cur:
+                    cur.execute(CHECK_GLASSDOOR_TABLE_EXISTS)
+                    rows = []
+                    if cur.fetchone()[0]:
+                        cur.execute(GET_COMPANY_NAME_INDEX_ENTRIES)
+                        rows = cur.fetchall()
+
+                index = CompanyNameIndex(score_cutoff=self.name_match_cutoff)
+                for company_name, company_lookup_key in rows:
+                    index.add(company_lookup_key, company_lookup_key)
+                    index.add(company_name, company_lookup_key)
+                logger.info(f"Loaded company name index with {len(index)} names")
+                self._name_index = index
+            return self._name_index
+
+    def _resolve_locally(self, company_lookup_key: str) -> str | None:
+        """
+        Resolve a company to an already-enriched company without calling the API.
+
+        Args:
+            company_lookup_key: Normalized company name/domain
+
+        Returns:
+            Lookup key of the matching enriched company, or None
+        """
+        if self.name_match_cutoff is None:
+            return None
+        matched_key = self.get_name_index().resolve(company_lookup_key)
+        if matched_key is not None and matched_key != company_lookup_key:
+            logger.info(f"Resolved company {company_lookup_key} locally to {matched_key}")
+            return matched_key
+        return None
+
+    def _remember_company(self, company_data: dict[str, Any], company_lookup_key: str) -> None:
+        """Add a newly enriched company to the name index so later variants resolve locally."""
+        if self.name_match_cutoff is None:
+            return
+        index = self.get_name_index()
+        index.add(company_lookup_key, company_lookup_key)
+        index.add(company_data.get("name"), company_lookup_key)
+
+    def _mark_company_resolved(self, company_lookup_key: str) -> None:
+        """Mark a company as enriched after resolving it locally."""
+        with self.db.get_cursor() as cur:
+            cur.execute(MARK_COMPANY_RESOLVED, (company_lookup_key,))
+
     def extract_company(self, company_lookup_key: str) -> dict[str, Any] | None:
         """
         Extract company data from Glassdoor API for a single company.
@@ -122,93 +252,105 @@ class CompanyExtractor:
         Returns:
             Company data dictionary if found, None otherwise
         """
-        logger.info(f"Searching Glassdoor for company: {company_lookup_key}")
-
         try:
             # Mark as queued
             self.mark_company_queued(company_lookup_key)
 
-            # Call Glassdoor API
-            response = self.client.search_company(
-                query=company_lookup_key,
-                limit=10,  # Get multiple results for fuzzy matching
-            )
+            status, company_data, error_message = self._lookup_company(company_lookup_key)
+            if status == "not_found":
+                self._mark_company_not_found(company_lookup_key)
+            elif status == "error":
+                self._mark_company_error(company_lookup_key, error_message or "Unknown error")
+            return company_data
 
-            # Check response
-            logger.debug(
-                f"API response for {company_lookup_key}: status={response.get('status')}, keys={list(response.keys()) if isinstance(response, dict) else 'not a dict'}"
-            )
+        except Exception as e:
+            logger.error(f"Error extracting company {company_lookup_key}: {e}", exc_info=True)
+            self._mark_company_error(company_lookup_key, str(e))
+            return None
 
-            # Check if response has error status
-            if response.get("status") and response.get("status") != "OK":
-                logger.warning(
-                    f"API returned non-OK status for {company_lookup_key}: {response.get('status')}"
-                )
-                error_msg = response.get("error", {}).get("message", "Unknown error")
-                logger.warning(f"Error message: {error_msg}")
-                self._mark_company_error(
-                    company_lookup_key, f"API status: {response.get('status')} - {error_msg}"
-                )
-                return None
+    def _lookup_company(
+        self, company_lookup_key: str
+    ) -> tuple[str, dict[str, Any] | None, str | None]:
+        """
+        Search Glassdoor for a company and pick the best match (no database writes).
 
-            # Get companies data - try different possible response structures
-            companies_data = response.get("data", [])
+        Args:
+            company_lookup_key: Normalized company name/domain to search for
 
-            # Log what we got
+        Returns:
+            Tuple of (status, company_data, error_message) where status is one of
+            success, not_found or error.
+
+        Raises:
+            requests.RequestException: If the API request fails
+        """
+        logger.info(f"Searching Glassdoor for company: {company_lookup_key}")
+
+        # Call Glassdoor API
+        response = self.client.search_company(
+            query=company_lookup_key,
+            limit=10,  # Get multiple results for fuzzy matching
+        )
+
+        # Check response
+        logger.debug(
+            f"API response for {company_lookup_key}: status={response.get('status')}, keys={list(response.keys()) if isinstance(response, dict) else 'not a dict'}"
+        )
+
+        # Check if response has error status
+        if response.get("status") and response.get("status") != "OK":
+            logger.warning(
+                f"API returned non-OK status for {company_lookup_key}: {response.get('status')}"
+            )
+            error_msg = response.get("error", {}).get("message", "Unknown error")
+            logger.warning(f"Error message: {error_msg}")
+            return "error", None, f"API status: {response.get('status')} - {error_msg}"
+
+        # Get companies data - try different possible response structures
+        companies_data = response.get("data", [])
+
+        # Log what we got
+        if companies_data:
+            logger.debug(
+                f"Found {len(companies_data)} results in 'data' key for {company_lookup_key}"
+            )
+            logger.debug(f"First result sample: {companies_data[0] if companies_data else 'N/A'}")
+        else:
+            # Try alternative response structure
+            companies_data = response.get("companies", [])
             if companies_data:
                 logger.debug(
-                    f"Found {len(companies_data)} results in 'data' key for {company_lookup_key}"
-                )
-                logger.debug(
-                    f"First result sample: {companies_data[0] if companies_data else 'N/A'}"
+                    f"Found {len(companies_data)} results in 'companies' key for {company_lookup_key}"
                 )
             else:
-                # Try alternative response structure
-                companies_data = response.get("companies", [])
-                if companies_data:
-                    logger.debug(
-                        f"Found {len(companies_data)} results in 'companies' key for {company_lookup_key}"
-                    )
-                else:
-                    # Try if response itself is a list
-                    if isinstance(response, list):
-                        companies_data = response
-                        logger.debug(f"Response is a list with {len(companies_data)} items")
-
-            # Check if data is empty or None
-            if not companies_data or (
-                isinstance(companies_data, list) and len(companies_data) == 0
-            ):
-                # Log at INFO level with more details
-                data_value = response.get("data")
-                status_value = response.get("status", "unknown")
-                logger.info(
-                    f"No company found for: {company_lookup_key} "
-                    f"(status: {status_value}, data type: {type(data_value).__name__}, "
-                    f"data length: {len(data_value) if isinstance(data_value, list) else 'N/A'})"
-                )
-                self._mark_company_not_found(company_lookup_key)
-                return None
+                # Try if response itself is a list
+                if isinstance(response, list):
+                    companies_data = response
+                    logger.debug(f"Response is a list with {len(companies_data)} items")
+
+        # Check if data is empty or None
+        if not companies_data or (isinstance(companies_data, list) and len(companies_data) == 0):
+            # Log at INFO level with more details
+            data_value = response.get("data")
+            status_value = response.get("status", "unknown")
+            logger.info(
+                f"No company found for: {company_lookup_key} "
+                f"(status: {status_value}, data type: {type(data_value).__name__}, "
+                f"data length: {len(data_value) if isinstance(data_value, list) else 'N/A'})"
+            )
+            return "not_found", None, None
 
-            # Use fuzzy matching to select best match
-            company_data = self._select_best_match(companies_data, company_lookup_key)
+        # Use fuzzy matching to select best match
+        company_data = self._select_best_match(companies_data, company_lookup_key)
 
-            if company_data:
-                logger.info(
-                    f"Found company: {company_data.get('name', 'Unknown')} (ID: {company_data.get('company_id')})"
-                )
-                return company_data
-            else:
-                logger.info(
-                    f"No company found with sufficient similarity for: {company_lookup_key}"
-                )
-                self._mark_company_not_found(company_lookup_key)
-                return None
+        if company_data:
+            logger.info(
+                f"Found company: {company_data.get('name', 'Unknown')} (ID: {company_data.get('company_id')})"
+            )
+            return "success", company_data, None
 
-        except Exception as e:
-            logger.error(f"Error extracting company {company_lookup_key}: {e}", exc_info=True)
-            self._mark_company_error(company_lookup_key, str(e))
-            return None
+        logger.info(f"No company found with sufficient similarity for: {company_lookup_key}")
+        return "not_found", None, None
 
     def _select_best_match(
         self,
@@ -219,6 +361,9 @@ class CompanyExtractor:
         """
         Select the best matching company from API results using fuzzy matching.
 
+        Names are normalized first (see normalize_company_name), so legal suffixes
+        and punctuation don't count against a match.
+
         Args:
             companies_data: List of company dictionaries from API
             company_lookup_key: Original normalized company name to match against
@@ -230,51 +375,37 @@ class CompanyExtractor:
         if not companies_data:
             return None
 
-        if len(companies_data) == 1:
-            # Only one result, return it if similarity is acceptable
-            company_name = companies_data[0].get("name", "")
-            similarity = fuzz.ratio(company_lookup_key.lower(), company_name.lower()) / 100.0
-            if similarity >= similarity_threshold:
-                return companies_data[0]
-            else:
-                logger.warning(
-                    f"Single result similarity ({similarity:.2%}) below threshold "
-                    f"({similarity_threshold:.2%}) for {company_lookup_key}"
-                )
-                return None
-
-        # Multiple results - find best match
-        best_match = None
-        best_similarity = 0.0
-
-        for company in companies_data:
-            company_name = company.get("name", "")
-            if not company_name:
-                continue
-
-            # Calculate similarity ratio (0-100, convert to 0-1)
-            similarity = fuzz.ratio(company_lookup_key.lower(), company_name.lower()) / 100.0
+        # Candidate names by result position (results without a name are skipped)
+        choices = {
+            i: normalized
+            for i, company in enumerate(companies_data)
+            if (normalized := normalize_company_name(company.get("name")))
+        }
+        match = process.extractOne(
+            normalize_company_name(company_lookup_key), choices, scorer=fuzz.ratio
+        )
+        if match is None:
+            logger.warning(f"No named results to match for {company_lookup_key}")
+            return None
 
-            if similarity > best_similarity:
-                best_similarity = similarity
-                best_match = company
+        _, score, best_index = match
+        best_match = companies_data[best_index]
+        best_similarity = score / 100.0
 
         # Check if best match meets threshold
-        if best_match and best_similarity >= similarity_threshold:
+        if best_similarity >= similarity_threshold:
             logger.info(
                 f"Selected best match: '{best_match.get('name')}' "
                 f"(similarity: {best_similarity:.2%}) for '{company_lookup_key}'"
             )
             return best_match
-        else:
-            logger.warning(
-                f"Best match similarity ({best_similarity:.2%}) below threshold "
-                f"({similarity_threshold:.2%}) for {company_lookup_key}"
-            )
-            logger.debug(
-                f"Available matches: {[c.get('name', 'Unknown') for c in companies_data[:3]]}"
-            )
-            return None
+
+        logger.warning(
+            f"Best match similarity ({best_similarity:.2%}) below threshold "
+            f"({similarity_threshold:.2%}) for {company_lookup_key}"
+        )
+        logger.debug(f"Available matches: {[c.get('name', 'Unknown') for c in companies_data[:3]]}")
+        return None
 
     def _write_company_to_db(self, company_data: dict[str, Any], company_lookup_key: str):
         """
@@ -285,30 +416,29 @@ class CompanyExtractor:
             company_lookup_key: Lookup key used to find the company
         """
         with self.db.get_cursor() as cur:
-            now = datetime.now()
-            today = date.today()
-
-            # Generate surrogate key
-            company_id = company_data.get("company_id", "")
-            key_string = f"{company_id}|{company_lookup_key}"
-            glassdoor_companies_key = int(hashlib.md5(key_string.encode()).hexdigest()[:15], 16)
-
             # Note: Duplicates will be handled by staging layer deduplication
-            cur.execute(
-                INSERT_COMPANY,
-                (
-                    glassdoor_companies_key,
-                    json.dumps(company_data),
-                    company_lookup_key,
-                    today,
-                    now,
-                    "glassdoor",
-                ),
-            )
+            cur.execute(INSERT_COMPANY, self._company_row(company_data, company_lookup_key))
 
             # Mark as successful in enrichment queue
             self._mark_company_success(company_lookup_key)
 
+    @staticmethod
+    def _company_row(company_data: dict[str, Any], company_lookup_key: str) -> tuple:
+        """Build the raw.glassdoor_companies row for a company."""
+        # Generate surrogate key
+        company_id = company_data.get("company_id", "")
+        key_string = f"{company_id}|{company_lookup_key}"
+        glassdoor_companies_key = int(hashlib.md5(key_string.encode()).hexdigest()[:15], 16)
+
+        return (
+            glassdoor_companies_key,
+            json.dumps(company_data),
+            company_lookup_key,
+            date.today(),
+            datetime.now(),
+            "glassdoor",
+        )
+
     def _mark_company_success(self, company_lookup_key: str):
         """Mark company as successfully enriched."""
         self._update_enrichment_status(company_lookup_key, "success")
@@ -327,6 +457,147 @@ class CompanyExtractor:
         with self.db.get_cursor() as cur:
             cur.execute(UPDATE_ENRICHMENT_STATUS, (status, status, company_lookup_key))
 
+    def enqueue_companies(
+        self, company_lookup_keys: list[str], queued_at: datetime | None = None
+    ) -> None:
+        """
+        Add companies to the enrichment queue as pending (retrying previous errors).
+
+        Args:
+            company_lookup_keys: Normalized company names/domains
+            queued_at: first_queued_at for new companies (defaults to now)
+        """
+        if not company_lookup_keys:
+            return
+        queued_at = queued_at or datetime.now()
+        with self.db.get_cursor() as cur:
+            execute_values(
+                cur,
+                ENQUEUE_COMPANIES_FOR_ENRICHMENT,
+                [(key, "pending", queued_at, 0) for key in company_lookup_keys],
+            )
+
+    def get_incremental_scan_start(self) -> datetime | None:
+        """
+        Get the posting load time an incremental scan starts from.
+
+        Returns:
+            Last enqueue time minus ENRICHMENT_SCAN_MARGIN, or None if the queue is empty
+        """
+        with self.db.get_cursor() as cur:
+            cur.execute(GET_ENRICHMENT_QUEUE_HIGH_WATER_MARK)
+            high_water_mark = cur.fetchone()[0]
+        return high_water_mark - ENRICHMENT_SCAN_MARGIN if high_water_mark else None
+
+    def lease_companies(self, batch_size: int) -> list[str]:
+        """
+        Lease a batch of pending companies from the enrichment queue.
+
+        Companies leased by other workers are skipped, not waited on.
+
+        Args:
+            batch_size: Maximum number of companies to lease
+
+        Returns:
+            Leased company lookup keys (empty when the queue is drained)
+        """
+        with self.db.get_cursor() as cur:
+            cur.execute(LEASE_COMPANIES_FOR_ENRICHMENT, (self.lease_seconds, batch_size))
+            return sorted(row[0] for row in cur.fetchall())
+
+    def _enrich_leased_batch(self, company_lookup_keys: list[str]) -> dict[str, str]:
+        """
+        Look up a leased batch and write companies and statuses back in one transaction.
+
+        Args:
+            company_lookup_keys: Leased company lookup keys
+
+        Returns:
+            Dictionary mapping company_lookup_key to status (success/resolved/not_found/error)
+        """
+        company_rows = []
+        status_rows = []
+        results = {}
+        for company_lookup_key in company_lookup_keys:
+            try:
+                if self._resolve_locally(company_lookup_key):
+                    status_rows.append((company_lookup_key, "success", None))
+                    results[company_lookup_key] = "resolved"
+                    continue
+                status, company_data, error_message = self._lookup_company(company_lookup_key)
+            except Exception as e:
+                logger.error(f"Error extracting company {company_lookup_key}: {e}", exc_info=True)
+                status, company_data, error_message = "error", None, str(e)
+
+            if company_data:
+                company_rows.append(self._company_row(company_data, company_lookup_key))
+                self._remember_company(company_data, company_lookup_key)
+            status_rows.append(
+                (company_lookup_key, status, error_message[:500] if error_message else None)
+            )
+            results[company_lookup_key] = status
+
+        with self.db.get_cursor() as cur:
+            if company_rows:
+                # Note: Duplicates will be handled by staging layer deduplication
+                execute_values(cur, INSERT_COMPANIES_BULK, company_rows)
+            execute_values(cur, UPDATE_ENRICHMENT_RESULTS_BULK, status_rows)
+
+        return results
+
+    def _extract_leased_companies(self, limit: int | None = None) -> dict[str, str]:
+        """
+        Enqueue companies needing enrichment, then drain the queue with leasing workers.
+
+        Args:
+            limit: Maximum number of companies this extractor processes (None for all)
+
+        Returns:
+            Dictionary mapping company_lookup_key to status (success/not_found/error)
+        """
+        # New companies are stamped with the scan start so the next incremental scan
+        # covers postings loaded while this one ran
+        scan_started_at = datetime.now()
+        since = self.get_incremental_scan_start() if self.incremental_scan else None
+        self.enqueue_companies(self.get_companies_to_enrich(since=since), queued_at=scan_started_at)
+
+        results: dict[str, str] = {}
+        results_lock = threading.Lock()
+        reserved = 0
+
+        def worker() -> None:
+            nonlocal reserved
+            while True:
+                # Reserve batch slots before leasing so workers don't overshoot the limit
+                with results_lock:
+                    batch_size = self.lease_batch_size
+                    if limit is not None:
+                        batch_size = min(batch_size, limit - reserved)
+                    reserved += max(batch_size, 0)
+                if batch_size <= 0:
+                    return
+
+                leased = self.lease_companies(batch_size)
+                with results_lock:
+                    reserved -= batch_size - len(leased)
+                if not leased:
+                    return
+
+                batch_results = self._enrich_leased_batch(leased)
+                with results_lock:
+                    results.update(batch_results)
+
+        logger.info(
+            f"Enriching companies from queue with {self.max_workers} worker(s), "
+            f"batch size {self.lease_batch_size}"
+        )
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="enrich") as pool:
+            futures = [pool.submit(worker) for _ in range(self.max_workers)]
+            for future in futures:
+                future.result()
+
+        return results
+
     def extract_all_companies(self, limit: int | None = None) -> dict[str, str]:
         """
         Extract company data for all companies needing enrichment.
@@ -335,8 +606,14 @@ class CompanyExtractor:
             limit: Maximum number of companies to process (None for all)
 
         Returns:
-            Dictionary mapping company_lookup_key to status (success/not_found/error)
+            Dictionary mapping company_lookup_key to status (success/not_found/error, or
+            resolved when matched to an enriched company without an API call)
         """
+        if self.lease_batch_size is not None:
+            results = self._extract_leased_companies(limit=limit)
+            self._log_summary(results)
+            return results
+
         companies = self.get_companies_to_enrich(limit=limit)
 
         if not companies:
@@ -346,9 +623,15 @@ class CompanyExtractor:
         results = {}
         for company_lookup_key in companies:
             try:
+                if self._resolve_locally(company_lookup_key):
+                    self._mark_company_resolved(company_lookup_key)
+                    results[company_lookup_key] = "resolved"
+                    continue
+
                 company_data = self.extract_company(company_lookup_key)
                 if company_data:
                     self._write_company_to_db(company_data, company_lookup_key)
+                    self._remember_company(company_data, company_lookup_key)
                     results[company_lookup_key] = "success"
                 else:
                     results[company_lookup_key] = "not_found"
@@ -356,13 +639,18 @@ class CompanyExtractor:
                 logger.error(f"Failed to extract company {company_lookup_key}: {e}")
                 results[company_lookup_key] = "error"
 
-        # Print summary
+        self._log_summary(results)
+        return results
+
+    @staticmethod
+    def _log_summary(results: dict[str, str]) -> None:
+        """Log success/resolved/not_found/error counts for an extraction run."""
         success_count = sum(1 for v in results.values() if v == "success")
+        resolved_count = sum(1 for v in results.values() if v == "resolved")
         not_found_count = sum(1 for v in results.values() if v == "not_found")
         error_count = sum(1 for v in results.values() if v == "error")
 
         logger.info(
-            f"Extraction complete. Success: {success_count}, Not Found: {not_found_count}, Errors: {error_count}"
+            f"Extraction complete. Success: {success_count}, Resolved locally: {resolved_count}, "
+            f"Not Found: {not_found_count}, Errors: {error_count}"
         )
-
-        return results
@@ -0,0 +1,148 @@
+"""
+Company Name Index
+
+Local company-name resolution for the Glassdoor extractor. Names are
+normalized (case, punctuation and trailing legal suffixes such as "Inc." or
+"LLC") and matched against companies that are already enriched, so variants
+like "Google LLC", "google" and "Google Inc." resolve to the same company
+without another Glassdoor search.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from collections.abc import Iterable
+
+from rapidfuzz import fuzz, process
+
+# Legal-form suffixes dropped from the end of company names before matching
+LEGAL_SUFFIXES = frozenset(
+    {
+        "ag",
+        "bv",
+        "co",
+        "company",
+        "corp",
+        "corporation",
+        "gmbh",
+        "inc",
+        "incorporated",
+        "limited",
+        "llc",
+        "llp",
+        "lp",
+        "ltd",
+        "plc",
+        "pty",
+        "sa",
+        "sarl",
+        "srl",
+    }
+)
+
+# Default minimum fuzz.ratio score (0-100) for a fuzzy match
+DEFAULT_SCORE_CUTOFF = 90.0
+
+# Names shorter than this (after normalization) only match exactly
+MIN_FUZZY_MATCH_LENGTH = 4
+
+_NON_ALPHANUMERIC = re.compile(r"[^\w]+")
+
+
+def normalize_company_name(name: str | None) -> str:
+    """
+    Normalize a company name for matching.
+
+    Lowercases, treats "&" as "and", strips punctuation and drops trailing legal
+    suffixes ("Acme Holdings, Inc." -> "acme holdings"). A name made only of
+    suffixes keeps its last token so it never normalizes to an empty string.
+
+    Args:
+        name: Company name or lookup key
+
+    Returns:
+        Normalized name ("" for empty input)
+    """
+    if not name:
+        return ""
+    text = name.casefold().replace("&", " and ").replace("_", " ")
+    tokens = _NON_ALPHANUMERIC.sub(" ", text).split()
+    while len(tokens) > 1 and tokens[-1] in LEGAL_SUFFIXES:
+        tokens.pop()
+    return " ".join(tokens)
+
+
+def name_similarity(first: str | None, second: str | None) -> float:
+    """Similarity (0-100) of two company names after normalization."""
+    return fuzz.ratio(normalize_company_name(first), normalize_company_name(second))
+
+
+class CompanyNameIndex:
+    """
+    In-memory index from normalized company names to company lookup keys.
+
+    Resolution tries an exact normalized match first and falls back to
+    rapidfuzz process.extractOne with a score cutoff. Thread-safe: companies
+    enriched during a run can be added while workers resolve names.
+    """
+
+    def __init__(
+        self,
+        entries: Iterable[tuple[str | None, str]] = (),
+        score_cutoff: float = DEFAULT_SCORE_CUTOFF,
+    ):
+        """
+        Initialize the index.
+
+        Args:
+            entries: (company name, company_lookup_key) pairs of enriched companies
+            score_cutoff: Minimum fuzz.ratio score (0-100) for a fuzzy match
+        """
+        self.score_cutoff = score_cutoff
+        self._lock = threading.Lock()
+        self._keys_by_name: dict[str, str] = {}
+        self._names: list[str] = []
+        for name, company_lookup_key in entries:
+            self.add(name, company_lookup_key)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def add(self, name: str | None, company_lookup_key: str) -> None:
+        """
+        Add an enriched company name (first key registered for a name wins).
+
+        Args:
+            name: Company name or lookup key
+            company_lookup_key: Lookup key of the enriched company
+        """
+        normalized = normalize_company_name(name)
+        if not normalized:
+            return
+        with self._lock:
+            if normalized not in self._keys_by_name:
+                self._keys_by_name[normalized] = company_lookup_key
+                self._names.append(normalized)
+
+    def resolve(self, name: str | None) -> str | None:
+        """
+        Resolve a company name to the lookup key of an enriched company.
+
+        Args:
+            name: Company name or lookup key to resolve
+
+        Returns:
+            Lookup key of the matching company, or None if nothing scores above the cutoff
+        """
+        normalized = normalize_company_name(name)
+        if not normalized:
+            return None
+        with self._lock:
+            company_lookup_key = self._keys_by_name.get(normalized)
+            if company_lookup_key is not None or len(normalized) < MIN_FUZZY_MATCH_LENGTH:
+                return company_lookup_key
+            match = process.extractOne(
+                normalized, self._names, scorer=fuzz.ratio, score_cutoff=self.score_cutoff
+            )
+            return self._keys_by_name[match[0]] if match else None
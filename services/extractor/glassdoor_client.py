@@ -12,6 +12,7 @@ from typing import Any
 import requests
 
 from .base_client import BaseAPIClient
+from .response_cache import ResponseCache
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +30,7 @@ class GlassdoorClient(BaseAPIClient):
         rate_limit_delay: float = 1.0,
         max_retries: int = 3,
         retry_backoff_factor: float = 2.0,
+        response_cache: ResponseCache | None = None,
     ):
         """
         Initialize Glassdoor API client.
@@ -38,6 +40,7 @@ class GlassdoorClient(BaseAPIClient):
             rate_limit_delay: Minimum delay between requests (seconds)
             max_retries: Maximum number of retry attempts
             retry_backoff_factor: Multiplier for exponential backoff
+            response_cache: Response cache for company searches (None disables caching)
         """
         super().__init__(
             api_key=api_key,
@@ -45,6 +48,7 @@ class GlassdoorClient(BaseAPIClient):
             rate_limit_delay=rate_limit_delay,
             max_retries=max_retries,
             retry_backoff_factor=retry_backoff_factor,
+            response_cache=response_cache,
         )
 
     def _make_request(
@@ -64,21 +68,10 @@ class GlassdoorClient(BaseAPIClient):
         Raises:
             requests.RequestException: If the request fails
         """
-        self._enforce_rate_limit()
-
-        url = f"{self.base_url}{endpoint}"
-        headers = self._get_headers()
-
         try:
             if method.upper() == "GET":
-                response = self.session.get(
-                    url, headers=headers, params=params, timeout=self.timeout
-                )
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-
-            self._log_request(endpoint, params, response.status_code)
-            return self._handle_response(response)
+                return self._get_json(endpoint, params)
+            raise ValueError(f"Unsupported HTTP method: {method}")
 
         except requests.RequestException as e:
             logger.error(f"Glassdoor API request failed: {e}")
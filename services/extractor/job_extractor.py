@@ -8,8 +8,10 @@ from __future__ import annotations
 
 import json
 import logging
-from datetime import date, datetime
-from hashlib import md5
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, date, datetime, timedelta
+from hashlib import md5, sha256
 from typing import Any
 
 from jobs.job_status_service import JobStatusService
@@ -22,18 +24,69 @@ from .queries import (
     CHECK_EXISTING_JOBS_FOR_USER,
     GET_ACTIVE_CAMPAIGNS_FOR_JOBS,
     GET_USER_ID_FOR_CAMPAIGN,
+    INSERT_JSEARCH_JOB_DESCRIPTIONS,
     INSERT_JSEARCH_JOB_POSTINGS,
+    UPDATE_EXTRACTION_HIGH_WATER_MARK,
 )
 
 logger = logging.getLogger(__name__)
 
+# JSearch date_posted windows from narrowest to widest ("anytime" is unbounded)
+DATE_WINDOW_DAYS = {"today": 1, "3days": 3, "week": 7, "month": 30}
+
+# Slack added to the gap since the high-water mark when picking a date window, so
+# postings indexed late by the provider (or "today" boundaries) are not missed
+HIGH_WATER_MARK_MARGIN = timedelta(hours=12)
+
+# Raw storage modes for raw.jsearch_job_postings. "full" stores each job object as
+# returned by the API; "slim" keeps only STAGED_JOB_FIELDS and moves job_description
+# to raw.jsearch_job_descriptions, stored once per distinct text (keyed by SHA-256).
+RAW_STORAGE_MODES = ("full", "slim")
+
+# Job fields read by dbt/models/staging/jsearch_job_postings.sql
+STAGED_JOB_FIELDS = frozenset(
+    {
+        "apply_options",
+        "employer_logo",
+        "employer_name",
+        "employer_website",
+        "job_apply_is_direct",
+        "job_apply_link",
+        "job_benefits",
+        "job_city",
+        "job_country",
+        "job_description",
+        "job_employment_type",
+        "job_employment_types",
+        "job_google_link",
+        "job_highlights",
+        "job_id",
+        "job_is_remote",
+        "job_latitude",
+        "job_location",
+        "job_longitude",
+        "job_max_salary",
+        "job_min_salary",
+        "job_onet_job_zone",
+        "job_onet_soc",
+        "job_posted_at",
+        "job_posted_at_datetime_utc",
+        "job_posted_at_timestamp",
+        "job_publisher",
+        "job_salary_period",
+        "job_state",
+        "job_title",
+    }
+)
+
 
 class JobExtractor:
     """
     Service for extracting job postings from JSearch API.
 
-    Reads active campaigns from marts.job_campaigns, calls JSearch API
-    for each campaign, and writes raw JSON responses to raw.jsearch_job_postings.
+    Reads active campaigns from marts.job_campaigns, calls JSearch API once
+    per distinct search (campaigns with identical search parameters share a
+    request), and writes raw JSON responses to raw.jsearch_job_postings.
     """
 
     def __init__(
@@ -41,6 +94,10 @@ class JobExtractor:
         database: Database,
         jsearch_client: JSearchClient,
         num_pages: int,
+        max_workers: int = 1,
+        page_workers: int | None = None,
+        incremental: bool = True,
+        raw_storage: str = "full",
     ):
         """Initialize the job extractor.
 
@@ -48,6 +105,19 @@ class JobExtractor:
             database: Database connection interface (implements Database protocol)
             jsearch_client: JSearch API client instance
             num_pages: Number of pages to fetch per campaign.
+            max_workers: Number of campaigns to extract concurrently. Requests are still
+                throttled by the client's shared rate limiter, and each worker holds at
+                most one database connection at a time, so keep this at or below the
+                connection pool size (DB_POOL_MAX_CONN).
+            page_workers: When set, fetch each search page by page with up to this many
+                page requests in flight, write each page as it arrives and stop once a
+                page contains only jobs that already exist. When None (default), all
+                num_pages are requested in a single call.
+            incremental: Search only the narrowest date window since each campaign's
+                high-water mark (newest posting seen) instead of its full date_window.
+            raw_storage: "full" (default) stores each job object as returned. "slim" drops
+                fields the staging model doesn't read and stores job_description once per
+                distinct text in raw.jsearch_job_descriptions.
         """
         if not database:
             raise ValueError("Database is required")
@@ -55,10 +125,23 @@ class JobExtractor:
             raise ValueError("JSearchClient is required")
         if not isinstance(num_pages, int) or num_pages <= 0:
             raise ValueError(f"num_pages must be a positive integer, got: {num_pages}")
+        if not isinstance(max_workers, int) or max_workers <= 0:
+            raise ValueError(f"max_workers must be a positive integer, got: {max_workers}")
+        if page_workers is not None and (not isinstance(page_workers, int) or page_workers <= 0):
+            raise ValueError(f"page_workers must be a positive integer, got: {page_workers}")
+        if raw_storage not in RAW_STORAGE_MODES:
+            raise ValueError(
+                f"raw_storage must be one of {', '.join(RAW_STORAGE_MODES)}, got: {raw_storage}"
+            )
 
         self.db = database
         self.client = jsearch_client
         self.num_pages = num_pages
+        self.max_workers = max_workers
+        self.page_workers = page_workers
+        self.incremental = incremental
+        self.raw_storage = raw_storage
+        self.last_run_stats: dict[str, int] = {}
 
     def get_active_campaigns(self) -> list[dict[str, Any]]:
         """Get all active campaigns from marts.job_campaigns.
@@ -84,43 +167,216 @@ class JobExtractor:
         Returns:
             Number of jobs extracted
         """
-        campaign_id = campaign["campaign_id"]
-        campaign_name = campaign["campaign_name"]
-        query = campaign["query"]
+        try:
+            return self._extract_search([campaign], raise_errors=True)[0]
+        except Exception as e:
+            logger.error(
+                f"Error extracting jobs for campaign {campaign['campaign_id']}: {e}", exc_info=True
+            )
+            raise
 
-        logger.info(
-            f"Extracting jobs for campaign {campaign_id} ({campaign_name}): query='{query}'"
-        )
+    def _extract_search(
+        self, campaigns: list[dict[str, Any]], raise_errors: bool = False
+    ) -> list[int]:
+        """Fetch jobs once for a group of identical searches and write them to each campaign.
+
+        The search covers only the narrowest date window since the group's high-water
+        mark (see incremental_date_window). With page streaming, fetching stops once a
+        page is new to none of the campaigns or is older than the high-water mark. The
+        mark advances only when the search completes without an API error.
+
+        Args:
+            campaigns: Campaigns sharing one search signature
+            raise_errors: Raise API and write errors instead of logging them. Otherwise
+                an API failure stops the group (pages already written still count) and a
+                write failure zeroes only the affected campaign.
+
+        Returns:
+            Number of jobs written for each campaign, in input order.
+        """
+        campaign_ids = [campaign["campaign_id"] for campaign in campaigns]
+        counts = [0] * len(campaigns)
+        failed: set[int] = set()
+        jobs_seen = 0
+        newest_posted_at: datetime | None = None
+        high_water_mark = self._group_high_water_mark(campaigns)
+        date_window = self.incremental_date_window(campaigns[0].get("date_window"), high_water_mark)
 
         try:
-            # Call JSearch API
-            response = self.client.search_jobs(
-                query=query,
-                location=campaign.get("location"),
-                country=campaign.get("country"),
-                date_posted=campaign.get("date_window"),
-                num_pages=self.num_pages,
-            )
+            for jobs_data in self._iter_job_pages(campaigns[0], date_window):
+                if not jobs_data:
+                    break
+                jobs_seen += len(jobs_data)
+                page_posted_at = [self._job_posted_at(job) for job in jobs_data]
+                newest_posted_at = max(
+                    (p for p in [*page_posted_at, newest_posted_at] if p is not None), default=None
+                )
 
-            # Extract job data from response
-            if response.get("status") != "OK":
-                logger.warning(f"API returned non-OK status: {response.get('status')}")
-                return 0
+                page_written = 0
+                for i, campaign_id in enumerate(campaign_ids):
+                    if i in failed:
+                        continue
+                    try:
+                        written = self._write_jobs_to_db(jobs_data, campaign_id)
+                    except Exception as e:
+                        if raise_errors:
+                            raise
+                        logger.error(f"Failed to extract jobs for campaign {campaign_id}: {e}")
+                        failed.add(i)
+                        counts[i] = 0
+                        continue
+                    counts[i] += written
+                    page_written += written
+
+                if len(failed) == len(campaigns) or self._page_exhausted(
+                    page_written, page_posted_at, high_water_mark, campaign_ids
+                ):
+                    break
+        except Exception as e:
+            if raise_errors:
+                raise
+            logger.error(f"Failed to extract jobs for campaign(s) {campaign_ids}: {e}")
+            return counts
 
-            jobs_data = response.get("data", [])
-            if not jobs_data:
+        for i, campaign_id in enumerate(campaign_ids):
+            if i in failed:
+                continue
+            if not jobs_seen:
                 logger.info(f"No jobs found for campaign {campaign_id}")
-                return 0
+            else:
+                logger.info(f"Extracted {counts[i]} jobs for campaign {campaign_id}")
+            if newest_posted_at is not None:
+                self._update_high_water_mark(campaign_id, newest_posted_at)
+        return counts
+
+    def _iter_job_pages(
+        self, campaign: dict[str, Any], date_window: str | None
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Call the JSearch API with a campaign's search parameters.
+
+        Yields a single batch with all num_pages when page streaming is off, otherwise
+        one batch per page as pages arrive (see JSearchClient.iter_search_pages).
+
+        Args:
+            campaign: Campaign dictionary with search parameters
+            date_window: JSearch date_posted window to search
+
+        Yields:
+            Lists of job posting dictionaries (empty if the API returned a non-OK status).
+        """
+        logger.info(
+            f"Extracting jobs for campaign {campaign['campaign_id']} "
+            f"({campaign['campaign_name']}): query='{campaign['query']}', "
+            f"date_window='{date_window}'"
+        )
+        search_params = {
+            "query": campaign["query"],
+            "location": campaign.get("location"),
+            "country": campaign.get("country"),
+            "date_posted": date_window,
+            "num_pages": self.num_pages,
+        }
+
+        if self.page_workers is not None:
+            yield from self.client.iter_search_pages(**search_params, max_workers=self.page_workers)
+            return
+
+        response = self.client.search_jobs(**search_params)
+        if response.get("status") != "OK":
+            logger.warning(f"API returned non-OK status: {response.get('status')}")
+            yield []
+            return
+
+        yield response.get("data", [])
+
+    def _page_exhausted(
+        self,
+        page_written: int,
+        page_posted_at: list[datetime | None],
+        high_water_mark: datetime | None,
+        campaign_ids: list[int],
+    ) -> bool:
+        """Whether page streaming should stop after this page.
+
+        Stops when the page held only existing jobs, or when every job on the page
+        was posted before the high-water mark.
+        """
+        if self.page_workers is None:
+            return False
+        if not page_written:
+            logger.info(
+                f"Page contained only existing jobs for campaign(s) {campaign_ids}, "
+                "skipping remaining pages"
+            )
+            return True
+        if high_water_mark is not None and all(
+            posted_at is not None and posted_at < high_water_mark for posted_at in page_posted_at
+        ):
+            logger.info(
+                f"Page is older than high-water mark {high_water_mark} for campaign(s) "
+                f"{campaign_ids}, skipping remaining pages"
+            )
+            return True
+        return False
+
+    def _group_high_water_mark(self, campaigns: list[dict[str, Any]]) -> datetime | None:
+        """Oldest high-water mark of a campaign group (None if any campaign has none)."""
+        if not self.incremental:
+            return None
+        marks = [campaign.get("extraction_high_water_mark") for campaign in campaigns]
+        if any(mark is None for mark in marks):
+            return None
+        return min(marks)
+
+    @staticmethod
+    def incremental_date_window(
+        date_window: str | None, high_water_mark: datetime | None, now: datetime | None = None
+    ) -> str | None:
+        """Pick the narrowest JSearch date window that covers the gap since the mark.
+
+        The result is never wider than the campaign's own date_window. Without a mark
+        (first run, or incremental extraction disabled) the campaign's window is used.
 
-            # Write to database
-            jobs_written = self._write_jobs_to_db(jobs_data, campaign_id)
-            logger.info(f"Extracted {jobs_written} jobs for campaign {campaign_id}")
+        Args:
+            date_window: Campaign's configured date window
+            high_water_mark: Newest posting time (UTC) seen for the campaign
+            now: Current UTC time (defaults to now)
 
-            return jobs_written
+        Returns:
+            JSearch date_posted value to search with.
+        """
+        if high_water_mark is None:
+            return date_window
+
+        now = now or datetime.now(UTC).replace(tzinfo=None)
+        gap = now - high_water_mark + HIGH_WATER_MARK_MARGIN
+        campaign_window_days = DATE_WINDOW_DAYS.get(date_window or "")
+        for window, days in DATE_WINDOW_DAYS.items():
+            if campaign_window_days is not None and days >= campaign_window_days:
+                break
+            if timedelta(days=days) >= gap:
+                return window
+        return date_window
+
+    @staticmethod
+    def _job_posted_at(job: dict[str, Any]) -> datetime | None:
+        """Posting time of a JSearch job as naive UTC (None if missing or invalid)."""
+        timestamp = job.get("job_posted_at_timestamp")
+        if timestamp is None:
+            return None
+        try:
+            return datetime.fromtimestamp(int(timestamp), UTC).replace(tzinfo=None)
+        except (TypeError, ValueError, OverflowError, OSError):
+            return None
 
+    def _update_high_water_mark(self, campaign_id: int, posted_at: datetime) -> None:
+        """Advance a campaign's high-water mark (never moves it backwards)."""
+        try:
+            with self.db.get_cursor() as cur:
+                cur.execute(UPDATE_EXTRACTION_HIGH_WATER_MARK, (posted_at, campaign_id))
         except Exception as e:
-            logger.error(f"Error extracting jobs for campaign {campaign_id}: {e}", exc_info=True)
-            raise
+            # Log but don't fail extraction; the next run just searches a wider window
+            logger.warning(f"Failed to update high-water mark for campaign {campaign_id}: {e}")
 
     def _write_jobs_to_db(self, jobs_data: list[dict[str, Any]], campaign_id: int) -> int:
         """Write job postings to raw.jsearch_job_postings table.
@@ -194,69 +450,135 @@ class JobExtractor:
 
         # Prepare data for bulk insert (only unique jobs)
         rows = []
+        descriptions: dict[str, str] = {}
         for job in unique_jobs:
             # Generate surrogate key (using hash of job_id and campaign_id for uniqueness)
             job_id = job.get("job_id", "")
             key_string = f"{job_id}|{campaign_id}"
             jsearch_job_postings_key = int(md5(key_string.encode()).hexdigest()[:15], 16)
 
+            description_hash = None
+            if self.raw_storage == "slim":
+                payload, description_hash, description = self.slim_job_payload(job)
+                if description_hash:
+                    descriptions[description_hash] = description
+            else:
+                payload = job  # Store entire job object as JSONB
+
             rows.append(
                 (
                     jsearch_job_postings_key,
-                    json.dumps(job),  # Store entire job object as JSONB
+                    json.dumps(payload),
                     today,
                     now,
                     "jsearch",
                     campaign_id,
+                    description_hash,
                 )
             )
 
-        # Bulk insert using execute_values for efficiency
+        # Bulk insert using execute_values for efficiency. Descriptions and the job_found
+        # history for the campaign owner are written in the same transaction.
         with self.db.get_cursor() as cur:
+            if descriptions:
+                execute_values(
+                    cur,
+                    INSERT_JSEARCH_JOB_DESCRIPTIONS,
+                    [(key, text, now) for key, text in descriptions.items()],
+                )
             execute_values(cur, INSERT_JSEARCH_JOB_POSTINGS, rows)
 
-        logger.info(
-            f"Inserted {len(rows)} unique jobs for campaign {campaign_id} "
-            f"(skipped {len(jobs_data) - len(rows)} duplicates)"
-        )
-
-        # Record job_found status history for the campaign owner
-        try:
             if user_id is not None:
-                status_service = JobStatusService(self.db)
-
-                # Record history for each newly inserted job
-                for job in unique_jobs:
-                    job_id = job.get("job_id", "")
-                    if job_id:
-                        try:
-                            status_service.record_job_found(
-                                jsearch_job_id=job_id,
-                                user_id=user_id,
-                                campaign_id=campaign_id,
-                            )
-                        except Exception as e:
-                            # Log but don't fail extraction if history recording fails
-                            logger.warning(
-                                f"Failed to record job_found history for job {job_id}: {e}"
-                            )
+                # Savepoint so a history failure doesn't roll back the raw insert
+                cur.execute("SAVEPOINT before_job_found_history")
+                try:
+                    JobStatusService(self.db).record_job_found_bulk(
+                        jsearch_job_ids=[job["job_id"] for job in unique_jobs],
+                        user_id=user_id,
+                        campaign_id=campaign_id,
+                        cur=cur,
+                    )
+                    cur.execute("RELEASE SAVEPOINT before_job_found_history")
+                except Exception as e:
+                    # Log but don't fail extraction if history recording fails
+                    cur.execute("ROLLBACK TO SAVEPOINT before_job_found_history")
+                    logger.warning(f"Error recording job_found history: {e}")
             else:
                 logger.warning(
                     f"Could not find user_id for campaign {campaign_id}, skipping history recording"
                 )
-        except Exception as e:
-            # Log but don't fail extraction if history recording fails
-            logger.warning(f"Error recording job_found history: {e}")
+
+        logger.info(
+            f"Inserted {len(rows)} unique jobs for campaign {campaign_id} "
+            f"(skipped {len(jobs_data) - len(rows)} duplicates)"
+        )
 
         return len(rows)
 
+    @staticmethod
+    def slim_job_payload(job: dict[str, Any]) -> tuple[dict[str, Any], str | None, str | None]:
+        """Split a job object for slim raw storage.
+
+        Args:
+            job: Job posting dictionary from the API
+
+        Returns:
+            Tuple of (payload with only STAGED_JOB_FIELDS minus job_description,
+            SHA-256 hex digest of the description, description text). The hash and
+            text are None when the job has no description.
+        """
+        payload = {
+            field: value
+            for field, value in job.items()
+            if field in STAGED_JOB_FIELDS and field != "job_description"
+        }
+        description = job.get("job_description")
+        if not description:
+            return payload, None, None
+        description_hash = sha256(description.encode("utf-8")).hexdigest()
+        return payload, description_hash, description
+
+    @staticmethod
+    def search_signature(campaign: dict[str, Any]) -> tuple[str, str, str, str]:
+        """Build the normalized search signature used to coalesce identical searches.
+
+        Campaigns with the same signature produce the same JSearch request, so their
+        results can be fetched once and shared.
+
+        Args:
+            campaign: Campaign dictionary with search parameters
+
+        Returns:
+            Tuple of (query, location, country, date_window), lowercased with
+            whitespace collapsed.
+        """
+
+        def normalize(value: Any) -> str:
+            return " ".join(str(value or "").lower().split())
+
+        return (
+            normalize(campaign.get("query")),
+            normalize(campaign.get("location")),
+            normalize(campaign.get("country")),
+            normalize(campaign.get("date_window")),
+        )
+
     def extract_all_jobs(self) -> dict[int, int]:
         """Extract jobs for all active campaigns.
 
+        Campaigns are grouped by search_signature() and each group costs a single API
+        request, whose results are written to every campaign in the group. With
+        max_workers > 1 groups are extracted concurrently on a thread pool; API
+        requests from all workers share the client's rate limiter, so the pool keeps
+        the provider busy up to its allowed rate instead of sleeping between searches.
+
+        Request counts for the run are kept in last_run_stats.
+
         Returns:
             Dictionary mapping campaign_id to number of jobs extracted.
         """
         campaigns = self.get_active_campaigns()
+        self.last_run_stats = {"api_requests_made": 0, "api_requests_saved": 0}
 
         if not campaigns:
             logger.warning(
@@ -264,14 +586,35 @@ class JobExtractor:
             )
             return {}
 
-        results = {}
+        groups: dict[tuple[str, str, str, str], list[dict[str, Any]]] = {}
         for campaign in campaigns:
-            try:
-                count = self.extract_jobs_for_campaign(campaign)
-                results[campaign["campaign_id"]] = count
-            except Exception as e:
-                logger.error(f"Failed to extract jobs for campaign {campaign['campaign_id']}: {e}")
-                results[campaign["campaign_id"]] = 0
+            groups.setdefault(self.search_signature(campaign), []).append(campaign)
+        groups_list = list(groups.values())
+
+        requests_saved = len(campaigns) - len(groups_list)
+        self.last_run_stats = {
+            "api_requests_made": len(groups_list),
+            "api_requests_saved": requests_saved,
+        }
+        if requests_saved:
+            logger.info(
+                f"Coalesced {len(campaigns)} campaigns into {len(groups_list)} searches "
+                f"({requests_saved} API requests saved)"
+            )
+
+        workers = min(self.max_workers, len(groups_list))
+        if workers > 1:
+            logger.info(f"Extracting {len(groups_list)} searches with {workers} workers")
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="extract") as pool:
+                group_counts = list(pool.map(self._extract_search, groups_list))
+        else:
+            group_counts = [self._extract_search(group) for group in groups_list]
+
+        results = {
+            campaign["campaign_id"]: count
+            for group, counts in zip(groups_list, group_counts, strict=True)
+            for campaign, count in zip(group, counts, strict=True)
+        }
 
         total_jobs = sum(results.values())
         logger.info(f"Extraction complete. Total jobs extracted: {total_jobs}")
@@ -7,14 +7,21 @@ Client for interacting with the JSearch API to fetch job postings.
 from __future__ import annotations
 
 import logging
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any
 
 import requests
 
 from .base_client import BaseAPIClient
+from .rate_limiter import TokenBucketRateLimiter
+from .response_cache import ResponseCache
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_JSEARCH_BASE_URL = "https://api.openwebninja.com/jsearch"
+
 
 class JSearchClient(BaseAPIClient):
     """
@@ -29,6 +36,9 @@ class JSearchClient(BaseAPIClient):
         rate_limit_delay: float = 1.0,
         max_retries: int = 3,
         retry_backoff_factor: float = 2.0,
+        base_url: str | None = None,
+        rate_limiter: TokenBucketRateLimiter | None = None,
+        response_cache: ResponseCache | None = None,
     ):
         """
         Initialize JSearch API client.
@@ -38,13 +48,18 @@ class JSearchClient(BaseAPIClient):
             rate_limit_delay: Minimum delay between requests (seconds)
             max_retries: Maximum number of retry attempts
             retry_backoff_factor: Multiplier for exponential backoff
+            base_url: API base URL override (e.g. a local mock server for testing)
+            rate_limiter: Rate limiter override (defaults to the shared per-host limiter)
+            response_cache: Response cache for search requests (None disables caching)
         """
         super().__init__(
             api_key=api_key,
-            base_url="https://api.openwebninja.com/jsearch",
+            base_url=base_url or DEFAULT_JSEARCH_BASE_URL,
             rate_limit_delay=rate_limit_delay,
             max_retries=max_retries,
             retry_backoff_factor=retry_backoff_factor,
+            rate_limiter=rate_limiter,
+            response_cache=response_cache,
         )
 
     def _make_request(
@@ -64,21 +79,10 @@ class JSearchClient(BaseAPIClient):
         Raises:
             requests.RequestException: If the request fails
         """
-        self._enforce_rate_limit()
-
-        url = f"{self.base_url}{endpoint}"
-        headers = self._get_headers()
-
         try:
             if method.upper() == "GET":
-                response = self.session.get(
-                    url, headers=headers, params=params, timeout=self.timeout
-                )
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-
-            self._log_request(endpoint, params, response.status_code)
-            return self._handle_response(response)
+                return self._get_json(endpoint, params)
+            raise ValueError(f"Unsupported HTTP method: {method}")
 
         except requests.RequestException as e:
             logger.error(f"JSearch API request failed: {e}")
@@ -137,3 +141,55 @@ class JSearchClient(BaseAPIClient):
         params.update(kwargs)
 
         return self._make_request("/search", params=params)
+
+    def iter_search_pages(
+        self,
+        query: str,
+        num_pages: int = 1,
+        max_workers: int = 1,
+        **kwargs,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Search for jobs one page at a time, yielding each page's jobs in page order.
+
+        Up to max_workers pages are requested concurrently (still throttled by the
+        client's rate limiter). Pages are requested lazily: when the caller stops
+        iterating, pages that have not started yet are cancelled, so at most
+        max_workers - 1 pages beyond the last consumed one are ever fetched.
+
+        Args:
+            query: Job search query
+            num_pages: Maximum number of pages to fetch
+            max_workers: Maximum number of page requests in flight
+            **kwargs: Other search_jobs parameters (location, country, date_posted, ...)
+
+        Yields:
+            List of job postings for each page (empty for a non-OK response)
+        """
+
+        def fetch_page(page: int) -> list[dict[str, Any]]:
+            response = self.search_jobs(query=query, page=page, num_pages=1, **kwargs)
+            if response.get("status") != "OK":
+                logger.warning(
+                    f"API returned non-OK status for page {page}: {response.get('status')}"
+                )
+                return []
+            return response.get("data", [])
+
+        if max_workers <= 1:
+            for page in range(1, num_pages + 1):
+                yield fetch_page(page)
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="jsearch-page") as pool:
+            pending: deque[Future[list[dict[str, Any]]]] = deque()
+            next_page = 1
+            try:
+                while pending or next_page <= num_pages:
+                    while next_page <= num_pages and len(pending) < max_workers:
+                        pending.append(pool.submit(fetch_page, next_page))
+                        next_page += 1
+                    yield pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
@@ -15,42 +15,86 @@ CHECK_GLASSDOOR_TABLE_EXISTS = """
     )
 """
 
-# Query to get companies needing enrichment when glassdoor_companies table exists
+# Query to get companies needing enrichment when glassdoor_companies table exists.
+# NOT EXISTS anti-joins (rather than NOT IN) plan as hash anti-joins and are NULL-safe.
 GET_COMPANIES_TO_ENRICH_WITH_TABLE = """
-    SELECT DISTINCT
-        lower(trim(employer_name)) as company_lookup_key
-    FROM staging.jsearch_job_postings
-    WHERE employer_name IS NOT NULL
-        AND trim(employer_name) != ''
-        AND lower(trim(employer_name)) NOT IN (
+    SELECT e.company_lookup_key
+    FROM (
+        SELECT DISTINCT lower(trim(employer_name)) AS company_lookup_key
+        FROM staging.jsearch_job_postings
+        WHERE employer_name IS NOT NULL
+            AND trim(employer_name) != ''
+    ) e
+    WHERE NOT EXISTS (
             -- Exclude companies already in staging.glassdoor_companies
-            SELECT DISTINCT company_lookup_key
-            FROM staging.glassdoor_companies
-            WHERE company_lookup_key IS NOT NULL
+            SELECT 1
+            FROM staging.glassdoor_companies g
+            WHERE g.company_lookup_key = e.company_lookup_key
         )
-        AND lower(trim(employer_name)) NOT IN (
+        AND NOT EXISTS (
             -- Exclude companies already successfully enriched or marked as not_found
-            SELECT company_lookup_key
-            FROM staging.company_enrichment_queue
-            WHERE enrichment_status IN ('success', 'not_found')
+            SELECT 1
+            FROM staging.company_enrichment_queue q
+            WHERE q.company_lookup_key = e.company_lookup_key
+                AND q.enrichment_status IN ('success', 'not_found')
         )
-    ORDER BY company_lookup_key
+    ORDER BY e.company_lookup_key
 """
 
 # Query to get companies needing enrichment when glassdoor_companies table doesn't exist yet
 GET_COMPANIES_TO_ENRICH_WITHOUT_TABLE = """
-    SELECT DISTINCT
-        lower(trim(employer_name)) as company_lookup_key
-    FROM staging.jsearch_job_postings
-    WHERE employer_name IS NOT NULL
-        AND trim(employer_name) != ''
-        AND lower(trim(employer_name)) NOT IN (
+    SELECT e.company_lookup_key
+    FROM (
+        SELECT DISTINCT lower(trim(employer_name)) AS company_lookup_key
+        FROM staging.jsearch_job_postings
+        WHERE employer_name IS NOT NULL
+            AND trim(employer_name) != ''
+    ) e
+    WHERE NOT EXISTS (
             -- Exclude companies already successfully enriched or marked as not_found
-            SELECT company_lookup_key
-            FROM staging.company_enrichment_queue
-            WHERE enrichment_status IN ('success', 'not_found')
+            SELECT 1
+            FROM staging.company_enrichment_queue q
+            WHERE q.company_lookup_key = e.company_lookup_key
+                AND q.enrichment_status IN ('success', 'not_found')
         )
-    ORDER BY company_lookup_key
+    ORDER BY e.company_lookup_key
+"""
+
+# Query to get companies needing enrichment from postings loaded since a timestamp
+# (incremental scan). Employers seen before were already enqueued, so only new postings
+# are scanned (idx_stg_jsearch_job_postings_load_timestamp); previously failed companies
+# are picked up from the queue for a retry.
+GET_NEW_COMPANIES_TO_ENRICH_SINCE = """
+    SELECT e.company_lookup_key
+    FROM (
+        SELECT lower(trim(employer_name)) AS company_lookup_key
+        FROM staging.jsearch_job_postings
+        WHERE employer_name IS NOT NULL
+            AND trim(employer_name) != ''
+            AND dwh_load_timestamp >= %s
+        UNION
+        SELECT company_lookup_key
+        FROM staging.company_enrichment_queue
+        WHERE enrichment_status = 'error'
+    ) e
+    WHERE NOT EXISTS (
+            SELECT 1
+            FROM staging.glassdoor_companies g
+            WHERE g.company_lookup_key = e.company_lookup_key
+        )
+        AND NOT EXISTS (
+            SELECT 1
+            FROM staging.company_enrichment_queue q
+            WHERE q.company_lookup_key = e.company_lookup_key
+                AND q.enrichment_status IN ('success', 'not_found')
+        )
+    ORDER BY e.company_lookup_key
+"""
+
+# Query to get the incremental scan watermark: when the last new company was enqueued
+GET_ENRICHMENT_QUEUE_HIGH_WATER_MARK = """
+    SELECT max(first_queued_at)
+    FROM staging.company_enrichment_queue
 """
 
 # Query to mark a company as queued/pending in the enrichment queue
@@ -99,6 +143,99 @@ UPDATE_ENRICHMENT_STATUS = """
     WHERE company_lookup_key = %s
 """
 
+# Query to list enriched company names for the local name index.
+# Both the Glassdoor name and the lookup key that found it resolve to that lookup key.
+GET_COMPANY_NAME_INDEX_ENTRIES = """
+    SELECT company_name, company_lookup_key
+    FROM staging.glassdoor_companies
+    WHERE company_lookup_key IS NOT NULL
+"""
+
+# Query to mark a company as enriched by resolving it locally to an existing company
+# (no API call). Inserts the queue row if the company was never queued.
+MARK_COMPANY_RESOLVED = """
+    INSERT INTO staging.company_enrichment_queue (
+        company_lookup_key,
+        enrichment_status,
+        first_queued_at,
+        last_attempt_at,
+        completed_at,
+        attempt_count
+    ) VALUES (%s, 'success', CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, 0)
+    ON CONFLICT (company_lookup_key)
+    DO UPDATE SET
+        enrichment_status = 'success',
+        last_attempt_at = CURRENT_TIMESTAMP,
+        completed_at = CURRENT_TIMESTAMP,
+        leased_until = NULL
+"""
+
+# Query to enqueue companies for leased (concurrent) enrichment, used with execute_values.
+# New companies are added as pending; companies that previously errored are retried.
+# Pending rows (possibly leased by another worker) and finished rows are left alone.
+ENQUEUE_COMPANIES_FOR_ENRICHMENT = """
+    INSERT INTO staging.company_enrichment_queue AS q (
+        company_lookup_key,
+        enrichment_status,
+        first_queued_at,
+        attempt_count
+    ) VALUES %s
+    ON CONFLICT (company_lookup_key)
+    DO UPDATE SET
+        enrichment_status = 'pending',
+        leased_until = NULL
+    WHERE q.enrichment_status = 'error'
+"""
+
+# Query to lease a batch of pending companies for enrichment.
+# FOR UPDATE SKIP LOCKED lets several workers lease concurrently without blocking or
+# double-leasing; leased_until makes the lease survive the short transaction, and an
+# expired lease (crashed worker) makes the company leasable again.
+LEASE_COMPANIES_FOR_ENRICHMENT = """
+    UPDATE staging.company_enrichment_queue AS q
+    SET leased_until = CURRENT_TIMESTAMP + %s * INTERVAL '1 second',
+        last_attempt_at = CURRENT_TIMESTAMP,
+        attempt_count = COALESCE(q.attempt_count, 0) + 1
+    WHERE q.company_lookup_key IN (
+        SELECT company_lookup_key
+        FROM staging.company_enrichment_queue
+        WHERE enrichment_status = 'pending'
+            AND (leased_until IS NULL OR leased_until < CURRENT_TIMESTAMP)
+        ORDER BY company_lookup_key
+        LIMIT %s
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING q.company_lookup_key
+"""
+
+# Query to write back enrichment results for a leased batch, used with execute_values.
+# Each VALUES row is (company_lookup_key, status, error_message); releases the lease.
+UPDATE_ENRICHMENT_RESULTS_BULK = """
+    UPDATE staging.company_enrichment_queue AS q
+    SET enrichment_status = v.status,
+        last_attempt_at = CURRENT_TIMESTAMP,
+        completed_at = CASE
+            WHEN v.status IN ('success', 'not_found') THEN CURRENT_TIMESTAMP
+            ELSE q.completed_at
+        END,
+        error_message = CASE WHEN v.status = 'error' THEN v.error_message ELSE q.error_message END,
+        leased_until = NULL
+    FROM (VALUES %s) AS v (company_lookup_key, status, error_message)
+    WHERE q.company_lookup_key = v.company_lookup_key
+"""
+
+# Base INSERT for raw.glassdoor_companies, used with execute_values
+INSERT_COMPANIES_BULK = """
+    INSERT INTO raw.glassdoor_companies (
+        glassdoor_companies_key,
+        raw_payload,
+        company_lookup_key,
+        dwh_load_date,
+        dwh_load_timestamp,
+        dwh_source_system
+    ) VALUES %s
+"""
+
 
 # === JobExtractor queries ===
 
@@ -112,12 +249,21 @@ GET_ACTIVE_CAMPAIGNS_FOR_JOBS = """
         country,
         date_window,
         email,
-        user_id
+        user_id,
+        extraction_high_water_mark
     FROM marts.job_campaigns
     WHERE is_active = true
     ORDER BY campaign_id
 """
 
+# Query to advance a campaign's extraction high-water mark (newest job_posted_at seen).
+# GREATEST ignores NULL, so the first run sets it and later runs never move it back.
+UPDATE_EXTRACTION_HIGH_WATER_MARK = """
+    UPDATE marts.job_campaigns
+    SET extraction_high_water_mark = GREATEST(extraction_high_water_mark, %s)
+    WHERE campaign_id = %s
+"""
+
 # Query to get user_id for a campaign
 GET_USER_ID_FOR_CAMPAIGN = """
     SELECT user_id
@@ -156,6 +302,18 @@ INSERT_JSEARCH_JOB_POSTINGS = """
         dwh_load_date,
         dwh_load_timestamp,
         dwh_source_system,
-        campaign_id
+        campaign_id,
+        job_description_hash
+    ) VALUES %s
+"""
+
+# Base INSERT for raw.jsearch_job_descriptions (slim raw storage), used with execute_values.
+# Each distinct description is stored once; repeats (same job in several campaigns) are skipped.
+INSERT_JSEARCH_JOB_DESCRIPTIONS = """
+    INSERT INTO raw.jsearch_job_descriptions (
+        description_hash,
+        job_description,
+        dwh_load_timestamp
     ) VALUES %s
+    ON CONFLICT (description_hash) DO NOTHING
 """
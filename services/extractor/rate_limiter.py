@@ -0,0 +1,118 @@
+"""
+Rate Limiter
+
+Thread-safe token-bucket rate limiter for outbound API requests. Limiters are
+shared per host through a module-level registry so that every client instance
+(and every worker thread) talking to the same provider draws from one bucket,
+packing requests right up to the provider's allowed rate.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# Module-level limiter registry: host -> TokenBucketRateLimiter
+# Shared across all API client instances that talk to the same host.
+_limiters: dict[str, TokenBucketRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+class TokenBucketRateLimiter:
+    """
+    Thread-safe token bucket.
+
+    Tokens refill continuously at `rate` per second up to `capacity`. Each request
+    takes one token; when the bucket is empty the caller reserves the next token
+    and sleeps until it is due. The lock is never held while sleeping, so waiting
+    threads are released in FIFO order at exactly the configured rate.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            rate: Sustained requests per second
+            capacity: Maximum burst size (tokens that can accumulate while idle)
+            clock: Monotonic clock function (injectable for tests)
+            sleep: Sleep function (injectable for tests)
+
+        Raises:
+            ValueError: If rate or capacity is not positive
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got: {rate}")
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, got: {capacity}")
+
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = capacity
+        self._updated_at = clock()
+
+    def acquire(self) -> float:
+        """
+        Take one token, sleeping until it is available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            # Reserve the token even if it is not there yet; a negative balance
+            # queues later callers behind this one.
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            logger.debug(f"Rate limiting: sleeping for {wait:.2f} seconds")
+            self._sleep(wait)
+        return wait
+
+
+def get_rate_limiter(url: str, rate: float, capacity: float = 1.0) -> TokenBucketRateLimiter:
+    """
+    Get or create the shared rate limiter for a URL's host.
+
+    The first caller for a host defines its rate and capacity; later callers for
+    the same host share that limiter.
+
+    Args:
+        url: Any URL on the provider's host (e.g. the client's base_url)
+        rate: Sustained requests per second
+        capacity: Maximum burst size
+
+    Returns:
+        Shared TokenBucketRateLimiter for the host
+    """
+    host = urlparse(url).netloc or url
+    with _limiters_lock:
+        limiter = _limiters.get(host)
+        if limiter is None:
+            limiter = TokenBucketRateLimiter(rate=rate, capacity=capacity)
+            _limiters[host] = limiter
+            logger.debug(f"Created rate limiter for {host} (rate={rate}/s, capacity={capacity})")
+        return limiter
+
+
+def reset_rate_limiters() -> None:
+    """Drop all shared rate limiters (used by tests and on reconfiguration)."""
+    with _limiters_lock:
+        _limiters.clear()
@@ -0,0 +1,268 @@
+"""
+Response Cache
+
+Disk-backed cache of JSON API responses, keyed by request URL and query
+parameters. A DAG retry or a same-day manual re-trigger repeats the exact
+JSearch/Glassdoor requests of the previous attempt; with a cache those
+requests are answered locally instead of spending API quota again.
+
+Entries live in a SQLite file, so the cache survives task retries and is
+shared by every worker process on the host. Freshness comes from the
+response's Cache-Control/Expires headers when present, otherwise from a
+default TTL. Stale entries that carry an ETag or Last-Modified validator are
+revalidated with a conditional request (a 304 refreshes the entry).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Default freshness for responses without cache headers (one day covers same-day re-triggers)
+DEFAULT_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# Stale entries are kept this long past expiry for conditional revalidation
+MAX_STALE_SECONDS = 7 * 24 * 60 * 60
+
+CACHE_FILE_NAME = "api_responses.sqlite3"
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS responses (
+        cache_key TEXT PRIMARY KEY,
+        body TEXT NOT NULL,
+        etag TEXT,
+        last_modified TEXT,
+        stored_at REAL NOT NULL,
+        expires_at REAL NOT NULL
+    )
+"""
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A cached JSON response and its validators."""
+
+    data: dict[str, Any]
+    etag: str | None
+    last_modified: str | None
+    expires_at: float
+    fresh: bool
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Headers for revalidating this entry with a conditional request."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def ttl_from_headers(headers: Mapping[str, str], default_ttl: float, now: float) -> float | None:
+    """
+    Work out how long a response may be served from cache.
+
+    Cache-Control no-store/private responses are not cached (None); no-cache
+    stores the response as immediately stale so it is always revalidated.
+    max-age wins over Expires; without either the default TTL applies.
+
+    Args:
+        headers: Response headers (case-insensitive mapping)
+        default_ttl: TTL in seconds when the response has no freshness headers
+        now: Current wall-clock time (epoch seconds)
+
+    Returns:
+        TTL in seconds, or None if the response must not be stored
+    """
+    directives = {}
+    for part in (headers.get("Cache-Control") or "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"')
+
+    if "no-store" in directives or "private" in directives:
+        return None
+    if "no-cache" in directives:
+        return 0.0
+    if "max-age" in directives:
+        try:
+            return max(float(directives["max-age"]), 0.0)
+        except ValueError:
+            pass
+    if headers.get("Expires"):
+        try:
+            return max(parsedate_to_datetime(headers["Expires"]).timestamp() - now, 0.0)
+        except (TypeError, ValueError):
+            return 0.0
+    return default_ttl
+
+
+class ResponseCache:
+    """
+    SQLite-backed JSON response cache with TTL and hit/miss counters.
+
+    Thread-safe: one connection is shared behind a lock. Several processes may
+    open the same file; SQLite serializes their writes.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        default_ttl: float = DEFAULT_CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Open (or create) the cache.
+
+        Args:
+            path: SQLite file path (":memory:" for a process-local cache)
+            default_ttl: Freshness in seconds for responses without cache headers
+            clock: Wall-clock time function (injectable for tests)
+
+        Raises:
+            ValueError: If default_ttl is negative
+        """
+        if default_ttl < 0:
+            raise ValueError(f"default_ttl must not be negative, got: {default_ttl}")
+
+        self.path = path
+        self.default_ttl = default_ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._lock, self._conn:
+            if path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(_SCHEMA)
+            self._conn.execute(
+                "DELETE FROM responses WHERE expires_at < ?", (clock() - MAX_STALE_SECONDS,)
+            )
+
+    @staticmethod
+    def make_key(url: str, params: Mapping[str, Any] | None = None) -> str:
+        """
+        Build the cache key for a request.
+
+        Args:
+            url: Full request URL (base URL + endpoint)
+            params: Query parameters (order-insensitive)
+
+        Returns:
+            Hex digest identifying the request
+        """
+        canonical = json.dumps([url, params or {}], sort_keys=True, default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get(self, cache_key: str) -> CachedResponse | None:
+        """
+        Look up a response, counting a hit only if it is fresh.
+
+        Stale entries are still returned (fresh=False) so the caller can revalidate them.
+
+        Args:
+            cache_key: Key from make_key()
+
+        Returns:
+            Cached response, or None if nothing is stored
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, etag, last_modified, expires_at FROM responses WHERE cache_key = ?",
+                (cache_key,),
+            ).fetchone()
+            fresh = row is not None and row[3] > self._clock()
+            if fresh:
+                self.hits += 1
+            else:
+                self.misses += 1
+        if row is None:
+            return None
+        return CachedResponse(
+            data=json.loads(row[0]),
+            etag=row[1],
+            last_modified=row[2],
+            expires_at=row[3],
+            fresh=fresh,
+        )
+
+    def store(self, cache_key: str, data: dict[str, Any], headers: Mapping[str, str]) -> bool:
+        """
+        Store a response, honoring its cache headers.
+
+        Args:
+            cache_key: Key from make_key()
+            data: Parsed JSON response
+            headers: Response headers
+
+        Returns:
+            True if stored, False if the response must not be cached
+        """
+        now = self._clock()
+        ttl = ttl_from_headers(headers, self.default_ttl, now)
+        if ttl is None:
+            return False
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(cache_key, body, etag, last_modified, stored_at, expires_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    cache_key,
+                    json.dumps(data),
+                    headers.get("ETag"),
+                    headers.get("Last-Modified"),
+                    now,
+                    now + ttl,
+                ),
+            )
+        return True
+
+    def refresh(self, cache_key: str, headers: Mapping[str, str]) -> None:
+        """
+        Extend a stale entry after the server answered 304 Not Modified.
+
+        Args:
+            cache_key: Key from make_key()
+            headers: Headers of the 304 response
+        """
+        now = self._clock()
+        ttl = ttl_from_headers(headers, self.default_ttl, now) or 0.0
+        with self._lock, self._conn:
+            self.revalidations += 1
+            self._conn.execute(
+                "UPDATE responses SET stored_at = ?, expires_at = ? WHERE cache_key = ?",
+                (now, now + ttl, cache_key),
+            )
+
+    def stats(self) -> dict[str, int]:
+        """Hit/miss/revalidation counters since the cache was opened."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidations": self.revalidations,
+            }
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._conn.close()
@@ -1,7 +1,13 @@
 """Job viewing, notes, and status services."""
 
 from .job_note_service import JobNoteService
-from .job_service import JobService
+from .job_service import JobService, decode_jobs_cursor, encode_jobs_cursor
 from .job_status_service import JobStatusService
 
-__all__ = ["JobService", "JobNoteService", "JobStatusService"]
+__all__ = [
+    "JobService",
+    "JobNoteService",
+    "JobStatusService",
+    "decode_jobs_cursor",
+    "encode_jobs_cursor",
+]
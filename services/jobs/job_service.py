@@ -2,21 +2,93 @@
 
 from __future__ import annotations
 
+import base64
+import binascii
+import json
 import logging
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
 from typing import Any
 
 from shared.database import Database
+from shared.row_set import RowSet
 
 from .queries import (
     GET_JOB_BY_ID,
     GET_JOB_COUNTS_FOR_CAMPAIGNS,
     GET_JOBS_FOR_CAMPAIGN_BASE,
     GET_JOBS_FOR_USER_BASE,
+    GET_RECENT_JOBS_FOR_USER,
     GET_SAME_COMPANY_JOBS,
+    JOBS_FOR_CAMPAIGN_KEYSET_FILTER,
+    JOBS_FOR_CAMPAIGN_ORDER_BY,
+    JOBS_FOR_USER_KEYSET_FILTER,
+    JOBS_FOR_USER_ORDER_BY,
+    JOBS_LIST_PAGE_LIMIT,
 )
 
 logger = logging.getLogger(__name__)
 
+_REJECTED_FILTER = "\n            AND COALESCE(ujs.status, 'waiting') != 'rejected'"
+
+
+def encode_jobs_cursor(job: dict[str, Any]) -> str:
+    """Build the opaque cursor for the page after a job in the jobs list.
+
+    Args:
+        job: Last job of a page (from get_jobs_for_campaign or get_jobs_for_user)
+
+    Returns:
+        URL-safe cursor encoding the job's sort key
+        (rank_score, ranked_at, jsearch_job_id, campaign_id)
+    """
+    rank_score = job.get("rank_score")
+    ranked_at = job.get("ranked_at")
+    key = [
+        "-Infinity" if rank_score is None else str(rank_score),
+        "-infinity" if ranked_at is None else ranked_at.isoformat(),
+        job["jsearch_job_id"],
+        job.get("campaign_id"),
+    ]
+    encoded = base64.urlsafe_b64encode(json.dumps(key).encode("utf-8"))
+    return encoded.decode("ascii").rstrip("=")
+
+
+def decode_jobs_cursor(cursor: str) -> tuple[str, str, str, int | None]:
+    """Decode a cursor from encode_jobs_cursor.
+
+    Args:
+        cursor: Cursor string from a previous page
+
+    Returns:
+        (rank_score, ranked_at, jsearch_job_id, campaign_id) with the score and
+        timestamp as strings for the query's numeric/timestamp casts
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        rank_score, ranked_at, jsearch_job_id, campaign_id = json.loads(
+            base64.urlsafe_b64decode(padded.encode("ascii"))
+        )
+        Decimal(rank_score)
+        if ranked_at != "-infinity":
+            datetime.fromisoformat(ranked_at)
+        if not isinstance(jsearch_job_id, str):
+            raise TypeError("jsearch_job_id must be a string")
+        if campaign_id is not None and not isinstance(campaign_id, int):
+            raise TypeError("campaign_id must be an integer")
+    except (
+        binascii.Error,
+        InvalidOperation,
+        TypeError,
+        UnicodeError,
+        ValueError,
+    ) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+    return rank_score, ranked_at, jsearch_job_id, campaign_id
+
 
 class JobService:
     """Service for querying jobs with rankings."""
@@ -38,45 +110,61 @@ class JobService:
         limit: int | None = None,
         offset: int = 0,
         include_rejected: bool = False,
-    ) -> list[dict[str, Any]]:
+        cursor: str | None = None,
+        as_rows: bool = False,
+    ) -> list[dict[str, Any]] | RowSet:
         """Get jobs with rankings for a specific campaign.
 
+        Jobs are ordered by rank score, ranked_at and job id (descending). For
+        pagination pass limit and, for every page after the first, the cursor
+        from encode_jobs_cursor() of the previous page's last job.
+
         Args:
             campaign_id: Campaign ID to get jobs for
             user_id: User ID to fetch notes for
             limit: Maximum number of jobs to return (optional)
             offset: Number of jobs to skip for pagination
             include_rejected: If True, include rejected jobs. Default False.
+            cursor: Only return jobs after this keyset cursor (optional)
+            as_rows: If True, return a RowSet (row tuples plus column names)
+                instead of building a dictionary per job
 
         Returns:
-            List of job dictionaries with ranking, company, and note information
+            List of job dictionaries (or RowSet) with ranking, company, and note information
 
         Raises:
-            ValueError: If limit or offset are negative
+            ValueError: If limit or offset are negative, or the cursor is invalid
         """
         if limit is not None and limit < 0:
             raise ValueError("Limit must be non-negative")
         if offset < 0:
             raise ValueError("Offset must be non-negative")
 
-        query = GET_JOBS_FOR_CAMPAIGN_BASE
+        params: list[Any] = [user_id, campaign_id]
+        filters = ""
         # Add rejected filter if not including rejected jobs
         if not include_rejected:
-            # Insert the filter before ORDER BY in the inner query
+            filters += _REJECTED_FILTER
+        if cursor:
+            filters += JOBS_FOR_CAMPAIGN_KEYSET_FILTER
+            params.extend(decode_jobs_cursor(cursor)[:3])
+        # Insert the filters into the ranked_jobs step, and page it before details are joined
+        query = GET_JOBS_FOR_CAMPAIGN_BASE.replace(
+            "WHERE dr.campaign_id = %s", "WHERE dr.campaign_id = %s" + filters
+        )
+        if limit:
             query = query.replace(
-                "WHERE dr.campaign_id = %s",
-                "WHERE dr.campaign_id = %s\n            AND COALESCE(ujs.status, 'waiting') != 'rejected'",
+                JOBS_FOR_CAMPAIGN_ORDER_BY, JOBS_FOR_CAMPAIGN_ORDER_BY + JOBS_LIST_PAGE_LIMIT
             )
-        if limit:
-            query += f" LIMIT {limit} OFFSET {offset}"
+            params.extend([limit, offset])
+        params.extend([user_id, user_id])
 
-        with self.db.get_cursor() as cur:
-            cur.execute(query, (user_id, user_id, user_id, campaign_id))
-            columns = [desc[0] for desc in cur.description]
-            jobs = [dict(zip(columns, row)) for row in cur.fetchall()]
+        with self.db.get_cursor(read_only=True) as cur:
+            cur.execute(query, params)
+            jobs = RowSet.from_cursor(cur)
 
         logger.debug(f"Retrieved {len(jobs)} job(s) for campaign {campaign_id}")
-        return jobs
+        return jobs if as_rows else jobs.to_dicts()
 
     def get_jobs_for_user(
         self,
@@ -84,44 +172,62 @@ class JobService:
         limit: int | None = None,
         offset: int = 0,
         include_rejected: bool = False,
-    ) -> list[dict[str, Any]]:
+        cursor: str | None = None,
+        as_rows: bool = False,
+    ) -> list[dict[str, Any]] | RowSet:
         """Get jobs with rankings for all campaigns belonging to a user.
 
+        Ordered and paginated like get_jobs_for_campaign(), with the campaign id
+        as the final tie-breaker.
+
         Args:
             user_id: User ID to get jobs for
             limit: Maximum number of jobs to return (optional)
             offset: Number of jobs to skip for pagination
             include_rejected: If True, include rejected jobs. Default False.
+            cursor: Only return jobs after this keyset cursor (optional)
+            as_rows: If True, return a RowSet (row tuples plus column names)
+                instead of building a dictionary per job
 
         Returns:
-            List of job dictionaries with ranking, company, and note information
+            List of job dictionaries (or RowSet) with ranking, company, and note information
 
         Raises:
-            ValueError: If limit or offset are negative
+            ValueError: If limit or offset are negative, or the cursor is invalid
         """
         if limit is not None and limit < 0:
             raise ValueError("Limit must be non-negative")
         if offset < 0:
             raise ValueError("Offset must be non-negative")
 
-        query = GET_JOBS_FOR_USER_BASE
+        params: list[Any] = [user_id, user_id]
+        filters = ""
         # Add rejected filter if not including rejected jobs
         if not include_rejected:
-            # Insert the filter before ORDER BY in the inner query
+            filters += _REJECTED_FILTER
+        if cursor:
+            keyset = decode_jobs_cursor(cursor)
+            if keyset[3] is None:
+                raise ValueError(f"Invalid cursor: {cursor!r}")
+            filters += JOBS_FOR_USER_KEYSET_FILTER
+            params.extend(keyset)
+        # Insert the filters into the ranked_jobs step, and page it before details are joined
+        query = GET_JOBS_FOR_USER_BASE.replace(
+            "WHERE jc.user_id = %s", "WHERE jc.user_id = %s" + filters
+        )
+        if limit:
             query = query.replace(
-                "WHERE jc.user_id = %s",
-                "WHERE jc.user_id = %s\n            AND COALESCE(ujs.status, 'waiting') != 'rejected'",
+                JOBS_FOR_USER_ORDER_BY, JOBS_FOR_USER_ORDER_BY + JOBS_LIST_PAGE_LIMIT
             )
-        if limit:
-            query += f" LIMIT {limit} OFFSET {offset}"
+            params.extend([limit, offset])
+        params.extend([user_id, user_id])
 
-        with self.db.get_cursor() as cur:
-            cur.execute(query, (user_id, user_id, user_id, user_id))
-            columns = [desc[0] for desc in cur.description]
-            jobs = [dict(zip(columns, row)) for row in cur.fetchall()]
+        with self.db.get_cursor(read_only=True) as cur:
+            cur.execute(query, params)
+            jobs = RowSet.from_cursor(cur)
 
         logger.debug(f"Retrieved {len(jobs)} job(s) for user {user_id}")
-        return jobs
+        return jobs if as_rows else jobs.to_dicts()
 
     def get_job_counts_for_campaigns(self, campaign_ids: list[int]) -> dict[int, int]:
         """Get job counts for multiple campaigns in a single query.
@@ -135,7 +241,7 @@ class JobService:
         if not campaign_ids:
             return {}
 
-        with self.db.get_cursor() as cur:
+        with self.db.get_cursor(read_only=True) as cur:
             cur.execute(GET_JOB_COUNTS_FOR_CAMPAIGNS, (campaign_ids,))
             results = cur.fetchall()
 
@@ -154,19 +260,18 @@ class JobService:
         Returns:
             List of job dictionaries
         """
-        query = GET_JOBS_FOR_USER_BASE
+        query = GET_RECENT_JOBS_FOR_USER
 
         if user_id is None:
             # For admin, we want all jobs. We'll use a dummy user_id for the status/notes joins
             # and remove the campaign owner filter.
             query = query.replace("WHERE jc.user_id = %s", "WHERE 1=1")
-            params = (0, 0, 0, 0)  # user_id for EXISTS, notes, status joins
+            # per-campaign limit, user_id for status, limit, user_id for applied companies and notes
+            params = (limit, 0, limit, 0, 0)
         else:
-            params = (user_id, user_id, user_id, user_id)
-
-        query += f" LIMIT {limit}"
+            params = (limit, user_id, user_id, limit, user_id, user_id)
 
-        with self.db.get_cursor() as cur:
+        with self.db.get_cursor(read_only=True) as cur:
             cur.execute(query, params)
             columns = [desc[0] for desc in cur.description]
             jobs = [dict(zip(columns, row)) for row in cur.fetchall()]
@@ -183,7 +288,7 @@ class JobService:
         Returns:
             Job dictionary or None if not found
         """
-        with self.db.get_cursor() as cur:
+        with self.db.get_cursor(read_only=True) as cur:
             cur.execute(
                 GET_JOB_BY_ID,
                 (
@@ -213,7 +318,7 @@ class JobService:
         Returns jobs in the user's campaigns with the user's application status.
         Excludes the current job. When company_key is null or job not found, returns [].
         """
-        with self.db.get_cursor() as cur:
+        with self.db.get_cursor(read_only=True) as cur:
             cur.execute(
                 GET_SAME_COMPANY_JOBS,
                 (user_id, jsearch_job_id, jsearch_job_id, user_id),
@@ -6,14 +6,20 @@ import json
 import logging
 from typing import Any
 
+from psycopg2.extras import execute_values
 from shared.database import Database
 
 from .queries import (
+    BUMP_ALL_USER_DATA_VERSIONS,
     GET_JOB_STATUS,
     GET_STATUS_HISTORY_BY_JOB,
     GET_STATUS_HISTORY_BY_JOB_AND_USER,
     GET_STATUS_HISTORY_BY_USER,
     INSERT_STATUS_HISTORY,
+    INSERT_STATUS_HISTORY_BULK,
+    REFRESH_ALL_APPLIED_COMPANIES,
+    REFRESH_USER_APPLIED_COMPANIES,
+    REFRESH_USER_DASHBOARD_STATUS_STATS,
     UPSERT_JOB_STATUS,
 )
 
@@ -109,6 +115,12 @@ class JobStatusService:
 
                     # Record history if status changed
                     if old_status != status:
+                        # Same transaction as the upsert, so job lists and the dashboard
+                        # never see the new status with stale derived data
+                        cur.execute(REFRESH_USER_APPLIED_COMPANIES, (user_id, user_id, user_id))
+                        cur.execute(
+                            REFRESH_USER_DASHBOARD_STATUS_STATS, (user_id, user_id, user_id)
+                        )
                         metadata = {
                             "old_status": old_status,
                             "new_status": status,
@@ -130,6 +142,24 @@ class JobStatusService:
             logger.error(f"Error upserting status: {e}", exc_info=True)
             raise
 
+    def refresh_applied_companies(self) -> int:
+        """Rebuild marts.user_applied_companies for all users.
+
+        Statuses keep their own user's set current; this catches changes on the
+        fact_jobs side (company keys change when dbt rebuilds the table). Every
+        user's data version is incremented too, since rebuilt company data shows
+        up in all job lists.
+
+        Returns:
+            Number of rows inserted
+        """
+        with self.db.get_cursor() as cur:
+            cur.execute(BUMP_ALL_USER_DATA_VERSIONS)
+            cur.execute(REFRESH_ALL_APPLIED_COMPANIES)
+            inserted = cur.rowcount
+        logger.info(f"Refreshed user applied companies ({inserted} new rows)")
+        return inserted
+
     def record_status_history(
         self,
         jsearch_job_id: str,
@@ -215,6 +245,49 @@ class JobStatusService:
             metadata=metadata if metadata else None,
         )
 
+    def record_job_found_bulk(
+        self,
+        jsearch_job_ids: list[str],
+        user_id: int,
+        campaign_id: int | None = None,
+        cur: Any | None = None,
+    ) -> int:
+        """Record that many jobs were first found/extracted, in a single INSERT.
+
+        Args:
+            jsearch_job_ids: Job IDs
+            user_id: User ID who owns the campaign
+            campaign_id: Optional campaign ID that found these jobs
+            cur: Optional open cursor. When given, the rows are written in the caller's
+                transaction (e.g. together with the raw job insert); otherwise a cursor
+                is borrowed from the database.
+
+        Returns:
+            Number of history rows inserted
+        """
+        if not jsearch_job_ids:
+            return 0
+
+        metadata_json = json.dumps({"campaign_id": campaign_id}) if campaign_id else None
+        rows = [
+            (job_id, user_id, "job_found", "extraction", "system", None, metadata_json, None)
+            for job_id in jsearch_job_ids
+        ]
+        template = "(%s, %s, %s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP)"
+
+        try:
+            if cur is not None:
+                execute_values(cur, INSERT_STATUS_HISTORY_BULK, rows, template=template)
+            else:
+                with self.db.get_cursor() as own_cur:
+                    execute_values(own_cur, INSERT_STATUS_HISTORY_BULK, rows, template=template)
+        except Exception as e:
+            logger.error(f"Error recording job_found history: {e}", exc_info=True)
+            raise
+
+        logger.debug(f"Recorded job_found history for {len(rows)} jobs, user {user_id}")
+        return len(rows)
+
     def record_ai_update(
         self,
         jsearch_job_id: str,
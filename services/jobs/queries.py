@@ -1,191 +1,265 @@
 """SQL queries for job viewing and job notes."""
 
+# Sort keys of the jobs list: rank score, ranked_at and job id, all descending. NULL scores
+# and timestamps sort last (as -Infinity), which keeps keyset comparisons NULL-free and
+# matches the expression index idx_dim_ranking_campaign_keyset.
+JOBS_LIST_SORT_KEYS = """
+            COALESCE(dr.rank_score, '-Infinity'::numeric) DESC,
+            COALESCE(dr.ranked_at, '-infinity'::timestamp) DESC,
+            dr.jsearch_job_id DESC"""
+
+# ORDER BY of the ranked_jobs step of GET_JOBS_FOR_CAMPAIGN_BASE; the service appends the
+# page limit (JOBS_LIST_PAGE_LIMIT) right after it
+JOBS_FOR_CAMPAIGN_ORDER_BY = f"""
+        ORDER BY{JOBS_LIST_SORT_KEYS}"""
+
+# ORDER BY of the ranked_jobs step of GET_JOBS_FOR_USER_BASE (campaign id breaks ties
+# between the same job ranked in several campaigns)
+JOBS_FOR_USER_ORDER_BY = f"""
+        ORDER BY{JOBS_LIST_SORT_KEYS},
+            dr.campaign_id DESC"""
+
+# Page limit for the ranked_jobs step of the jobs list queries
+JOBS_LIST_PAGE_LIMIT = """
+        LIMIT %s OFFSET %s"""
+
 # Query to get jobs with rankings, companies, notes, and status for a campaign.
-# Uses INNER JOIN fact_jobs so we only show jobs that have full gold data (title,
-# company, location, etc.). Jobs in dim_ranking without fact_jobs are not shown
-# to avoid "Unknown" placeholders in the UI.
-# Note: The rejected filter is applied conditionally in the service method
-GET_JOBS_FOR_CAMPAIGN_BASE = """
-    SELECT
-        jsearch_job_id,
-        campaign_id,
-        rank_score,
-        rank_explain,
-        ranked_at,
-        job_title,
-        job_location,
-        employment_type,
-        job_posted_at_datetime_utc,
-        apply_options,
-        job_apply_link,
-        job_publisher,
-        extracted_skills,
-        job_min_salary,
-        job_max_salary,
-        job_salary_currency,
-        remote_work_type,
-        company_name,
-        company_size,
-        rating,
-        company_link,
-        company_logo,
-        note_count,
-        job_status,
-        user_applied_to_company,
-        job_summary,
-        seniority_level
-    FROM (
-        SELECT DISTINCT ON (dr.jsearch_job_id)
+# Uses fact_jobs so we only show jobs that have full gold data (title, company,
+# location, etc.). Jobs in dim_ranking without fact_jobs are not shown to avoid
+# "Unknown" placeholders in the UI.
+# ranked_jobs picks (and pages) the campaign's rankings first, reading them in
+# idx_dim_ranking_campaign_keyset order; job details, the user's note count (a
+# lateral count on idx_job_notes_job_user) and the "applied to this company" flag
+# (a primary key probe of marts.user_applied_companies) are only looked up for the
+# rows returned.
+# Note: The rejected and keyset filters and the page limit are applied
+# conditionally in the service method
+GET_JOBS_FOR_CAMPAIGN_BASE = f"""
+    WITH ranked_jobs AS (
+        SELECT
             dr.jsearch_job_id,
             dr.campaign_id,
             dr.rank_score,
             dr.rank_explain,
             dr.ranked_at,
-            fj.job_title,
-            fj.job_location,
-            fj.employment_type,
-            fj.job_posted_at_datetime_utc,
-            fj.apply_options,
-            fj.job_apply_link,
-            fj.job_publisher,
-            fj.job_summary,
-            fj.extracted_skills,
-            fj.job_min_salary,
-            fj.job_max_salary,
-            fj.job_salary_period,
-            fj.job_salary_currency,
-            fj.remote_work_type,
-            fj.seniority_level,
-            fj.employer_name,
-            COALESCE(dc.company_name, fj.employer_name) as company_name,
-            dc.company_size,
-            dc.rating,
-            dc.company_link,
-            dc.logo as company_logo,
-            COALESCE(jn.note_count, 0) as note_count,
-            COALESCE(ujs.status, 'waiting') as job_status,
-            (fj.company_key IS NOT NULL AND EXISTS (
-                SELECT 1
-                FROM marts.fact_jobs fj2
-                INNER JOIN marts.user_job_status ujs2
-                    ON fj2.jsearch_job_id = ujs2.jsearch_job_id AND ujs2.user_id = %s
-                WHERE fj2.company_key = fj.company_key
-                  AND ujs2.status != 'waiting'
-            )) as user_applied_to_company
+            COALESCE(dr.rank_score, '-Infinity'::numeric) as sort_rank_score,
+            COALESCE(dr.ranked_at, '-infinity'::timestamp) as sort_ranked_at,
+            COALESCE(ujs.status, 'waiting') as job_status
         FROM marts.dim_ranking dr
-        INNER JOIN marts.job_campaigns jc
-            ON dr.campaign_id = jc.campaign_id
-        INNER JOIN marts.fact_jobs fj
-            ON dr.jsearch_job_id = fj.jsearch_job_id
-            AND dr.campaign_id = fj.campaign_id
-        LEFT JOIN marts.dim_companies dc
-            ON fj.company_key = dc.company_key
-        LEFT JOIN (
-            SELECT jsearch_job_id, user_id, COUNT(*) as note_count
-            FROM marts.job_notes
-            GROUP BY jsearch_job_id, user_id
-        ) jn ON dr.jsearch_job_id = jn.jsearch_job_id AND jn.user_id = %s
         LEFT JOIN marts.user_job_status ujs
             ON dr.jsearch_job_id = ujs.jsearch_job_id
             AND ujs.user_id = %s
         WHERE dr.campaign_id = %s
-        ORDER BY dr.jsearch_job_id, dr.rank_score DESC NULLS LAST, dr.ranked_at DESC NULLS LAST
-    ) ranked_jobs
-    ORDER BY rank_score DESC NULLS LAST, ranked_at DESC NULLS LAST
+            AND EXISTS (
+                SELECT 1
+                FROM marts.fact_jobs fj
+                WHERE fj.jsearch_job_id = dr.jsearch_job_id
+                    AND fj.campaign_id = dr.campaign_id
+            ){JOBS_FOR_CAMPAIGN_ORDER_BY}
+    )
+    SELECT
+        rj.jsearch_job_id,
+        rj.campaign_id,
+        rj.rank_score,
+        rj.rank_explain,
+        rj.ranked_at,
+        fj.job_title,
+        fj.job_location,
+        fj.employment_type,
+        fj.job_posted_at_datetime_utc,
+        fj.apply_options,
+        fj.job_apply_link,
+        fj.job_publisher,
+        fj.extracted_skills,
+        fj.job_min_salary,
+        fj.job_max_salary,
+        fj.job_salary_currency,
+        fj.remote_work_type,
+        COALESCE(dc.company_name, fj.employer_name) as company_name,
+        dc.company_size,
+        dc.rating,
+        dc.company_link,
+        dc.logo as company_logo,
+        COALESCE(jn.note_count, 0) as note_count,
+        rj.job_status,
+        EXISTS (
+            SELECT 1
+            FROM marts.user_applied_companies uac
+            WHERE uac.user_id = %s
+                AND uac.company_key = fj.company_key
+        ) as user_applied_to_company,
+        fj.job_summary,
+        fj.seniority_level
+    FROM ranked_jobs rj
+    INNER JOIN marts.fact_jobs fj
+        ON rj.jsearch_job_id = fj.jsearch_job_id
+        AND rj.campaign_id = fj.campaign_id
+    LEFT JOIN marts.dim_companies dc
+        ON fj.company_key = dc.company_key
+    LEFT JOIN LATERAL (
+        SELECT COUNT(*) as note_count
+        FROM marts.job_notes n
+        WHERE n.jsearch_job_id = rj.jsearch_job_id
+            AND n.user_id = %s
+    ) jn ON true
+    ORDER BY rj.sort_rank_score DESC, rj.sort_ranked_at DESC, rj.jsearch_job_id DESC
 """
 
-# Query to get jobs for all user's campaigns
-# Note: The rejected filter is applied conditionally in the service method
-GET_JOBS_FOR_USER_BASE = """
+# Keyset filter for GET_JOBS_FOR_CAMPAIGN_BASE: rows after the cursor
+# (rank score, ranked_at, job id) in JOBS_LIST_SORT_KEYS order
+JOBS_FOR_CAMPAIGN_KEYSET_FILTER = """
+            AND (
+                COALESCE(dr.rank_score, '-Infinity'::numeric),
+                COALESCE(dr.ranked_at, '-infinity'::timestamp),
+                dr.jsearch_job_id
+            ) < (%s::numeric, %s::timestamp, %s)"""
+
+# Job details, note count, status and "applied to this company" flag for the rows
+# picked by the ranked_jobs step of the user-wide jobs queries
+JOBS_FOR_USER_DETAILS = """
     SELECT
-        jsearch_job_id,
-        campaign_id,
-        campaign_name,
-        rank_score,
-        rank_explain,
-        ranked_at,
-        job_title,
-        job_location,
-        employment_type,
-        job_posted_at_datetime_utc,
-        apply_options,
-        job_apply_link,
-        job_publisher,
-        extracted_skills,
-        job_min_salary,
-        job_max_salary,
-        job_salary_currency,
-        remote_work_type,
-        company_name,
-        company_size,
-        rating,
-        company_link,
-        company_logo,
-        note_count,
-        job_status,
-        user_applied_to_company,
-        job_summary,
-        seniority_level
-    FROM (
-        SELECT DISTINCT ON (dr.jsearch_job_id, dr.campaign_id)
+        rj.jsearch_job_id,
+        rj.campaign_id,
+        rj.campaign_name,
+        rj.rank_score,
+        rj.rank_explain,
+        rj.ranked_at,
+        fj.job_title,
+        fj.job_location,
+        fj.employment_type,
+        fj.job_posted_at_datetime_utc,
+        fj.apply_options,
+        fj.job_apply_link,
+        fj.job_publisher,
+        fj.extracted_skills,
+        fj.job_min_salary,
+        fj.job_max_salary,
+        fj.job_salary_currency,
+        fj.remote_work_type,
+        COALESCE(dc.company_name, fj.employer_name) as company_name,
+        dc.company_size,
+        dc.rating,
+        dc.company_link,
+        dc.logo as company_logo,
+        COALESCE(jn.note_count, 0) as note_count,
+        rj.job_status,
+        EXISTS (
+            SELECT 1
+            FROM marts.user_applied_companies uac
+            WHERE uac.user_id = %s
+                AND uac.company_key = fj.company_key
+        ) as user_applied_to_company,
+        fj.job_summary,
+        fj.seniority_level
+    FROM ranked_jobs rj
+    INNER JOIN marts.fact_jobs fj
+        ON rj.jsearch_job_id = fj.jsearch_job_id
+        AND rj.campaign_id = fj.campaign_id
+    LEFT JOIN marts.dim_companies dc
+        ON fj.company_key = dc.company_key
+    LEFT JOIN LATERAL (
+        SELECT COUNT(*) as note_count
+        FROM marts.job_notes n
+        WHERE n.jsearch_job_id = rj.jsearch_job_id
+            AND n.user_id = %s
+    ) jn ON true
+    ORDER BY
+        rj.sort_rank_score DESC,
+        rj.sort_ranked_at DESC,
+        rj.jsearch_job_id DESC,
+        rj.campaign_id DESC
+"""
+
+# Query to get jobs for all user's campaigns (one row per job and campaign).
+# Same structure as GET_JOBS_FOR_CAMPAIGN_BASE.
+# Note: The rejected and keyset filters and the page limit are applied
+# conditionally in the service method
+GET_JOBS_FOR_USER_BASE = f"""
+    WITH ranked_jobs AS (
+        SELECT
             dr.jsearch_job_id,
             dr.campaign_id,
             jc.campaign_name,
             dr.rank_score,
             dr.rank_explain,
             dr.ranked_at,
-            fj.job_title,
-            fj.job_location,
-            fj.employment_type,
-            fj.job_posted_at_datetime_utc,
-            fj.apply_options,
-            fj.job_apply_link,
-            fj.job_publisher,
-            fj.job_summary,
-            fj.extracted_skills,
-            fj.job_min_salary,
-            fj.job_max_salary,
-            fj.job_salary_period,
-            fj.job_salary_currency,
-            fj.remote_work_type,
-            fj.seniority_level,
-            fj.employer_name,
-            COALESCE(dc.company_name, fj.employer_name) as company_name,
-            dc.company_size,
-            dc.rating,
-            dc.company_link,
-            dc.logo as company_logo,
-            COALESCE(jn.note_count, 0) as note_count,
-            COALESCE(ujs.status, 'waiting') as job_status,
-            (fj.company_key IS NOT NULL AND EXISTS (
-                SELECT 1
-                FROM marts.fact_jobs fj2
-                INNER JOIN marts.user_job_status ujs2
-                    ON fj2.jsearch_job_id = ujs2.jsearch_job_id AND ujs2.user_id = %s
-                WHERE fj2.company_key = fj.company_key
-                  AND ujs2.status != 'waiting'
-            )) as user_applied_to_company
+            COALESCE(dr.rank_score, '-Infinity'::numeric) as sort_rank_score,
+            COALESCE(dr.ranked_at, '-infinity'::timestamp) as sort_ranked_at,
+            COALESCE(ujs.status, 'waiting') as job_status
         FROM marts.dim_ranking dr
-        INNER JOIN marts.fact_jobs fj
-            ON dr.jsearch_job_id = fj.jsearch_job_id
-            AND dr.campaign_id = fj.campaign_id
         INNER JOIN marts.job_campaigns jc
             ON dr.campaign_id = jc.campaign_id
-        LEFT JOIN marts.dim_companies dc
-            ON fj.company_key = dc.company_key
-        LEFT JOIN (
-            SELECT jsearch_job_id, user_id, COUNT(*) as note_count
-            FROM marts.job_notes
-            GROUP BY jsearch_job_id, user_id
-        ) jn ON dr.jsearch_job_id = jn.jsearch_job_id AND jn.user_id = %s
         LEFT JOIN marts.user_job_status ujs
             ON dr.jsearch_job_id = ujs.jsearch_job_id
             AND ujs.user_id = %s
         WHERE jc.user_id = %s
-        ORDER BY dr.jsearch_job_id, dr.campaign_id, dr.rank_score DESC NULLS LAST, dr.ranked_at DESC NULLS LAST
-    ) ranked_jobs
-    ORDER BY rank_score DESC NULLS LAST, ranked_at DESC NULLS LAST
-"""
+            AND EXISTS (
+                SELECT 1
+                FROM marts.fact_jobs fj
+                WHERE fj.jsearch_job_id = dr.jsearch_job_id
+                    AND fj.campaign_id = dr.campaign_id
+            ){JOBS_FOR_USER_ORDER_BY}
+    ){JOBS_FOR_USER_DETAILS}"""
+
+# Query to get a user's top-ranked jobs across campaigns (dashboard "recent jobs").
+# A lateral per-campaign top-N reads each campaign's idx_dim_ranking_campaign_keyset
+# range and stops after N rows, instead of sorting every ranked job of the user.
+# Params: limit (per campaign), user_id (status), user_id (campaign owner), limit,
+# user_id (applied companies), user_id (notes)
+GET_RECENT_JOBS_FOR_USER = f"""
+    WITH ranked_jobs AS (
+        SELECT
+            dr.jsearch_job_id,
+            dr.campaign_id,
+            jc.campaign_name,
+            dr.rank_score,
+            dr.rank_explain,
+            dr.ranked_at,
+            dr.sort_rank_score,
+            dr.sort_ranked_at,
+            COALESCE(ujs.status, 'waiting') as job_status
+        FROM marts.job_campaigns jc
+        CROSS JOIN LATERAL (
+            SELECT
+                dr.jsearch_job_id,
+                dr.campaign_id,
+                dr.rank_score,
+                dr.rank_explain,
+                dr.ranked_at,
+                COALESCE(dr.rank_score, '-Infinity'::numeric) as sort_rank_score,
+                COALESCE(dr.ranked_at, '-infinity'::timestamp) as sort_ranked_at
+            FROM marts.dim_ranking dr
+            WHERE dr.campaign_id = jc.campaign_id
+                AND EXISTS (
+                    SELECT 1
+                    FROM marts.fact_jobs fj
+                    WHERE fj.jsearch_job_id = dr.jsearch_job_id
+                        AND fj.campaign_id = dr.campaign_id
+                )
+            ORDER BY{JOBS_LIST_SORT_KEYS}
+            LIMIT %s
+        ) dr
+        LEFT JOIN marts.user_job_status ujs
+            ON dr.jsearch_job_id = ujs.jsearch_job_id
+            AND ujs.user_id = %s
+        WHERE jc.user_id = %s
+        ORDER BY
+            dr.sort_rank_score DESC,
+            dr.sort_ranked_at DESC,
+            dr.jsearch_job_id DESC,
+            dr.campaign_id DESC
+        LIMIT %s
+    ){JOBS_FOR_USER_DETAILS}"""
+
+# Keyset filter for GET_JOBS_FOR_USER_BASE: rows after the cursor
+# (rank score, ranked_at, job id, campaign id)
+JOBS_FOR_USER_KEYSET_FILTER = """
+            AND (
+                COALESCE(dr.rank_score, '-Infinity'::numeric),
+                COALESCE(dr.ranked_at, '-infinity'::timestamp),
+                dr.jsearch_job_id,
+                dr.campaign_id
+            ) < (%s::numeric, %s::timestamp, %s, %s)"""
 
 # Query to get all notes by job_id and user_id (ordered newest first)
 GET_NOTES_BY_JOB_AND_USER = """
@@ -214,27 +288,46 @@ GET_NOTE_BY_ID = """
     WHERE note_id = %s AND user_id = %s
 """
 
+# Data-modifying CTE that increments the data version (HTTP cache validator) of the
+# user whose note changed; the note queries below run it in the same statement
+NOTE_DATA_VERSION_BUMP = """
+    data_version_bump AS (
+        UPDATE marts.user_dashboard_stats uds
+        SET data_version = uds.data_version + 1, updated_at = CURRENT_TIMESTAMP
+        FROM note
+        WHERE uds.user_id = note.user_id
+    )"""
+
 # Query to insert a new note
-INSERT_NOTE = """
-    INSERT INTO marts.job_notes (jsearch_job_id, user_id, campaign_id, note_text, created_at, updated_at)
-    VALUES (%s, %s, %s, %s, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
-    RETURNING note_id
+INSERT_NOTE = f"""
+    WITH note AS (
+        INSERT INTO marts.job_notes (jsearch_job_id, user_id, campaign_id, note_text, created_at, updated_at)
+        VALUES (%s, %s, %s, %s, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+        RETURNING note_id, user_id
+    ),{NOTE_DATA_VERSION_BUMP}
+    SELECT note_id FROM note
 """
 
 # Query to update an existing note
-UPDATE_NOTE = """
-    UPDATE marts.job_notes
-    SET note_text = %s, updated_at = CURRENT_TIMESTAMP
-    WHERE note_id = %s AND user_id = %s
-    RETURNING note_id
+UPDATE_NOTE = f"""
+    WITH note AS (
+        UPDATE marts.job_notes
+        SET note_text = %s, updated_at = CURRENT_TIMESTAMP
+        WHERE note_id = %s AND user_id = %s
+        RETURNING note_id, user_id
+    ),{NOTE_DATA_VERSION_BUMP}
+    SELECT note_id FROM note
 """
 
 
 # Query to delete a note
-DELETE_NOTE = """
-    DELETE FROM marts.job_notes
-    WHERE note_id = %s AND user_id = %s
-    RETURNING note_id
+DELETE_NOTE = f"""
+    WITH note AS (
+        DELETE FROM marts.job_notes
+        WHERE note_id = %s AND user_id = %s
+        RETURNING note_id, user_id
+    ),{NOTE_DATA_VERSION_BUMP}
+    SELECT note_id FROM note
 """
 
 # Query to get job status by job_id and user_id
@@ -262,6 +355,97 @@ UPSERT_JOB_STATUS = """
     RETURNING user_job_status_id
 """
 
+# Query to refresh one user's marts.user_applied_companies rows: companies where
+# any of the user's jobs has a status other than 'waiting'. Stale rows are deleted and
+# new ones inserted in one statement. Params: user_id (x3).
+REFRESH_USER_APPLIED_COMPANIES = """
+    WITH applied AS (
+        SELECT DISTINCT fj.company_key
+        FROM marts.user_job_status ujs
+        INNER JOIN marts.fact_jobs fj
+            ON ujs.jsearch_job_id = fj.jsearch_job_id
+        WHERE ujs.user_id = %s
+            AND ujs.status != 'waiting'
+            AND fj.company_key IS NOT NULL
+    ),
+    removed AS (
+        DELETE FROM marts.user_applied_companies uac
+        WHERE uac.user_id = %s
+            AND uac.company_key NOT IN (SELECT company_key FROM applied)
+    )
+    INSERT INTO marts.user_applied_companies (user_id, company_key)
+    SELECT %s, company_key
+    FROM applied
+    ON CONFLICT (user_id, company_key) DO NOTHING
+"""
+
+# Query to refresh marts.user_applied_companies for all users (after dbt rebuilds
+# fact_jobs, whose company keys the set is derived from)
+REFRESH_ALL_APPLIED_COMPANIES = """
+    WITH applied AS (
+        SELECT DISTINCT ujs.user_id, fj.company_key
+        FROM marts.user_job_status ujs
+        INNER JOIN marts.fact_jobs fj
+            ON ujs.jsearch_job_id = fj.jsearch_job_id
+        WHERE ujs.status != 'waiting'
+            AND fj.company_key IS NOT NULL
+    ),
+    removed AS (
+        DELETE FROM marts.user_applied_companies uac
+        WHERE NOT EXISTS (
+            SELECT 1
+            FROM applied a
+            WHERE a.user_id = uac.user_id
+                AND a.company_key = uac.company_key
+        )
+    )
+    INSERT INTO marts.user_applied_companies (user_id, company_key)
+    SELECT user_id, company_key
+    FROM applied
+    ON CONFLICT (user_id, company_key) DO NOTHING
+"""
+
+# Query to increment every user's data version (HTTP cache validator) after company
+# data shared by all users' job lists was rebuilt
+BUMP_ALL_USER_DATA_VERSIONS = """
+    UPDATE marts.user_dashboard_stats
+    SET data_version = data_version + 1, updated_at = CURRENT_TIMESTAMP
+"""
+
+# Query to refresh the job status part of a user's marts.user_dashboard_stats row
+# (status counts and applied jobs per day over the dashboard's 7-day window) and
+# increment its data version. Users without a row are skipped; their row is
+# computed in full on first dashboard read.
+# Params: user_id (x3)
+REFRESH_USER_DASHBOARD_STATUS_STATS = """
+    UPDATE marts.user_dashboard_stats uds
+    SET
+        tracked_jobs = s.tracked_jobs,
+        acted_jobs = s.acted_jobs,
+        applied_by_day = a.applied_by_day,
+        data_version = uds.data_version + 1,
+        updated_at = CURRENT_TIMESTAMP
+    FROM (
+        SELECT
+            COUNT(*) as tracked_jobs,
+            COUNT(*) FILTER (WHERE ujs.status != 'waiting') as acted_jobs
+        FROM marts.user_job_status ujs
+        WHERE ujs.user_id = %s
+    ) s,
+    (
+        SELECT COALESCE(jsonb_object_agg(d.day, d.applied), '{}'::jsonb) as applied_by_day
+        FROM (
+            SELECT DATE(ujs.created_at)::text as day, COUNT(*) as applied
+            FROM marts.user_job_status ujs
+            WHERE ujs.user_id = %s
+                AND ujs.status != 'waiting'
+                AND ujs.created_at >= CURRENT_DATE - 6
+            GROUP BY 1
+        ) d
+    ) a
+    WHERE uds.user_id = %s
+"""
+
 # Query to get job counts for multiple campaigns.
 # Count only jobs that exist in both dim_ranking and fact_jobs so the list
 # matches what the campaign detail page shows (same JOIN as GET_JOBS_FOR_CAMPAIGN_BASE).
@@ -435,6 +619,15 @@ INSERT_STATUS_HISTORY = """
     RETURNING history_id
 """
 
+# Query to insert many status history entries with execute_values (one VALUES tuple per row)
+INSERT_STATUS_HISTORY_BULK = """
+    INSERT INTO marts.job_status_history (
+        jsearch_job_id, user_id, status, change_type, changed_by,
+        changed_by_user_id, metadata, notes, created_at
+    )
+    VALUES %s
+"""
+
 # Query to get status history by job and user
 GET_STATUS_HISTORY_BY_JOB_AND_USER = """
     SELECT
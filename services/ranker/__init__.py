@@ -5,5 +5,6 @@ Service for ranking jobs based on campaign preferences.
 """
 
 from .job_ranker import JobRanker
+from .sql_job_ranker import SQLJobRanker
 
-__all__ = ["JobRanker"]
+__all__ = ["JobRanker", "SQLJobRanker"]
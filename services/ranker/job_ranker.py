@@ -6,6 +6,7 @@ Ranks jobs based on campaign preferences and writes scores to marts.dim_ranking
 
 from __future__ import annotations
 
+import heapq
 import json
 import logging
 import re
@@ -13,19 +14,128 @@ from datetime import date, datetime
 from pathlib import Path
 from typing import Any
 
-from psycopg2.extras import execute_values
-from shared import Database
+from shared import Database, copy_rows
 
 from .queries import (
+    CREATE_RANKINGS_LOAD_TABLE,
     GET_ACTIVE_CAMPAIGNS_FOR_RANKING,
     GET_CAMPAIGN_BY_ID,
     GET_JOBS_FOR_CAMPAIGN,
-    INSERT_RANKINGS,
+    GET_JOBS_FOR_CAMPAIGN_STREAM,
+    GET_STATUS_JOB_IDS_FOR_CAMPAIGN,
+    PRUNE_STALE_RANKINGS,
+    TRUNCATE_RANKINGS_LOAD_TABLE,
+    UPSERT_RANKINGS_FROM_LOAD_TABLE,
     VALIDATE_JOB_EXISTS,
 )
 
 logger = logging.getLogger(__name__)
 
+# Ranking factors in the order they are scored. Each factor is persisted as a
+# typed "<factor>_points" column in marts.dim_ranking.
+RANKING_FACTORS = (
+    "location_match",
+    "salary_match",
+    "company_size_match",
+    "skills_match",
+    "keyword_match",
+    "employment_type_match",
+    "seniority_match",
+    "remote_type_match",
+    "recency",
+)
+
+# Default scoring weights (percentages, sum to 100). Used when neither the campaign
+# nor ranking_config.json provides weights.
+DEFAULT_SCORING_WEIGHTS = {
+    "location_match": 15.0,
+    "salary_match": 15.0,
+    "company_size_match": 10.0,
+    "skills_match": 15.0,
+    "keyword_match": 15.0,
+    "employment_type_match": 5.0,
+    "seniority_match": 10.0,
+    "remote_type_match": 10.0,
+    "recency": 5.0,
+}
+
+# Country code -> terms that identify the country in a job location string
+COUNTRY_NAME_TERMS = {
+    "ca": ["canada", "canadian"],
+    "us": ["united states", "usa", "u.s.", "america"],
+    "gb": ["united kingdom", "england", "britain"],
+}
+
+# Company size preference -> (min, max) employee range
+COMPANY_SIZE_RANGES = {
+    "1-50": (1, 50),
+    "51-200": (51, 200),
+    "201-500": (201, 500),
+    "501-1000": (501, 1000),
+    "1001-5000": (1001, 5000),
+    "5001-10000": (5001, 10000),
+    "10000+": (10001, float("inf")),
+}
+
+# Seniority hierarchy used for partial seniority matches
+SENIORITY_LEVELS = {
+    "intern": 1,
+    "entry": 2,
+    "junior": 2,
+    "mid": 3,
+    "senior": 4,
+    "lead": 5,
+    "executive": 6,
+}
+
+# Column order of the COPY load table (see CREATE_RANKINGS_LOAD_TABLE)
+RANKING_LOAD_COLUMNS = (
+    "jsearch_job_id",
+    "campaign_id",
+    "rank_score",
+    *(f"{factor}_points" for factor in RANKING_FACTORS),
+    "ranked_at",
+    "ranked_date",
+    "dwh_load_timestamp",
+    "dwh_source_system",
+)
+
+
+class TopKRankings:
+    """
+    Bounded collection of the best K rankings of a campaign.
+
+    Rankings are pushed through a min-heap of size K while scoring, so memory
+    stays O(K) however many jobs the campaign has. Rankings for job IDs in
+    keep_job_ids (jobs the user has a status for) are always kept and do not
+    count towards K.
+    """
+
+    def __init__(self, k: int, keep_job_ids: set[str] | None = None):
+        self.k = k
+        self.keep_job_ids = keep_job_ids or set()
+        self._heap: list[tuple[float, str, dict[str, Any]]] = []
+        self._kept: list[dict[str, Any]] = []
+
+    def add(self, ranking: dict[str, Any]):
+        """Offer a ranking; it is kept only if it is in the current top K (or protected)."""
+        job_id = ranking["jsearch_job_id"]
+        if job_id in self.keep_job_ids:
+            self._kept.append(ranking)
+            return
+
+        # Ties on rank_score are broken by job ID so the selection is deterministic
+        item = (ranking["rank_score"], job_id, ranking)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, item)
+        elif item[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, item)
+
+    def rankings(self) -> list[dict[str, Any]]:
+        """Return the kept rankings, best first, followed by protected rankings."""
+        top = [item[2] for item in sorted(self._heap, key=lambda item: item[:2], reverse=True)]
+        return top + self._kept
+
 
 class JobRanker:
     """
@@ -35,7 +145,13 @@ class JobRanker:
     scores each job/campaign pair, and writes rankings to marts.dim_ranking table using UPSERT.
     """
 
-    def __init__(self, database: Database, config_path: str | None = None):
+    def __init__(
+        self,
+        database: Database,
+        config_path: str | None = None,
+        stream_chunk_size: int | None = None,
+        top_k: int | None = None,
+    ):
         """
         Initialize the job ranker.
 
@@ -43,14 +159,26 @@ class JobRanker:
             database: Database connection interface (implements Database protocol)
             config_path: Optional path to ranking config JSON file. If not provided,
                         will look for ranking_config.json in the ranker directory.
+            stream_chunk_size: Optional chunk size for streaming mode. When set, jobs are
+                        read through a server-side cursor and scored/written in chunks of
+                        this size, so memory stays constant regardless of campaign size.
+            top_k: Optional default for top-K mode. When set, only the best top_k jobs per
+                        campaign (plus jobs the user has a status for) are kept in
+                        marts.dim_ranking. A campaign's ranking_top_k overrides it.
 
         Raises:
-            ValueError: If database is None
+            ValueError: If database is None or stream_chunk_size/top_k is not positive
         """
         if not database:
             raise ValueError("Database is required")
+        if stream_chunk_size is not None and stream_chunk_size <= 0:
+            raise ValueError("stream_chunk_size must be positive")
+        if top_k is not None and top_k <= 0:
+            raise ValueError("top_k must be positive")
 
         self.db = database
+        self.stream_chunk_size = stream_chunk_size
+        self.top_k = top_k
         self._currency_rates = None  # Lazy-loaded currency rates
         self._scoring_weights = self._load_scoring_weights(config_path)
 
@@ -247,19 +375,6 @@ class JobRanker:
         Returns:
             Dictionary mapping factor names to weights (as percentages)
         """
-        # Default weights
-        default_weights = {
-            "location_match": 15.0,
-            "salary_match": 15.0,
-            "company_size_match": 10.0,
-            "skills_match": 15.0,
-            "keyword_match": 15.0,
-            "employment_type_match": 5.0,
-            "seniority_match": 10.0,
-            "remote_type_match": 10.0,
-            "recency": 5.0,
-        }
-
         # Try to find config file
         possible_paths = [
             config_path,
@@ -292,7 +407,7 @@ class JobRanker:
 
         # Use defaults if config not found
         logger.info("Using default scoring weights")
-        return default_weights
+        return dict(DEFAULT_SCORING_WEIGHTS)
 
     def _score_location_match(self, job: dict[str, Any], campaign: dict[str, Any]) -> float:
         """
@@ -318,14 +433,7 @@ class JobRanker:
 
         # Country match
         if campaign_country:
-            # Common country name mappings
-            country_mappings = {
-                "ca": ["canada", "canadian"],
-                "us": ["united states", "usa", "u.s.", "america"],
-                "gb": ["united kingdom", "england", "britain"],
-            }
-
-            country_terms = country_mappings.get(campaign_country, [campaign_country])
+            country_terms = COUNTRY_NAME_TERMS.get(campaign_country, [campaign_country])
             for term in country_terms:
                 if term in job_location:
                     return 0.7  # Partial match for country
@@ -701,17 +809,6 @@ class JobRanker:
         # Normalize company size values
         company_size_str = str(company_size).strip()
 
-        # Company size ranges
-        size_ranges = {
-            "1-50": (1, 50),
-            "51-200": (51, 200),
-            "201-500": (201, 500),
-            "501-1000": (501, 1000),
-            "1001-5000": (1001, 5000),
-            "5001-10000": (5001, 10000),
-            "10000+": (10001, float("inf")),
-        }
-
         # Extract numeric value from company_size
         job_size_num = self._parse_company_size_numeric(company_size_str)
 
@@ -726,8 +823,8 @@ class JobRanker:
                 continue
 
             # Check if job size falls within campaign preference range
-            if campaign_preference in size_ranges:
-                min_size, max_size = size_ranges[campaign_preference]
+            if campaign_preference in COMPANY_SIZE_RANGES:
+                min_size, max_size = COMPANY_SIZE_RANGES[campaign_preference]
                 if min_size <= job_size_num <= max_size:
                     best_score = max(best_score, 1.0)
                     continue
@@ -896,25 +993,14 @@ class JobRanker:
         if job_seniority in campaign_seniorities:
             return 1.0
 
-        # Seniority hierarchy for partial matches
-        seniority_levels = {
-            "intern": 1,
-            "entry": 2,
-            "junior": 2,
-            "mid": 3,
-            "senior": 4,
-            "lead": 5,
-            "executive": 6,
-        }
-
-        job_level = seniority_levels.get(job_seniority, 0)
+        job_level = SENIORITY_LEVELS.get(job_seniority, 0)
         if job_level == 0:
             return 0.3  # Unknown job level
 
         # Find best match among preferences
         best_score = 0.0
         for campaign_seniority in campaign_seniorities:
-            campaign_level = seniority_levels.get(campaign_seniority, 0)
+            campaign_level = SENIORITY_LEVELS.get(campaign_seniority, 0)
             if campaign_level == 0:
                 continue
 
@@ -1006,6 +1092,76 @@ class JobRanker:
             result = cur.fetchone()
             return result[0] > 0 if result else False
 
+    def _resolve_campaign(self, campaign: dict[str, Any] | int) -> tuple[int, dict[str, Any]]:
+        """
+        Resolve a campaign argument to (campaign_id, campaign dict).
+
+        Args:
+            campaign: Campaign dictionary from job_campaigns, or campaign_id (int) to fetch
+
+        Returns:
+            Tuple of (campaign_id, campaign dictionary)
+
+        Raises:
+            ValueError: If campaign_id is given and the campaign does not exist
+        """
+        if not isinstance(campaign, int):
+            return campaign["campaign_id"], campaign
+
+        campaign_id = campaign
+        with self.db.get_cursor() as cur:
+            cur.execute(GET_CAMPAIGN_BY_ID, (campaign_id,))
+            if cur.description is None:
+                raise ValueError(f"Campaign {campaign_id} not found")
+            columns = [desc[0] for desc in cur.description]
+            row = cur.fetchone()
+            if not row:
+                raise ValueError(f"Campaign {campaign_id} not found")
+            campaign = dict(zip(columns, row))
+
+        # Normalize ranking_weights: convert JSON string to dict if needed
+        ranking_weights = campaign.get("ranking_weights")
+        if ranking_weights and isinstance(ranking_weights, str):
+            try:
+                campaign["ranking_weights"] = json.loads(ranking_weights)
+            except (json.JSONDecodeError, TypeError):
+                campaign["ranking_weights"] = None
+
+        return campaign_id, campaign
+
+    def _build_ranking(
+        self,
+        job: dict[str, Any],
+        campaign: dict[str, Any],
+        campaign_id: int,
+        now: datetime,
+        today: date,
+    ) -> dict[str, Any]:
+        """
+        Score a job and build its ranking record for marts.dim_ranking.
+
+        Args:
+            job: Job dictionary from fact_jobs
+            campaign: Campaign dictionary from job_campaigns
+            campaign_id: Campaign ID
+            now: Timestamp used for ranked_at / dwh_load_timestamp
+            today: Date used for ranked_date
+
+        Returns:
+            Ranking dictionary
+        """
+        score, explanation = self.calculate_job_score(job, campaign)
+        return {
+            "jsearch_job_id": job["jsearch_job_id"],
+            "campaign_id": campaign_id,
+            "rank_score": round(score, 2),
+            "rank_explain": explanation,
+            "ranked_at": now,
+            "ranked_date": today,
+            "dwh_load_timestamp": now,
+            "dwh_source_system": "ranker",
+        }
+
     def rank_jobs_for_campaign(self, campaign: dict[str, Any] | int) -> int:
         """
         Process and save rankings for all jobs belonging to a campaign (workflow method).
@@ -1016,7 +1172,11 @@ class JobRanker:
         3. Writes all rankings to marts.dim_ranking table using UPSERT
 
         This is the main entry point for ranking jobs - it handles the complete process
-        from fetching jobs to persisting rankings in the database.
+        from fetching jobs to persisting rankings in the database. When the ranker was
+        created with stream_chunk_size, the streaming path is used instead
+        (see _rank_jobs_streaming). In top-K mode (campaign ranking_top_k or the ranker's
+        top_k) only the best K jobs plus jobs the user has a status for are written, and
+        the campaign's other rankings are pruned.
 
         Args:
             campaign: Campaign dictionary from job_campaigns, or campaign_id (int) to fetch
@@ -1024,28 +1184,7 @@ class JobRanker:
         Returns:
             Number of jobs ranked and saved to database
         """
-        # If campaign is an int, fetch the campaign dict from database
-        if isinstance(campaign, int):
-            campaign_id = campaign
-            with self.db.get_cursor() as cur:
-                cur.execute(GET_CAMPAIGN_BY_ID, (campaign_id,))
-                if cur.description is None:
-                    raise ValueError(f"Campaign {campaign_id} not found")
-                columns = [desc[0] for desc in cur.description]
-                row = cur.fetchone()
-                if not row:
-                    raise ValueError(f"Campaign {campaign_id} not found")
-                campaign = dict(zip(columns, row))
-                # Normalize ranking_weights: convert JSON string to dict if needed
-                ranking_weights = campaign.get("ranking_weights")
-                if ranking_weights and isinstance(ranking_weights, str):
-                    try:
-                        campaign["ranking_weights"] = json.loads(ranking_weights)
-                    except (json.JSONDecodeError, TypeError):
-                        campaign["ranking_weights"] = None
-        else:
-            campaign_id = campaign["campaign_id"]
-
+        campaign_id, campaign = self._resolve_campaign(campaign)
         campaign_name = campaign["campaign_name"]
 
         logger.info(
@@ -1053,6 +1192,9 @@ class JobRanker:
             extra={"campaign_id": campaign_id, "campaign_name": campaign_name},
         )
 
+        if self.stream_chunk_size:
+            return self._rank_jobs_streaming(campaign_id, campaign)
+
         # Get jobs for this campaign
         jobs = self.get_jobs_for_campaign(campaign_id)
 
@@ -1085,19 +1227,7 @@ class JobRanker:
                 skipped_jobs.append(job_id)
                 continue
 
-            score, explanation = self.calculate_job_score(job, campaign)
-            rankings.append(
-                {
-                    "jsearch_job_id": job_id,
-                    "campaign_id": campaign_id,
-                    "rank_score": round(score, 2),
-                    "rank_explain": json.dumps(explanation),
-                    "ranked_at": now,
-                    "ranked_date": today,
-                    "dwh_load_timestamp": now,
-                    "dwh_source_system": "ranker",
-                }
-            )
+            rankings.append(self._build_ranking(job, campaign, campaign_id, now, today))
 
         if skipped_jobs:
             logger.warning(
@@ -1110,9 +1240,6 @@ class JobRanker:
                 },
             )
 
-        # Write to database
-        self._write_rankings(rankings)
-
         if not rankings:
             logger.warning(
                 f"No valid jobs to rank for campaign {campaign_id} "
@@ -1121,8 +1248,18 @@ class JobRanker:
             )
             return 0
 
-        # Write to database
-        self._write_rankings(rankings)
+        # Write to database (top-K mode keeps only the best jobs and prunes the rest)
+        top_k = self._get_top_k(campaign)
+        if top_k:
+            with self.db.get_cursor() as cur:
+                top_rankings = TopKRankings(top_k, self._get_status_job_ids(cur, campaign_id))
+                for ranking in rankings:
+                    top_rankings.add(ranking)
+                rankings = top_rankings.rankings()
+                self._copy_rankings(cur, rankings)
+                self._prune_stale_rankings(cur, campaign_id, now)
+        else:
+            self._write_rankings(rankings)
 
         avg_score = sum(r["rank_score"] for r in rankings) / len(rankings) if rankings else 0.0
         logger.info(
@@ -1137,36 +1274,184 @@ class JobRanker:
 
         return len(rankings)
 
+    def _rank_jobs_streaming(self, campaign_id: int, campaign: dict[str, Any]) -> int:
+        """
+        Rank a campaign's jobs in constant memory.
+
+        Jobs are read through a server-side (named) cursor and scored in chunks of
+        stream_chunk_size. Each chunk is written with COPY + upsert on the same
+        connection, so the whole campaign is ranked in a single transaction without
+        ever holding more than one chunk in memory.
+
+        Jobs come straight from fact_jobs in the same transaction, so the per-job
+        existence check used by the in-memory path is not needed here.
+
+        In top-K mode chunks are fed through a TopKRankings heap instead of being
+        written, and the surviving rankings are written once at the end.
+
+        Args:
+            campaign_id: Campaign ID
+            campaign: Campaign dictionary from job_campaigns
+
+        Returns:
+            Number of jobs ranked and saved to database
+        """
+        chunk_size = self.stream_chunk_size
+        top_k = self._get_top_k(campaign)
+        now = datetime.now()
+        today = date.today()
+        ranked_count = 0
+        score_total = 0.0
+
+        with self.db.get_cursor() as cur:
+            top_rankings = (
+                TopKRankings(top_k, self._get_status_job_ids(cur, campaign_id)) if top_k else None
+            )
+            with cur.connection.cursor(name=f"rank_campaign_{campaign_id}") as stream_cur:
+                stream_cur.itersize = chunk_size
+                stream_cur.execute(GET_JOBS_FOR_CAMPAIGN_STREAM, (campaign_id,))
+                columns = None
+
+                while True:
+                    rows = stream_cur.fetchmany(chunk_size)
+                    if not rows:
+                        break
+                    if columns is None:
+                        columns = [desc[0] for desc in stream_cur.description]
+
+                    rankings = [
+                        self._build_ranking(
+                            dict(zip(columns, row)), campaign, campaign_id, now, today
+                        )
+                        for row in rows
+                    ]
+                    if top_rankings:
+                        for ranking in rankings:
+                            top_rankings.add(ranking)
+                    else:
+                        self._copy_rankings(cur, rankings)
+                        ranked_count += len(rankings)
+                        score_total += sum(r["rank_score"] for r in rankings)
+
+                    logger.debug(f"Ranked chunk of {len(rankings)} jobs for campaign {campaign_id}")
+
+            if top_rankings:
+                rankings = top_rankings.rankings()
+                if rankings:
+                    self._copy_rankings(cur, rankings)
+                    self._prune_stale_rankings(cur, campaign_id, now)
+                ranked_count = len(rankings)
+                score_total = sum(r["rank_score"] for r in rankings)
+
+        if not ranked_count:
+            logger.info(
+                f"No jobs found for campaign {campaign_id}",
+                extra={"campaign_id": campaign_id},
+            )
+            return 0
+
+        avg_score = score_total / ranked_count
+        logger.info(
+            f"Ranked {ranked_count} jobs for campaign {campaign_id} in streaming mode "
+            f"(avg score: {avg_score:.2f})",
+            extra={
+                "campaign_id": campaign_id,
+                "jobs_ranked": ranked_count,
+                "chunk_size": chunk_size,
+                "avg_score": round(avg_score, 2),
+            },
+        )
+
+        return ranked_count
+
+    def _get_top_k(self, campaign: dict[str, Any]) -> int | None:
+        """
+        Get the top-K limit for a campaign.
+
+        Args:
+            campaign: Campaign dictionary (may contain ranking_top_k)
+
+        Returns:
+            Maximum number of rankings to keep, or None to keep all of them
+        """
+        top_k = campaign.get("ranking_top_k") or self.top_k
+        return int(top_k) if top_k else None
+
+    def _get_status_job_ids(self, cur, campaign_id: int) -> set[str]:
+        """
+        Get IDs of jobs the user has a status for in this campaign.
+
+        Args:
+            cur: Database cursor
+            campaign_id: Campaign ID
+
+        Returns:
+            Set of jsearch_job_id values that top-K mode must keep
+        """
+        cur.execute(GET_STATUS_JOB_IDS_FOR_CAMPAIGN, (campaign_id,))
+        return {row[0] for row in cur.fetchall()}
+
+    def _prune_stale_rankings(self, cur, campaign_id: int, ranked_at: datetime):
+        """
+        Delete a campaign's rankings that were not written by the current top-K run.
+
+        Args:
+            cur: Database cursor (runs in the same transaction as the write)
+            campaign_id: Campaign ID
+            ranked_at: ranked_at timestamp shared by all rankings of the current run
+        """
+        cur.execute(PRUNE_STALE_RANKINGS, {"campaign_id": campaign_id, "ranked_at": ranked_at})
+        logger.info(
+            f"Pruned {cur.rowcount} ranking(s) outside the top K for campaign {campaign_id}",
+            extra={"campaign_id": campaign_id, "pruned_count": cur.rowcount},
+        )
+
     def _write_rankings(self, rankings: list[dict[str, Any]]):
         """
         Write rankings to marts.dim_ranking table using UPSERT.
-        Uses INSERT ... ON CONFLICT to update existing rankings.
 
         Args:
-            rankings: List of ranking dictionaries
+            rankings: List of ranking dictionaries (rank_explain is the explanation dict
+                returned by calculate_job_score)
         """
         if not rankings:
             return
 
         with self.db.get_cursor() as cur:
-            # Prepare data for bulk insert
-            rows = []
-            for ranking in rankings:
-                rows.append(
-                    (
-                        ranking["jsearch_job_id"],
-                        ranking["campaign_id"],
-                        ranking["rank_score"],
-                        ranking["rank_explain"],
-                        ranking["ranked_at"],
-                        ranking["ranked_date"],
-                        ranking["dwh_load_timestamp"],
-                        ranking["dwh_source_system"],
-                    )
-                )
+            self._copy_rankings(cur, rankings)
+
+    def _copy_rankings(self, cur, rankings: list[dict[str, Any]]):
+        """
+        Upsert rankings on an open cursor.
+
+        Rows are streamed with COPY into a temporary load table, then merged with
+        INSERT ... SELECT ... ON CONFLICT. The factor breakdown is written as typed
+        numeric columns and rank_explain JSONB is built server-side from them.
+        The load table is truncated afterwards so it can be reused for the next
+        chunk in the same transaction.
+
+        Args:
+            cur: Database cursor (the write joins the cursor's transaction)
+            rankings: List of ranking dictionaries
+        """
+        rows = (
+            (
+                ranking["jsearch_job_id"],
+                ranking["campaign_id"],
+                ranking["rank_score"],
+                *(ranking["rank_explain"].get(factor) for factor in RANKING_FACTORS),
+                ranking["ranked_at"],
+                ranking["ranked_date"],
+                ranking["dwh_load_timestamp"],
+                ranking["dwh_source_system"],
+            )
+            for ranking in rankings
+        )
 
-            # Bulk insert/update using execute_values
-            execute_values(cur, INSERT_RANKINGS, rows)
+        cur.execute(CREATE_RANKINGS_LOAD_TABLE)
+        copy_rows(cur, "tmp_dim_ranking_load", RANKING_LOAD_COLUMNS, rows)
+        cur.execute(UPSERT_RANKINGS_FROM_LOAD_TABLE)
+        cur.execute(TRUNCATE_RANKINGS_LOAD_TABLE)
 
     def rank_all_jobs(self) -> dict[int, int]:
         """
@@ -22,7 +22,9 @@ GET_ACTIVE_CAMPAIGNS_FOR_RANKING = """
         company_size_preference,
         employment_type_preference,
         -- Ranking weights (JSONB, percentages should sum to 100%)
-        ranking_weights
+        ranking_weights,
+        -- Optional top-K ranking mode (NULL = keep all rankings)
+        ranking_top_k
     FROM marts.job_campaigns
     WHERE is_active = true
     ORDER BY campaign_id
@@ -44,7 +46,8 @@ SELECT
     seniority,
     company_size_preference,
     employment_type_preference,
-    ranking_weights
+    ranking_weights,
+    ranking_top_k
 FROM marts.job_campaigns
 WHERE campaign_id = %s
 """
@@ -74,6 +77,30 @@ GET_JOBS_FOR_CAMPAIGN = """
     ORDER BY fj.job_posted_at_datetime_utc DESC NULLS LAST
 """
 
+# Query to stream jobs for a campaign through a server-side cursor (streaming mode).
+# Same columns as GET_JOBS_FOR_CAMPAIGN but unsorted: ranking order does not matter
+# for scoring, and skipping the sort lets Postgres return rows immediately.
+GET_JOBS_FOR_CAMPAIGN_STREAM = """
+    SELECT
+        fj.jsearch_job_id,
+        fj.job_title,
+        fj.job_location,
+        fj.employment_type,
+        fj.job_posted_at_datetime_utc,
+        fj.company_key,
+        fj.extracted_skills,
+        fj.seniority_level,
+        fj.remote_work_type,
+        fj.job_min_salary,
+        fj.job_max_salary,
+        fj.job_salary_period,
+        fj.job_salary_currency,
+        dc.company_size
+    FROM marts.fact_jobs fj
+    LEFT JOIN marts.dim_companies dc ON fj.company_key = dc.company_key
+    WHERE fj.campaign_id = %s
+"""
+
 # Query to validate that a job exists in fact_jobs
 VALIDATE_JOB_EXISTS = """
     SELECT COUNT(*) as job_count
@@ -82,22 +109,568 @@ VALIDATE_JOB_EXISTS = """
         AND campaign_id = %s
 """
 
-# Query to insert/update rankings in marts.dim_ranking
-INSERT_RANKINGS = """
+# Query to get jobs the campaign owner has a status for (top-K mode keeps these
+# rankings even when they fall outside the top K)
+GET_STATUS_JOB_IDS_FOR_CAMPAIGN = """
+    SELECT DISTINCT jsearch_job_id
+    FROM marts.user_job_status
+    WHERE campaign_id = %s
+"""
+
+# Query to prune rankings not written by the current top-K run. Rows of the run
+# share its ranked_at timestamp; jobs with a user_job_status are never pruned.
+PRUNE_STALE_RANKINGS = """
+    DELETE FROM marts.dim_ranking dr
+    WHERE dr.campaign_id = %(campaign_id)s
+        AND dr.ranked_at IS DISTINCT FROM %(ranked_at)s
+        AND NOT EXISTS (
+            SELECT 1
+            FROM marts.user_job_status ujs
+            WHERE ujs.campaign_id = dr.campaign_id
+                AND ujs.jsearch_job_id = dr.jsearch_job_id
+        )
+"""
+
+# Temporary load table for COPY-based ranking writes.
+# Factor columns hold the weighted points per ranking factor (same values as the
+# rank_explain breakdown). Dropped automatically when the transaction commits.
+CREATE_RANKINGS_LOAD_TABLE = """
+    CREATE TEMP TABLE IF NOT EXISTS tmp_dim_ranking_load (
+        jsearch_job_id varchar,
+        campaign_id integer,
+        rank_score numeric,
+        location_match_points numeric,
+        salary_match_points numeric,
+        company_size_match_points numeric,
+        skills_match_points numeric,
+        keyword_match_points numeric,
+        employment_type_match_points numeric,
+        seniority_match_points numeric,
+        remote_type_match_points numeric,
+        recency_points numeric,
+        ranked_at timestamp,
+        ranked_date date,
+        dwh_load_timestamp timestamp,
+        dwh_source_system varchar
+    ) ON COMMIT DROP
+"""
+
+TRUNCATE_RANKINGS_LOAD_TABLE = "TRUNCATE tmp_dim_ranking_load"
+
+# Query to insert/update rankings in marts.dim_ranking from the load table.
+# rank_explain is built server-side from the typed factor columns so the ranker
+# never serializes JSON per row.
+UPSERT_RANKINGS_FROM_LOAD_TABLE = """
     INSERT INTO marts.dim_ranking (
         jsearch_job_id,
         campaign_id,
         rank_score,
         rank_explain,
+        location_match_points,
+        salary_match_points,
+        company_size_match_points,
+        skills_match_points,
+        keyword_match_points,
+        employment_type_match_points,
+        seniority_match_points,
+        remote_type_match_points,
+        recency_points,
         ranked_at,
         ranked_date,
         dwh_load_timestamp,
         dwh_source_system
-    ) VALUES %s
+    )
+    SELECT
+        jsearch_job_id,
+        campaign_id,
+        rank_score,
+        jsonb_build_object(
+            'location_match', location_match_points,
+            'salary_match', salary_match_points,
+            'company_size_match', company_size_match_points,
+            'skills_match', skills_match_points,
+            'keyword_match', keyword_match_points,
+            'employment_type_match', employment_type_match_points,
+            'seniority_match', seniority_match_points,
+            'remote_type_match', remote_type_match_points,
+            'recency', recency_points,
+            'total_score', rank_score
+        ),
+        location_match_points,
+        salary_match_points,
+        company_size_match_points,
+        skills_match_points,
+        keyword_match_points,
+        employment_type_match_points,
+        seniority_match_points,
+        remote_type_match_points,
+        recency_points,
+        ranked_at,
+        ranked_date,
+        dwh_load_timestamp,
+        dwh_source_system
+    FROM tmp_dim_ranking_load
+    ON CONFLICT (jsearch_job_id, campaign_id)
+    DO UPDATE SET
+        rank_score = EXCLUDED.rank_score,
+        rank_explain = EXCLUDED.rank_explain,
+        location_match_points = EXCLUDED.location_match_points,
+        salary_match_points = EXCLUDED.salary_match_points,
+        company_size_match_points = EXCLUDED.company_size_match_points,
+        skills_match_points = EXCLUDED.skills_match_points,
+        keyword_match_points = EXCLUDED.keyword_match_points,
+        employment_type_match_points = EXCLUDED.employment_type_match_points,
+        seniority_match_points = EXCLUDED.seniority_match_points,
+        remote_type_match_points = EXCLUDED.remote_type_match_points,
+        recency_points = EXCLUDED.recency_points,
+        ranked_at = EXCLUDED.ranked_at,
+        ranked_date = EXCLUDED.ranked_date,
+        dwh_load_timestamp = EXCLUDED.dwh_load_timestamp,
+        dwh_source_system = EXCLUDED.dwh_source_system
+"""
+
+# Set-based ranking of one campaign, computed entirely in Postgres (SQL backend).
+# Mirrors the Python scorers in JobRanker (the reference implementation): each
+# factor is scored 0-1, multiplied by its weight, rounded to 2 decimals, and the
+# total is clamped to 0-100. Campaign preferences are pre-parsed in Python and
+# passed as scalar/array parameters; scoring arithmetic uses float8 like Python.
+# In top-K mode (top_k not NULL) only the best K jobs plus jobs with a
+# user_job_status are written.
+RANK_JOBS_FOR_CAMPAIGN_IN_SQL = r"""
+    WITH jobs AS (
+        SELECT
+            fj.jsearch_job_id,
+            lower(fj.job_location) AS job_location,
+            lower(fj.job_title) AS job_title,
+            fj.employment_type,
+            ARRAY(
+                SELECT DISTINCT btrim(employment_type, E' \t\r\n')
+                FROM unnest(string_to_array(upper(fj.employment_type), ',')) AS employment_type
+                WHERE btrim(employment_type, E' \t\r\n') <> ''
+            ) AS employment_types,
+            lower(fj.seniority_level) AS seniority_level,
+            COALESCE(NULLIF(lower(fj.remote_work_type), ''), 'onsite') AS remote_work_type,
+            fj.extracted_skills,
+            -- job_posted_at_datetime_utc is ISO text in dbt builds and timestamp in tests
+            NULLIF(fj.job_posted_at_datetime_utc::text, '') AS job_posted_at,
+            dc.company_size,
+            btrim(dc.company_size, E' \t\r\n') AS company_size_trimmed,
+            CASE
+                WHEN strpos(dc.company_size, '-') > 0 THEN
+                    CASE
+                        WHEN btrim(split_part(dc.company_size, '-', 1), E' \t\r\n') ~ '^[0-9]+$'
+                            AND btrim(split_part(dc.company_size, '-', 2), E' \t\r\n') ~ '^[0-9]+$'
+                        THEN (
+                            btrim(split_part(dc.company_size, '-', 1), E' \t\r\n')::float8
+                            + btrim(split_part(dc.company_size, '-', 2), E' \t\r\n')::float8
+                        ) / 2
+                    END
+                ELSE substring(dc.company_size FROM '[0-9]+')::float8
+            END AS company_size_num,
+            CASE
+                WHEN salary.job_min_annual IS NOT NULL AND salary.job_max_annual IS NOT NULL
+                    THEN (salary.job_min_annual + salary.job_max_annual) / 2
+                ELSE COALESCE(salary.job_min_annual, salary.job_max_annual)
+            END AS job_salary_avg
+        FROM marts.fact_jobs fj
+        LEFT JOIN marts.dim_companies dc
+            ON fj.company_key = dc.company_key
+        LEFT JOIN unnest(%(currency_codes)s::text[], %(currency_usd_rates)s::float8[])
+            AS cr(currency_code, usd_rate)
+            ON cr.currency_code = upper(fj.job_salary_currency)
+        CROSS JOIN LATERAL (
+            SELECT
+                CASE
+                    WHEN COALESCE(fj.job_salary_period, '') = ''
+                        OR lower(fj.job_salary_period) IN ('year', 'annual', 'annually', 'yr', 'y')
+                        THEN 1.0
+                    WHEN lower(fj.job_salary_period) IN ('month', 'monthly', 'mo', 'm') THEN 12.0
+                    WHEN lower(fj.job_salary_period) IN ('week', 'weekly', 'wk', 'w') THEN 52.0
+                    WHEN lower(fj.job_salary_period) IN ('day', 'daily', 'd') THEN 260.0
+                    WHEN lower(fj.job_salary_period) IN ('hour', 'hourly', 'hr', 'h') THEN 2080.0
+                    ELSE 1.0
+                END::float8 AS period_multiplier,
+                (
+                    %(campaign_currency_valid)s
+                    AND fj.job_salary_currency ~ '^[A-Za-z]{3}$'
+                    AND fj.job_salary_currency <> %(campaign_currency)s
+                ) AS convert_currency
+        ) salary_norm
+        CROSS JOIN LATERAL (
+            SELECT
+                CASE
+                    WHEN salary_norm.convert_currency
+                        THEN NULLIF(fj.job_min_salary, 0)::float8 * salary_norm.period_multiplier
+                            * COALESCE(cr.usd_rate, 1.0)
+                            / %(campaign_currency_rate)s::float8
+                    ELSE NULLIF(fj.job_min_salary, 0)::float8 * salary_norm.period_multiplier
+                END AS job_min_annual,
+                CASE
+                    WHEN salary_norm.convert_currency
+                        THEN NULLIF(fj.job_max_salary, 0)::float8 * salary_norm.period_multiplier
+                            * COALESCE(cr.usd_rate, 1.0)
+                            / %(campaign_currency_rate)s::float8
+                    ELSE NULLIF(fj.job_max_salary, 0)::float8 * salary_norm.period_multiplier
+                END AS job_max_annual
+        ) salary
+        WHERE fj.campaign_id = %(campaign_id)s
+    ),
+    factor_scores AS (
+        SELECT
+            j.jsearch_job_id,
+            -- Factor 1: Location match
+            CASE
+                WHEN COALESCE(j.job_location, '') = '' THEN 0.0
+                WHEN %(location)s <> '' AND strpos(j.job_location, %(location)s) > 0 THEN 1.0
+                WHEN EXISTS (
+                    SELECT 1
+                    FROM unnest(%(country_terms)s::text[]) AS term
+                    WHERE strpos(j.job_location, term) > 0
+                ) THEN 0.7
+                ELSE 0.0
+            END::float8 AS location_score,
+            -- Factor 2: Salary match
+            CASE
+                WHEN %(campaign_salary_avg)s::float8 IS NULL THEN 0.5
+                WHEN COALESCE(j.job_salary_avg, 0) = 0 THEN 0.3
+                ELSE (
+                    SELECT
+                        CASE
+                            WHEN ratio >= 1.0 THEN
+                                CASE WHEN ratio <= 1.2 THEN 1.0 WHEN ratio <= 1.5 THEN 0.9 ELSE 0.7 END
+                            WHEN ratio >= 0.9 THEN 0.8
+                            WHEN ratio >= 0.7 THEN 0.5
+                            WHEN ratio >= 0.5 THEN 0.3
+                            ELSE 0.1
+                        END
+                    FROM (
+                        SELECT
+                            CASE
+                                WHEN %(campaign_salary_avg)s::float8 > 0
+                                    THEN j.job_salary_avg / %(campaign_salary_avg)s::float8
+                                ELSE 0
+                            END AS ratio
+                    ) salary_ratio
+                )
+            END::float8 AS salary_score,
+            -- Factor 3: Company size match
+            CASE
+                WHEN NOT %(has_company_size_preference)s THEN 0.5
+                WHEN COALESCE(j.company_size, '') = '' THEN 0.3
+                ELSE COALESCE(NULLIF((
+                    SELECT MAX(
+                        CASE
+                            WHEN j.company_size_num IS NULL THEN
+                                CASE WHEN strpos(lower(j.company_size_trimmed), pref.size) > 0 THEN 1.0 ELSE 0.0 END
+                            WHEN pref.range_min IS NOT NULL
+                                AND j.company_size_num >= pref.range_min
+                                AND (pref.range_max IS NULL OR j.company_size_num <= pref.range_max)
+                                THEN 1.0
+                            ELSE GREATEST(
+                                CASE
+                                    WHEN pref.range_min IS NULL THEN 0.0
+                                    WHEN j.company_size_num < pref.range_min THEN
+                                        CASE WHEN j.company_size_num / pref.range_min >= 0.7 THEN 0.6 ELSE 0.3 END
+                                    WHEN pref.range_max IS NULL THEN 0.8
+                                    WHEN pref.range_max / j.company_size_num >= 0.7 THEN 0.6
+                                    ELSE 0.3
+                                END,
+                                CASE WHEN strpos(lower(j.company_size_trimmed), pref.size) > 0 THEN 1.0 ELSE 0.0 END
+                            )
+                        END
+                    )
+                    FROM unnest(
+                        %(company_size_preferences)s::text[],
+                        %(company_size_range_mins)s::float8[],
+                        %(company_size_range_maxs)s::float8[]
+                    ) AS pref(size, range_min, range_max)
+                ), 0), 0.3)
+            END::float8 AS company_size_score,
+            -- Factor 4: Skills match
+            CASE
+                WHEN NOT %(has_skills_preference)s THEN 0.5
+                WHEN j.extracted_skills IS NULL
+                    OR j.extracted_skills IN (
+                        '[]'::jsonb, '{}'::jsonb, '""'::jsonb, 'null'::jsonb, 'false'::jsonb, '0'::jsonb
+                    ) THEN 0.3
+                WHEN cardinality(%(skills)s::text[]) = 0 THEN 0.5
+                WHEN skills.job_skill_count = 0 THEN 0.3
+                ELSE (
+                    SELECT
+                        CASE
+                            WHEN match_ratio >= 1.0 THEN 1.0
+                            WHEN match_ratio >= 0.7 THEN 0.8
+                            WHEN match_ratio >= 0.5 THEN 0.6
+                            WHEN match_ratio >= 0.3 THEN 0.4
+                            ELSE 0.2
+                        END
+                    FROM (
+                        SELECT skills.matched_skill_count::float8 / cardinality(%(skills)s::text[])
+                            AS match_ratio
+                    ) skills_ratio
+                )
+            END::float8 AS skills_score,
+            -- Factor 5: Position name/title match
+            CASE
+                WHEN COALESCE(j.job_title, '') = '' OR cardinality(%(query_keywords)s::text[]) = 0
+                    THEN 0.0
+                ELSE (
+                    SELECT
+                        CASE
+                            WHEN matched = 0 THEN 0.0
+                            WHEN matched = cardinality(%(query_keywords)s::text[]) THEN 1.0
+                            ELSE matched::float8 / cardinality(%(query_keywords)s::text[]) * 0.8
+                        END
+                    FROM (
+                        SELECT count(*) AS matched
+                        FROM unnest(%(query_keywords)s::text[]) AS keyword
+                        WHERE EXISTS (
+                            SELECT 1
+                            FROM regexp_matches(j.job_title, '\w+', 'g') AS title_word(word)
+                            WHERE title_word.word[1] = keyword
+                        )
+                    ) keyword_matches
+                )
+            END::float8 AS keyword_score,
+            -- Factor 6: Employment type match
+            CASE
+                WHEN NOT %(has_employment_type_preference)s THEN 0.5
+                WHEN COALESCE(j.employment_type, '') = '' THEN 0.3
+                WHEN j.employment_types && %(employment_type_preferences)s::text[] THEN 1.0
+                WHEN EXISTS (
+                    SELECT 1
+                    FROM unnest(%(employment_type_preferences)s::text[]) AS pref
+                    WHERE strpos(array_to_string(j.employment_types, ' '), pref) > 0
+                ) THEN 0.8
+                ELSE 0.0
+            END::float8 AS employment_type_score,
+            -- Factor 7: Seniority level match
+            CASE
+                WHEN NOT %(has_seniority_preference)s THEN 0.5
+                WHEN COALESCE(j.seniority_level, '') = '' THEN 0.3
+                WHEN j.seniority_level = ANY(%(seniority_preferences)s::text[]) THEN 1.0
+                WHEN seniority.job_level = 0 THEN 0.3
+                ELSE COALESCE((
+                    SELECT MAX(
+                        CASE abs(pref_level - seniority.job_level)
+                            WHEN 0 THEN 1.0
+                            WHEN 1 THEN 0.7
+                            WHEN 2 THEN 0.4
+                            ELSE 0.2
+                        END
+                    )
+                    FROM unnest(%(seniority_preference_levels)s::int[]) AS pref_level
+                ), 0.3)
+            END::float8 AS seniority_score,
+            -- Factor 8: Remote type match
+            CASE
+                WHEN NOT %(has_remote_preference)s THEN 0.5
+                WHEN j.remote_work_type = ANY(%(remote_preferences)s::text[]) THEN 1.0
+                ELSE COALESCE(NULLIF((
+                    SELECT MAX(
+                        CASE
+                            WHEN pref = 'hybrid' AND j.remote_work_type IN ('remote', 'onsite') THEN 0.7
+                            WHEN pref = 'remote' AND j.remote_work_type = 'hybrid' THEN 0.7
+                            WHEN pref = 'remote' AND j.remote_work_type = 'onsite' THEN 0.2
+                            WHEN pref = 'onsite' AND j.remote_work_type = 'hybrid' THEN 0.7
+                            WHEN pref = 'onsite' AND j.remote_work_type = 'remote' THEN 0.2
+                            ELSE 0.0
+                        END
+                    )
+                    FROM unnest(%(remote_preferences)s::text[]) AS pref
+                ), 0), 0.3)
+            END::float8 AS remote_type_score,
+            -- Factor 9: Recency
+            CASE
+                WHEN j.job_posted_at IS NULL THEN 0.5
+                WHEN j.job_posted_at !~ '^\d{4}-\d{2}-\d{2}' THEN 0.5
+                ELSE (
+                    SELECT
+                        CASE
+                            WHEN days_old <= 0 THEN 1.0
+                            WHEN days_old <= 7 THEN 1.0 - (days_old * 0.04)
+                            WHEN days_old <= 30 THEN 0.72 - ((days_old - 7) * 0.018)
+                            WHEN days_old <= 90 THEN 0.3 - ((days_old - 30) * 0.005)
+                            ELSE 0.0
+                        END
+                    FROM (
+                        SELECT floor(
+                            extract(epoch FROM (%(now_utc)s::timestamptz - j.job_posted_at::timestamptz))
+                            / 86400
+                        )::float8 AS days_old
+                    ) job_age
+                )
+            END::float8 AS recency_score
+        FROM jobs j
+        LEFT JOIN LATERAL (
+            SELECT
+                count(*) AS job_skill_count,
+                count(*) FILTER (WHERE skill = ANY(%(skills)s::text[])) AS matched_skill_count
+            FROM (
+                SELECT DISTINCT btrim(lower(element #>> '{}'), E' \t\r\n') AS skill
+                FROM jsonb_array_elements(
+                    CASE
+                        WHEN jsonb_typeof(j.extracted_skills) = 'array' THEN j.extracted_skills
+                        ELSE '[]'::jsonb
+                    END
+                ) AS element
+                WHERE jsonb_typeof(element) = 'string'
+            ) job_skills
+        ) skills ON true
+        CROSS JOIN LATERAL (
+            SELECT
+                COALESCE((
+                    SELECT level.rank
+                    FROM unnest(%(seniority_level_names)s::text[], %(seniority_level_ranks)s::int[])
+                        AS level(name, rank)
+                    WHERE level.name = j.seniority_level
+                ), 0) AS job_level
+        ) seniority
+    ),
+    factor_points AS (
+        -- Points are score * weight rounded like Python's round(float, 2): the float8 is
+        -- expanded to its exact numeric value (integer part + 60-bit fraction) and ties are
+        -- rounded half to even, so both backends agree to the cent.
+        SELECT
+            fs.jsearch_job_id,
+            points.p[1] AS location_match_points,
+            points.p[2] AS salary_match_points,
+            points.p[3] AS company_size_match_points,
+            points.p[4] AS skills_match_points,
+            points.p[5] AS keyword_match_points,
+            points.p[6] AS employment_type_match_points,
+            points.p[7] AS seniority_match_points,
+            points.p[8] AS remote_type_match_points,
+            points.p[9] AS recency_points
+        FROM factor_scores fs
+        CROSS JOIN LATERAL (
+            SELECT array_agg(
+                CASE
+                    WHEN exact.cents - floor(exact.cents) = 0.5
+                        THEN (floor(exact.cents) + mod(floor(exact.cents), 2)) / 100
+                    ELSE round(exact.cents) / 100
+                END
+                ORDER BY factor.ordinal
+            )::numeric(10, 2)[] AS p
+            FROM unnest(ARRAY[
+                fs.location_score * %(weight_location_match)s::float8,
+                fs.salary_score * %(weight_salary_match)s::float8,
+                fs.company_size_score * %(weight_company_size_match)s::float8,
+                fs.skills_score * %(weight_skills_match)s::float8,
+                fs.keyword_score * %(weight_keyword_match)s::float8,
+                fs.employment_type_score * %(weight_employment_type_match)s::float8,
+                fs.seniority_score * %(weight_seniority_match)s::float8,
+                fs.remote_type_score * %(weight_remote_type_match)s::float8,
+                fs.recency_score * %(weight_recency)s::float8
+            ]) WITH ORDINALITY AS factor(value, ordinal)
+            CROSS JOIN LATERAL (
+                SELECT (
+                    floor(factor.value)::numeric
+                    + ((factor.value - floor(factor.value)) * 1152921504606846976::float8)::bigint::numeric
+                        / 1152921504606846976
+                ) * 100 AS cents
+            ) exact
+        ) points
+    ),
+    scored AS (
+        SELECT
+            factor_points.*,
+            round(
+                LEAST(
+                    100,
+                    GREATEST(
+                        0,
+                        location_match_points + salary_match_points + company_size_match_points
+                        + skills_match_points + keyword_match_points + employment_type_match_points
+                        + seniority_match_points + remote_type_match_points + recency_points
+                    )
+                ),
+                2
+            ) AS rank_score,
+            EXISTS (
+                SELECT 1
+                FROM marts.user_job_status ujs
+                WHERE ujs.campaign_id = %(campaign_id)s
+                    AND ujs.jsearch_job_id = factor_points.jsearch_job_id
+            ) AS has_user_status
+        FROM factor_points
+    ),
+    -- Top-K mode: position among jobs without a user status (same tie-break as
+    -- TopKRankings: higher rank_score, then higher job ID by code point)
+    positioned AS (
+        SELECT
+            scored.*,
+            row_number() OVER (
+                PARTITION BY has_user_status
+                ORDER BY rank_score DESC, jsearch_job_id COLLATE "C" DESC
+            ) AS score_position
+        FROM scored
+    )
+    INSERT INTO marts.dim_ranking (
+        jsearch_job_id,
+        campaign_id,
+        rank_score,
+        rank_explain,
+        location_match_points,
+        salary_match_points,
+        company_size_match_points,
+        skills_match_points,
+        keyword_match_points,
+        employment_type_match_points,
+        seniority_match_points,
+        remote_type_match_points,
+        recency_points,
+        ranked_at,
+        ranked_date,
+        dwh_load_timestamp,
+        dwh_source_system
+    )
+    SELECT
+        jsearch_job_id,
+        %(campaign_id)s,
+        rank_score,
+        jsonb_build_object(
+            'location_match', location_match_points,
+            'salary_match', salary_match_points,
+            'company_size_match', company_size_match_points,
+            'skills_match', skills_match_points,
+            'keyword_match', keyword_match_points,
+            'employment_type_match', employment_type_match_points,
+            'seniority_match', seniority_match_points,
+            'remote_type_match', remote_type_match_points,
+            'recency', recency_points,
+            'total_score', rank_score
+        ),
+        location_match_points,
+        salary_match_points,
+        company_size_match_points,
+        skills_match_points,
+        keyword_match_points,
+        employment_type_match_points,
+        seniority_match_points,
+        remote_type_match_points,
+        recency_points,
+        %(now)s,
+        %(today)s,
+        %(now)s,
+        'ranker_sql'
+    FROM positioned
+    WHERE %(top_k)s::integer IS NULL
+        OR has_user_status
+        OR score_position <= %(top_k)s::integer
     ON CONFLICT (jsearch_job_id, campaign_id)
     DO UPDATE SET
         rank_score = EXCLUDED.rank_score,
         rank_explain = EXCLUDED.rank_explain,
+        location_match_points = EXCLUDED.location_match_points,
+        salary_match_points = EXCLUDED.salary_match_points,
+        company_size_match_points = EXCLUDED.company_size_match_points,
+        skills_match_points = EXCLUDED.skills_match_points,
+        keyword_match_points = EXCLUDED.keyword_match_points,
+        employment_type_match_points = EXCLUDED.employment_type_match_points,
+        seniority_match_points = EXCLUDED.seniority_match_points,
+        remote_type_match_points = EXCLUDED.remote_type_match_points,
+        recency_points = EXCLUDED.recency_points,
         ranked_at = EXCLUDED.ranked_at,
         ranked_date = EXCLUDED.ranked_date,
         dwh_load_timestamp = EXCLUDED.dwh_load_timestamp,
@@ -0,0 +1,171 @@
+"""
+SQL Job Ranker Service
+
+Set-based ranking backend: scores every job of a campaign in a single
+INSERT ... SELECT inside PostgreSQL instead of pulling jobs into Python.
+The Python scorers in JobRanker remain the reference implementation; this
+backend mirrors them factor by factor (see RANK_JOBS_FOR_CAMPAIGN_IN_SQL).
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from datetime import UTC, datetime
+from typing import Any
+
+from .job_ranker import (
+    COMPANY_SIZE_RANGES,
+    COUNTRY_NAME_TERMS,
+    DEFAULT_SCORING_WEIGHTS,
+    RANKING_FACTORS,
+    SENIORITY_LEVELS,
+    JobRanker,
+)
+from .queries import RANK_JOBS_FOR_CAMPAIGN_IN_SQL
+
+logger = logging.getLogger(__name__)
+
+
+def _split_preferences(value: str | None) -> list[str]:
+    """Split a comma-separated campaign preference into stripped, non-empty values."""
+    return [p.strip() for p in (value or "").split(",") if p.strip()]
+
+
+class SQLJobRanker(JobRanker):
+    """
+    Job ranker that computes scores in PostgreSQL.
+
+    Campaign preferences are parsed once in Python and bound as query parameters;
+    the database scores and upserts all jobs for the campaign in one statement.
+    Produces the same factor breakdown as JobRanker (within rounding of ties).
+    """
+
+    def build_campaign_params(
+        self, campaign_id: int, campaign: dict[str, Any], now: datetime | None = None
+    ) -> dict[str, Any]:
+        """
+        Build the query parameters for RANK_JOBS_FOR_CAMPAIGN_IN_SQL.
+
+        Args:
+            campaign_id: Campaign ID
+            campaign: Campaign dictionary from job_campaigns
+            now: Ranking timestamp (defaults to the current time)
+
+        Returns:
+            Dictionary of named query parameters
+        """
+        now = now or datetime.now()
+
+        # Location
+        country = (campaign.get("country") or "").lower()
+        country_terms = COUNTRY_NAME_TERMS.get(country, [country]) if country else []
+
+        # Salary (campaign average in campaign currency; None means no preference)
+        campaign_min = campaign.get("min_salary")
+        campaign_max = campaign.get("max_salary")
+        campaign_salary_avg = None
+        if campaign_min and campaign_max:
+            campaign_salary_avg = (float(campaign_min) + float(campaign_max)) / 2
+        elif campaign_min:
+            campaign_salary_avg = float(campaign_min)
+        elif campaign_max:
+            campaign_salary_avg = float(campaign_max)
+        campaign_currency = campaign.get("currency") or "USD"
+        rates = self._load_currency_rates()
+
+        # Company size
+        company_size_preference = campaign.get("company_size_preference") or ""
+        company_sizes = _split_preferences(company_size_preference)
+        size_ranges = [COMPANY_SIZE_RANGES.get(size) for size in company_sizes]
+
+        # Skills
+        campaign_skills = {
+            skill.strip().lower()
+            for skill in re.split(r"[;,]", campaign.get("skills") or "")
+            if skill.strip()
+        }
+
+        # Keywords
+        query_keywords = set(re.findall(r"\b\w+\b", (campaign.get("query") or "").lower()))
+
+        # Employment type, seniority and remote preferences
+        employment_type_preference = (campaign.get("employment_type_preference") or "").upper()
+        seniority_preference = (campaign.get("seniority") or "").lower()
+        seniorities = _split_preferences(seniority_preference)
+        remote_preference = (campaign.get("remote_preference") or "").lower()
+
+        weights = self._get_weights_for_campaign(campaign)
+
+        params = {
+            "campaign_id": campaign_id,
+            "now": now,
+            "now_utc": now.astimezone(UTC),
+            "today": now.date(),
+            "location": (campaign.get("location") or "").lower(),
+            "country_terms": country_terms,
+            "campaign_salary_avg": campaign_salary_avg or None,
+            "campaign_currency": campaign_currency,
+            "campaign_currency_valid": self._validate_currency(campaign_currency),
+            "campaign_currency_rate": float(rates.get(campaign_currency.upper(), 1.0)),
+            "currency_codes": list(rates),
+            "currency_usd_rates": [float(rate) for rate in rates.values()],
+            "has_company_size_preference": bool(company_size_preference),
+            "company_size_preferences": [size.lower() for size in company_sizes],
+            "company_size_range_mins": [r[0] if r else None for r in size_ranges],
+            "company_size_range_maxs": [
+                r[1] if r and r[1] != float("inf") else None for r in size_ranges
+            ],
+            "has_skills_preference": bool(campaign.get("skills")),
+            "skills": sorted(campaign_skills),
+            "query_keywords": sorted(query_keywords),
+            "has_employment_type_preference": bool(employment_type_preference),
+            "employment_type_preferences": _split_preferences(employment_type_preference),
+            "has_seniority_preference": bool(seniority_preference),
+            "seniority_preferences": seniorities,
+            "seniority_preference_levels": [
+                SENIORITY_LEVELS[s] for s in seniorities if s in SENIORITY_LEVELS
+            ],
+            "seniority_level_names": list(SENIORITY_LEVELS),
+            "seniority_level_ranks": list(SENIORITY_LEVELS.values()),
+            "has_remote_preference": bool(remote_preference),
+            "remote_preferences": _split_preferences(remote_preference),
+            "top_k": self._get_top_k(campaign),
+        }
+        for factor in RANKING_FACTORS:
+            params[f"weight_{factor}"] = float(weights.get(factor, DEFAULT_SCORING_WEIGHTS[factor]))
+        return params
+
+    def rank_jobs_for_campaign(self, campaign: dict[str, Any] | int) -> int:
+        """
+        Score and upsert rankings for all jobs of a campaign in one SQL statement.
+
+        In top-K mode the statement only writes the best K jobs (plus jobs with a
+        user status) and the campaign's other rankings are pruned afterwards.
+
+        Args:
+            campaign: Campaign dictionary from job_campaigns, or campaign_id (int) to fetch
+
+        Returns:
+            Number of jobs ranked and saved to database
+        """
+        campaign_id, campaign = self._resolve_campaign(campaign)
+        campaign_name = campaign["campaign_name"]
+
+        logger.info(
+            f"Ranking jobs in SQL for campaign {campaign_id} ({campaign_name})",
+            extra={"campaign_id": campaign_id, "campaign_name": campaign_name},
+        )
+
+        params = self.build_campaign_params(campaign_id, campaign)
+        with self.db.get_cursor() as cur:
+            cur.execute(RANK_JOBS_FOR_CAMPAIGN_IN_SQL, params)
+            ranked = cur.rowcount
+            if params["top_k"] and ranked:
+                self._prune_stale_rankings(cur, campaign_id, params["now"])
+
+        logger.info(
+            f"Ranked {ranked} jobs in SQL for campaign {campaign_id}",
+            extra={"campaign_id": campaign_id, "jobs_ranked": ranked},
+        )
+        return ranked
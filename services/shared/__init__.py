@@ -5,12 +5,25 @@ This package contains shared building blocks used across multiple services,
 such as database abstractions.
 """
 
-from .database import Database, PostgreSQLDatabase, close_all_pools
-from .metrics_recorder import MetricsRecorder
+from .bulk_copy import copy_rows
+from .connection_pool import InstrumentedConnectionPool, PoolTimeoutError
+from .database import Database, PostgreSQLDatabase, close_all_pools, get_pool_stats
+from .metrics_recorder import CAMPAIGN_PROGRESS_CHANNEL, MetricsRecorder
+from .notification_listener import RESYNC, NotificationListener, Subscription
+from .row_set import RowSet
 
 __all__ = [
+    "CAMPAIGN_PROGRESS_CHANNEL",
     "Database",
+    "InstrumentedConnectionPool",
+    "PoolTimeoutError",
     "PostgreSQLDatabase",
     "MetricsRecorder",
+    "NotificationListener",
+    "RESYNC",
+    "RowSet",
+    "Subscription",
     "close_all_pools",
+    "copy_rows",
+    "get_pool_stats",
 ]
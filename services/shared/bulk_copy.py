@@ -0,0 +1,69 @@
+"""
+Bulk COPY helpers
+
+Streams Python rows into PostgreSQL with COPY FROM STDIN (text format).
+COPY avoids the per-row statement overhead of INSERT/execute_values and is
+used for the hot bulk-load paths (e.g. ranking writes).
+"""
+
+from __future__ import annotations
+
+import io
+from collections.abc import Iterable, Sequence
+from datetime import date, datetime
+from typing import Any
+
+# Characters that must be escaped in COPY text format
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def format_copy_value(value: Any) -> str:
+    """
+    Format a single Python value for COPY text format.
+
+    Args:
+        value: Value to format (None is written as NULL)
+
+    Returns:
+        Escaped text representation of the value
+    """
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, datetime | date):
+        return value.isoformat()
+    return str(value).translate(_COPY_ESCAPES)
+
+
+def copy_rows(
+    cur,
+    table: str,
+    columns: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+) -> int:
+    """
+    Load rows into a table using COPY FROM STDIN.
+
+    Args:
+        cur: psycopg2 cursor (the load runs in the cursor's transaction)
+        table: Target table name (optionally schema-qualified)
+        columns: Column names, in the same order as the values in each row
+        rows: Iterable of row tuples
+
+    Returns:
+        Number of rows written to the COPY buffer
+    """
+    buffer = io.StringIO()
+    count = 0
+    for row in rows:
+        buffer.write("\t".join(format_copy_value(v) for v in row))
+        buffer.write("\n")
+        count += 1
+
+    if not count:
+        return 0
+
+    buffer.seek(0)
+    cur.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN", buffer)
+    return count
@@ -0,0 +1,273 @@
+"""
+Instrumented Connection Pool
+
+Thread-safe psycopg2 connection pool with blocking, first-come-first-served
+checkout. psycopg2's ThreadedConnectionPool raises "connection pool
+exhausted" as soon as every connection is in use, and closes any connection
+returned while minconn connections are already idle. This pool instead makes
+callers wait (up to a timeout) in a FIFO queue for the next free connection,
+keeps returned connections open for reuse, and records metrics: checkout wait
+times, connections in use, how often the pool was saturated and connection ages.
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+import psycopg2
+from psycopg2 import pool
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE, TRANSACTION_STATUS_UNKNOWN
+
+# Default time a checkout waits for a free connection before giving up
+DEFAULT_ACQUIRE_TIMEOUT_SECONDS = 30.0
+
+# Upper bounds (milliseconds) of the checkout wait histogram buckets; slower waits land in "+Inf"
+WAIT_HISTOGRAM_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000)
+
+
+class PoolTimeoutError(pool.PoolError):
+    """No connection became free within the acquire timeout."""
+
+
+class InstrumentedConnectionPool:
+    """
+    Bounded connection pool with a fair wait queue and usage metrics.
+
+    Exposes the getconn/putconn/closeall interface of psycopg2's pools. At most
+    maxconn connections are checked out at once; further getconn() calls queue
+    in arrival order and block until a connection is returned or the acquire
+    timeout expires (PoolTimeoutError, a psycopg2 PoolError).
+    """
+
+    def __init__(
+        self,
+        minconn: int,
+        maxconn: int,
+        *args: Any,
+        acquire_timeout: float = DEFAULT_ACQUIRE_TIMEOUT_SECONDS,
+        connect: Callable[..., Any] = psycopg2.connect,
+        clock: Callable[[], float] = time.monotonic,
+        **kwargs: Any,
+    ):
+        """
+        Initialize the pool and open minconn connections.
+
+        Args:
+            minconn: Connections opened up front
+            maxconn: Maximum connections checked out at once
+            *args: Positional arguments for connect (e.g. the DSN)
+            acquire_timeout: Seconds getconn() waits for a free connection
+            connect: Connection factory (injectable for tests)
+            clock: Monotonic time function (injectable for tests)
+            **kwargs: Keyword arguments for connect
+
+        Raises:
+            ValueError: If the sizes or acquire_timeout are invalid
+        """
+        if minconn < 0 or maxconn < 1 or minconn > maxconn:
+            raise ValueError(f"Invalid pool size: minconn={minconn}, maxconn={maxconn}")
+        if acquire_timeout < 0:
+            raise ValueError(f"acquire_timeout must not be negative, got: {acquire_timeout}")
+
+        self.minconn = minconn
+        self.maxconn = maxconn
+        self.acquire_timeout = acquire_timeout
+        self._connect_args = args
+        self._connect_kwargs = kwargs
+        self._connect = connect
+        self._clock = clock
+
+        self._cond = threading.Condition()
+        self._idle: list[Any] = []
+        self._in_use: dict[int, Any] = {}
+        self._created_at: dict[int, float] = {}
+        self._waiters: deque[object] = deque()
+        self._checked_out = 0
+        self.closed = False
+
+        self._checkouts = 0
+        self._max_reached_events = 0
+        self._timeouts = 0
+        self._wait_buckets = [0] * (len(WAIT_HISTOGRAM_BUCKETS_MS) + 1)
+        self._wait_total_ms = 0.0
+        self._wait_max_ms = 0.0
+
+        for _ in range(minconn):
+            self._idle.append(self._open())
+
+    def _open(self) -> Any:
+        """Open a new connection and remember when it was created."""
+        conn = self._connect(*self._connect_args, **self._connect_kwargs)
+        with self._cond:
+            self._created_at[id(conn)] = self._clock()
+        return conn
+
+    def getconn(self, timeout: float | None = None) -> Any:
+        """
+        Check out a connection, waiting in line if all maxconn are in use.
+
+        Args:
+            timeout: Seconds to wait (defaults to the pool's acquire_timeout)
+
+        Returns:
+            A connection (idle one reused, otherwise a new one)
+
+        Raises:
+            PoolTimeoutError: If no connection became free in time
+            psycopg2.pool.PoolError: If the pool is closed
+        """
+        timeout = self.acquire_timeout if timeout is None else timeout
+        started = self._clock()
+        with self._cond:
+            if self.closed:
+                raise pool.PoolError("connection pool is closed")
+            if self._waiters or self._checked_out >= self.maxconn:
+                self._wait_for_turn(started + timeout)
+            self._checked_out += 1
+            conn = self._idle.pop() if self._idle else None
+
+        if conn is None:
+            try:
+                conn = self._open()
+            except Exception:
+                with self._cond:
+                    self._checked_out -= 1
+                    self._cond.notify_all()
+                raise
+
+        with self._cond:
+            self._in_use[id(conn)] = conn
+            self._record_wait((self._clock() - started) * 1000)
+        return conn
+
+    def _wait_for_turn(self, deadline: float) -> None:
+        """Queue behind earlier waiters until first in line with a free slot (lock held)."""
+        ticket = object()
+        self._waiters.append(ticket)
+        self._max_reached_events += 1
+        try:
+            while self._waiters[0] is not ticket or self._checked_out >= self.maxconn:
+                remaining = deadline - self._clock()
+                if remaining <= 0:
+                    self._timeouts += 1
+                    raise PoolTimeoutError(
+                        f"No database connection available within {self.acquire_timeout:g}s "
+                        f"({self.maxconn} in use)"
+                    )
+                self._cond.wait(remaining)
+                if self.closed:
+                    raise pool.PoolError("connection pool is closed")
+        finally:
+            self._waiters.remove(ticket)
+            # The next waiter may now be first in line
+            self._cond.notify_all()
+
+    def _record_wait(self, wait_ms: float) -> None:
+        """Add a checkout wait time to the histogram (lock held)."""
+        self._checkouts += 1
+        self._wait_buckets[bisect.bisect_left(WAIT_HISTOGRAM_BUCKETS_MS, wait_ms)] += 1
+        self._wait_total_ms += wait_ms
+        self._wait_max_ms = max(self._wait_max_ms, wait_ms)
+
+    def putconn(self, conn: Any, close: bool = False) -> None:
+        """
+        Return a connection to the pool.
+
+        Connections in an unknown state are closed; connections left in a
+        transaction are rolled back before being reused.
+
+        Args:
+            conn: Connection from getconn()
+            close: Close the connection instead of keeping it for reuse
+
+        Raises:
+            psycopg2.pool.PoolError: If the connection wasn't checked out from this pool
+        """
+        with self._cond:
+            if id(conn) not in self._in_use:
+                raise pool.PoolError("trying to put unkeyed connection")
+
+        if not close and not conn.closed:
+            status = conn.info.transaction_status
+            if status == TRANSACTION_STATUS_UNKNOWN:
+                close = True
+            elif status != TRANSACTION_STATUS_IDLE:
+                try:
+                    conn.rollback()
+                except Exception:  # noqa: BLE001
+                    close = True
+
+        with self._cond:
+            del self._in_use[id(conn)]
+            self._checked_out -= 1
+            close = close or conn.closed or self.closed
+            if close:
+                self._created_at.pop(id(conn), None)
+            else:
+                self._idle.append(conn)
+            self._cond.notify_all()
+
+        if close and not conn.closed:
+            try:
+                conn.close()
+            except Exception:  # noqa: BLE001
+                pass
+
+    def closeall(self) -> None:
+        """Close every connection and wake up waiting callers with a PoolError."""
+        with self._cond:
+            self.closed = True
+            connections = self._idle + list(self._in_use.values())
+            self._idle.clear()
+            self._created_at.clear()
+            self._cond.notify_all()
+        for conn in connections:
+            try:
+                conn.close()
+            except Exception:  # noqa: BLE001
+                pass
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Snapshot of the pool's usage metrics.
+
+        Returns:
+            Dict with current sizes (in_use, idle, waiting), counters since creation
+            (checkouts, max_reached_events, timeouts), the checkout wait histogram
+            (per-bucket counts keyed by upper bound in ms) and open connection ages
+        """
+        with self._cond:
+            now = self._clock()
+            ages = [now - created for created in self._created_at.values()]
+            histogram = {
+                f"le_{bound}ms": count
+                for bound, count in zip(WAIT_HISTOGRAM_BUCKETS_MS, self._wait_buckets, strict=False)
+            }
+            histogram["le_inf"] = self._wait_buckets[-1]
+            return {
+                "minconn": self.minconn,
+                "maxconn": self.maxconn,
+                "in_use": self._checked_out,
+                "idle": len(self._idle),
+                "waiting": len(self._waiters),
+                "checkouts": self._checkouts,
+                "max_reached_events": self._max_reached_events,
+                "timeouts": self._timeouts,
+                "checkout_wait_ms": {
+                    "avg": round(self._wait_total_ms / self._checkouts, 3)
+                    if self._checkouts
+                    else 0.0,
+                    "max": round(self._wait_max_ms, 3),
+                    "histogram": histogram,
+                },
+                "connection_age_seconds": {
+                    "count": len(ages),
+                    "min": round(min(ages), 1) if ages else None,
+                    "max": round(max(ages), 1) if ages else None,
+                },
+            }
@@ -5,17 +5,20 @@ from __future__ import annotations
 import logging
 import os
 import threading
+import time
 from contextlib import contextmanager
 from typing import Protocol
 
 import psycopg2
-from psycopg2 import pool
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE, TRANSACTION_STATUS_UNKNOWN
+
+from .connection_pool import DEFAULT_ACQUIRE_TIMEOUT_SECONDS, InstrumentedConnectionPool
 
 logger = logging.getLogger(__name__)
 
-# Module-level pool registry: connection_string -> ThreadedConnectionPool
+# Module-level pool registry: connection_string -> InstrumentedConnectionPool
 # Shared across all PostgreSQLDatabase instances with the same connection string.
-_pools: dict[str, pool.ThreadedConnectionPool] = {}
+_pools: dict[str, InstrumentedConnectionPool] = {}
 _pools_lock = threading.Lock()
 
 # Default pool sizes; keep conservative to stay within DigitalOcean managed DB limits.
@@ -24,22 +27,54 @@ _pools_lock = threading.Lock()
 _DEFAULT_MIN_CONN = 1
 _DEFAULT_MAX_CONN = 5
 
+# How long a checkout waits for a free connection when all are in use.
+# DB_POOL_ACQUIRE_TIMEOUT_SECONDS: wait in seconds before raising PoolTimeoutError (default 30)
+_DEFAULT_ACQUIRE_TIMEOUT_SECONDS = DEFAULT_ACQUIRE_TIMEOUT_SECONDS
+
+# Pooled connections idle longer than this are pinged (SELECT 1) before reuse.
+# DB_HEALTH_CHECK_IDLE_SECONDS: idle threshold in seconds (default 30; 0 pings every checkout)
+_DEFAULT_HEALTH_CHECK_IDLE_SECONDS = 30.0
+
+# TCP keepalives so the OS notices dead peers on idle pooled connections.
+# Only applied when the connection string doesn't set them.
+_KEEPALIVE_SETTINGS = {
+    "keepalives": 1,
+    "keepalives_idle": 30,
+    "keepalives_interval": 10,
+    "keepalives_count": 3,
+}
 
-def _get_pool(connection_string: str) -> pool.ThreadedConnectionPool:
-    """Get or create a ThreadedConnectionPool for the given connection string."""
+# When each pooled connection was last returned cleanly: id(conn) -> time.monotonic().
+# Connections missing here (new, or returned after an error) are pinged before reuse.
+_idle_since: dict[int, float] = {}
+_idle_since_lock = threading.Lock()
+
+
+def _get_pool(connection_string: str) -> InstrumentedConnectionPool:
+    """Get or create a connection pool for the given connection string."""
     with _pools_lock:
         if connection_string not in _pools:
             minconn = int(os.getenv("DB_POOL_MIN_CONN", str(_DEFAULT_MIN_CONN)))
             maxconn = int(os.getenv("DB_POOL_MAX_CONN", str(_DEFAULT_MAX_CONN)))
             minconn = max(1, min(minconn, maxconn))
             maxconn = max(minconn, maxconn)
-            _pools[connection_string] = pool.ThreadedConnectionPool(
-                minconn, maxconn, connection_string
+            acquire_timeout = float(
+                os.getenv("DB_POOL_ACQUIRE_TIMEOUT_SECONDS", str(_DEFAULT_ACQUIRE_TIMEOUT_SECONDS))
+            )
+            dsn_params = psycopg2.extensions.parse_dsn(connection_string)
+            keepalives = {k: v for k, v in _KEEPALIVE_SETTINGS.items() if k not in dsn_params}
+            _pools[connection_string] = InstrumentedConnectionPool(
+                minconn,
+                maxconn,
+                connection_string,
+                acquire_timeout=max(acquire_timeout, 0.0),
+                **keepalives,
             )
             logger.debug(
-                "Created connection pool for database (min=%s, max=%s)",
+                "Created connection pool for database (min=%s, max=%s, acquire_timeout=%ss)",
                 minconn,
                 maxconn,
+                acquire_timeout,
             )
         return _pools[connection_string]
 
@@ -55,6 +90,31 @@ def close_all_pools() -> None:
         _pools.clear()
 
 
+def _describe_pool(connection_string: str) -> str:
+    """Identify a pool by user, host, port and database, without the password."""
+    try:
+        params = psycopg2.extensions.parse_dsn(connection_string)
+    except psycopg2.ProgrammingError:
+        return "unknown"
+    return (
+        f"{params.get('user', '')}@{params.get('host', 'localhost')}:"
+        f"{params.get('port', '5432')}/{params.get('dbname', '')}"
+    )
+
+
+def get_pool_stats() -> list[dict]:
+    """Usage metrics of every connection pool in this process.
+
+    Returns:
+        One dict per pool: "database" (user@host:port/dbname) plus the pool's
+        stats() (in-use count, checkout wait histogram, saturation events,
+        connection ages)
+    """
+    with _pools_lock:
+        pools = list(_pools.items())
+    return [{"database": _describe_pool(conn_str), **p.stats()} for conn_str, p in pools]
+
+
 class Database(Protocol):
     """Protocol for database operations.
 
@@ -64,9 +124,13 @@ class Database(Protocol):
     """
 
     @contextmanager
-    def get_cursor(self):
+    def get_cursor(self, read_only: bool = False):
         """Get a database cursor as a context manager.
 
+        Args:
+            read_only: Hint that the block doesn't write, letting implementations
+                skip transaction overhead.
+
         Yields:
             A database cursor that can be used to execute queries.
 
@@ -78,9 +142,10 @@ class Database(Protocol):
 class PostgreSQLDatabase:
     """PostgreSQL implementation of Database protocol with connection pooling.
 
-    Uses a shared ThreadedConnectionPool per connection string. Connections
+    Uses a shared InstrumentedConnectionPool per connection string. Connections
     are reused instead of created per request, preventing "remaining connection
-    slots are reserved" errors on managed databases (e.g., DigitalOcean).
+    slots are reserved" errors on managed databases (e.g., DigitalOcean). When all
+    connections are in use, get_cursor() waits in line for one to be returned.
     """
 
     def __init__(self, connection_string: str):
@@ -99,12 +164,18 @@ class PostgreSQLDatabase:
         self._pool = _get_pool(connection_string)
 
     @contextmanager
-    def get_cursor(self):
+    def get_cursor(self, read_only: bool = False):
         """Get a database cursor as a context manager.
 
         Borrows a connection from the pool (transaction mode for SAVEPOINT support)
         and yields a cursor. The connection is returned to the pool when exiting.
-        If the connection is dead, it attempts to get a new one.
+        Connections are only pinged when they were idle longer than
+        DB_HEALTH_CHECK_IDLE_SECONDS or their last use failed; a dead connection is
+        replaced with a new one.
+
+        Args:
+            read_only: Run in autocommit mode for queries that don't write. Skips the
+                BEGIN/COMMIT round trips; each statement sees its own snapshot.
 
         Yields:
             A psycopg2 cursor for executing queries.
@@ -115,47 +186,108 @@ class PostgreSQLDatabase:
                 results = cur.fetchall()
         """
         conn = None
+        clean = False
+        if self._pool.closed:
+            # close_all_pools() ran since this instance was created (long-lived
+            # instances are shared app-wide); pick up the replacement pool.
+            self._pool = _get_pool(self.connection_string)
         try:
             conn = self._pool.getconn()
-
-            # Check if connection is still alive
-            try:
-                with conn.cursor() as check_cur:
-                    check_cur.execute("SELECT 1")
-            except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            if not self._is_usable(conn):
                 # Connection is dead, try to get a new one
                 logger.warning("Pooled connection is dead, attempting to get a new one")
-                try:
-                    self._pool.putconn(conn, close=True)
-                except Exception:
-                    pass
+                self._discard(conn)
                 conn = self._pool.getconn()
 
             # Use transaction mode (autocommit=False) so SAVEPOINT works.
             # CampaignService and other code use SAVEPOINT for partial rollback;
             # SAVEPOINT requires an active transaction (autocommit must be False).
-            # Ensure connection is clean before use.
-            try:
-                conn.rollback()
-            except Exception:  # noqa: BLE001
-                pass
+            # Read-only cursors use autocommit, so no transaction is opened at all.
+            if read_only:
+                conn.autocommit = True
 
             with conn.cursor() as cur:
                 yield cur
 
-            # Commit the transaction so changes are persisted.
-            try:
-                conn.commit()
-            except Exception:  # noqa: BLE001
-                pass
+            # Commit the transaction so changes are persisted (nothing to commit if
+            # no statement ran or the cursor is read-only).
+            if conn.info.transaction_status != TRANSACTION_STATUS_IDLE:
+                try:
+                    conn.commit()
+                except Exception:  # noqa: BLE001
+                    pass
+            clean = True
         except Exception as e:
             logger.error("Database error in get_cursor: %s", e)
             raise
         finally:
             if conn:
+                self._release(conn, clean)
+
+    def _is_usable(self, conn) -> bool:
+        """Check a pooled connection before use, pinging it only when necessary.
+
+        Closed connections and connections in an unknown state are unusable. A
+        connection left inside a transaction is rolled back. Connections that were
+        idle longer than the health-check threshold (or whose last use failed) get a
+        SELECT 1 in autocommit mode, which costs a single round trip.
+        """
+        if conn.closed:
+            return False
+        status = conn.info.transaction_status
+        if status == TRANSACTION_STATUS_UNKNOWN:
+            return False
+
+        with _idle_since_lock:
+            idle_since = _idle_since.pop(id(conn), None)
+        threshold = float(
+            os.getenv("DB_HEALTH_CHECK_IDLE_SECONDS", str(_DEFAULT_HEALTH_CHECK_IDLE_SECONDS))
+        )
+        needs_ping = idle_since is None or time.monotonic() - idle_since >= threshold
+
+        try:
+            if status != TRANSACTION_STATUS_IDLE:
+                conn.rollback()
+            if needs_ping:
+                conn.autocommit = True
                 try:
-                    # Rollback any uncommitted work before returning connection to pool
+                    with conn.cursor() as check_cur:
+                        check_cur.execute("SELECT 1")
+                finally:
+                    conn.autocommit = False
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            return False
+        return True
+
+    def _release(self, conn, clean: bool) -> None:
+        """Return a connection to the pool, rolling back only if a transaction is open.
+
+        Connections whose use failed are pinged on their next checkout; connections
+        that can't be reset are closed instead of returned.
+        """
+        try:
+            if not conn.closed:
+                # Rollback any uncommitted work before returning connection to pool
+                if conn.info.transaction_status != TRANSACTION_STATUS_IDLE:
                     conn.rollback()
-                except Exception:  # noqa: BLE001
-                    pass
-                self._pool.putconn(conn)
+                conn.autocommit = False
+        except Exception:  # noqa: BLE001
+            self._discard(conn)
+            return
+
+        if conn.closed:
+            self._discard(conn)
+            return
+        if clean:
+            with _idle_since_lock:
+                _idle_since[id(conn)] = time.monotonic()
+        self._pool.putconn(conn)
+
+    def _discard(self, conn) -> None:
+        """Close a broken connection and remove it from the pool."""
+        with _idle_since_lock:
+            _idle_since.pop(id(conn), None)
+        try:
+            self._pool.putconn(conn, close=True)
+        except Exception:  # noqa: BLE001
+            pass
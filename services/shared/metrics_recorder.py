@@ -3,6 +3,8 @@ ETL Run Metrics Recorder
 
 Utility for recording pipeline run metrics to marts.etl_run_metrics table.
 Used by Airflow tasks to track processing statistics, API usage, errors, etc.
+Campaign task metrics are also announced on the CAMPAIGN_PROGRESS_CHANNEL
+notification channel, which the backend streams to clients watching a campaign.
 """
 
 from __future__ import annotations
@@ -17,6 +19,10 @@ from .database import Database
 
 logger = logging.getLogger(__name__)
 
+# Postgres NOTIFY channel announcing campaign task metrics as they are recorded.
+# Payload: JSON with campaign_id, dag_run_id, task_name, task_status, run_timestamp
+CAMPAIGN_PROGRESS_CHANNEL = "campaign_progress"
+
 
 class MetricsRecorder:
     """
@@ -81,6 +87,8 @@ class MetricsRecorder:
 
         Returns:
             Generated run_id (UUID string)
+
+        Campaign tasks are announced on CAMPAIGN_PROGRESS_CHANNEL when the row commits.
         """
         run_id = str(uuid.uuid4())
         run_timestamp = datetime.now()
@@ -154,6 +162,23 @@ class MetricsRecorder:
                         metadata_json,
                     ),
                 )
+                if campaign_id is not None:
+                    # Delivered to listeners when this transaction commits
+                    cur.execute(
+                        "SELECT pg_notify(%s, %s)",
+                        (
+                            CAMPAIGN_PROGRESS_CHANNEL,
+                            json.dumps(
+                                {
+                                    "campaign_id": campaign_id,
+                                    "dag_run_id": dag_run_id,
+                                    "task_name": task_name,
+                                    "task_status": task_status,
+                                    "run_timestamp": run_timestamp.isoformat(),
+                                }
+                            ),
+                        ),
+                    )
 
             logger.debug(
                 f"Recorded metrics for task {task_name} (run_id: {run_id}, status: {task_status})"
@@ -0,0 +1,196 @@
+"""
+Notification Listener
+
+Fans out Postgres NOTIFY messages on one channel to in-process subscribers.
+A single background thread per listener holds a dedicated autocommit
+connection (outside the connection pool, since LISTEN is tied to the session),
+waits for notifications with select() and copies each payload into every
+subscriber's queue. Subscribers (e.g. server-sent event streams) block on their
+own queue, so any number of them cost one database connection per process.
+
+Notifications sent while the connection is down are lost; after reconnecting,
+and when a slow subscriber's queue overflows, subscribers receive RESYNC and
+should re-read the current state from the database.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import select
+import threading
+from collections.abc import Callable
+from typing import Any
+
+import psycopg2
+from psycopg2 import sql
+
+logger = logging.getLogger(__name__)
+
+# Delivered instead of a payload when notifications may have been missed
+RESYNC = None
+
+# Seconds between checks for shutdown while waiting for notifications
+_DEFAULT_POLL_INTERVAL_SECONDS = 5.0
+
+# Seconds to wait before reconnecting after the listening connection failed
+_DEFAULT_RECONNECT_DELAY_SECONDS = 2.0
+
+# Payloads buffered per subscriber before it is told to resync instead
+_DEFAULT_SUBSCRIBER_QUEUE_SIZE = 100
+
+
+class Subscription:
+    """Queue of notification payloads for one subscriber."""
+
+    def __init__(self, maxsize: int):
+        self._queue: queue.Queue[str | None] = queue.Queue(maxsize=maxsize)
+
+    def get(self, timeout: float | None = None) -> str | None:
+        """
+        Wait for the next payload.
+
+        Args:
+            timeout: Seconds to wait (None waits forever)
+
+        Returns:
+            Payload string, or RESYNC if notifications may have been missed
+
+        Raises:
+            queue.Empty: If nothing arrived within the timeout
+        """
+        return self._queue.get(timeout=timeout)
+
+    def put(self, payload: str | None) -> None:
+        """Queue a payload; on overflow, drop the backlog and ask for a resync."""
+        try:
+            self._queue.put_nowait(payload)
+        except queue.Full:
+            with self._queue.mutex:
+                self._queue.queue.clear()
+            self._queue.put_nowait(RESYNC)
+
+
+class NotificationListener:
+    """
+    LISTEN on a channel in a background thread and dispatch to subscribers.
+
+    The thread starts with the first subscription and runs until close().
+    """
+
+    def __init__(
+        self,
+        connection_string: str,
+        channel: str,
+        *,
+        connect: Callable[..., Any] = psycopg2.connect,
+        poll_interval: float = _DEFAULT_POLL_INTERVAL_SECONDS,
+        reconnect_delay: float = _DEFAULT_RECONNECT_DELAY_SECONDS,
+        queue_size: int = _DEFAULT_SUBSCRIBER_QUEUE_SIZE,
+    ):
+        """
+        Initialize the listener (no connection is opened until the first subscription).
+
+        Args:
+            connection_string: PostgreSQL connection string
+            channel: Notification channel to LISTEN on
+            connect: Connection factory (injectable for tests)
+            poll_interval: Seconds between shutdown checks while idle
+            reconnect_delay: Seconds to wait before reconnecting after an error
+            queue_size: Payloads buffered per subscriber
+        """
+        if not connection_string:
+            raise ValueError("Connection string is required")
+        self.connection_string = connection_string
+        self.channel = channel
+        self._connect = connect
+        self._poll_interval = poll_interval
+        self._reconnect_delay = reconnect_delay
+        self._queue_size = queue_size
+
+        self._lock = threading.Lock()
+        self._subscribers: set[Subscription] = set()
+        self._thread: threading.Thread | None = None
+        self._stopped = threading.Event()
+        self._listening = threading.Event()
+
+    def subscribe(self) -> Subscription:
+        """
+        Register a subscriber, starting the listener thread if needed.
+
+        Returns:
+            Subscription to read payloads from; pass it to unsubscribe() when done
+        """
+        subscription = Subscription(self._queue_size)
+        with self._lock:
+            self._subscribers.add(subscription)
+            if self._thread is None and not self._stopped.is_set():
+                self._thread = threading.Thread(
+                    target=self._run, name=f"listen-{self.channel}", daemon=True
+                )
+                self._thread.start()
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Stop delivering payloads to a subscription."""
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def wait_until_listening(self, timeout: float | None = None) -> bool:
+        """Block until the LISTEN is active; returns False on timeout."""
+        return self._listening.wait(timeout)
+
+    def close(self) -> None:
+        """Stop the listener thread and close its connection."""
+        self._stopped.set()
+        with self._lock:
+            thread = self._thread
+        if thread is not None:
+            thread.join(self._poll_interval + 1)
+
+    def _dispatch(self, payload: str | None) -> None:
+        """Copy a payload (or RESYNC) to every subscriber."""
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscription in subscribers:
+            subscription.put(payload)
+
+    def _run(self) -> None:
+        """Listener thread: (re)connect, LISTEN and dispatch until closed."""
+        reconnecting = False
+        while not self._stopped.is_set():
+            conn = None
+            try:
+                conn = self._connect(self.connection_string)
+                conn.autocommit = True
+                with conn.cursor() as cur:
+                    cur.execute(sql.SQL("LISTEN {}").format(sql.Identifier(self.channel)))
+                self._listening.set()
+                if reconnecting:
+                    # Anything sent while we were disconnected is gone
+                    self._dispatch(RESYNC)
+                    logger.info(f"Reconnected listener on channel {self.channel}")
+                reconnecting = True
+                self._listen(conn)
+            except Exception as e:  # noqa: BLE001
+                self._listening.clear()
+                logger.warning(f"Listener on channel {self.channel} failed: {e}")
+                self._stopped.wait(self._reconnect_delay)
+            finally:
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except Exception:  # noqa: BLE001
+                        pass
+        self._listening.clear()
+
+    def _listen(self, conn: Any) -> None:
+        """Wait for notifications on an open connection until closed."""
+        while not self._stopped.is_set():
+            readable, _, _ = select.select([conn], [], [], self._poll_interval)
+            if not readable:
+                continue
+            conn.poll()
+            while conn.notifies:
+                notify = conn.notifies.pop(0)
+                self._dispatch(notify.payload)
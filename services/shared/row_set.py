@@ -0,0 +1,80 @@
+"""
+Row Set
+
+Query results kept as the cursor returned them: a tuple of column names plus a
+list of row tuples. Large list endpoints can slice and serialize a RowSet
+without first converting every row into a dictionary; the backend JSON
+provider writes it as a list of objects, or as a compact columns/rows table
+via as_table().
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from typing import Any, overload
+
+
+class RowSet(Sequence[dict[str, Any]]):
+    """
+    Read-only sequence of query rows that behaves like a list of dictionaries.
+
+    Indexing returns a dictionary for that row only; slicing returns another
+    RowSet sharing the same columns.
+    """
+
+    __slots__ = ("columns", "rows")
+
+    def __init__(self, columns: Iterable[str], rows: Iterable[tuple[Any, ...]]):
+        """
+        Initialize the row set.
+
+        Args:
+            columns: Column names, in row order
+            rows: Row tuples
+        """
+        self.columns: tuple[str, ...] = tuple(columns)
+        self.rows: list[tuple[Any, ...]] = list(rows)
+
+    @classmethod
+    def from_cursor(cls, cur: Any) -> RowSet:
+        """
+        Fetch all remaining rows of an executed cursor.
+
+        Args:
+            cur: Database cursor after execute()
+
+        Returns:
+            RowSet with the cursor's column names and rows
+        """
+        return cls((desc[0] for desc in cur.description), cur.fetchall())
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    @overload
+    def __getitem__(self, index: int) -> dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> RowSet: ...
+
+    def __getitem__(self, index: int | slice) -> dict[str, Any] | RowSet:
+        if isinstance(index, slice):
+            return RowSet(self.columns, self.rows[index])
+        return dict(zip(self.columns, self.rows[index]))
+
+    def __repr__(self) -> str:
+        return f"RowSet(columns={self.columns!r}, rows=<{len(self.rows)} rows>)"
+
+    def to_dicts(self) -> list[dict[str, Any]]:
+        """Convert every row to a dictionary keyed by column name."""
+        columns = self.columns
+        return [dict(zip(columns, row)) for row in self.rows]
+
+    def as_table(self) -> dict[str, Any]:
+        """
+        Columnar form for serialization: column names once, rows as arrays.
+
+        Returns:
+            Dictionary with "columns" and "rows" (no per-row dictionaries)
+        """
+        return {"columns": self.columns, "rows": self.rows}
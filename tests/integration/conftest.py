@@ -476,6 +476,24 @@ def test_database(test_db_connection_string):
                 ):
                     pass
 
+            # Run per-user mart migrations (applied companies, dashboard stats and the
+            # data version counter), which job status and note writes keep current
+            for user_mart_script in (
+                "29_add_user_applied_companies.sql",
+                "30_add_user_dashboard_stats.sql",
+                "31_add_user_data_version.sql",
+            ):
+                with open(
+                    project_root / "docker" / "init" / user_mart_script, encoding="utf-8"
+                ) as f:
+                    try:
+                        cur.execute(f.read())
+                    except (
+                        psycopg2.errors.DuplicateTable,
+                        psycopg2.errors.DuplicateObject,
+                    ):
+                        pass
+
             # Run chatgpt_enrichments migration (creates staging.chatgpt_enrichments)
             chatgpt_script = (
                 project_root / "docker" / "init" / "13_create_chatgpt_enrichments_table.sql"
@@ -0,0 +1,277 @@
+"""Integration tests checking the SQL ranking backend against the Python ranker."""
+
+from __future__ import annotations
+
+import json
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from services.ranker.job_ranker import RANKING_FACTORS, JobRanker
+from services.ranker.sql_job_ranker import SQLJobRanker
+from services.shared import PostgreSQLDatabase
+
+# Mark all tests in this module as integration tests
+pytestmark = pytest.mark.integration
+
+COMPANIES = {
+    "parity-small": "1-50",
+    "parity-mid": "501-1000",
+    "parity-huge": "10000+",
+    "parity-text": "About 200 employees",
+    "parity-label": "Large",
+    "parity-none": None,
+}
+
+LOCATIONS = ["Toronto, ON", "Vancouver, Canada", "New York, USA", "London, England", "", None]
+TITLES = [
+    "Senior Software Engineer",
+    "Data Engineer",
+    "software developer (Python)",
+    "Engineering Manager",
+    None,
+]
+EMPLOYMENT_TYPES = ["FULLTIME", "FULLTIME, PARTTIME", "Full-time", "CONTRACTOR", None]
+SENIORITIES = ["intern", "entry", "mid", "senior", "lead", "principal", None]
+REMOTE_TYPES = ["remote", "hybrid", "onsite", "", None]
+SKILLS = [
+    ["Python", "SQL", " AWS "],
+    ["python", "docker"],
+    ["Java"],
+    [],
+    None,
+]
+SALARIES = [
+    (None, None, None, None),
+    (90000, 120000, "year", "USD"),
+    (100000, None, "year", "CAD"),
+    (None, 150000, None, "EUR"),
+    (50, 70, "hour", "USD"),
+    (6000, 8000, "month", "usd"),
+    (80000, 95000, "year", "XX"),
+]
+
+CAMPAIGNS = [
+    {
+        "campaign_id": 9101,
+        "campaign_name": "Parity With Preferences",
+        "query": "Senior Software Engineer",
+        "location": "Toronto",
+        "country": "ca",
+        "min_salary": 100000,
+        "max_salary": 130000,
+        "currency": "CAD",
+        "company_size_preference": "51-200,10000+",
+        "skills": "Python; SQL, Kubernetes",
+        "employment_type_preference": "FULLTIME,PARTTIME",
+        "seniority": "senior,lead",
+        "remote_preference": "remote,hybrid",
+        "ranking_weights": None,
+    },
+    {
+        "campaign_id": 9102,
+        "campaign_name": "Parity Neutral",
+        "query": "data",
+        "location": None,
+        "country": "us",
+        "min_salary": None,
+        "max_salary": None,
+        "currency": None,
+        "company_size_preference": None,
+        "skills": None,
+        "employment_type_preference": None,
+        "seniority": None,
+        "remote_preference": None,
+        "ranking_weights": {"location_match": 40.0, "keyword_match": 40.0, "recency": 20.0},
+    },
+]
+
+
+def _seed(db: PostgreSQLDatabase, job_count: int = 120) -> None:
+    """Insert companies and a deterministic mix of jobs for every parity campaign."""
+    rng = random.Random(2024)
+    now = datetime.now()
+
+    with db.get_cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO marts.users (username, email, password_hash, role)
+            VALUES ('parity_test_user', 'parity@test.com', 'hash', 'user')
+            ON CONFLICT (username) DO UPDATE SET email = EXCLUDED.email
+            RETURNING user_id
+            """
+        )
+        user_id = cur.fetchone()[0]
+        for campaign in CAMPAIGNS:
+            cur.execute(
+                """
+                INSERT INTO marts.job_campaigns
+                (campaign_id, user_id, campaign_name, is_active, query, location, country,
+                 date_window, email, created_at, updated_at, total_run_count)
+                VALUES (%s, %s, %s, true, %s, %s, %s, 'week', 'parity@test.com',
+                        NOW(), NOW(), 0)
+                ON CONFLICT (campaign_id) DO NOTHING
+                """,
+                (
+                    campaign["campaign_id"],
+                    user_id,
+                    campaign["campaign_name"],
+                    campaign["query"],
+                    campaign["location"],
+                    campaign["country"],
+                ),
+            )
+
+        for company_key, company_size in COMPANIES.items():
+            cur.execute(
+                """
+                INSERT INTO marts.dim_companies (company_key, company_name, company_size)
+                VALUES (%s, %s, %s)
+                ON CONFLICT (company_key) DO UPDATE SET company_size = EXCLUDED.company_size
+                """,
+                (company_key, company_key, company_size),
+            )
+
+        for campaign in CAMPAIGNS:
+            for i in range(job_count):
+                skills = rng.choice(SKILLS)
+                min_salary, max_salary, period, currency = rng.choice(SALARIES)
+                # Offset by an hour so day boundaries don't move between the two runs
+                days_old = rng.choice([None, 0, 1, 5, 7, 8, 20, 30, 45, 89, 91, 200])
+                posted_at = None if days_old is None else now - timedelta(days=days_old, hours=1)
+                cur.execute(
+                    """
+                    INSERT INTO marts.fact_jobs
+                    (jsearch_job_id, campaign_id, company_key, job_title, job_location,
+                     employment_type, job_posted_at_datetime_utc, extracted_skills,
+                     job_min_salary, job_max_salary, job_salary_period, job_salary_currency,
+                     remote_work_type, seniority_level, dwh_load_date, dwh_load_timestamp,
+                     dwh_source_system)
+                    VALUES
+                    (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
+                     CURRENT_DATE, NOW(), 'test')
+                    """,
+                    (
+                        f"parity-{campaign['campaign_id']}-{i}",
+                        campaign["campaign_id"],
+                        rng.choice(list(COMPANIES)),
+                        rng.choice(TITLES),
+                        rng.choice(LOCATIONS),
+                        rng.choice(EMPLOYMENT_TYPES),
+                        posted_at,
+                        None if skills is None else json.dumps(skills),
+                        min_salary,
+                        max_salary,
+                        period,
+                        currency,
+                        rng.choice(REMOTE_TYPES),
+                        rng.choice(SENIORITIES),
+                    ),
+                )
+
+
+def _fetch_rankings(db: PostgreSQLDatabase, campaign_id: int) -> dict[str, dict[str, float]]:
+    """Return {job_id: {factor_points..., rank_score}} for a campaign."""
+    point_columns = [f"{factor}_points" for factor in RANKING_FACTORS]
+    with db.get_cursor() as cur:
+        cur.execute(
+            f"""
+            SELECT jsearch_job_id, rank_score, {", ".join(point_columns)}
+            FROM marts.dim_ranking
+            WHERE campaign_id = %s
+            """,
+            (campaign_id,),
+        )
+        rows = cur.fetchall()
+    return {
+        row[0]: {
+            name: float(value)
+            for name, value in zip(["rank_score", *point_columns], row[1:], strict=True)
+        }
+        for row in rows
+    }
+
+
+class TestSQLRankerParity:
+    """The SQL backend must reproduce the Python ranker's scores."""
+
+    @pytest.mark.parametrize("campaign", CAMPAIGNS, ids=lambda c: c["campaign_name"])
+    def test_sql_backend_matches_python_backend(self, test_database, campaign):
+        db = PostgreSQLDatabase(connection_string=test_database)
+        _seed(db)
+
+        python_count = JobRanker(database=db).rank_jobs_for_campaign(dict(campaign))
+        python_rankings = _fetch_rankings(db, campaign["campaign_id"])
+
+        sql_count = SQLJobRanker(database=db).rank_jobs_for_campaign(dict(campaign))
+        sql_rankings = _fetch_rankings(db, campaign["campaign_id"])
+
+        assert sql_count == python_count == len(python_rankings)
+        assert sql_rankings.keys() == python_rankings.keys()
+
+        mismatches = [
+            (job_id, expected, sql_rankings[job_id])
+            for job_id, expected in python_rankings.items()
+            if sql_rankings[job_id] != expected
+        ]
+        assert not mismatches, f"SQL backend diverged from Python backend: {mismatches[:5]}"
+
+    def test_sql_backend_marks_source_system(self, test_database):
+        db = PostgreSQLDatabase(connection_string=test_database)
+        _seed(db, job_count=3)
+        campaign = dict(CAMPAIGNS[0])
+
+        SQLJobRanker(database=db).rank_jobs_for_campaign(campaign)
+
+        with db.get_cursor() as cur:
+            cur.execute(
+                """
+                SELECT DISTINCT dwh_source_system, rank_explain ? 'total_score'
+                FROM marts.dim_ranking
+                WHERE campaign_id = %s
+                """,
+                (campaign["campaign_id"],),
+            )
+            assert cur.fetchall() == [("ranker_sql", True)]
+
+    def test_top_k_keeps_same_jobs_in_both_backends(self, test_database):
+        db = PostgreSQLDatabase(connection_string=test_database)
+        _seed(db)
+        campaign = dict(CAMPAIGNS[0])
+        campaign_id = campaign["campaign_id"]
+
+        # Rank everything once, then give the user a status on the worst job
+        JobRanker(database=db).rank_jobs_for_campaign(dict(campaign))
+        with db.get_cursor() as cur:
+            cur.execute(
+                """
+                SELECT jsearch_job_id FROM marts.dim_ranking
+                WHERE campaign_id = %s
+                ORDER BY rank_score, jsearch_job_id
+                LIMIT 1
+                """,
+                (campaign_id,),
+            )
+            worst_job_id = cur.fetchone()[0]
+            cur.execute(
+                """
+                INSERT INTO marts.user_job_status (jsearch_job_id, user_id, campaign_id, status)
+                SELECT %s, user_id, campaign_id, 'applied'
+                FROM marts.job_campaigns WHERE campaign_id = %s
+                """,
+                (worst_job_id, campaign_id),
+            )
+
+        kept = {}
+        for name, ranker in [
+            ("python", JobRanker(database=db, top_k=10)),
+            ("streaming", JobRanker(database=db, top_k=10, stream_chunk_size=25)),
+            ("sql", SQLJobRanker(database=db, top_k=10)),
+        ]:
+            assert ranker.rank_jobs_for_campaign(dict(campaign)) == 11, name
+            kept[name] = set(_fetch_rankings(db, campaign_id))
+
+        assert worst_job_id in kept["python"]
+        assert len(kept["python"]) == 11
+        assert kept["python"] == kept["streaming"] == kept["sql"]
@@ -1,5 +1,7 @@
-"""Unit tests for CampaignService status derivation from metrics."""
+"""Unit tests for CampaignService status derivation from metrics, dashboard stats and
+HTTP cache validators."""
 
+from datetime import date, datetime
 from unittest.mock import Mock
 
 import pytest
@@ -342,3 +344,123 @@ class TestCampaignServiceStatusFromMetrics:
         assert result["is_complete"] is True
         assert result["jobs_available"] is True
         assert result["dag_run_id"] == "latest_dag_run_789"
+
+
+class TestCampaignServiceDashboardStats:
+    """Test cases for the precomputed dashboard stats."""
+
+    def _row(self, **overrides):
+        row = {
+            "total_campaigns": 3,
+            "active_campaigns": 2,
+            "jobs_processed": 40,
+            "tracked_jobs": 8,
+            "acted_jobs": 2,
+            "found_by_day": {"2026-03-10": 12, "2026-03-01": 99},
+            "applied_by_day": {"2026-03-09": 1},
+            "today": date(2026, 3, 10),
+        }
+        row.update(overrides)
+        return tuple(row.values())
+
+    def test_user_stats_are_a_single_row_read(self, campaign_service, mock_database):
+        """Test a user's stats come from their row, with the 7-day activity window filled in."""
+        mock_cursor = mock_database.get_cursor.return_value.__enter__.return_value
+        mock_cursor.fetchone.return_value = self._row()
+
+        stats = campaign_service.get_dashboard_stats(user_id=5)
+
+        assert mock_cursor.execute.call_count == 1
+        assert mock_cursor.execute.call_args[0][1] == (5,)
+        assert stats["total_campaigns"] == 3
+        assert stats["active_campaigns"] == 2
+        assert stats["jobs_processed"] == 40
+        assert stats["success_rate"] == 25.0
+        activity = stats["activity_data"]
+        assert [d["date"] for d in activity] == [f"2026-03-{day:02d}" for day in range(4, 11)]
+        assert activity[-1] == {"date": "2026-03-10", "found": 12, "applied": 0}
+        assert activity[-2] == {"date": "2026-03-09", "found": 0, "applied": 1}
+
+    def test_missing_user_row_is_computed(self, campaign_service, mock_database):
+        """Test a user without a stats row gets one computed before the read."""
+        mock_cursor = mock_database.get_cursor.return_value.__enter__.return_value
+        mock_cursor.fetchone.side_effect = [None, self._row()]
+        mock_cursor.rowcount = 1
+
+        stats = campaign_service.get_dashboard_stats(user_id=5)
+
+        refresh_call = mock_cursor.execute.call_args_list[1]
+        assert "INSERT INTO marts.user_dashboard_stats" in refresh_call[0][0]
+        assert refresh_call[0][1] == ([5], [5])
+        assert stats["jobs_processed"] == 40
+
+    def test_admin_stats_sum_all_rows(self, campaign_service, mock_database):
+        """Test admin stats add up every user's row."""
+        mock_cursor = mock_database.get_cursor.return_value.__enter__.return_value
+        mock_cursor.fetchall.side_effect = [
+            [],
+            [self._row(), self._row(tracked_jobs=0, acted_jobs=0, applied_by_day={})],
+        ]
+
+        stats = campaign_service.get_dashboard_stats(user_id=None)
+
+        assert stats["total_campaigns"] == 6
+        assert stats["jobs_processed"] == 80
+        assert stats["success_rate"] == 25.0
+        assert stats["activity_data"][-1]["found"] == 24
+
+    def test_toggle_active_refreshes_owner_stats(self, campaign_service, mock_database):
+        """Test toggling a campaign refreshes its owner's dashboard stats."""
+        mock_cursor = mock_database.get_cursor.return_value.__enter__.return_value
+        mock_cursor.fetchone.side_effect = [(True,), (5,)]
+
+        assert campaign_service.toggle_active(1) is False
+
+        assert mock_cursor.execute.call_args[0][1] == ([5], [5])
+
+
+class TestCampaignServiceCacheValidators:
+    """Test cases for the data version and campaign status validators."""
+
+    def test_user_data_version_is_a_single_row_read(self, campaign_service, mock_database):
+        """Test a user's data version comes from their stats row."""
+        mock_cursor = mock_database.get_cursor.return_value.__enter__.return_value
+        changed_at = datetime(2026, 3, 10, 12, 0)
+        mock_cursor.fetchone.return_value = (7, 1, changed_at)
+
+        assert campaign_service.get_data_version(5) == (7, 1, changed_at)
+        assert mock_cursor.execute.call_count == 1
+        assert mock_cursor.execute.call_args[0][1] == (5,)
+
+    def test_missing_user_row_is_computed_for_data_version(self, campaign_service, mock_database):
+        """Test a user without a stats row gets one computed before the version is read."""
+        mock_cursor = mock_database.get_cursor.return_value.__enter__.return_value
+        mock_cursor.fetchone.side_effect = [None, (1, 1, None)]
+
+        assert campaign_service.get_data_version(5) == (1, 1, None)
+        assert (
+            "INSERT INTO marts.user_dashboard_stats" in mock_cursor.execute.call_args_list[1][0][0]
+        )
+
+    def test_admin_data_version_covers_all_users(self, campaign_service, mock_database):
+        """Test the admin data version aggregates every row."""
+        mock_cursor = mock_database.get_cursor.return_value.__enter__.return_value
+        mock_cursor.fetchone.return_value = (42, 3, None)
+
+        assert campaign_service.get_data_version(None) == (42, 3, None)
+        assert "SUM(data_version)" in mock_cursor.execute.call_args[0][0]
+
+    def test_status_version_filters_by_dag_run(self, campaign_service, mock_database):
+        """Test the status validators are scoped to the requested DAG run."""
+        mock_cursor = mock_database.get_cursor.return_value.__enter__.return_value
+        mock_cursor.fetchone.return_value = (3, None)
+
+        campaign_service.get_campaign_status_version(1)
+        query, params = mock_cursor.execute.call_args[0]
+        assert "dag_run_id" not in query
+        assert params == [1]
+
+        campaign_service.get_campaign_status_version(1, dag_run_id="run_1")
+        query, params = mock_cursor.execute.call_args[0]
+        assert "dag_run_id = %s" in query
+        assert params == [1, "run_1"]
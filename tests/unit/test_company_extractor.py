@@ -4,8 +4,10 @@ Unit tests for Company Extractor service.
 Tests fuzzy matching, SQL injection prevention, and existing company checks.
 """
 
+import threading
 from contextlib import contextmanager
-from unittest.mock import MagicMock, Mock
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
@@ -172,7 +174,207 @@ class TestCompanyExtractorExistingCompanyCheck:
         last_call = execute_calls[-1]
         query = last_call[0][0] if last_call[0] else ""
 
-        # Verify query checks staging.glassdoor_companies
+        # Verify query checks staging.glassdoor_companies with NULL-safe anti-joins
         assert "staging.glassdoor_companies" in query
         assert "company_lookup_key" in query
-        assert "NOT IN" in query
+        assert "NOT EXISTS" in query
+        assert "NOT IN" not in query
+
+    def test_get_companies_to_enrich_since_scans_new_postings_only(self):
+        """Test that an incremental scan filters postings by load timestamp."""
+        mock_db = MockDatabase()
+        mock_db.cursor.fetchone.return_value = (True,)
+        mock_db.cursor.fetchall.return_value = []
+        since = datetime(2026, 1, 1)
+
+        extractor = CompanyExtractor(database=mock_db, glassdoor_client=Mock(spec=GlassdoorClient))
+        extractor.get_companies_to_enrich(limit=5, since=since)
+
+        query, params = mock_db.cursor.execute.call_args.args
+        assert "dwh_load_timestamp >= %s" in query
+        assert "enrichment_status = 'error'" in query
+        assert params == (since, 5)
+
+
+class TestCompanyExtractorLeasedMode:
+    """Test leased (concurrent) enrichment through the queue."""
+
+    def _client(self):
+        def search_company(query, limit):
+            if query == "missing":
+                return {"status": "OK", "data": []}
+            if query == "broken":
+                raise RuntimeError("api down")
+            return {"status": "OK", "data": [{"name": query, "company_id": 1}]}
+
+        client = Mock(spec=GlassdoorClient)
+        client.search_company.side_effect = search_company
+        return client
+
+    def test_rejects_invalid_lease_batch_size(self):
+        with pytest.raises(ValueError, match="lease_batch_size must be a positive integer"):
+            CompanyExtractor(
+                database=MockDatabase(), glassdoor_client=self._client(), lease_batch_size=0
+            )
+
+    def test_incremental_scan_requires_leased_mode(self):
+        with pytest.raises(ValueError, match="incremental_scan requires lease_batch_size"):
+            CompanyExtractor(
+                database=MockDatabase(), glassdoor_client=self._client(), incremental_scan=True
+            )
+
+    def test_incremental_scan_starts_before_last_enqueue(self):
+        db = MockDatabase()
+        high_water_mark = datetime(2026, 3, 1, 12)
+        extractor = CompanyExtractor(
+            database=db, glassdoor_client=self._client(), lease_batch_size=2, incremental_scan=True
+        )
+
+        with (
+            patch.object(extractor, "get_incremental_scan_start", return_value=high_water_mark),
+            patch.object(extractor, "get_companies_to_enrich", return_value=["acme"]) as mock_get,
+            patch.object(extractor, "enqueue_companies") as mock_enqueue,
+            patch.object(extractor, "lease_companies", return_value=[]),
+        ):
+            extractor.extract_all_companies()
+
+        mock_get.assert_called_once_with(since=high_water_mark)
+        keys = mock_enqueue.call_args.args[0]
+        queued_at = mock_enqueue.call_args.kwargs["queued_at"]
+        assert keys == ["acme"]
+        assert queued_at <= datetime.now()
+
+        db.cursor.fetchone.return_value = (high_water_mark,)
+        assert extractor.get_incremental_scan_start() == high_water_mark - timedelta(hours=12)
+        db.cursor.fetchone.return_value = (None,)
+        assert extractor.get_incremental_scan_start() is None
+
+    def test_lease_companies_uses_skip_locked(self):
+        db = MockDatabase()
+        db.cursor.fetchall.return_value = [("b",), ("a",)]
+        extractor = CompanyExtractor(
+            database=db, glassdoor_client=self._client(), lease_batch_size=5, lease_seconds=120
+        )
+
+        leased = extractor.lease_companies(5)
+
+        assert leased == ["a", "b"]
+        query, params = db.cursor.execute.call_args.args
+        assert "FOR UPDATE SKIP LOCKED" in query
+        assert params == (120, 5)
+
+    def test_leased_batch_is_written_in_bulk(self):
+        db = MockDatabase()
+        extractor = CompanyExtractor(
+            database=db, glassdoor_client=self._client(), lease_batch_size=3
+        )
+
+        with patch("services.extractor.company_extractor.execute_values") as mock_execute_values:
+            results = extractor._enrich_leased_batch(["acme", "missing", "broken"])
+
+        assert results == {"acme": "success", "missing": "not_found", "broken": "error"}
+        assert mock_execute_values.call_count == 2
+        company_rows = mock_execute_values.call_args_list[0].args[2]
+        status_rows = mock_execute_values.call_args_list[1].args[2]
+        assert [row[2] for row in company_rows] == ["acme"]
+        assert status_rows == [
+            ("acme", "success", None),
+            ("missing", "not_found", None),
+            ("broken", "error", "api down"),
+        ]
+
+    def test_workers_drain_queue_up_to_limit(self):
+        extractor = CompanyExtractor(
+            database=MockDatabase(),
+            glassdoor_client=self._client(),
+            lease_batch_size=2,
+            max_workers=3,
+        )
+        queue = [f"company {i}" for i in range(10)]
+        queue_lock = threading.Lock()
+        leased_batches = []
+
+        def lease_companies(batch_size):
+            with queue_lock:
+                batch = [queue.pop(0) for _ in range(min(batch_size, len(queue)))]
+                leased_batches.append(batch)
+                return batch
+
+        with (
+            patch.object(extractor, "get_companies_to_enrich", return_value=list(queue)),
+            patch.object(extractor, "enqueue_companies") as mock_enqueue,
+            patch.object(extractor, "lease_companies", side_effect=lease_companies),
+            patch.object(
+                extractor,
+                "_enrich_leased_batch",
+                side_effect=lambda keys: dict.fromkeys(keys, "success"),
+            ),
+        ):
+            results = extractor.extract_all_companies(limit=7)
+
+        mock_enqueue.assert_called_once()
+        assert len(results) == 7
+        assert all(len(batch) <= 2 for batch in leased_batches)
+        assert sorted(results) == sorted(f"company {i}" for i in range(7))
+
+
+class TestCompanyExtractorNameResolution:
+    """Test local resolution of company name variants before calling the API."""
+
+    def _extractor(self, index_rows, **kwargs):
+        db = MockDatabase()
+        db.cursor.fetchone.return_value = (True,)
+        db.cursor.fetchall.return_value = index_rows
+        client = Mock(spec=GlassdoorClient)
+        client.search_company.side_effect = lambda query, limit: {
+            "status": "OK",
+            "data": [{"name": query.title(), "company_id": 1}],
+        }
+        return CompanyExtractor(database=db, glassdoor_client=client, **kwargs), db, client
+
+    def test_variant_of_enriched_company_skips_api(self):
+        extractor, db, client = self._extractor([("Google", "google")])
+
+        with patch.object(extractor, "get_companies_to_enrich", return_value=["google llc"]):
+            results = extractor.extract_all_companies()
+
+        assert results == {"google llc": "resolved"}
+        client.search_company.assert_not_called()
+        query, params = db.cursor.execute.call_args.args
+        assert "'success'" in query
+        assert params == ("google llc",)
+
+    def test_enriched_company_is_added_to_index_during_run(self):
+        extractor, _, client = self._extractor([])
+
+        with (
+            patch.object(extractor, "get_companies_to_enrich", return_value=["acme", "acme inc"]),
+            patch.object(extractor, "_write_company_to_db"),
+        ):
+            results = extractor.extract_all_companies()
+
+        assert results == {"acme": "success", "acme inc": "resolved"}
+        assert client.search_company.call_count == 1
+
+    def test_leased_batch_resolves_variants(self):
+        extractor, _, client = self._extractor([("Google", "google")], lease_batch_size=2)
+
+        with patch("services.extractor.company_extractor.execute_values") as mock_execute_values:
+            results = extractor._enrich_leased_batch(["google inc", "acme"])
+
+        assert results == {"google inc": "resolved", "acme": "success"}
+        client.search_company.assert_called_once()
+        status_rows = mock_execute_values.call_args_list[1].args[2]
+        assert status_rows == [("google inc", "success", None), ("acme", "success", None)]
+
+    def test_resolution_can_be_disabled(self):
+        extractor, _, client = self._extractor([("Google", "google")], name_match_cutoff=None)
+
+        with (
+            patch.object(extractor, "get_companies_to_enrich", return_value=["google llc"]),
+            patch.object(extractor, "_write_company_to_db"),
+        ):
+            results = extractor.extract_all_companies()
+
+        assert results == {"google llc": "success"}
+        client.search_company.assert_called_once()
@@ -0,0 +1,93 @@
+"""
+Unit tests for the company name index.
+
+Tests name normalization, exact and fuzzy resolution, and concurrent use.
+"""
+
+import threading
+
+import pytest
+
+from services.extractor.company_name_index import (
+    CompanyNameIndex,
+    name_similarity,
+    normalize_company_name,
+)
+
+
+class TestNormalizeCompanyName:
+    """Test company name normalization."""
+
+    @pytest.mark.parametrize(
+        "name,expected",
+        [
+            ("Google LLC", "google"),
+            ("  GOOGLE, Inc. ", "google"),
+            ("Acme Holdings, Ltd.", "acme holdings"),
+            ("Procter & Gamble Co.", "procter and gamble"),
+            ("Company", "company"),
+            ("", ""),
+            (None, ""),
+        ],
+    )
+    def test_normalize(self, name, expected):
+        assert normalize_company_name(name) == expected
+
+    def test_similarity_ignores_legal_suffix(self):
+        assert name_similarity("Google LLC", "google") == 100
+
+
+class TestCompanyNameIndex:
+    """Test resolution against enriched company names."""
+
+    def test_exact_variant_resolves_to_enriched_key(self):
+        index = CompanyNameIndex([("Google", "google llc")])
+
+        assert index.resolve("Google Inc.") == "google llc"
+        assert index.resolve("google") == "google llc"
+
+    def test_fuzzy_match_respects_cutoff(self):
+        index = CompanyNameIndex([("Microsoft", "microsoft")], score_cutoff=90)
+
+        assert index.resolve("Microsoft Corporatoin") is None
+        assert index.resolve("Mircosoft") is None
+        assert (
+            CompanyNameIndex([("Microsoft", "microsoft")], score_cutoff=85).resolve("Mircosoft")
+            == "microsoft"
+        )
+
+    def test_short_names_only_match_exactly(self):
+        index = CompanyNameIndex([("IBM", "ibm")], score_cutoff=0)
+
+        assert index.resolve("ibm corp") == "ibm"
+        assert index.resolve("HBM") is None
+
+    def test_unknown_or_empty_name_is_unresolved(self):
+        index = CompanyNameIndex([("Google", "google")])
+
+        assert index.resolve("Completely Different Company") is None
+        assert index.resolve("") is None
+        assert len(CompanyNameIndex()) == 0
+
+    def test_first_key_for_a_name_wins(self):
+        index = CompanyNameIndex([("Acme", "acme"), ("Acme Inc", "acme inc")])
+
+        assert len(index) == 1
+        assert index.resolve("ACME") == "acme"
+
+    def test_concurrent_add_and_resolve(self):
+        index = CompanyNameIndex()
+        names = [f"company number {i}" for i in range(200)]
+
+        def add_names(chunk):
+            for name in chunk:
+                index.add(name, name)
+                assert index.resolve(name) == name
+
+        threads = [threading.Thread(target=add_names, args=(names[i::4],)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(index) == 200
@@ -0,0 +1,182 @@
+"""
+Unit tests for InstrumentedConnectionPool.
+
+Uses a fake connect() factory, so blocking checkout, fairness and metrics are
+tested without a database.
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from psycopg2 import pool
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE, TRANSACTION_STATUS_INTRANS
+
+from services.shared.connection_pool import InstrumentedConnectionPool, PoolTimeoutError
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = 0
+        self.status = TRANSACTION_STATUS_IDLE
+        self.rolled_back = False
+
+    @property
+    def info(self):
+        return SimpleNamespace(transaction_status=self.status)
+
+    def rollback(self):
+        self.rolled_back = True
+        self.status = TRANSACTION_STATUS_IDLE
+
+    def close(self):
+        self.closed = 1
+
+
+def _pool(minconn=1, maxconn=2, **kwargs):
+    opened = []
+
+    def connect(*args, **kw):
+        conn = FakeConnection()
+        opened.append(conn)
+        return conn
+
+    return InstrumentedConnectionPool(minconn, maxconn, "dsn", connect=connect, **kwargs), opened
+
+
+def _wait_until(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.005)
+
+
+class TestCheckout:
+    """Test connection reuse and bounded checkout."""
+
+    def test_returned_connections_are_kept_for_reuse(self):
+        p, opened = _pool(minconn=1, maxconn=3)
+
+        first, second = p.getconn(), p.getconn()
+        p.putconn(first)
+        p.putconn(second)
+
+        assert len(opened) == 2
+        assert not first.closed and not second.closed
+        assert p.getconn() is second
+
+    def test_open_transaction_is_rolled_back_on_return(self):
+        p, _ = _pool()
+        conn = p.getconn()
+        conn.status = TRANSACTION_STATUS_INTRANS
+
+        p.putconn(conn)
+
+        assert conn.rolled_back
+        assert p.stats()["idle"] == 1
+
+    def test_close_removes_connection(self):
+        p, _ = _pool()
+        conn = p.getconn()
+
+        p.putconn(conn, close=True)
+
+        assert conn.closed
+        assert p.stats()["connection_age_seconds"]["count"] == 0
+
+    def test_unknown_connection_is_rejected(self):
+        p, _ = _pool()
+
+        with pytest.raises(pool.PoolError):
+            p.putconn(FakeConnection())
+
+    def test_exhausted_pool_times_out(self):
+        p, _ = _pool(maxconn=1, acquire_timeout=0.05)
+        p.getconn()
+
+        with pytest.raises(PoolTimeoutError):
+            p.getconn()
+
+        stats = p.stats()
+        assert stats["timeouts"] == 1
+        assert stats["max_reached_events"] == 1
+        assert stats["waiting"] == 0
+
+    def test_waiter_gets_returned_connection(self):
+        p, _ = _pool(maxconn=1)
+        held = p.getconn()
+        result = {}
+        waiter = threading.Thread(target=lambda: result.update(conn=p.getconn()))
+        waiter.start()
+        _wait_until(lambda: p.stats()["waiting"] == 1)
+
+        p.putconn(held)
+        waiter.join(2)
+
+        assert result["conn"] is held
+
+    def test_waiters_are_served_in_arrival_order(self):
+        p, _ = _pool(maxconn=1)
+        held = p.getconn()
+        served = []
+
+        def take(name):
+            conn = p.getconn()
+            served.append(name)
+            p.putconn(conn)
+
+        threads = []
+        for name in ("first", "second", "third"):
+            thread = threading.Thread(target=take, args=(name,))
+            thread.start()
+            threads.append(thread)
+            _wait_until(lambda n=len(threads): p.stats()["waiting"] == n)
+
+        p.putconn(held)
+        for thread in threads:
+            thread.join(2)
+
+        assert served == ["first", "second", "third"]
+
+    def test_closeall_wakes_waiters(self):
+        p, opened = _pool(maxconn=1)
+        p.getconn()
+        errors = []
+
+        def take():
+            try:
+                p.getconn()
+            except pool.PoolError as e:
+                errors.append(e)
+
+        waiter = threading.Thread(target=take)
+        waiter.start()
+        _wait_until(lambda: p.stats()["waiting"] == 1)
+        p.closeall()
+        waiter.join(2)
+
+        assert len(errors) == 1
+        assert all(conn.closed for conn in opened)
+
+
+class TestStats:
+    """Test pool metrics."""
+
+    def test_stats_report_usage_and_wait_histogram(self):
+        now = [100.0]
+        p, _ = _pool(minconn=1, maxconn=2, clock=lambda: now[0])
+        now[0] = 160.0
+        p.getconn()
+
+        stats = p.stats()
+
+        assert stats["in_use"] == 1
+        assert stats["idle"] == 0
+        assert stats["checkouts"] == 1
+        assert stats["checkout_wait_ms"]["histogram"]["le_1ms"] == 1
+        assert stats["connection_age_seconds"] == {"count": 1, "min": 60.0, "max": 60.0}
+
+    def test_invalid_sizes_are_rejected(self):
+        with pytest.raises(ValueError):
+            InstrumentedConnectionPool(3, 2, "dsn", connect=lambda *a, **k: FakeConnection())
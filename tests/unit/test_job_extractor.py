@@ -0,0 +1,586 @@
+"""
+Unit tests for Job Extractor service.
+
+Concurrent extraction runs against a local mock JSearch provider.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from services.extractor.job_extractor import JobExtractor
+from services.extractor.jsearch_client import JSearchClient
+from services.extractor.queries import UPDATE_EXTRACTION_HIGH_WATER_MARK
+from services.extractor.rate_limiter import TokenBucketRateLimiter
+
+
+class MockJSearchProvider(ThreadingHTTPServer):
+    """Local JSearch stand-in that records how many requests were in flight at once."""
+
+    daemon_threads = True
+
+    def __init__(self, response_delay: float = 0.1):
+        super().__init__(("127.0.0.1", 0), MockJSearchHandler)
+        self.response_delay = response_delay
+        self.queries = []
+        self.pages = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/jsearch"
+
+
+class MockJSearchHandler(BaseHTTPRequestHandler):
+    def do_GET(self):  # noqa: N802
+        server = self.server
+        params = parse_qs(urlparse(self.path).query)
+        query = params["query"][0]
+        page = int(params.get("page", ["1"])[0])
+        with server.lock:
+            server.queries.append(query)
+            server.pages.append(page)
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        time.sleep(server.response_delay)
+        with server.lock:
+            server.in_flight -= 1
+
+        if query == "broken":
+            self.send_response(400)
+            self.end_headers()
+            return
+
+        body = json.dumps(
+            {"status": "OK", "data": [{"job_id": f"{query}-p{page}-{i}"} for i in range(3)]}
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def mock_provider():
+    server = MockJSearchProvider()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _campaigns(count):
+    return [
+        {"campaign_id": i, "campaign_name": f"Campaign {i}", "query": f"query-{i}"}
+        for i in range(1, count + 1)
+    ]
+
+
+def _client(provider, rate=100.0, capacity=10):
+    return JSearchClient(
+        api_key="test-key",
+        base_url=provider.base_url,
+        max_retries=0,
+        rate_limiter=TokenBucketRateLimiter(rate=rate, capacity=capacity),
+    )
+
+
+class TestJobExtractorInit:
+    """Test constructor validation."""
+
+    def test_requires_positive_max_workers(self):
+        with pytest.raises(ValueError, match="max_workers must be a positive integer"):
+            JobExtractor(
+                database=MagicMock(), jsearch_client=MagicMock(), num_pages=1, max_workers=0
+            )
+
+
+class TestJobExtractorConcurrency:
+    """Test concurrent multi-campaign extraction against a mock provider."""
+
+    def _extract(self, extractor, campaigns):
+        with (
+            patch.object(extractor, "get_active_campaigns", return_value=campaigns),
+            patch.object(
+                extractor, "_write_jobs_to_db", side_effect=lambda jobs, campaign_id: len(jobs)
+            ),
+        ):
+            return extractor.extract_all_jobs()
+
+    def test_sequential_by_default(self, mock_provider):
+        extractor = JobExtractor(
+            database=MagicMock(), jsearch_client=_client(mock_provider), num_pages=1
+        )
+
+        results = self._extract(extractor, _campaigns(3))
+
+        assert results == {1: 3, 2: 3, 3: 3}
+        assert mock_provider.max_in_flight == 1
+
+    def test_concurrent_extraction_overlaps_requests(self, mock_provider):
+        extractor = JobExtractor(
+            database=MagicMock(),
+            jsearch_client=_client(mock_provider),
+            num_pages=1,
+            max_workers=4,
+        )
+
+        results = self._extract(extractor, _campaigns(8))
+
+        assert results == dict.fromkeys(range(1, 9), 3)
+        assert sorted(mock_provider.queries) == sorted(f"query-{i}" for i in range(1, 9))
+        assert mock_provider.max_in_flight > 1
+
+    def test_concurrent_extraction_respects_shared_rate_limit(self, mock_provider):
+        mock_provider.response_delay = 0
+        extractor = JobExtractor(
+            database=MagicMock(),
+            jsearch_client=_client(mock_provider, rate=20.0, capacity=1),
+            num_pages=1,
+            max_workers=4,
+        )
+
+        start = time.monotonic()
+        self._extract(extractor, _campaigns(5))
+        elapsed = time.monotonic() - start
+
+        # 5 requests at 20/s with no burst: the last one cannot start before 0.2s
+        assert elapsed >= 0.19
+
+    def test_failed_campaign_does_not_stop_others(self, mock_provider):
+        campaigns = _campaigns(3)
+        campaigns[1]["query"] = "broken"
+        extractor = JobExtractor(
+            database=MagicMock(),
+            jsearch_client=_client(mock_provider),
+            num_pages=1,
+            max_workers=3,
+        )
+
+        results = self._extract(extractor, campaigns)
+
+        assert results == {1: 3, 2: 0, 3: 3}
+
+
+class TestJobExtractorQueryCoalescing:
+    """Test that identical searches across campaigns share one API request."""
+
+    def test_search_signature_normalizes_case_and_whitespace(self):
+        first = {"query": "Data  Engineer ", "location": "Toronto", "country": "CA"}
+        second = {"query": "data engineer", "location": " toronto", "country": "ca"}
+        third = {
+            "query": "data engineer",
+            "location": "toronto",
+            "country": "ca",
+            "date_window": "week",
+        }
+
+        assert JobExtractor.search_signature(first) == JobExtractor.search_signature(second)
+        assert JobExtractor.search_signature(first) != JobExtractor.search_signature(third)
+
+    def test_identical_searches_are_requested_once_and_fanned_out(self):
+        campaigns = [
+            {"campaign_id": 1, "campaign_name": "A", "query": "Python", "country": "ca"},
+            {"campaign_id": 2, "campaign_name": "B", "query": "python ", "country": "CA"},
+            {"campaign_id": 3, "campaign_name": "C", "query": "Java", "country": "ca"},
+        ]
+        client = MagicMock()
+        client.search_jobs.side_effect = lambda query, **kwargs: {
+            "status": "OK",
+            "data": [{"job_id": f"{query.strip().lower()}-1"}],
+        }
+        extractor = JobExtractor(database=MagicMock(), jsearch_client=client, num_pages=2)
+        written = []
+
+        def write_jobs(jobs, campaign_id):
+            written.append((campaign_id, [job["job_id"] for job in jobs]))
+            return len(jobs)
+
+        with (
+            patch.object(extractor, "get_active_campaigns", return_value=campaigns),
+            patch.object(extractor, "_write_jobs_to_db", side_effect=write_jobs),
+        ):
+            results = extractor.extract_all_jobs()
+
+        assert client.search_jobs.call_count == 2
+        assert results == {1: 1, 2: 1, 3: 1}
+        assert sorted(written) == [(1, ["python-1"]), (2, ["python-1"]), (3, ["java-1"])]
+        assert extractor.last_run_stats == {"api_requests_made": 2, "api_requests_saved": 1}
+
+    def test_api_failure_zeroes_the_whole_group(self):
+        campaigns = [
+            {"campaign_id": 1, "campaign_name": "A", "query": "Python"},
+            {"campaign_id": 2, "campaign_name": "B", "query": "Python"},
+        ]
+        client = MagicMock()
+        client.search_jobs.side_effect = RuntimeError("quota exceeded")
+        extractor = JobExtractor(database=MagicMock(), jsearch_client=client, num_pages=1)
+
+        with patch.object(extractor, "get_active_campaigns", return_value=campaigns):
+            results = extractor.extract_all_jobs()
+
+        assert results == {1: 0, 2: 0}
+        client.search_jobs.assert_called_once()
+
+    def test_write_failure_only_affects_its_campaign(self):
+        campaigns = [
+            {"campaign_id": 1, "campaign_name": "A", "query": "Python"},
+            {"campaign_id": 2, "campaign_name": "B", "query": "Python"},
+        ]
+        client = MagicMock()
+        client.search_jobs.return_value = {"status": "OK", "data": [{"job_id": "j1"}]}
+        extractor = JobExtractor(database=MagicMock(), jsearch_client=client, num_pages=1)
+
+        def write_jobs(jobs, campaign_id):
+            if campaign_id == 1:
+                raise RuntimeError("deadlock")
+            return len(jobs)
+
+        with (
+            patch.object(extractor, "get_active_campaigns", return_value=campaigns),
+            patch.object(extractor, "_write_jobs_to_db", side_effect=write_jobs),
+        ):
+            results = extractor.extract_all_jobs()
+
+        assert results == {1: 0, 2: 1}
+
+
+class TestPageStreaming:
+    """Test page-level fetching in JSearchClient and JobExtractor."""
+
+    def test_iter_search_pages_fetches_concurrently_in_page_order(self, mock_provider):
+        client = _client(mock_provider)
+
+        pages = list(client.iter_search_pages(query="python", num_pages=6, max_workers=3))
+
+        assert [page[0]["job_id"] for page in pages] == [
+            f"python-p{page}-0" for page in range(1, 7)
+        ]
+        assert sorted(mock_provider.pages) == [1, 2, 3, 4, 5, 6]
+        assert mock_provider.max_in_flight > 1
+
+    def test_iter_search_pages_stops_requesting_when_caller_stops(self, mock_provider):
+        client = _client(mock_provider)
+        pages = client.iter_search_pages(query="python", num_pages=10, max_workers=2)
+
+        next(pages)
+        pages.close()
+
+        # Page 1 was consumed and page 2 was already in flight; nothing else is requested
+        assert sorted(mock_provider.pages) == [1, 2]
+
+    def test_streams_pages_and_stops_at_first_duplicate_page(self):
+        client = MagicMock()
+        client.iter_search_pages.return_value = iter(
+            [[{"job_id": "a"}], [{"job_id": "b"}], [{"job_id": "c"}], [{"job_id": "d"}]]
+        )
+        extractor = JobExtractor(
+            database=MagicMock(), jsearch_client=client, num_pages=4, page_workers=2
+        )
+        existing = {"b"}
+        written = []
+
+        def write_jobs(jobs, campaign_id):
+            new_jobs = [job["job_id"] for job in jobs if job["job_id"] not in existing]
+            written.extend(new_jobs)
+            return len(new_jobs)
+
+        with patch.object(extractor, "_write_jobs_to_db", side_effect=write_jobs):
+            count = extractor.extract_jobs_for_campaign(
+                {"campaign_id": 1, "campaign_name": "A", "query": "Python"}
+            )
+
+        assert count == 1
+        assert written == ["a"]
+        client.search_jobs.assert_not_called()
+        assert client.iter_search_pages.call_args.kwargs["max_workers"] == 2
+
+    def test_group_keeps_fetching_while_any_campaign_gets_new_jobs(self):
+        client = MagicMock()
+        client.iter_search_pages.return_value = iter(
+            [[{"job_id": "a"}], [{"job_id": "b"}], [{"job_id": "c"}]]
+        )
+        extractor = JobExtractor(
+            database=MagicMock(), jsearch_client=client, num_pages=3, page_workers=1
+        )
+        # Campaign 1 already has a and b; campaign 2 has nothing yet
+        existing = {1: {"a", "b"}, 2: {"b"}}
+
+        def write_jobs(jobs, campaign_id):
+            return len([job for job in jobs if job["job_id"] not in existing[campaign_id]])
+
+        campaigns = [
+            {"campaign_id": 1, "campaign_name": "A", "query": "Python"},
+            {"campaign_id": 2, "campaign_name": "B", "query": "python"},
+        ]
+        with (
+            patch.object(extractor, "get_active_campaigns", return_value=campaigns),
+            patch.object(extractor, "_write_jobs_to_db", side_effect=write_jobs),
+        ):
+            results = extractor.extract_all_jobs()
+
+        # Page 1 is new for campaign 2; page 2 is a duplicate for both, so page 3 is skipped
+        assert results == {1: 0, 2: 1}
+
+
+class TestIncrementalExtraction:
+    """Test high-water-mark driven date windows and early stopping."""
+
+    NOW = datetime(2026, 3, 10, 12, 0)
+
+    @pytest.mark.parametrize(
+        ("date_window", "mark_age", "expected"),
+        [
+            ("month", None, "month"),
+            ("month", timedelta(hours=2), "today"),
+            ("month", timedelta(days=2), "3days"),
+            ("month", timedelta(days=5), "week"),
+            ("month", timedelta(days=20), "month"),
+            ("anytime", timedelta(days=20), "month"),
+            ("anytime", timedelta(days=90), "anytime"),
+            ("3days", timedelta(days=2), "3days"),
+            ("today", timedelta(hours=2), "today"),
+            (None, timedelta(hours=2), "today"),
+        ],
+    )
+    def test_incremental_date_window(self, date_window, mark_age, expected):
+        mark = None if mark_age is None else self.NOW - mark_age
+
+        assert JobExtractor.incremental_date_window(date_window, mark, now=self.NOW) == expected
+
+    def test_group_uses_oldest_mark_and_advances_marks(self):
+        recent = datetime.now(UTC).replace(tzinfo=None) - timedelta(hours=1)
+        campaigns = [
+            {
+                "campaign_id": 1,
+                "campaign_name": "A",
+                "query": "Python",
+                "date_window": "month",
+                "extraction_high_water_mark": recent,
+            },
+            {
+                "campaign_id": 2,
+                "campaign_name": "B",
+                "query": "Python",
+                "date_window": "month",
+                "extraction_high_water_mark": recent - timedelta(days=2),
+            },
+        ]
+        newest = datetime(2026, 3, 10, 11, 0)
+        client = MagicMock()
+        client.search_jobs.return_value = {
+            "status": "OK",
+            "data": [{"job_id": "j1", "job_posted_at_timestamp": int(newest.timestamp())}],
+        }
+        db = MagicMock()
+        cursor = db.get_cursor.return_value.__enter__.return_value
+        extractor = JobExtractor(database=db, jsearch_client=client, num_pages=1)
+
+        with (
+            patch.object(extractor, "get_active_campaigns", return_value=campaigns),
+            patch.object(extractor, "_write_jobs_to_db", return_value=1),
+        ):
+            extractor.extract_all_jobs()
+
+        assert client.search_jobs.call_args.kwargs["date_posted"] == "3days"
+        mark_updates = [
+            c.args[1]
+            for c in cursor.execute.call_args_list
+            if c.args[0] == UPDATE_EXTRACTION_HIGH_WATER_MARK
+        ]
+        expected_mark = datetime.fromtimestamp(int(newest.timestamp()), UTC).replace(tzinfo=None)
+        assert mark_updates == [(expected_mark, 1), (expected_mark, 2)]
+
+    def test_campaign_without_mark_searches_full_window(self):
+        client = MagicMock()
+        client.search_jobs.return_value = {"status": "OK", "data": []}
+        extractor = JobExtractor(database=MagicMock(), jsearch_client=client, num_pages=1)
+
+        extractor.extract_jobs_for_campaign(
+            {"campaign_id": 1, "campaign_name": "A", "query": "Python", "date_window": "week"}
+        )
+
+        assert client.search_jobs.call_args.kwargs["date_posted"] == "week"
+
+    def test_incremental_disabled_ignores_mark(self):
+        client = MagicMock()
+        client.search_jobs.return_value = {"status": "OK", "data": []}
+        extractor = JobExtractor(
+            database=MagicMock(), jsearch_client=client, num_pages=1, incremental=False
+        )
+
+        extractor.extract_jobs_for_campaign(
+            {
+                "campaign_id": 1,
+                "campaign_name": "A",
+                "query": "Python",
+                "date_window": "week",
+                "extraction_high_water_mark": datetime.now(UTC).replace(tzinfo=None)
+                - timedelta(hours=1),
+            }
+        )
+
+        assert client.search_jobs.call_args.kwargs["date_posted"] == "week"
+
+    def test_paging_stops_once_page_is_older_than_mark(self):
+        mark = datetime(2026, 3, 1)
+
+        def page(job_id, posted_at):
+            timestamp = int(posted_at.replace(tzinfo=UTC).timestamp())
+            return [{"job_id": job_id, "job_posted_at_timestamp": timestamp}]
+
+        client = MagicMock()
+        client.iter_search_pages.return_value = iter(
+            [
+                page("new", mark + timedelta(days=1)),
+                page("old-but-unseen", mark - timedelta(days=1)),
+                page("never-fetched", mark - timedelta(days=2)),
+            ]
+        )
+        extractor = JobExtractor(
+            database=MagicMock(), jsearch_client=client, num_pages=3, page_workers=1
+        )
+        written = []
+
+        def write_jobs(jobs, campaign_id):
+            written.extend(job["job_id"] for job in jobs)
+            return len(jobs)
+
+        with patch.object(extractor, "_write_jobs_to_db", side_effect=write_jobs):
+            count = extractor.extract_jobs_for_campaign(
+                {
+                    "campaign_id": 1,
+                    "campaign_name": "A",
+                    "query": "Python",
+                    "date_window": "anytime",
+                    "extraction_high_water_mark": mark,
+                }
+            )
+
+        assert count == 2
+        assert written == ["new", "old-but-unseen"]
+
+    def test_api_failure_does_not_advance_mark(self):
+        client = MagicMock()
+        client.iter_search_pages.side_effect = RuntimeError("timeout")
+        db = MagicMock()
+        cursor = db.get_cursor.return_value.__enter__.return_value
+        extractor = JobExtractor(database=db, jsearch_client=client, num_pages=2, page_workers=2)
+        campaigns = [{"campaign_id": 1, "campaign_name": "A", "query": "Python"}]
+
+        with patch.object(extractor, "get_active_campaigns", return_value=campaigns):
+            assert extractor.extract_all_jobs() == {1: 0}
+
+        assert not any(
+            c.args[0] == UPDATE_EXTRACTION_HIGH_WATER_MARK for c in cursor.execute.call_args_list
+        )
+
+
+class TestWriteJobsToDb:
+    """Test the raw insert and job_found history write."""
+
+    def _db(self, cursor):
+        db = MagicMock()
+        db.get_cursor.return_value.__enter__.return_value = cursor
+        return db
+
+    def test_history_is_written_in_bulk_with_the_raw_insert(self):
+        cursor = MagicMock()
+        cursor.fetchone.return_value = (42,)  # user_id
+        cursor.fetchall.return_value = [("existing",)]
+        extractor = JobExtractor(database=self._db(cursor), jsearch_client=MagicMock(), num_pages=1)
+        jobs = [{"job_id": "existing"}, {"job_id": "new-1"}, {"job_id": "new-2"}]
+
+        with (
+            patch("services.extractor.job_extractor.execute_values") as mock_execute_values,
+            patch("services.extractor.job_extractor.JobStatusService") as mock_status_service,
+        ):
+            written = extractor._write_jobs_to_db(jobs, campaign_id=7)
+
+        assert written == 2
+        assert len(mock_execute_values.call_args.args[2]) == 2
+        record_bulk = mock_status_service.return_value.record_job_found_bulk
+        record_bulk.assert_called_once_with(
+            jsearch_job_ids=["new-1", "new-2"], user_id=42, campaign_id=7, cur=cursor
+        )
+        mock_status_service.return_value.record_job_found.assert_not_called()
+        executed = [c.args[0] for c in cursor.execute.call_args_list]
+        assert "RELEASE SAVEPOINT before_job_found_history" in executed
+
+    def test_history_failure_rolls_back_to_savepoint_only(self):
+        cursor = MagicMock()
+        cursor.fetchone.return_value = (42,)
+        cursor.fetchall.return_value = []
+        extractor = JobExtractor(database=self._db(cursor), jsearch_client=MagicMock(), num_pages=1)
+
+        with (
+            patch("services.extractor.job_extractor.execute_values"),
+            patch("services.extractor.job_extractor.JobStatusService") as mock_status_service,
+        ):
+            mock_status_service.return_value.record_job_found_bulk.side_effect = RuntimeError(
+                "boom"
+            )
+            written = extractor._write_jobs_to_db([{"job_id": "new-1"}], campaign_id=7)
+
+        assert written == 1
+        executed = [c.args[0] for c in cursor.execute.call_args_list]
+        assert "ROLLBACK TO SAVEPOINT before_job_found_history" in executed
+
+    def test_full_storage_keeps_the_api_job_object(self):
+        cursor = MagicMock()
+        cursor.fetchone.return_value = None
+        cursor.fetchall.return_value = []
+        extractor = JobExtractor(database=self._db(cursor), jsearch_client=MagicMock(), num_pages=1)
+        job = {"job_id": "j1", "job_description": "Build things", "job_salary": None}
+
+        with patch("services.extractor.job_extractor.execute_values") as mock_execute_values:
+            extractor._write_jobs_to_db([job], campaign_id=7)
+
+        assert mock_execute_values.call_count == 1
+        (row,) = mock_execute_values.call_args.args[2]
+        assert json.loads(row[1]) == job
+        assert row[6] is None
+
+    def test_slim_storage_stores_each_description_once(self):
+        cursor = MagicMock()
+        cursor.fetchone.return_value = None
+        cursor.fetchall.return_value = []
+        extractor = JobExtractor(
+            database=self._db(cursor), jsearch_client=MagicMock(), num_pages=1, raw_storage="slim"
+        )
+        jobs = [
+            {"job_id": "j1", "job_title": "Dev", "job_description": "Same text", "job_salary": 1},
+            {"job_id": "j2", "job_title": "Dev", "job_description": "Same text"},
+            {"job_id": "j3", "job_title": "QA"},
+        ]
+
+        with patch("services.extractor.job_extractor.execute_values") as mock_execute_values:
+            written = extractor._write_jobs_to_db(jobs, campaign_id=7)
+
+        assert written == 3
+        description_rows = mock_execute_values.call_args_list[0].args[2]
+        posting_rows = mock_execute_values.call_args_list[1].args[2]
+        description_hash = hashlib.sha256(b"Same text").hexdigest()
+        assert [row[:2] for row in description_rows] == [(description_hash, "Same text")]
+        assert json.loads(posting_rows[0][1]) == {"job_id": "j1", "job_title": "Dev"}
+        assert [row[6] for row in posting_rows] == [description_hash, description_hash, None]
+
+    def test_rejects_unknown_raw_storage(self):
+        with pytest.raises(ValueError, match="raw_storage must be one of full, slim"):
+            JobExtractor(
+                database=MagicMock(), jsearch_client=MagicMock(), num_pages=1, raw_storage="zip"
+            )
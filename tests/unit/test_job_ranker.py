@@ -9,11 +9,13 @@ Tests the scoring logic for multiple preferences support:
 - Job validation to prevent orphaned rankings
 """
 
-from unittest.mock import MagicMock
+from datetime import datetime
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-from services.ranker.job_ranker import JobRanker
+from services.ranker.job_ranker import RANKING_LOAD_COLUMNS, JobRanker, TopKRankings
+from services.ranker.queries import PRUNE_STALE_RANKINGS
 
 
 class TestJobRankerMultiplePreferences:
@@ -320,7 +322,7 @@ class TestJobRankerValidation:
         # First call: get_jobs_for_campaign returns both jobs
         # Second call: validate_job_exists for valid_job_1 returns True
         # Third call: validate_job_exists for invalid_job_1 returns False
-        # Fourth call: _write_rankings (execute_values)
+        # Fourth call: _write_rankings (COPY into load table)
         def execute_side_effect(query, *args):
             if "GET_JOBS_FOR_CAMPAIGN" in query or "SELECT" in query and "fact_jobs" in query:
                 if "valid_job_1" in str(args) and "invalid_job_1" not in str(args):
@@ -371,22 +373,21 @@ class TestJobRankerValidation:
             "employment_type_preference": "FULLTIME",
         }
 
-        # Mock execute_values for _write_rankings
+        # Mock copy_rows for _write_rankings
         from unittest.mock import patch
 
-        with patch("services.ranker.job_ranker.execute_values") as mock_execute_values:
+        with patch("services.ranker.job_ranker.copy_rows") as mock_copy_rows:
             result = ranker.rank_jobs_for_campaign(campaign)
 
             # Should only rank the valid job
             assert result == 1
-            # Should have called execute_values once with one ranking
-            assert mock_execute_values.called
+            # Should have called copy_rows once with one ranking
+            assert mock_copy_rows.call_count == 1
             # Check that only valid job was ranked (invalid job was skipped)
-            call_args = mock_execute_values.call_args
+            call_args = mock_copy_rows.call_args
             assert call_args is not None
-            # execute_values signature: execute_values(cursor, query, rows, ...)
-            # call_args.args[0] = cursor, call_args.args[1] = query, call_args.args[2] = rows
-            rows = call_args.args[2]  # Third argument is rows
+            # copy_rows signature: copy_rows(cursor, table, columns, rows)
+            rows = list(call_args.args[3])
             assert len(rows) == 1
             assert rows[0][0] == "valid_job_1"  # jsearch_job_id is first element
 
@@ -453,8 +454,225 @@ class TestJobRankerValidation:
 
         from unittest.mock import patch
 
-        with patch("services.ranker.job_ranker.execute_values"):
+        with patch("services.ranker.job_ranker.copy_rows"):
             result = ranker.rank_jobs_for_campaign(campaign)
 
             # Should return 0 since all jobs were invalid
             assert result == 0
+
+
+class TestJobRankerWriteRankings:
+    """Test the COPY-based ranking write path."""
+
+    @pytest.fixture
+    def ranker(self):
+        """Create a JobRanker instance with a mock database."""
+        mock_db = MagicMock()
+        return JobRanker(database=mock_db)
+
+    def test_write_rankings_copies_typed_factor_columns(self, ranker):
+        """Test that factor points are written as typed columns, not a JSON string."""
+        mock_cursor = MagicMock()
+        ranker.db.get_cursor.return_value.__enter__.return_value = mock_cursor
+
+        job = {"job_title": "Software Engineer", "job_location": "New York, NY"}
+        campaign = {"campaign_id": 1, "query": "Software Engineer", "location": "New York"}
+        score, explanation = ranker.calculate_job_score(job, campaign)
+        now = datetime(2025, 1, 1, 12, 0, 0)
+        rankings = [
+            {
+                "jsearch_job_id": "job\t1",
+                "campaign_id": 1,
+                "rank_score": round(score, 2),
+                "rank_explain": explanation,
+                "ranked_at": now,
+                "ranked_date": now.date(),
+                "dwh_load_timestamp": now,
+                "dwh_source_system": "ranker",
+            }
+        ]
+
+        ranker._write_rankings(rankings)
+
+        mock_cursor.copy_expert.assert_called_once()
+        copy_sql, buffer = mock_cursor.copy_expert.call_args.args
+        assert "tmp_dim_ranking_load" in copy_sql
+        assert "location_match_points" in copy_sql
+
+        fields = buffer.getvalue().rstrip("\n").split("\t")
+        assert len(fields) == len(RANKING_LOAD_COLUMNS)
+        assert fields[0] == "job\\t1"  # Tab in job ID is escaped
+        assert (
+            float(fields[RANKING_LOAD_COLUMNS.index("location_match_points")])
+            == (explanation["location_match"])
+        )
+        assert fields[RANKING_LOAD_COLUMNS.index("ranked_at")] == "2025-01-01T12:00:00"
+
+        # Upsert builds rank_explain server-side from the load table
+        executed = [call.args[0] for call in mock_cursor.execute.call_args_list]
+        assert any("jsonb_build_object" in query for query in executed)
+
+    def test_write_rankings_skips_empty_list(self, ranker):
+        """Test that no database work is done when there are no rankings."""
+        ranker._write_rankings([])
+        ranker.db.get_cursor.assert_not_called()
+
+
+class TestJobRankerStreaming:
+    """Test streaming (constant-memory) ranking mode."""
+
+    @pytest.fixture
+    def ranker(self):
+        """Create a streaming JobRanker instance with a mock database."""
+        mock_db = MagicMock()
+        return JobRanker(database=mock_db, stream_chunk_size=2)
+
+    def test_stream_chunk_size_must_be_positive(self):
+        """Test that a non-positive chunk size is rejected."""
+        with pytest.raises(ValueError, match="stream_chunk_size"):
+            JobRanker(database=MagicMock(), stream_chunk_size=0)
+
+    def test_rank_jobs_streaming_writes_each_chunk(self, ranker):
+        """Test that jobs are fetched and written chunk by chunk on one connection."""
+        mock_cursor = MagicMock()
+        ranker.db.get_cursor.return_value.__enter__.return_value = mock_cursor
+        stream_cursor = mock_cursor.connection.cursor.return_value.__enter__.return_value
+        stream_cursor.description = [("jsearch_job_id",), ("job_title",)]
+        stream_cursor.fetchmany.side_effect = [
+            [("job_1", "Data Engineer"), ("job_2", "Data Analyst")],
+            [("job_3", "Software Engineer")],
+            [],
+        ]
+
+        campaign = {"campaign_id": 7, "campaign_name": "Data", "query": "data engineer"}
+
+        with patch("services.ranker.job_ranker.copy_rows") as mock_copy_rows:
+            result = ranker.rank_jobs_for_campaign(campaign)
+
+        assert result == 3
+        # Named (server-side) cursor is used for reading
+        assert mock_cursor.connection.cursor.call_args.kwargs["name"] == "rank_campaign_7"
+        stream_cursor.fetchmany.assert_called_with(2)
+        # One COPY per chunk, on the same cursor/transaction
+        assert mock_copy_rows.call_count == 2
+        chunk_ids = [[row[0] for row in call.args[3]] for call in mock_copy_rows.call_args_list]
+        assert chunk_ids == [["job_1", "job_2"], ["job_3"]]
+        assert all(call.args[0] is mock_cursor for call in mock_copy_rows.call_args_list)
+        # No per-job existence checks in streaming mode
+        assert ranker.db.get_cursor.call_count == 1
+
+    def test_rank_jobs_streaming_no_jobs(self, ranker):
+        """Test that streaming mode returns 0 for a campaign with no jobs."""
+        mock_cursor = MagicMock()
+        ranker.db.get_cursor.return_value.__enter__.return_value = mock_cursor
+        stream_cursor = mock_cursor.connection.cursor.return_value.__enter__.return_value
+        stream_cursor.fetchmany.return_value = []
+
+        campaign = {"campaign_id": 7, "campaign_name": "Data"}
+
+        with patch("services.ranker.job_ranker.copy_rows") as mock_copy_rows:
+            result = ranker.rank_jobs_for_campaign(campaign)
+
+        assert result == 0
+        mock_copy_rows.assert_not_called()
+
+
+class TestTopKRankings:
+    """Test the bounded top-K ranking collector."""
+
+    @staticmethod
+    def _ranking(job_id, score):
+        return {"jsearch_job_id": job_id, "rank_score": score}
+
+    def test_keeps_best_k_in_score_order(self):
+        top = TopKRankings(2)
+        for job_id, score in [("a", 10.0), ("b", 50.0), ("c", 30.0), ("d", 5.0)]:
+            top.add(self._ranking(job_id, score))
+
+        assert [r["jsearch_job_id"] for r in top.rankings()] == ["b", "c"]
+
+    def test_ties_are_broken_by_job_id(self):
+        top = TopKRankings(1)
+        top.add(self._ranking("job_a", 40.0))
+        top.add(self._ranking("job_b", 40.0))
+
+        assert [r["jsearch_job_id"] for r in top.rankings()] == ["job_b"]
+
+    def test_protected_jobs_are_kept_outside_k(self):
+        top = TopKRankings(1, keep_job_ids={"applied"})
+        top.add(self._ranking("applied", 1.0))
+        top.add(self._ranking("best", 90.0))
+        top.add(self._ranking("second", 80.0))
+
+        assert [r["jsearch_job_id"] for r in top.rankings()] == ["best", "applied"]
+
+
+class TestJobRankerTopK:
+    """Test top-K ranking mode."""
+
+    def test_top_k_must_be_positive(self):
+        """Test that a non-positive top_k is rejected."""
+        with pytest.raises(ValueError, match="top_k"):
+            JobRanker(database=MagicMock(), top_k=0)
+
+    def test_campaign_top_k_overrides_ranker_default(self):
+        """Test that ranking_top_k on the campaign takes precedence."""
+        ranker = JobRanker(database=MagicMock(), top_k=100)
+
+        assert ranker._get_top_k({"ranking_top_k": 5}) == 5
+        assert ranker._get_top_k({"ranking_top_k": None}) == 100
+        assert JobRanker(database=MagicMock())._get_top_k({}) is None
+
+    def test_rank_jobs_top_k_writes_best_jobs_and_prunes(self):
+        """Test that only the top K (plus status jobs) are written and the rest pruned."""
+        ranker = JobRanker(database=MagicMock(), top_k=1)
+        mock_cursor = MagicMock()
+        ranker.db.get_cursor.return_value.__enter__.return_value = mock_cursor
+        # Jobs the user has a status for
+        mock_cursor.fetchall.return_value = [("job_low",)]
+
+        jobs = [
+            {"jsearch_job_id": "job_low", "job_title": "Cashier"},
+            {"jsearch_job_id": "job_best", "job_title": "Data Engineer"},
+            {"jsearch_job_id": "job_mid", "job_title": "Data Analyst"},
+        ]
+        campaign = {"campaign_id": 3, "campaign_name": "Data", "query": "data engineer"}
+
+        with (
+            patch.object(ranker, "get_jobs_for_campaign", return_value=jobs),
+            patch.object(ranker, "_validate_job_exists_in_fact_jobs", return_value=True),
+            patch("services.ranker.job_ranker.copy_rows") as mock_copy_rows,
+        ):
+            result = ranker.rank_jobs_for_campaign(campaign)
+
+        assert result == 2
+        written_ids = [row[0] for row in mock_copy_rows.call_args.args[3]]
+        assert written_ids == ["job_best", "job_low"]
+
+        prune_calls = [
+            c for c in mock_cursor.execute.call_args_list if c.args[0] == PRUNE_STALE_RANKINGS
+        ]
+        assert len(prune_calls) == 1
+        assert prune_calls[0].args[1]["campaign_id"] == 3
+
+    def test_rank_jobs_streaming_top_k_writes_once(self):
+        """Test that streaming top-K mode writes the surviving rankings in one COPY."""
+        ranker = JobRanker(database=MagicMock(), stream_chunk_size=2, top_k=2)
+        mock_cursor = MagicMock()
+        ranker.db.get_cursor.return_value.__enter__.return_value = mock_cursor
+        mock_cursor.fetchall.return_value = []
+        stream_cursor = mock_cursor.connection.cursor.return_value.__enter__.return_value
+        stream_cursor.description = [("jsearch_job_id",), ("job_title",)]
+        stream_cursor.fetchmany.side_effect = [
+            [("job_1", "Data Engineer"), ("job_2", "Cashier")],
+            [("job_3", "Data Engineer Lead")],
+            [],
+        ]
+        campaign = {"campaign_id": 7, "campaign_name": "Data", "query": "data engineer"}
+
+        with patch("services.ranker.job_ranker.copy_rows") as mock_copy_rows:
+            result = ranker.rank_jobs_for_campaign(campaign)
+
+        assert result == 2
+        mock_copy_rows.assert_called_once()
+        assert sorted(row[0] for row in mock_copy_rows.call_args.args[3]) == ["job_1", "job_3"]
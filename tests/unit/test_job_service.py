@@ -1,10 +1,12 @@
 """Unit tests for JobService."""
 
+from datetime import datetime
+from decimal import Decimal
 from unittest.mock import Mock
 
 import pytest
 
-from services.jobs.job_service import JobService
+from services.jobs.job_service import JobService, decode_jobs_cursor, encode_jobs_cursor
 
 
 @pytest.fixture
@@ -152,6 +154,19 @@ class TestJobService:
         assert jobs[1]["jsearch_job_id"] == "job2"
         assert jobs[1]["job_status"] == "approved"
 
+    def test_get_jobs_for_user_as_rows_keeps_tuples(self, job_service, mock_database):
+        """Test that as_rows=True returns the query's tuples without building dictionaries."""
+        mock_cursor = Mock()
+        mock_database.get_cursor.return_value.__enter__.return_value = mock_cursor
+        mock_cursor.description = [("jsearch_job_id",), ("job_status",)]
+        mock_cursor.fetchall.return_value = [("job1", "waiting"), ("job2", "approved")]
+
+        jobs = job_service.get_jobs_for_user(user_id=1, as_rows=True)
+
+        assert jobs.columns == ("jsearch_job_id", "job_status")
+        assert jobs.rows == [("job1", "waiting"), ("job2", "approved")]
+        assert jobs[-1] == {"jsearch_job_id": "job2", "job_status": "approved"}
+
     def test_get_same_company_jobs_returns_list(self, job_service, mock_database):
         """Test that get_same_company_jobs returns list of same-company jobs."""
         mock_cursor = Mock()
@@ -178,3 +193,99 @@ class TestJobService:
         params = call_args[0][1]
         assert params[1] == "current-job"
         assert params[2] == "current-job"
+
+
+class TestJobsKeysetPagination:
+    """Test cursor encoding and keyset filters for the jobs list."""
+
+    def _execute(self, mock_database):
+        mock_cursor = Mock()
+        mock_database.get_cursor.return_value.__enter__.return_value = mock_cursor
+        mock_cursor.description = [("jsearch_job_id",)]
+        mock_cursor.fetchall.return_value = []
+        return mock_cursor
+
+    def test_cursor_round_trip(self):
+        job = {
+            "jsearch_job_id": "job-1",
+            "campaign_id": 7,
+            "rank_score": Decimal("87.50"),
+            "ranked_at": datetime(2026, 1, 2, 3, 4, 5),
+        }
+
+        cursor = encode_jobs_cursor(job)
+
+        assert decode_jobs_cursor(cursor) == ("87.50", "2026-01-02T03:04:05", "job-1", 7)
+
+    def test_cursor_encodes_missing_score_as_lowest(self):
+        job = {"jsearch_job_id": "job-1", "campaign_id": 7, "rank_score": None, "ranked_at": None}
+
+        assert decode_jobs_cursor(encode_jobs_cursor(job))[:2] == ("-Infinity", "-infinity")
+
+    @pytest.mark.parametrize("cursor", ["not-base64!", "W10", "WyJ4IiwiLWluZmluaXR5IiwiaiIsMV0"])
+    def test_invalid_cursor_raises_value_error(self, cursor):
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_jobs_cursor(cursor)
+
+    def test_campaign_page_uses_keyset_filter_and_bound_limit(self, job_service, mock_database):
+        mock_cursor = self._execute(mock_database)
+        cursor = encode_jobs_cursor(
+            {"jsearch_job_id": "job-9", "campaign_id": 3, "rank_score": 50, "ranked_at": None}
+        )
+
+        job_service.get_jobs_for_campaign(campaign_id=3, user_id=1, limit=26, cursor=cursor)
+
+        query, params = mock_cursor.execute.call_args[0]
+        assert "< (%s::numeric, %s::timestamp, %s)" in query
+        # The page is limited before job details, notes and flags are joined
+        assert query.index("LIMIT %s OFFSET %s") < query.index("FROM ranked_jobs")
+        assert params == [1, 3, "50", "-infinity", "job-9", 26, 0, 1, 1]
+
+    def test_user_page_includes_campaign_tie_breaker(self, job_service, mock_database):
+        mock_cursor = self._execute(mock_database)
+        cursor = encode_jobs_cursor(
+            {"jsearch_job_id": "job-9", "campaign_id": 3, "rank_score": 50, "ranked_at": None}
+        )
+
+        job_service.get_jobs_for_user(user_id=1, limit=26, cursor=cursor)
+
+        query, params = mock_cursor.execute.call_args[0]
+        assert "< (%s::numeric, %s::timestamp, %s, %s)" in query
+        assert params == [1, 1, "50", "-infinity", "job-9", 3, 26, 0, 1, 1]
+
+    def test_user_page_rejects_cursor_without_campaign(self, job_service):
+        cursor = encode_jobs_cursor(
+            {"jsearch_job_id": "job-9", "rank_score": 50, "ranked_at": None}
+        )
+
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            job_service.get_jobs_for_user(user_id=1, limit=26, cursor=cursor)
+
+
+class TestRecentJobs:
+    """Test the dashboard's recent jobs query."""
+
+    def test_recent_jobs_limit_each_campaign(self, job_service, mock_database):
+        mock_cursor = Mock()
+        mock_database.get_cursor.return_value.__enter__.return_value = mock_cursor
+        mock_cursor.description = [("jsearch_job_id",)]
+        mock_cursor.fetchall.return_value = [("job-1",)]
+
+        jobs = job_service.get_recent_jobs(user_id=4, limit=5)
+
+        query, params = mock_cursor.execute.call_args[0]
+        assert "CROSS JOIN LATERAL" in query
+        assert params == (5, 4, 4, 5, 4, 4)
+        assert jobs == [{"jsearch_job_id": "job-1"}]
+
+    def test_recent_jobs_for_admin_drop_owner_filter(self, job_service, mock_database):
+        mock_cursor = Mock()
+        mock_database.get_cursor.return_value.__enter__.return_value = mock_cursor
+        mock_cursor.description = [("jsearch_job_id",)]
+        mock_cursor.fetchall.return_value = []
+
+        job_service.get_recent_jobs(user_id=None, limit=5)
+
+        query, params = mock_cursor.execute.call_args[0]
+        assert "jc.user_id = %s" not in query
+        assert query.count("%s") == len(params)
@@ -175,6 +175,39 @@ class TestJobStatusService:
 
         assert history_id == 1
 
+    def test_record_job_found_bulk_uses_single_insert(self, job_status_service, mock_database):
+        """Test record_job_found_bulk writes all rows with one execute_values call."""
+        mock_cursor = Mock()
+        mock_database.get_cursor.return_value.__enter__.return_value = mock_cursor
+
+        with patch("services.jobs.job_status_service.execute_values") as mock_execute_values:
+            count = job_status_service.record_job_found_bulk(["job1", "job2"], 1, campaign_id=7)
+
+        assert count == 2
+        mock_execute_values.assert_called_once()
+        cur, _, rows = mock_execute_values.call_args.args
+        assert cur is mock_cursor
+        assert rows == [
+            ("job1", 1, "job_found", "extraction", "system", None, '{"campaign_id": 7}', None),
+            ("job2", 1, "job_found", "extraction", "system", None, '{"campaign_id": 7}', None),
+        ]
+
+    def test_record_job_found_bulk_uses_callers_cursor(self, job_status_service, mock_database):
+        """Test record_job_found_bulk writes in the caller's transaction when given a cursor."""
+        caller_cursor = Mock()
+
+        with patch("services.jobs.job_status_service.execute_values") as mock_execute_values:
+            job_status_service.record_job_found_bulk(["job1"], 1, cur=caller_cursor)
+
+        assert mock_execute_values.call_args.args[0] is caller_cursor
+        assert mock_execute_values.call_args.args[2][0][6] is None
+        mock_database.get_cursor.assert_not_called()
+
+    def test_record_job_found_bulk_empty(self, job_status_service, mock_database):
+        """Test record_job_found_bulk is a no-op for no jobs."""
+        assert job_status_service.record_job_found_bulk([], 1) == 0
+        mock_database.get_cursor.assert_not_called()
+
     def test_record_ai_update(self, job_status_service, mock_database):
         """Test record_ai_update creates history entry."""
         mock_cursor = Mock()
@@ -348,6 +381,50 @@ class TestJobStatusService:
         # Should have called execute for get_status, upsert, and record_history
         assert mock_cursor.execute.call_count >= 3
 
+    @patch("services.jobs.job_service.JobService")
+    def test_upsert_status_refreshes_applied_companies_on_change(
+        self, mock_job_service_class, job_status_service, mock_database
+    ):
+        """Test upsert_status refreshes the user's derived job data when status changes."""
+        mock_cursor = Mock()
+        mock_database.get_cursor.return_value.__enter__.return_value = mock_cursor
+        mock_job_service_class.return_value.get_job_by_id.return_value = None
+        mock_cursor.description = [("user_job_status_id",), ("status",)]
+        mock_cursor.fetchone.side_effect = [(1, "waiting"), (1,), (1,)]
+
+        job_status_service.upsert_status("job123", 7, "applied", campaign_id=2)
+
+        queries = [c[0][0] for c in mock_cursor.execute.call_args_list]
+        refresh = [q for q in queries if "user_applied_companies" in q]
+        assert len(refresh) == 1
+        assert mock_cursor.execute.call_args_list[queries.index(refresh[0])][0][1] == (7, 7, 7)
+        assert any("UPDATE marts.user_dashboard_stats" in q for q in queries)
+
+    def test_upsert_status_unchanged_skips_applied_companies_refresh(
+        self, job_status_service, mock_database
+    ):
+        """Test upsert_status leaves derived job data alone when status is unchanged."""
+        mock_cursor = Mock()
+        mock_database.get_cursor.return_value.__enter__.return_value = mock_cursor
+        mock_cursor.description = [("user_job_status_id",), ("status",)]
+        mock_cursor.fetchone.side_effect = [(1, "applied"), (1,)]
+
+        job_status_service.upsert_status("job123", 7, "applied", campaign_id=2)
+
+        queries = [c[0][0] for c in mock_cursor.execute.call_args_list]
+        assert not any(
+            "user_applied_companies" in q or "user_dashboard_stats" in q for q in queries
+        )
+
+    def test_refresh_applied_companies(self, job_status_service, mock_database):
+        """Test refresh_applied_companies rebuilds the set for all users."""
+        mock_cursor = Mock()
+        mock_database.get_cursor.return_value.__enter__.return_value = mock_cursor
+        mock_cursor.rowcount = 4
+
+        assert job_status_service.refresh_applied_companies() == 4
+        assert "user_applied_companies" in mock_cursor.execute.call_args[0][0]
+
     def test_get_status_history_invalid_limit(self, job_status_service):
         """Test get_status_history raises ValueError for invalid limit."""
         with pytest.raises(ValueError, match="limit must be between 1 and 10000"):
@@ -0,0 +1,169 @@
+"""
+Unit tests for NotificationListener.
+
+Uses a fake connection backed by a socket pair, so select() wakes up when a test
+"sends" a notification and reconnects can be simulated without a database.
+"""
+
+import queue
+import socket
+import time
+from types import SimpleNamespace
+
+import psycopg2
+import pytest
+
+from services.shared.notification_listener import RESYNC, NotificationListener, Subscription
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query):
+        self.conn.executed.append(query)
+
+
+class FakeConnection:
+    """Connection double whose socket becomes readable when notify() is called."""
+
+    def __init__(self):
+        self._sock, self._peer = socket.socketpair()
+        self.autocommit = False
+        self.executed = []
+        self.notifies = []
+        self._pending = []
+        self.broken = False
+        self.closed = False
+
+    def fileno(self):
+        return self._sock.fileno()
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def notify(self, payload):
+        self._pending.append(SimpleNamespace(payload=payload))
+        self._peer.send(b"x")
+
+    def break_connection(self):
+        self.broken = True
+        self._peer.send(b"x")
+
+    def poll(self):
+        self._sock.recv(1024)
+        if self.broken:
+            raise psycopg2.OperationalError("server closed the connection unexpectedly")
+        self.notifies.extend(self._pending)
+        self._pending.clear()
+
+    def close(self):
+        self.closed = True
+        self._sock.close()
+        self._peer.close()
+
+
+def _listener(**kwargs):
+    connections = []
+
+    def connect(dsn):
+        conn = FakeConnection()
+        connections.append(conn)
+        return conn
+
+    listener = NotificationListener(
+        "dsn", "campaign_progress", connect=connect, poll_interval=0.05, **kwargs
+    )
+    return listener, connections
+
+
+@pytest.fixture
+def listener_and_connections():
+    listener, connections = _listener(reconnect_delay=0.01)
+    yield listener, connections
+    listener.close()
+
+
+def _wait_until(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.005)
+
+
+class TestNotificationListener:
+    """Test LISTEN setup, fan-out and reconnects."""
+
+    def test_first_subscription_starts_listening(self, listener_and_connections):
+        listener, connections = listener_and_connections
+        assert connections == []
+
+        listener.subscribe()
+
+        assert listener.wait_until_listening(2)
+        assert connections[0].autocommit is True
+        assert len(connections[0].executed) == 1
+
+    def test_payloads_reach_every_subscriber(self, listener_and_connections):
+        listener, connections = listener_and_connections
+        first, second = listener.subscribe(), listener.subscribe()
+        listener.wait_until_listening(2)
+
+        connections[0].notify('{"campaign_id": 1}')
+
+        assert first.get(timeout=2) == '{"campaign_id": 1}'
+        assert second.get(timeout=2) == '{"campaign_id": 1}'
+
+    def test_unsubscribed_queue_gets_nothing(self, listener_and_connections):
+        listener, connections = listener_and_connections
+        kept, dropped = listener.subscribe(), listener.subscribe()
+        listener.wait_until_listening(2)
+        listener.unsubscribe(dropped)
+
+        connections[0].notify("payload")
+
+        assert kept.get(timeout=2) == "payload"
+        with pytest.raises(queue.Empty):
+            dropped.get(timeout=0.05)
+
+    def test_reconnect_asks_subscribers_to_resync(self, listener_and_connections):
+        listener, connections = listener_and_connections
+        subscription = listener.subscribe()
+        listener.wait_until_listening(2)
+
+        connections[0].break_connection()
+        _wait_until(lambda: len(connections) == 2)
+
+        assert subscription.get(timeout=2) is RESYNC
+        assert connections[0].closed
+        connections[1].notify("after reconnect")
+        assert subscription.get(timeout=2) == "after reconnect"
+
+    def test_close_stops_the_thread(self):
+        listener, connections = _listener()
+        listener.subscribe()
+        listener.wait_until_listening(2)
+
+        listener.close()
+
+        assert connections[0].closed
+        assert not listener.wait_until_listening(0)
+
+
+class TestSubscription:
+    """Test subscriber queue overflow."""
+
+    def test_overflow_replaces_backlog_with_resync(self):
+        subscription = Subscription(maxsize=2)
+        for payload in ("a", "b", "c"):
+            subscription.put(payload)
+
+        assert subscription.get(timeout=0) is RESYNC
+        with pytest.raises(queue.Empty):
+            subscription.get(timeout=0)
@@ -0,0 +1,125 @@
+"""
+Unit tests for the token-bucket rate limiter and its use by API clients.
+"""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from services.extractor.glassdoor_client import GlassdoorClient
+from services.extractor.jsearch_client import JSearchClient
+from services.extractor.rate_limiter import (
+    TokenBucketRateLimiter,
+    get_rate_limiter,
+    reset_rate_limiters,
+)
+
+
+class FakeClock:
+    """Manually advanced clock; sleeping advances time."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture(autouse=True)
+def _reset_limiters():
+    reset_rate_limiters()
+    yield
+    reset_rate_limiters()
+
+
+class TestTokenBucketRateLimiter:
+    """Test token bucket behaviour."""
+
+    def test_rejects_non_positive_rate_and_capacity(self):
+        with pytest.raises(ValueError, match="rate must be positive"):
+            TokenBucketRateLimiter(rate=0)
+        with pytest.raises(ValueError, match="capacity must be positive"):
+            TokenBucketRateLimiter(rate=1, capacity=0)
+
+    def test_burst_up_to_capacity_then_paces_at_rate(self):
+        clock = FakeClock()
+        limiter = TokenBucketRateLimiter(rate=2, capacity=3, clock=clock, sleep=clock.sleep)
+
+        waits = [limiter.acquire() for _ in range(5)]
+
+        assert waits[:3] == [0.0, 0.0, 0.0]
+        assert waits[3:] == pytest.approx([0.5, 0.5])
+
+    def test_tokens_refill_while_idle_but_not_beyond_capacity(self):
+        clock = FakeClock()
+        limiter = TokenBucketRateLimiter(rate=1, capacity=2, clock=clock, sleep=clock.sleep)
+        limiter.acquire()
+        limiter.acquire()
+
+        clock.now += 10  # Refills to capacity (2), not 10
+
+        assert [limiter.acquire() for _ in range(3)] == pytest.approx([0.0, 0.0, 1.0])
+
+    def test_concurrent_callers_queue_behind_each_other(self):
+        """Waiting callers reserve successive slots instead of all waking together."""
+        clock = FakeClock()
+        # Sleep is a no-op so every thread reserves against the same clock reading
+        limiter = TokenBucketRateLimiter(rate=10, capacity=1, clock=clock, sleep=lambda _: None)
+        waits = []
+        lock = threading.Lock()
+
+        def worker():
+            wait = limiter.acquire()
+            with lock:
+                waits.append(wait)
+
+        threads = [threading.Thread(target=worker) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(waits) == pytest.approx([0.0, 0.1, 0.2, 0.3, 0.4])
+
+
+class TestSharedRateLimiter:
+    """Test the per-host limiter registry."""
+
+    def test_limiter_is_shared_per_host(self):
+        first = get_rate_limiter("https://api.example.com/jsearch", rate=1)
+        second = get_rate_limiter("https://api.example.com/other", rate=5)
+        other_host = get_rate_limiter("http://localhost:8099/jsearch", rate=1)
+
+        assert first is second
+        assert first.rate == 1
+        assert other_host is not first
+
+    def test_clients_on_same_host_share_limiter(self):
+        jsearch = JSearchClient(api_key="key")
+        glassdoor = GlassdoorClient(api_key="key")
+        another_jsearch = JSearchClient(api_key="other-key")
+
+        assert jsearch.rate_limiter is glassdoor.rate_limiter is another_jsearch.rate_limiter
+        assert jsearch.rate_limiter.rate == pytest.approx(1.0)
+
+    def test_client_uses_injected_limiter(self):
+        limiter = TokenBucketRateLimiter(rate=100)
+        client = JSearchClient(api_key="key", base_url="http://mock/jsearch", rate_limiter=limiter)
+
+        with patch.object(limiter, "acquire") as mock_acquire:
+            client._enforce_rate_limit()
+
+        assert client.base_url == "http://mock/jsearch"
+        mock_acquire.assert_called_once()
+
+    def test_zero_delay_disables_rate_limiting(self):
+        client = JSearchClient(api_key="key", rate_limit_delay=0)
+
+        assert client.rate_limiter is None
+        client._enforce_rate_limit()
@@ -0,0 +1,143 @@
+"""
+Unit tests for the API response cache and its use by API clients.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+from requests.structures import CaseInsensitiveDict
+
+from services.extractor.glassdoor_client import GlassdoorClient
+from services.extractor.jsearch_client import JSearchClient
+from services.extractor.response_cache import ResponseCache, ttl_from_headers
+
+
+class FakeClock:
+    """Manually advanced wall clock."""
+
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _response(status_code=200, data=None, headers=None):
+    response = Mock()
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(headers or {})
+    response.json.return_value = data
+    response.raise_for_status.return_value = None
+    return response
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    cache = ResponseCache(str(tmp_path / "responses.sqlite3"), default_ttl=60, clock=clock)
+    yield cache
+    cache.close()
+
+
+class TestTtlFromHeaders:
+    """Test freshness derived from response headers."""
+
+    @pytest.mark.parametrize(
+        "headers,expected",
+        [
+            ({}, 60),
+            ({"Cache-Control": "public, max-age=300"}, 300),
+            ({"Cache-Control": "no-cache"}, 0),
+            ({"Cache-Control": "no-store"}, None),
+            ({"Cache-Control": "private, max-age=300"}, None),
+            ({"Expires": "Thu, 01 Jan 1970 00:01:40 GMT"}, 40),
+            ({"Expires": "0"}, 0),
+        ],
+    )
+    def test_ttl(self, headers, expected):
+        assert ttl_from_headers(CaseInsensitiveDict(headers), 60, now=60) == expected
+
+
+class TestResponseCache:
+    """Test storage, expiry and counters."""
+
+    def test_key_ignores_param_order(self):
+        assert ResponseCache.make_key("u", {"a": 1, "b": 2}) == ResponseCache.make_key(
+            "u", {"b": 2, "a": 1}
+        )
+        assert ResponseCache.make_key("u", {"a": 1}) != ResponseCache.make_key("u", {"a": 2})
+
+    def test_entry_is_fresh_until_ttl_expires(self, cache, clock):
+        assert cache.get("k") is None
+        assert cache.store("k", {"status": "OK"}, CaseInsensitiveDict({"ETag": '"v1"'}))
+
+        assert cache.get("k").fresh
+        clock.now += 61
+        stale = cache.get("k")
+
+        assert not stale.fresh
+        assert stale.data == {"status": "OK"}
+        assert stale.conditional_headers() == {"If-None-Match": '"v1"'}
+        assert cache.stats() == {"hits": 1, "misses": 2, "revalidations": 0}
+
+    def test_no_store_response_is_not_cached(self, cache):
+        assert not cache.store("k", {}, CaseInsensitiveDict({"Cache-Control": "no-store"}))
+        assert cache.get("k") is None
+
+    def test_entries_persist_across_instances(self, tmp_path, cache, clock):
+        cache.store("k", {"status": "OK", "data": [1]}, CaseInsensitiveDict())
+
+        reopened = ResponseCache(str(tmp_path / "responses.sqlite3"), default_ttl=60, clock=clock)
+        try:
+            assert reopened.get("k").data == {"status": "OK", "data": [1]}
+        finally:
+            reopened.close()
+
+
+class TestClientResponseCaching:
+    """Test that clients answer repeated requests from the cache."""
+
+    def test_repeated_search_costs_one_api_call(self, cache):
+        client = JSearchClient(api_key="k", rate_limit_delay=0, response_cache=cache)
+        client.session.get = Mock(return_value=_response(data={"status": "OK", "data": []}))
+
+        first = client.search_jobs(query="python", location="Toronto", num_pages=1)
+        second = client.search_jobs(query="python", location="Toronto", num_pages=1)
+
+        assert first == second
+        assert client.session.get.call_count == 1
+        assert cache.stats()["hits"] == 1
+
+    def test_stale_entry_is_revalidated_with_etag(self, cache, clock):
+        client = GlassdoorClient(api_key="k", rate_limit_delay=0, response_cache=cache)
+        payload = {"status": "OK", "data": [{"name": "Acme"}]}
+        client.session.get = Mock(
+            side_effect=[
+                _response(data=payload, headers={"ETag": '"v1"'}),
+                _response(status_code=304, headers={"Cache-Control": "max-age=120"}),
+            ]
+        )
+
+        client.search_company("acme")
+        clock.now += 61
+        result = client.search_company("acme")
+
+        assert result == payload
+        assert client.session.get.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+        clock.now += 100
+        assert client.search_company("acme") == payload
+        assert client.session.get.call_count == 2
+        assert cache.stats()["revalidations"] == 1
+
+    def test_error_envelope_is_not_cached(self, cache):
+        client = GlassdoorClient(api_key="k", rate_limit_delay=0, response_cache=cache)
+        client.session.get = Mock(return_value=_response(data={"status": "ERROR"}))
+
+        client.search_company("acme")
+        client.search_company("acme")
+
+        assert client.session.get.call_count == 2
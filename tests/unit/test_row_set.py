@@ -0,0 +1,44 @@
+"""Unit tests for RowSet."""
+
+from unittest.mock import Mock
+
+from services.shared.row_set import RowSet
+
+
+def _row_set():
+    return RowSet(("id", "title"), [(1, "a"), (2, "b"), (3, "c")])
+
+
+class TestRowSet:
+    """Test list-of-dictionaries behaviour over row tuples."""
+
+    def test_from_cursor_uses_description_and_rows(self):
+        cur = Mock()
+        cur.description = [("id",), ("title",)]
+        cur.fetchall.return_value = [(1, "a")]
+
+        rows = RowSet.from_cursor(cur)
+
+        assert rows.columns == ("id", "title")
+        assert rows.rows == [(1, "a")]
+
+    def test_index_returns_row_dictionary(self):
+        rows = _row_set()
+
+        assert len(rows) == 3
+        assert rows[0] == {"id": 1, "title": "a"}
+        assert rows[-1] == {"id": 3, "title": "c"}
+
+    def test_slice_returns_row_set_with_same_columns(self):
+        page = _row_set()[:2]
+
+        assert isinstance(page, RowSet)
+        assert page.columns == ("id", "title")
+        assert page.rows == [(1, "a"), (2, "b")]
+
+    def test_iteration_and_conversions(self):
+        rows = _row_set()
+
+        assert list(rows) == rows.to_dicts()
+        assert rows.to_dicts()[1] == {"id": 2, "title": "b"}
+        assert rows.as_table() == {"columns": ("id", "title"), "rows": rows.rows}
@@ -0,0 +1,104 @@
+"""
+Unit tests for the SQL ranking backend (SQLJobRanker).
+
+Scoring parity with the Python ranker is covered by the integration test
+tests/integration/test_sql_ranker_parity.py; these tests check parameter
+building and the single-statement workflow.
+"""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from services.ranker.job_ranker import DEFAULT_SCORING_WEIGHTS, RANKING_FACTORS
+from services.ranker.queries import RANK_JOBS_FOR_CAMPAIGN_IN_SQL
+from services.ranker.sql_job_ranker import SQLJobRanker
+
+
+class TestSQLJobRankerParams:
+    """Test campaign preference parsing into query parameters."""
+
+    @pytest.fixture
+    def ranker(self):
+        """Create a SQLJobRanker instance with a mock database."""
+        return SQLJobRanker(database=MagicMock())
+
+    def test_build_campaign_params_parses_preferences(self, ranker):
+        campaign = {
+            "location": "Toronto",
+            "country": "CA",
+            "query": "Senior Python Developer, python",
+            "min_salary": 100000,
+            "max_salary": 120000,
+            "currency": "CAD",
+            "company_size_preference": "51-200, 10000+,Startup",
+            "skills": "Python; SQL, python",
+            "employment_type_preference": "fulltime, contractor",
+            "seniority": "Senior,principal",
+            "remote_preference": "Remote",
+        }
+        now = datetime(2025, 1, 15, 12, 0)
+
+        params = ranker.build_campaign_params(7, campaign, now=now)
+
+        assert params["campaign_id"] == 7
+        assert params["today"] == now.date()
+        assert params["location"] == "toronto"
+        assert params["country_terms"] == ["canada", "canadian"]
+        assert params["campaign_salary_avg"] == 110000.0
+        assert params["campaign_currency_valid"] is True
+        assert params["company_size_preferences"] == ["51-200", "10000+", "startup"]
+        assert params["company_size_range_mins"] == [51, 10001, None]
+        assert params["company_size_range_maxs"] == [200, None, None]
+        assert params["skills"] == ["python", "sql"]
+        assert params["query_keywords"] == ["developer", "python", "senior"]
+        assert params["employment_type_preferences"] == ["FULLTIME", "CONTRACTOR"]
+        assert params["seniority_preferences"] == ["senior", "principal"]
+        assert params["seniority_preference_levels"] == [4]
+        assert params["remote_preferences"] == ["remote"]
+        assert params["weight_location_match"] == DEFAULT_SCORING_WEIGHTS["location_match"]
+
+    def test_build_campaign_params_without_preferences(self, ranker):
+        params = ranker.build_campaign_params(1, {"ranking_weights": {"recency": 50}})
+
+        assert params["campaign_salary_avg"] is None
+        assert params["country_terms"] == []
+        assert params["has_company_size_preference"] is False
+        assert params["has_skills_preference"] is False
+        assert params["has_employment_type_preference"] is False
+        assert params["has_seniority_preference"] is False
+        assert params["has_remote_preference"] is False
+        assert params["query_keywords"] == []
+        # Custom weights override only the factors they name
+        assert params["weight_recency"] == 50.0
+        assert params["weight_salary_match"] == DEFAULT_SCORING_WEIGHTS["salary_match"]
+
+    def test_build_campaign_params_binds_every_query_placeholder(self, ranker):
+        params = ranker.build_campaign_params(1, {})
+
+        for factor in RANKING_FACTORS:
+            assert f"weight_{factor}" in params
+        # Interpolation raises KeyError for any placeholder missing from params
+        rendered = RANK_JOBS_FOR_CAMPAIGN_IN_SQL % dict.fromkeys(params, "x")
+        assert "%(" not in rendered
+
+
+class TestSQLJobRankerWorkflow:
+    """Test the single-statement ranking workflow."""
+
+    def test_rank_jobs_for_campaign_executes_single_statement(self):
+        mock_db = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.rowcount = 42
+        mock_db.get_cursor.return_value.__enter__.return_value = mock_cursor
+        ranker = SQLJobRanker(database=mock_db)
+
+        count = ranker.rank_jobs_for_campaign({"campaign_id": 3, "campaign_name": "Test"})
+
+        assert count == 42
+        mock_cursor.execute.assert_called_once()
+        query, params = mock_cursor.execute.call_args.args
+        assert query == RANK_JOBS_FOR_CAMPAIGN_IN_SQL
+        assert params["campaign_id"] == 3
+        mock_cursor.fetchall.assert_not_called()